@@ -0,0 +1,3 @@
+"""
+Data persistence layer.
+"""
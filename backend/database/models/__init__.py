@@ -0,0 +1,8 @@
+"""
+Pydantic models from specs/technical.md Section 4.
+"""
+
+from backend.database.models.memory import AgentMemory
+from backend.database.models.tasks import Task
+
+__all__ = ["AgentMemory", "Task"]
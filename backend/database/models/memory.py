@@ -0,0 +1,20 @@
+"""
+Agent memory model (specs/technical.md Section 4.5).
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class AgentMemory(BaseModel):
+    memory_id: UUID
+    agent_id: str
+    memory_type: str = Field(..., pattern="^(episodic|semantic)$")
+    content: str
+    relevance_tags: List[str] = []
+    created_at: datetime
+    accessed_at: Optional[datetime] = None
+    metadata: Optional[dict] = None
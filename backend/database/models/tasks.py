@@ -0,0 +1,27 @@
+"""
+Task model (specs/technical.md Section 4.1).
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class Task(BaseModel):
+    task_id: UUID
+    agent_id: str
+    campaign_id: Optional[str] = None
+    task_type: str = Field(..., pattern="^(generate_text|generate_image|render_video|post_content|engage_reply)$")
+    priority: str = Field(default="medium", pattern="^(high|medium|low)$")
+    status: str = Field(default="pending", pattern="^(pending|executing|completed|failed|cancelled)$")
+    parameters: dict
+    context: Optional[dict] = None  # goal_description, persona_constraints, required_resources
+    dependencies: List[UUID] = []
+    assigned_worker_id: Optional[str] = None
+    state_version_snapshot: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    error: Optional[dict] = None
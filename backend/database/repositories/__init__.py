@@ -0,0 +1,3 @@
+"""
+Data access layer (repository pattern).
+"""
@@ -0,0 +1,299 @@
+"""
+GlobalState Store
+
+Versioned per-agent state (specs/technical.md Section 2.4, tables ``agents``
+and ``state_commits``) used by the GlobalState commit service.
+
+Entities -- goals, campaigns and committed tasks -- are addressed by an
+:data:`EntityKey` of ``(kind, entity_id)``. :meth:`StateStore.apply` is a
+compare-and-set on ``state_version``: it applies a set of entity writes and
+advances the version by exactly one, or raises :class:`StateVersionConflict`
+if another writer got there first.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Optional, Protocol, Sequence, Set, Tuple
+
+EntityKey = Tuple[str, str]
+
+
+class UnknownAgentError(KeyError):
+    """Raised when an agent has no GlobalState row."""
+
+
+class StateVersionConflict(Exception):
+    """Raised by :meth:`StateStore.apply` when ``state_version`` has moved."""
+
+    def __init__(self, agent_id: str, expected: int, current: int):
+        super().__init__(
+            f"state_version of {agent_id} is {current}, expected {expected}"
+        )
+        self.agent_id = agent_id
+        self.expected = expected
+        self.current = current
+
+
+@dataclass
+class StateCommitRecord:
+    """One row of the ``state_commits`` log (specs/technical.md 3.1.10)."""
+
+    commit_id: str
+    agent_id: str
+    task_id: Optional[str]
+    input_state_version: int
+    output_state_version: int
+    commit_hash: str
+    committed_by: str
+    occ_conflict: bool = False
+    committed_at: float = field(default_factory=time.time)
+
+
+class StateStore(Protocol):
+    """Persistence layer for GlobalState."""
+
+    def snapshot(self, agent_id: str, keys: Iterable[EntityKey]) -> Tuple[int, Set[EntityKey]]:
+        """Return the current ``state_version`` and which of ``keys`` exist."""
+        ...
+
+    def apply(
+        self,
+        agent_id: str,
+        expected_version: int,
+        writes: Dict[EntityKey, Optional[Dict[str, Any]]],
+        commits: Sequence[StateCommitRecord],
+    ) -> int:
+        """
+        Apply ``writes`` (``None`` deletes) and log ``commits`` if the version
+        is still ``expected_version``; returns the new version.
+        """
+        ...
+
+    def record_commits(self, commits: Sequence[StateCommitRecord]) -> None:
+        """Log commits that did not change state (e.g. OCC rejections)."""
+        ...
+
+    def read(self, agent_id: str) -> Tuple[int, Dict[EntityKey, Dict[str, Any]]]:
+        ...
+
+
+@dataclass
+class _AgentState:
+    state_version: int = 0
+    entities: Dict[EntityKey, Dict[str, Any]] = field(default_factory=dict)
+
+
+class InMemoryStateStore:
+    """
+    Dict-backed :class:`StateStore`; thread-safe so it can be driven from an
+    executor. Keeps the most recent ``max_commits`` commit records.
+    """
+
+    def __init__(self, max_commits: int = 100_000):
+        self.commits: Deque[StateCommitRecord] = deque(maxlen=max_commits)
+        self._agents: Dict[str, _AgentState] = {}
+        self._lock = threading.Lock()
+
+    def create_agent(self, agent_id: str, state_version: int = 0) -> None:
+        with self._lock:
+            self._agents.setdefault(agent_id, _AgentState(state_version))
+
+    def snapshot(self, agent_id: str, keys: Iterable[EntityKey]) -> Tuple[int, Set[EntityKey]]:
+        with self._lock:
+            state = self._agent(agent_id)
+            return state.state_version, {key for key in keys if key in state.entities}
+
+    def apply(
+        self,
+        agent_id: str,
+        expected_version: int,
+        writes: Dict[EntityKey, Optional[Dict[str, Any]]],
+        commits: Sequence[StateCommitRecord],
+    ) -> int:
+        with self._lock:
+            state = self._agent(agent_id)
+            if state.state_version != expected_version:
+                raise StateVersionConflict(agent_id, expected_version, state.state_version)
+            for key, body in writes.items():
+                if body is None:
+                    state.entities.pop(key, None)
+                else:
+                    state.entities[key] = body
+            state.state_version += 1
+            self.commits.extend(commits)
+            return state.state_version
+
+    def record_commits(self, commits: Sequence[StateCommitRecord]) -> None:
+        with self._lock:
+            self.commits.extend(commits)
+
+    def read(self, agent_id: str) -> Tuple[int, Dict[EntityKey, Dict[str, Any]]]:
+        with self._lock:
+            state = self._agent(agent_id)
+            return state.state_version, dict(state.entities)
+
+    def _agent(self, agent_id: str) -> _AgentState:
+        try:
+            return self._agents[agent_id]
+        except KeyError:
+            raise UnknownAgentError(agent_id) from None
+
+
+class SQLiteStateStore:
+    """
+    :class:`StateStore` in SQLite for local load tests.
+
+    Use ``":memory:"`` for tests; a file path lets several processes contend
+    on the same agents, which exercises the :class:`StateVersionConflict` path.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS agents (
+                agent_id TEXT PRIMARY KEY,
+                state_version INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS state_entities (
+                agent_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                body TEXT NOT NULL,
+                PRIMARY KEY (agent_id, kind, entity_id)
+            );
+            CREATE TABLE IF NOT EXISTS state_commits (
+                commit_id TEXT PRIMARY KEY,
+                agent_id TEXT NOT NULL,
+                task_id TEXT,
+                input_state_version INTEGER NOT NULL,
+                output_state_version INTEGER NOT NULL,
+                commit_hash TEXT NOT NULL,
+                committed_by TEXT NOT NULL,
+                committed_at REAL NOT NULL,
+                occ_conflict INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_state_commits_agent ON state_commits (agent_id);
+            """
+        )
+
+    def create_agent(self, agent_id: str, state_version: int = 0) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO agents (agent_id, state_version) VALUES (?, ?)",
+                (agent_id, state_version),
+            )
+
+    def snapshot(self, agent_id: str, keys: Iterable[EntityKey]) -> Tuple[int, Set[EntityKey]]:
+        keys = list(keys)
+        with self._lock:
+            version = self._version(agent_id)
+            existing = set()
+            # One query per kind; batches rarely touch more than a few kinds.
+            by_kind: Dict[str, List[str]] = {}
+            for kind, entity_id in keys:
+                by_kind.setdefault(kind, []).append(entity_id)
+            for kind, ids in by_kind.items():
+                placeholders = ",".join("?" * len(ids))
+                for (entity_id,) in self._conn.execute(
+                    "SELECT entity_id FROM state_entities"
+                    f" WHERE agent_id = ? AND kind = ? AND entity_id IN ({placeholders})",
+                    (agent_id, kind, *ids),
+                ):
+                    existing.add((kind, entity_id))
+            return version, existing
+
+    def apply(
+        self,
+        agent_id: str,
+        expected_version: int,
+        writes: Dict[EntityKey, Optional[Dict[str, Any]]],
+        commits: Sequence[StateCommitRecord],
+    ) -> int:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    "UPDATE agents SET state_version = state_version + 1"
+                    " WHERE agent_id = ? AND state_version = ?",
+                    (agent_id, expected_version),
+                )
+                if cursor.rowcount == 0:
+                    current = self._version(agent_id)
+                    raise StateVersionConflict(agent_id, expected_version, current)
+                self._conn.executemany(
+                    "DELETE FROM state_entities WHERE agent_id = ? AND kind = ? AND entity_id = ?",
+                    [(agent_id, *key) for key, body in writes.items() if body is None],
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO state_entities (agent_id, kind, entity_id, body)"
+                    " VALUES (?, ?, ?, ?)",
+                    [
+                        (agent_id, *key, json.dumps(body, separators=(",", ":")))
+                        for key, body in writes.items()
+                        if body is not None
+                    ],
+                )
+                self._insert_commits(commits)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return expected_version + 1
+
+    def record_commits(self, commits: Sequence[StateCommitRecord]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._insert_commits(commits)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def read(self, agent_id: str) -> Tuple[int, Dict[EntityKey, Dict[str, Any]]]:
+        with self._lock:
+            version = self._version(agent_id)
+            rows = self._conn.execute(
+                "SELECT kind, entity_id, body FROM state_entities WHERE agent_id = ?",
+                (agent_id,),
+            )
+            return version, {(kind, entity_id): json.loads(body) for kind, entity_id, body in rows}
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _version(self, agent_id: str) -> int:
+        row = self._conn.execute(
+            "SELECT state_version FROM agents WHERE agent_id = ?", (agent_id,)
+        ).fetchone()
+        if row is None:
+            raise UnknownAgentError(agent_id)
+        return int(row[0])
+
+    def _insert_commits(self, commits: Sequence[StateCommitRecord]) -> None:
+        self._conn.executemany(
+            "INSERT INTO state_commits (commit_id, agent_id, task_id, input_state_version,"
+            " output_state_version, commit_hash, committed_by, committed_at, occ_conflict)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    c.commit_id,
+                    c.agent_id,
+                    c.task_id,
+                    c.input_state_version,
+                    c.output_state_version,
+                    c.commit_hash,
+                    c.committed_by,
+                    c.committed_at,
+                    int(c.occ_conflict),
+                )
+                for c in commits
+            ],
+        )
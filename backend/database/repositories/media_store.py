@@ -0,0 +1,151 @@
+"""
+Media Store
+
+Content-addressed store for downloaded media (skill_download_youtube).
+
+Files live under ``root`` named by their SHA-256; a SQLite index maps source
+keys (video id plus variant, HTTP ETag) to digests, so media already on disk
+is found before anything is downloaded again, and identical bytes reached
+through different sources share one file. Partial downloads are kept under
+``root/partial`` so an interrupted transfer can resume with a range request.
+``root`` may be a mounted object storage bucket; ``base_url`` then turns
+stored paths into object storage URLs.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional, Tuple, Union
+
+BUFFER_SIZE = 1024 * 1024
+
+
+class StoredMedia(NamedTuple):
+    sha256: str
+    path: Path
+    url: str
+    size: int
+    mime_type: Optional[str]
+
+
+def file_sha256(path: Union[str, Path], buffer_size: int = BUFFER_SIZE) -> Tuple[str, int]:
+    """SHA-256 and size of a file, read through one reusable buffer."""
+    digest = hashlib.sha256()
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    size = 0
+    with open(path, "rb") as f:
+        while n := f.readinto(buffer):
+            digest.update(view[:n])
+            size += n
+    return digest.hexdigest(), size
+
+
+class MediaStore:
+    """
+    Content-addressed media files with a source-key index.
+
+    Args:
+        root: Directory holding media files and the index
+        base_url: Prefix for artifact URLs (default: local file paths)
+    """
+
+    def __init__(self, root: Union[str, Path], base_url: Optional[str] = None):
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.partial_dir = self.root / "partial"
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.root / "index.sqlite"), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS media ("
+            " sha256 TEXT PRIMARY KEY,"
+            " relpath TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " mime_type TEXT,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS media_keys ("
+            " key TEXT PRIMARY KEY,"
+            " sha256 TEXT NOT NULL REFERENCES media (sha256))"
+        )
+
+    def lookup(self, *keys: str) -> Optional[StoredMedia]:
+        """First stored file reachable from ``keys`` that still exists on disk."""
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT m.sha256, m.relpath, m.size, m.mime_type"
+                    " FROM media_keys k JOIN media m ON m.sha256 = k.sha256 WHERE k.key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and (self.root / row[1]).exists():
+                    return self._stored(*row)
+        return None
+
+    def partial_path(self, key: str, suffix: str = "") -> Path:
+        """Stable location of the partial download for ``key``."""
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.partial_dir / f"{name}{suffix}.part"
+
+    def commit(
+        self,
+        source: Path,
+        sha256: str,
+        size: int,
+        extension: str,
+        keys: Iterable[str],
+        mime_type: Optional[str] = None,
+    ) -> Tuple[StoredMedia, bool]:
+        """
+        Move a completed file into the store under its digest and index
+        ``keys`` plus ``sha256:<digest>``.
+
+        Returns:
+            ``(stored, duplicate)``; for a duplicate the existing file is kept
+            and ``source`` is deleted
+        """
+        relpath = f"{sha256[:2]}/{sha256}.{extension.lstrip('.')}"
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT relpath, size, mime_type FROM media WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+            duplicate = row is not None and (self.root / row[0]).exists()
+            if duplicate:
+                source.unlink()
+                relpath, size, mime_type = row
+            else:
+                target = self.root / relpath
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(source, target)
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO media (sha256, relpath, size, mime_type, created_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (sha256, relpath, size, mime_type, time.time()),
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO media_keys (key, sha256) VALUES (?, ?)",
+                    [(key, sha256) for key in [*keys, f"sha256:{sha256}"]],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self._stored(sha256, relpath, size, mime_type), duplicate
+
+    def _stored(self, sha256: str, relpath: str, size: int, mime_type: Optional[str]) -> StoredMedia:
+        path = self.root / relpath
+        url = f"{self.base_url}/{relpath}" if self.base_url else str(path)
+        return StoredMedia(sha256, path, url, size, mime_type)
+
+    def close(self) -> None:
+        self._conn.close()
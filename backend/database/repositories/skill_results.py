@@ -0,0 +1,275 @@
+"""
+Skill Result Store
+
+Content-addressed idempotency cache for skill execution (skills/README.md:
+"check for existing results before execution"; W-006).
+
+Results are keyed by ``skill_name``, ``task_id`` and a canonical SHA-256 of
+the validated input model, so a retried ``execute_render_video`` with the same
+input returns the stored result instead of repeating a costly generation,
+while a task re-issued with different input is executed afresh. Concurrent
+executions of the same key share one in-flight future. Results are stored as
+compact (optionally zlib-compressed) JSON blobs in a byte-bounded LRU backed
+by memory or SQLite.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Protocol, Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Blob header bytes: payloads above the threshold are compressed.
+_RAW = b"j"
+_ZLIB = b"z"
+COMPRESS_THRESHOLD = 512
+
+
+def canonical_input_hash(input_data: BaseModel) -> str:
+    """SHA-256 of the input model's canonical JSON (sorted keys, no spaces)."""
+    payload = json.dumps(
+        input_data.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def result_key(skill_name: str, input_data: BaseModel) -> str:
+    return f"{skill_name}:{input_data.task_id}:{canonical_input_hash(input_data)}"
+
+
+def encode_blob(result: Dict[str, Any]) -> bytes:
+    raw = json.dumps(result, separators=(",", ":")).encode("utf-8")
+    if len(raw) > COMPRESS_THRESHOLD:
+        compressed = zlib.compress(raw, 6)
+        if len(compressed) < len(raw):
+            return _ZLIB + compressed
+    return _RAW + raw
+
+
+def decode_blob(blob: bytes) -> Dict[str, Any]:
+    header, body = blob[:1], blob[1:]
+    if header == _ZLIB:
+        body = zlib.decompress(body)
+    elif header != _RAW:
+        raise ValueError(f"unknown result blob header: {header!r}")
+    return json.loads(body)
+
+
+class BlobStore(Protocol):
+    """Byte-bounded key/blob storage used by :class:`SkillResultStore`."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    def put(self, key: str, blob: bytes) -> int:
+        """Store ``blob``; returns the number of entries evicted to fit it."""
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+
+class InMemoryBlobStore:
+    """LRU blob store bounded by total blob bytes."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._blobs: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            blob = self._blobs.get(key)
+            if blob is not None:
+                self._blobs.move_to_end(key)
+            return blob
+
+    def put(self, key: str, blob: bytes) -> int:
+        if len(blob) > self.max_bytes:
+            return 0
+        with self._lock:
+            previous = self._blobs.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous)
+            evicted = 0
+            while self._blobs and self.total_bytes + len(blob) > self.max_bytes:
+                _, old = self._blobs.popitem(last=False)
+                self.total_bytes -= len(old)
+                evicted += 1
+            self._blobs[key] = blob
+            self.total_bytes += len(blob)
+            return evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            blob = self._blobs.pop(key, None)
+            if blob is not None:
+                self.total_bytes -= len(blob)
+
+
+class SQLiteBlobStore:
+    """
+    LRU blob store in SQLite, bounded by total blob bytes.
+
+    Use ``":memory:"`` for tests; a file path gives a store shared by every
+    Worker process on the host.
+    """
+
+    def __init__(self, path: str = ":memory:", max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS skill_results ("
+            " key TEXT PRIMARY KEY,"
+            " blob BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_skill_results_accessed"
+            " ON skill_results (accessed_at)"
+        )
+
+    @property
+    def total_bytes(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM skill_results").fetchone()
+        return int(row[0])
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM skill_results").fetchone()[0])
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blob FROM skill_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE skill_results SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            return bytes(row[0])
+
+    def put(self, key: str, blob: bytes) -> int:
+        if len(blob) > self.max_bytes:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM skill_results WHERE key = ?", (key,))
+                used = self._conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM skill_results"
+                ).fetchone()[0]
+                evicted = 0
+                overflow = used + len(blob) - self.max_bytes
+                if overflow > 0:
+                    victims = []
+                    for victim, size in self._conn.execute(
+                        "SELECT key, size FROM skill_results ORDER BY accessed_at"
+                    ):
+                        victims.append((victim,))
+                        overflow -= size
+                        if overflow <= 0:
+                            break
+                    self._conn.executemany("DELETE FROM skill_results WHERE key = ?", victims)
+                    evicted = len(victims)
+                self._conn.execute(
+                    "INSERT INTO skill_results (key, blob, size, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, blob, len(blob), time.time()),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM skill_results WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@dataclass
+class ResultStoreStats:
+    hits: int = 0
+    misses: int = 0
+    inflight_joins: int = 0
+    evictions: int = 0
+    stored_bytes: int = 0
+
+
+class SkillResultStore:
+    """
+    Idempotency layer in front of skill execution.
+
+    :meth:`get_or_execute` returns a stored result for the same skill, task
+    and canonical input, joins an identical in-flight execution, or runs the
+    skill and stores its output. Failures are never cached.
+    """
+
+    def __init__(self, blobs: Optional[BlobStore] = None):
+        self.blobs: BlobStore = blobs if blobs is not None else InMemoryBlobStore()
+        self.stats = ResultStoreStats()
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    def lookup(
+        self, skill_name: str, input_data: BaseModel, output_model: Type[ModelT]
+    ) -> Optional[ModelT]:
+        blob = self.blobs.get(result_key(skill_name, input_data))
+        if blob is None:
+            return None
+        return output_model.model_validate(decode_blob(blob))
+
+    async def get_or_execute(
+        self,
+        skill_name: str,
+        input_data: BaseModel,
+        output_model: Type[ModelT],
+        execute: Callable[[], Awaitable[ModelT]],
+    ) -> ModelT:
+        key = result_key(skill_name, input_data)
+        blob = self.blobs.get(key)
+        if blob is not None:
+            self.stats.hits += 1
+            return output_model.model_validate(decode_blob(blob))
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.inflight_joins += 1
+            return await asyncio.shield(task)
+
+        self.stats.misses += 1
+        task = asyncio.ensure_future(self._execute_and_store(key, execute))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _execute_and_store(
+        self, key: str, execute: Callable[[], Awaitable[ModelT]]
+    ) -> ModelT:
+        output = await execute()
+        blob = encode_blob(output.model_dump(mode="json"))
+        self.stats.evictions += self.blobs.put(key, blob)
+        self.stats.stored_bytes += len(blob)
+        return output
+
+    def invalidate(self, skill_name: str, input_data: BaseModel) -> None:
+        self.blobs.delete(result_key(skill_name, input_data))
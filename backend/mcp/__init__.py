@@ -0,0 +1,7 @@
+"""
+Model Context Protocol integration.
+
+All external interactions in Chimera route through MCP servers
+(specs/_meta.md Section 2.3). This package holds the client abstractions
+used by Planner, Worker and Judge services.
+"""
@@ -0,0 +1,10 @@
+"""
+MCP client implementations for external services.
+
+The pooled client lives in :mod:`backend.mcp.clients.pooled` and is not
+re-exported here, so importing the base interface stays cheap.
+"""
+
+from backend.mcp.clients.base import MCPClient, MCPError
+
+__all__ = ["MCPClient", "MCPError"]
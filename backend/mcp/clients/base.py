@@ -0,0 +1,32 @@
+"""
+MCP client interface.
+
+Every skill ``execute_*`` function and every service that reaches an external
+provider receives an object satisfying :class:`MCPClient`. Concrete
+implementations live alongside this module.
+"""
+
+from typing import Any, Dict, Optional, Protocol, runtime_checkable
+
+
+class MCPError(Exception):
+    """Raised when an MCP server returns an error or cannot be reached."""
+
+    def __init__(self, message: str, code: Optional[str] = None):
+        super().__init__(message)
+        self.code = code
+
+
+@runtime_checkable
+class MCPClient(Protocol):
+    """Minimal surface Chimera services rely on when talking to MCP servers."""
+
+    async def call_tool(
+        self, server: str, tool: str, arguments: Dict[str, Any]
+    ) -> Any:
+        """Invoke ``tool`` on ``server`` (e.g. ``mcp-server-twitter``)."""
+        ...
+
+    async def read_resource(self, uri: str) -> Any:
+        """Fetch an MCP Resource such as ``twitter://mentions/recent``."""
+        ...
@@ -0,0 +1,407 @@
+"""
+Pooled MCP Client
+
+:class:`MCPClient` implementation that keeps persistent stdio sessions to
+each MCP server instead of opening (and handshaking) a session per task.
+
+- Each server gets a small pool of sessions; requests are pipelined over a
+  session (many JSON-RPC requests in flight, responses matched by id) and
+  spread over the pool by least in-flight count. Dead sessions are replaced
+  on next use.
+- Token buckets throttle calls per server and per ``server/tool``
+  (CC-001 rate-limit awareness).
+- Concurrent identical ``read_resource`` calls share one fetch.
+- Every call is timed into a per-``server/tool`` :class:`LatencyHistogram`.
+"""
+
+import asyncio
+import bisect
+import itertools
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from backend.mcp.clients.base import MCPError
+
+PROTOCOL_VERSION = "2025-06-18"
+CLIENT_INFO = {"name": "chimera", "version": "0.1.0"}
+
+
+@dataclass
+class ServerConfig:
+    """
+    How to launch one MCP server.
+
+    Args:
+        command: Executable and arguments of the stdio server
+        env: Extra environment variables for the server process
+        cwd: Working directory of the server process
+        pool_size: Maximum concurrent sessions to this server
+        max_inflight: Pipelined requests per session before a new session opens
+    """
+
+    command: List[str]
+    env: Optional[Dict[str, str]] = None
+    cwd: Optional[str] = None
+    pool_size: int = 2
+    max_inflight: int = 32
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens per second up to ``burst``.
+
+    Args:
+        rate: Sustained calls per second
+        burst: Bucket capacity (default: ``max(1, rate)``)
+        clock: Monotonic time source
+    """
+
+    def __init__(
+        self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it."""
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1.0
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> float:
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class LatencyHistogram:
+    """Log-spaced latency histogram (0.25 ms to ~2 min buckets, in seconds)."""
+
+    BOUNDS: Tuple[float, ...] = tuple(0.00025 * 2 ** (i / 2) for i in range(38))
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q``-th percentile (0-100)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bucket, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return self.BOUNDS[bucket] if bucket < len(self.BOUNDS) else self.max
+        return self.max
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Non-empty ``(upper_bound_seconds, count)`` pairs; the last bound may be ``inf``."""
+        bounds = list(self.BOUNDS) + [float("inf")]
+        return [(bounds[i], n) for i, n in enumerate(self.counts) if n]
+
+
+@dataclass
+class PooledClientStats:
+    sessions_opened: int = 0
+    requests: int = 0
+    resource_fetches: int = 0
+    resource_coalesced: int = 0
+    throttled: int = 0
+    throttled_seconds: float = 0.0
+    latency: Dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    @property
+    def requests_per_session(self) -> float:
+        return self.requests / self.sessions_opened if self.sessions_opened else 0.0
+
+
+class StdioSession:
+    """One initialized MCP session over a server's stdin/stdout, with pipelining."""
+
+    def __init__(self, name: str, config: ServerConfig):
+        self.name = name
+        self.config = config
+        self.inflight = 0
+        self.closed = False
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+
+    async def start(self) -> None:
+        env = {**os.environ, **self.config.env} if self.config.env else None
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                *self.config.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                env=env,
+                cwd=self.config.cwd,
+                limit=16 * 1024 * 1024,
+            )
+        except OSError as exc:
+            raise MCPError(f"{self.name}: cannot start server: {exc}", "unavailable") from exc
+        self._reader = asyncio.ensure_future(self._read_loop())
+        await self.request(
+            "initialize",
+            {"protocolVersion": PROTOCOL_VERSION, "capabilities": {}, "clientInfo": CLIENT_INFO},
+        )
+        await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    async def request(self, method: str, params: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        if self.closed:
+            raise MCPError(f"{self.name}: session closed", "unavailable")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self.inflight += 1
+        try:
+            await self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise MCPError(f"{self.name}: {method} timed out after {timeout}s", "timeout") from None
+        finally:
+            self.inflight -= 1
+            self._pending.pop(request_id, None)
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        assert self._process is not None and self._process.stdin is not None
+        try:
+            self._process.stdin.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+            await self._process.stdin.drain()
+        except (ConnectionError, RuntimeError) as exc:
+            self._fail_all(f"{self.name}: write failed: {exc}")
+            raise MCPError(f"{self.name}: session closed", "unavailable") from exc
+
+    async def _read_loop(self) -> None:
+        assert self._process is not None and self._process.stdout is not None
+        stdout = self._process.stdout
+        try:
+            while line := await stdout.readline():
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue  # servers may log non-protocol lines
+                if not isinstance(message, dict):
+                    continue  # ... some of which happen to parse as JSON
+                future = self._pending.get(message.get("id"))
+                if future is None or future.done() or "method" in message:
+                    continue  # server notifications and requests are not used
+                error = message.get("error")
+                if isinstance(error, dict):
+                    future.set_exception(
+                        MCPError(f"{self.name}: {error.get('message')}", str(error.get("code")))
+                    )
+                elif error is not None:
+                    future.set_exception(MCPError(f"{self.name}: {error}"))
+                else:
+                    future.set_result(message.get("result"))
+        finally:
+            self._fail_all(f"{self.name}: server closed the session")
+
+    def _fail_all(self, reason: str) -> None:
+        self.closed = True
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(MCPError(reason, "unavailable"))
+
+    async def close(self) -> None:
+        self.closed = True
+        process = self._process
+        if process is None:
+            return
+        if process.stdin is not None and not process.stdin.is_closing():
+            process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), 2.0)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+
+
+class _ServerPool:
+    def __init__(self, name: str, config: ServerConfig, stats: PooledClientStats):
+        self.name = name
+        self.config = config
+        self.stats = stats
+        self.sessions: List[StdioSession] = []
+        self._opening: Optional[asyncio.Task] = None
+
+    async def session(self) -> StdioSession:
+        """Least-loaded live session, opening one while all are busy and the pool has room."""
+        while True:
+            self.sessions = [s for s in self.sessions if not s.closed]
+            best = min(self.sessions, key=lambda s: s.inflight, default=None)
+            if best is not None and (best.inflight == 0 or len(self.sessions) >= self.config.pool_size):
+                return best
+            if self._opening is None:
+                self._opening = asyncio.ensure_future(self._open())
+                self._opening.add_done_callback(self._opened)
+            if best is not None and best.inflight < self.config.max_inflight:
+                return best  # keep pipelining while the new session handshakes
+            await asyncio.shield(self._opening)
+
+    def _opened(self, task: asyncio.Task) -> None:
+        self._opening = None
+        if not task.cancelled():
+            task.exception()  # surfaced to waiters; mark retrieved for background opens
+
+    async def _open(self) -> None:
+        session = StdioSession(self.name, self.config)
+        try:
+            await session.start()
+        except BaseException:
+            await session.close()
+            raise
+        self.sessions.append(session)
+        self.stats.sessions_opened += 1
+
+    async def close(self) -> None:
+        sessions, self.sessions = self.sessions, []
+        await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+
+
+class PooledMCPClient:
+    """
+    Pooled, pipelined, rate-limited :class:`MCPClient`.
+
+    Args:
+        servers: Launch configuration per server name (e.g. ``mcp-server-twitter``)
+        rate_limits: ``(rate_per_second, burst)`` keyed by ``server`` or
+            ``server/tool``; a call must clear both its buckets
+        resource_servers: URI scheme to server name for ``read_resource``
+            (default: ``mcp-server-<scheme>``)
+        request_timeout: Seconds to wait for any single response
+        clock: Monotonic time source for rate limiting
+    """
+
+    def __init__(
+        self,
+        servers: Mapping[str, ServerConfig],
+        rate_limits: Optional[Mapping[str, Tuple[float, float]]] = None,
+        resource_servers: Optional[Mapping[str, str]] = None,
+        request_timeout: Optional[float] = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.stats = PooledClientStats()
+        self.request_timeout = request_timeout
+        self.resource_servers = dict(resource_servers or {})
+        self._pools = {name: _ServerPool(name, config, self.stats) for name, config in servers.items()}
+        self._buckets = {
+            key: TokenBucket(rate, burst, clock) for key, (rate, burst) in (rate_limits or {}).items()
+        }
+        self._reads: Dict[str, asyncio.Task] = {}
+
+    @property
+    def latency(self) -> Dict[str, LatencyHistogram]:
+        """Per ``server/tool`` latency histograms (resource reads use ``server/resources/read``)."""
+        return self.stats.latency
+
+    async def call_tool(self, server: str, tool: str, arguments: Dict[str, Any]) -> Any:
+        result = await self._request(
+            server, tool, "tools/call", {"name": tool, "arguments": arguments}
+        )
+        return _tool_payload(server, tool, result)
+
+    async def read_resource(self, uri: str) -> Any:
+        task = self._reads.get(uri)
+        if task is None:
+            task = asyncio.ensure_future(self._read(uri))
+            self._reads[uri] = task
+            task.add_done_callback(lambda _: self._reads.pop(uri, None))
+            self.stats.resource_fetches += 1
+        else:
+            self.stats.resource_coalesced += 1
+        return await asyncio.shield(task)
+
+    async def _read(self, uri: str) -> Any:
+        scheme = uri.split("://", 1)[0]
+        server = self.resource_servers.get(scheme, f"mcp-server-{scheme}")
+        result = await self._request(server, "resources/read", "resources/read", {"uri": uri})
+        return _resource_payload(result)
+
+    async def _request(self, server: str, tool: str, method: str, params: Dict[str, Any]) -> Any:
+        pool = self._pools.get(server)
+        if pool is None:
+            raise MCPError(f"unknown MCP server: {server}", "unknown_server")
+        for key in (server, f"{server}/{tool}"):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                waited = await bucket.acquire()
+                if waited:
+                    self.stats.throttled += 1
+                    self.stats.throttled_seconds += waited
+        session = await pool.session()
+        self.stats.requests += 1
+        started = time.perf_counter()
+        try:
+            return await session.request(method, params, self.request_timeout)
+        finally:
+            histogram = self.stats.latency.get(f"{server}/{tool}")
+            if histogram is None:
+                histogram = self.stats.latency[f"{server}/{tool}"] = LatencyHistogram()
+            histogram.observe(time.perf_counter() - started)
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*(pool.close() for pool in self._pools.values()))
+
+    async def __aenter__(self) -> "PooledMCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+def _tool_payload(server: str, tool: str, result: Any) -> Any:
+    if not isinstance(result, dict):
+        return result
+    content = result.get("content") or []
+    texts = [c.get("text", "") for c in content if c.get("type") == "text"]
+    if result.get("isError"):
+        raise MCPError(f"{server}/{tool}: {' '.join(texts) or 'tool error'}", "tool_error")
+    if "structuredContent" in result:
+        return result["structuredContent"]
+    if len(texts) == 1:
+        try:
+            return json.loads(texts[0])
+        except ValueError:
+            return texts[0]
+    return result
+
+
+def _resource_payload(result: Any) -> Any:
+    contents = result.get("contents") if isinstance(result, dict) else None
+    if not contents:
+        return result
+    first = contents[0]
+    if "text" not in first:
+        return first
+    if (first.get("mimeType") or "").endswith("json"):
+        return json.loads(first["text"])
+    return first["text"]
@@ -0,0 +1,123 @@
+"""
+Fake MCP server for local tests and load experiments.
+
+Speaks MCP's newline-delimited JSON-RPC 2.0 over stdio and handles requests
+concurrently, so pipelined clients see out-of-order responses. Tools:
+
+- ``echo``: returns its arguments
+- ``sleep``: waits ``seconds`` then returns them
+- ``fail``: returns an ``isError`` tool result
+- ``stats``: returns request counters for this process
+- ``log``: writes each of ``lines`` raw to stdout, then echoes its arguments
+
+Any other tool echoes ``{"tool": name, "arguments": ...}``. ``resources/read``
+returns ``{"uri": uri, "read": n}`` as JSON text after ``--latency-ms``.
+
+Usage:
+    python -m backend.mcp.fake_server --name mcp-server-fake --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import Counter
+from typing import Any, Dict
+
+PROTOCOL_VERSION = "2025-06-18"
+
+
+class FakeMCPServer:
+    def __init__(self, name: str, latency: float):
+        self.name = name
+        self.latency = latency
+        self.counters: Counter = Counter()
+
+    async def handle(self, message: Dict[str, Any]) -> Any:
+        method = message.get("method")
+        params = message.get("params") or {}
+        self.counters[method] += 1
+        if method == "initialize":
+            return {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {"tools": {}, "resources": {}},
+                "serverInfo": {"name": self.name, "version": "0.0.0"},
+            }
+        if method == "tools/call":
+            return await self.call_tool(params.get("name"), params.get("arguments") or {})
+        if method == "resources/read":
+            uri = params["uri"]
+            self.counters[f"read:{uri}"] += 1
+            await asyncio.sleep(self.latency)
+            text = json.dumps({"uri": uri, "read": self.counters[f"read:{uri}"]})
+            return {"contents": [{"uri": uri, "mimeType": "application/json", "text": text}]}
+        raise LookupError(f"method not found: {method}")
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        self.counters[f"tool:{name}"] += 1
+        await asyncio.sleep(self.latency)
+        if name == "echo":
+            payload: Any = arguments
+        elif name == "sleep":
+            await asyncio.sleep(float(arguments.get("seconds", 0)))
+            payload = arguments
+        elif name == "fail":
+            return {
+                "content": [{"type": "text", "text": arguments.get("message", "tool failed")}],
+                "isError": True,
+            }
+        elif name == "stats":
+            payload = dict(self.counters)
+        elif name == "log":
+            for line in arguments.get("lines", []):
+                sys.stdout.write(f"{line}\n")
+            sys.stdout.flush()
+            payload = arguments
+        else:
+            payload = {"tool": name, "arguments": arguments}
+        return {
+            "content": [{"type": "text", "text": json.dumps(payload)}],
+            "structuredContent": payload,
+        }
+
+    async def respond(self, message: Dict[str, Any], write) -> None:
+        try:
+            result = await self.handle(message)
+            reply = {"jsonrpc": "2.0", "id": message["id"], "result": result}
+        except LookupError as exc:
+            reply = {"jsonrpc": "2.0", "id": message["id"], "error": {"code": -32601, "message": str(exc)}}
+        except Exception as exc:
+            reply = {"jsonrpc": "2.0", "id": message["id"], "error": {"code": -32603, "message": str(exc)}}
+        write(reply)
+
+    async def serve(self) -> None:
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=16 * 1024 * 1024)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+        def write(reply: Dict[str, Any]) -> None:
+            sys.stdout.write(json.dumps(reply, separators=(",", ":")) + "\n")
+            sys.stdout.flush()
+
+        pending = set()
+        while line := await reader.readline():
+            message = json.loads(line)
+            if "id" not in message:
+                continue  # notification
+            task = asyncio.ensure_future(self.respond(message, write))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--name", default="mcp-server-fake")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(FakeMCPServer(args.name, args.latency_ms / 1e3).serve())
+
+
+if __name__ == "__main__":
+    main()
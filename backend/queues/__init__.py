@@ -0,0 +1,3 @@
+"""
+Queue management for task_queue, review_queue and hitl_queue.
+"""
@@ -0,0 +1,356 @@
+"""
+HITL Queue
+
+SQLite-backed store for the Judge's ``hitl_queue`` behind
+``GET /dashboard/hitl-queue`` and the approve/reject endpoints
+(specs/technical.md Sections 2.5.1-2.5.3, table ``hitl_approvals``).
+
+Pending reviews are ordered by ``(pending_since, review_id)``. Each dashboard
+filter has a partial index on that key covering only pending rows of its
+category, so a page is an index range scan regardless of queue depth:
+keyset pagination (``cursor``) seeks straight to the page, while the offset
+API is kept for compatibility. ``total_count`` comes from counters maintained
+in the same transaction as every enqueue and decision, never from a COUNT
+scan. Approve and reject are primary-key updates, O(log n).
+"""
+
+import base64
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+HITLFilter = Literal["all", "sensitive", "low_confidence", "financial"]
+FILTERS: Tuple[str, ...] = ("all", "sensitive", "low_confidence", "financial")
+
+SENSITIVE_TAGS = frozenset({"politics", "health", "finance", "financial", "religion", "sensitive"})
+FINANCIAL_TAGS = frozenset({"finance", "financial", "transaction", "payment"})
+
+
+class HITLQueueItem(BaseModel):
+    review_id: str
+    result_id: str
+    agent_id: str
+    artifact: Dict[str, Any]
+    confidence_score: float
+    risk_tags: List[str] = []
+    judge_reasoning: str = ""
+    created_at: datetime
+    pending_since: datetime
+
+
+class HITLQueuePage(BaseModel):
+    """``GET /dashboard/hitl-queue`` response, plus a keyset cursor."""
+
+    items: List[HITLQueueItem]
+    total_count: int
+    has_more: bool
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class HITLDecision:
+    """A recorded ``hitl_approvals`` row."""
+
+    approval_id: str
+    review_id: str
+    agent_id: str
+    decision: str
+    artifact_hash: str
+    policy_version: str
+
+
+def _encode_cursor(pending_since: float, review_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{pending_since!r}|{review_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[float, str]:
+    try:
+        pending_since, review_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return float(pending_since), review_id
+    except ValueError:
+        raise ValueError(f"invalid cursor: {cursor!r}") from None
+
+
+def _timestamp(value: Any) -> float:
+    if value is None:
+        return time.time()
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class HITLQueue:
+    """
+    Pending HITL reviews with filtered keyset pagination.
+
+    Args:
+        path: SQLite database path (``":memory:"`` for tests)
+        low_confidence_threshold: Reviews below this ``confidence_score``
+            match the ``low_confidence`` filter
+        clock: Wall-clock time source for ``pending_since``
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        low_confidence_threshold: float = 0.8,
+        clock=time.time,
+    ):
+        self.low_confidence_threshold = low_confidence_threshold
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS hitl_queue (
+                review_id TEXT PRIMARY KEY,
+                result_id TEXT NOT NULL,
+                agent_id TEXT NOT NULL,
+                artifact TEXT NOT NULL,
+                confidence_score REAL NOT NULL,
+                risk_tags TEXT NOT NULL,
+                judge_reasoning TEXT NOT NULL,
+                policy_version TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                pending_since REAL NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                is_sensitive INTEGER NOT NULL,
+                is_low_confidence INTEGER NOT NULL,
+                is_financial INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_hitl_all
+                ON hitl_queue (pending_since, review_id) WHERE status = 'pending';
+            CREATE INDEX IF NOT EXISTS idx_hitl_sensitive
+                ON hitl_queue (pending_since, review_id)
+                WHERE status = 'pending' AND is_sensitive = 1;
+            CREATE INDEX IF NOT EXISTS idx_hitl_low_confidence
+                ON hitl_queue (pending_since, review_id)
+                WHERE status = 'pending' AND is_low_confidence = 1;
+            CREATE INDEX IF NOT EXISTS idx_hitl_financial
+                ON hitl_queue (pending_since, review_id)
+                WHERE status = 'pending' AND is_financial = 1;
+            CREATE TABLE IF NOT EXISTS hitl_counters (
+                filter TEXT PRIMARY KEY,
+                pending INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS hitl_approvals (
+                approval_id TEXT PRIMARY KEY,
+                review_id TEXT NOT NULL,
+                reviewer_id TEXT NOT NULL,
+                decision TEXT NOT NULL,
+                artifact_hash TEXT NOT NULL,
+                policy_version TEXT NOT NULL,
+                notes TEXT,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_hitl_approvals_review ON hitl_approvals (review_id);
+            """
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO hitl_counters (filter, pending) VALUES (?, 0)",
+            [(name,) for name in FILTERS],
+        )
+
+    def enqueue(self, review: Dict[str, Any]) -> None:
+        self.enqueue_many([review])
+
+    def enqueue_many(self, reviews: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add Judge reviews routed to ``hitl_queue``.
+
+        Each review needs ``review_id``, ``result_id``, ``agent_id``,
+        ``artifact`` and ``confidence_score``; ``risk_tags``,
+        ``judge_reasoning``, ``policy_version`` and ``created_at`` are
+        optional. Returns the number enqueued.
+        """
+        now = self._clock()
+        rows = []
+        counts = dict.fromkeys(FILTERS, 0)
+        for review in reviews:
+            tags = list(review.get("risk_tags") or [])
+            flags = self._flags(review["confidence_score"], tags)
+            rows.append(
+                (
+                    str(review["review_id"]),
+                    str(review["result_id"]),
+                    review["agent_id"],
+                    json.dumps(review["artifact"], separators=(",", ":")),
+                    float(review["confidence_score"]),
+                    json.dumps(tags),
+                    review.get("judge_reasoning", ""),
+                    review.get("policy_version", ""),
+                    _timestamp(review.get("created_at")),
+                    now,
+                    *(int(flags[name]) for name in FILTERS[1:]),
+                )
+            )
+            for name, flag in flags.items():
+                counts[name] += flag
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO hitl_queue (review_id, result_id, agent_id, artifact,"
+                    " confidence_score, risk_tags, judge_reasoning, policy_version,"
+                    " created_at, pending_since, is_sensitive, is_low_confidence, is_financial)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._bump_counters(counts, +1)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def total_count(self, filter: HITLFilter = "all") -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT pending FROM hitl_counters WHERE filter = ?", (self._check_filter(filter),)
+            ).fetchone()
+        return int(row[0])
+
+    def list(
+        self,
+        filter: HITLFilter = "all",
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> HITLQueuePage:
+        """
+        One page of pending reviews, oldest first.
+
+        Pass the previous page's ``next_cursor`` as ``cursor`` for keyset
+        pagination; ``offset`` is honoured only without a cursor.
+        """
+        self._check_filter(filter)
+        where = "status = 'pending'"
+        if filter != "all":
+            where += f" AND is_{filter} = 1"
+        params: List[Any] = []
+        if cursor is not None:
+            where += " AND (pending_since, review_id) > (?, ?)"
+            params.extend(_decode_cursor(cursor))
+        sql = (
+            "SELECT review_id, result_id, agent_id, artifact, confidence_score, risk_tags,"
+            " judge_reasoning, created_at, pending_since"
+            f" FROM hitl_queue INDEXED BY idx_hitl_{filter} WHERE {where}"
+            " ORDER BY pending_since, review_id LIMIT ? OFFSET ?"
+        )
+        params.extend((limit + 1, 0 if cursor is not None else offset))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        items = [
+            HITLQueueItem(
+                review_id=row[0],
+                result_id=row[1],
+                agent_id=row[2],
+                artifact=json.loads(row[3]),
+                confidence_score=row[4],
+                risk_tags=json.loads(row[5]),
+                judge_reasoning=row[6],
+                created_at=datetime.fromtimestamp(row[7], timezone.utc),
+                pending_since=datetime.fromtimestamp(row[8], timezone.utc),
+            )
+            for row in rows
+        ]
+        next_cursor = _encode_cursor(rows[-1][8], rows[-1][0]) if has_more else None
+        return HITLQueuePage(
+            items=items,
+            total_count=self.total_count(filter),
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
+
+    def approve(self, review_id: str, reviewer_id: str, notes: Optional[str] = None) -> HITLDecision:
+        return self._decide(review_id, reviewer_id, "approved", notes)
+
+    def reject(self, review_id: str, reviewer_id: str, reason: str = "") -> HITLDecision:
+        return self._decide(review_id, reviewer_id, "rejected", reason)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _decide(
+        self, review_id: str, reviewer_id: str, decision: str, notes: Optional[str]
+    ) -> HITLDecision:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT status, agent_id, artifact, policy_version, is_sensitive,"
+                    " is_low_confidence, is_financial FROM hitl_queue WHERE review_id = ?",
+                    (review_id,),
+                ).fetchone()
+                if row is None:
+                    raise KeyError(review_id)
+                status, agent_id, artifact, policy_version, *flags = row
+                if status != "pending":
+                    raise ValueError(f"review {review_id} already {status}")
+                self._conn.execute(
+                    "UPDATE hitl_queue SET status = ? WHERE review_id = ?", (decision, review_id)
+                )
+                counts = {"all": 1, **{name: flag for name, flag in zip(FILTERS[1:], flags)}}
+                self._bump_counters(counts, -1)
+                record = HITLDecision(
+                    approval_id=str(uuid.uuid4()),
+                    review_id=review_id,
+                    agent_id=agent_id,
+                    decision=decision,
+                    artifact_hash=hashlib.sha256(artifact.encode("utf-8")).hexdigest(),
+                    policy_version=policy_version,
+                )
+                self._conn.execute(
+                    "INSERT INTO hitl_approvals (approval_id, review_id, reviewer_id, decision,"
+                    " artifact_hash, policy_version, notes, created_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        record.approval_id,
+                        review_id,
+                        reviewer_id,
+                        decision,
+                        record.artifact_hash,
+                        policy_version,
+                        notes,
+                        self._clock(),
+                    ),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return record
+
+    def _flags(self, confidence_score: float, tags: Sequence[str]) -> Dict[str, bool]:
+        lowered = {tag.lower() for tag in tags}
+        return {
+            "all": True,
+            "sensitive": bool(lowered & SENSITIVE_TAGS),
+            "low_confidence": confidence_score < self.low_confidence_threshold,
+            "financial": bool(lowered & FINANCIAL_TAGS),
+        }
+
+    def _bump_counters(self, counts: Dict[str, int], sign: int) -> None:
+        self._conn.executemany(
+            "UPDATE hitl_counters SET pending = pending + ? WHERE filter = ?",
+            [(sign * count, name) for name, count in counts.items() if count],
+        )
+
+    @staticmethod
+    def _check_filter(filter: str) -> str:
+        if filter not in FILTERS:
+            raise ValueError(f"invalid filter {filter!r}; expected one of {FILTERS}")
+        return filter
@@ -0,0 +1,380 @@
+"""
+Task Queue
+
+In-process asyncio scheduler for the Worker pool's ``task_queue`` (P-004,
+W-006, ``POST /worker/execute``). The Planner inserts task DAGs; a task is
+released to Workers only once every dependency has completed.
+
+Release is O(out-degree): each task keeps a count of unfinished dependencies
+that is decremented when a dependency completes, so the DAG is never
+rescanned. Ready tasks are dispatched by priority with aging -- a task's sort
+key is the time it became ready plus a per-priority offset -- so ``high``
+tasks go first but a ``low`` task that has waited long enough overtakes newer
+``high`` ones and never starves. Cycles are rejected at insertion time.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+
+from backend.database.models.tasks import Task
+
+PRIORITIES = ("high", "medium", "low")
+
+PENDING = "pending"
+EXECUTING = "executing"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+_FINISHED = (COMPLETED, FAILED, CANCELLED)
+
+
+class CycleError(ValueError):
+    """Raised when inserted tasks would make the task graph cyclic."""
+
+    def __init__(self, task_ids: Sequence[str]):
+        super().__init__(f"dependency cycle among tasks: {sorted(task_ids)}")
+        self.task_ids = list(task_ids)
+
+
+class UnknownDependencyError(KeyError):
+    """Raised when a task depends on a task the scheduler has never seen."""
+
+
+@dataclass
+class TaskRecord:
+    """Persisted form of a scheduled task."""
+
+    task_id: str
+    priority: str
+    dependencies: Tuple[str, ...]
+    status: str = PENDING
+    payload: Any = None
+
+
+class TaskStore(Protocol):
+    """Persistence layer for :class:`TaskScheduler`."""
+
+    def save_tasks(self, records: Sequence[TaskRecord]) -> None:
+        ...
+
+    def update_status(self, task_id: str, status: str) -> None:
+        ...
+
+    def load(self) -> Iterable[TaskRecord]:
+        ...
+
+
+class InMemoryTaskStore:
+    """Default :class:`TaskStore`; keeps records in a dict."""
+
+    def __init__(self) -> None:
+        self.records: Dict[str, TaskRecord] = {}
+
+    def save_tasks(self, records: Sequence[TaskRecord]) -> None:
+        for record in records:
+            self.records[record.task_id] = record
+
+    def update_status(self, task_id: str, status: str) -> None:
+        self.records[task_id].status = status
+
+    def load(self) -> Iterable[TaskRecord]:
+        return list(self.records.values())
+
+
+class _Node:
+    __slots__ = ("record", "waiting_on", "dependents")
+
+    def __init__(self, record: TaskRecord, waiting_on: int):
+        self.record = record
+        self.waiting_on = waiting_on
+        self.dependents: List["_Node"] = []
+
+
+@dataclass
+class SchedulerStats:
+    submitted: int = 0
+    released: int = 0
+    dispatched: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    dispatched_by_priority: Dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(PRIORITIES, 0)
+    )
+
+
+class TaskScheduler:
+    """
+    DAG-gated, priority-with-aging task queue.
+
+    Args:
+        store: Persistence layer (default: :class:`InMemoryTaskStore`)
+        aging_seconds: Head start of each priority level over the next one;
+            a ``low`` task waits at most ``2 * aging_seconds`` behind newly
+            readied ``high`` tasks
+        clock: Monotonic time source
+    """
+
+    def __init__(
+        self,
+        store: Optional[TaskStore] = None,
+        aging_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.store: TaskStore = store if store is not None else InMemoryTaskStore()
+        self.aging_seconds = aging_seconds
+        self.stats = SchedulerStats()
+        self._clock = clock
+        self._offsets = {p: i * aging_seconds for i, p in enumerate(PRIORITIES)}
+        self._nodes: Dict[str, _Node] = {}
+        self._ready: List[Tuple[float, int, _Node]] = []
+        self._seq = itertools.count()
+        self._unfinished = 0
+        self._getters: Deque["asyncio.Future[None]"] = deque()
+        self._idle: List["asyncio.Future[None]"] = []
+
+    def __len__(self) -> int:
+        return self._unfinished
+
+    @property
+    def ready_count(self) -> int:
+        return len(self._ready)
+
+    def status(self, task_id: str) -> str:
+        return self._nodes[task_id].record.status
+
+    def unfinished(self) -> List[str]:
+        """task_ids not yet completed, failed or cancelled, in insertion order."""
+        return [task_id for task_id, node in self._nodes.items() if node.record.status not in _FINISHED]
+
+    def submit(self, task: Task) -> None:
+        """Insert a spec Task model; its ``dependencies`` gate its release."""
+        self.add(
+            str(task.task_id),
+            task.priority,
+            [str(dep) for dep in task.dependencies],
+            payload=task,
+        )
+
+    def add(
+        self,
+        task_id: str,
+        priority: str = "medium",
+        dependencies: Iterable[str] = (),
+        payload: Any = None,
+    ) -> None:
+        """Insert one task whose dependencies are already known."""
+        self.add_many([(task_id, priority, tuple(dependencies), payload)])
+
+    def add_many(
+        self, tasks: Iterable[Tuple[str, str, Sequence[str], Any]]
+    ) -> None:
+        """
+        Insert a batch of ``(task_id, priority, dependencies, payload)``.
+
+        Dependencies may reference tasks already in the scheduler or other
+        tasks in the same batch, in any order. The batch is validated as a
+        whole: on :class:`CycleError`, :class:`UnknownDependencyError` or a
+        bad priority nothing is inserted. Cycle detection costs O(batch
+        size + batch edges), since existing tasks cannot depend on new ones.
+        """
+        batch: Dict[str, TaskRecord] = {}
+        for task_id, priority, dependencies, payload in tasks:
+            if priority not in self._offsets:
+                raise ValueError(f"invalid priority {priority!r} for task {task_id}")
+            if task_id in self._nodes or task_id in batch:
+                raise ValueError(f"duplicate task_id: {task_id}")
+            batch[task_id] = TaskRecord(task_id, priority, tuple(dependencies), payload=payload)
+        if not batch:
+            return
+        for record in batch.values():
+            for dep in record.dependencies:
+                if dep not in batch and dep not in self._nodes:
+                    raise UnknownDependencyError(dep)
+        self._check_acyclic(batch)
+
+        new_nodes = []
+        for record in batch.values():
+            node = _Node(record, 0)
+            self._nodes[record.task_id] = node
+            new_nodes.append(node)
+        doomed = []
+        for node in new_nodes:
+            for dep in node.record.dependencies:
+                parent = self._nodes[dep]
+                if parent.record.status == COMPLETED:
+                    continue
+                if parent.record.status in (FAILED, CANCELLED):
+                    doomed.append(node)
+                    continue
+                node.waiting_on += 1
+                parent.dependents.append(node)
+
+        self.store.save_tasks([node.record for node in new_nodes])
+        self.stats.submitted += len(new_nodes)
+        self._unfinished += len(new_nodes)
+        self._cancel_tree(doomed)
+        for node in new_nodes:
+            if node.waiting_on == 0 and node.record.status == PENDING:
+                self._push_ready(node)
+
+    def get_nowait(self) -> Optional[Tuple[str, Any]]:
+        """Pop the next ready task as ``(task_id, payload)``, or ``None``."""
+        while self._ready:
+            _, _, node = heapq.heappop(self._ready)
+            if node.record.status != PENDING:
+                continue  # cancelled while queued
+            self._set_status(node, EXECUTING)
+            self.stats.dispatched += 1
+            self.stats.dispatched_by_priority[node.record.priority] += 1
+            return node.record.task_id, node.record.payload
+        return None
+
+    async def get(self) -> Tuple[str, Any]:
+        """Wait for the next ready task."""
+        while True:
+            item = self.get_nowait()
+            if item is not None:
+                return item
+            waiter = asyncio.get_running_loop().create_future()
+            self._getters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if not waiter.done():
+                    waiter.cancel()
+
+    def complete(self, task_id: str) -> List[str]:
+        """Mark a task completed; returns the task_ids it released."""
+        node = self._finish(task_id, COMPLETED)
+        self.stats.completed += 1
+        released = []
+        for child in node.dependents:
+            if child.record.status != PENDING:
+                continue
+            child.waiting_on -= 1
+            if child.waiting_on == 0:
+                self._push_ready(child)
+                released.append(child.record.task_id)
+        node.dependents = []
+        return released
+
+    def fail(self, task_id: str) -> List[str]:
+        """Mark a task failed and cancel its descendants; returns them."""
+        node = self._finish(task_id, FAILED)
+        self.stats.failed += 1
+        dependents, node.dependents = node.dependents, []
+        return self._cancel_tree(dependents)
+
+    def requeue(self, task_id: str) -> None:
+        """Return an executing task to the ready queue (e.g. after an OCC retry)."""
+        node = self._nodes[task_id]
+        if node.record.status != EXECUTING:
+            raise ValueError(f"task {task_id} is {node.record.status}, not executing")
+        self._set_status(node, PENDING)
+        self._push_ready(node)
+
+    async def join(self) -> None:
+        """Wait until every inserted task has finished."""
+        if self._unfinished == 0:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._idle.append(waiter)
+        await waiter
+
+    @classmethod
+    def restore(cls, store: TaskStore, **options: Any) -> "TaskScheduler":
+        """Rebuild a scheduler from persisted records; executing tasks are requeued."""
+        scheduler = cls(store=store, **options)
+        records = list(store.load())
+        for record in records:
+            if record.status in _FINISHED:
+                scheduler._nodes[record.task_id] = _Node(record, 0)
+        scheduler.add_many(
+            (r.task_id, r.priority, r.dependencies, r.payload)
+            for r in records
+            if r.status not in _FINISHED
+        )
+        return scheduler
+
+    def _finish(self, task_id: str, status: str) -> _Node:
+        node = self._nodes[task_id]
+        if node.record.status in _FINISHED:
+            raise ValueError(f"task {task_id} already {node.record.status}")
+        self._set_status(node, status)
+        self._task_done()
+        return node
+
+    def _cancel_tree(self, roots: Iterable[_Node]) -> List[str]:
+        cancelled = []
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            if node.record.status in _FINISHED:
+                continue
+            self._set_status(node, CANCELLED)
+            self.stats.cancelled += 1
+            self._task_done()
+            cancelled.append(node.record.task_id)
+            stack.extend(node.dependents)
+            node.dependents = []
+        return cancelled
+
+    def _push_ready(self, node: _Node) -> None:
+        key = self._clock() + self._offsets[node.record.priority]
+        heapq.heappush(self._ready, (key, next(self._seq), node))
+        self.stats.released += 1
+        while self._getters:
+            waiter = self._getters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def _set_status(self, node: _Node, status: str) -> None:
+        node.record.status = status
+        self.store.update_status(node.record.task_id, status)
+
+    def _task_done(self) -> None:
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            for waiter in self._idle:
+                if not waiter.done():
+                    waiter.set_result(None)
+            self._idle.clear()
+
+    def _check_acyclic(self, batch: Dict[str, TaskRecord]) -> None:
+        # Kahn's algorithm restricted to edges inside the batch.
+        indegree = dict.fromkeys(batch, 0)
+        children: Dict[str, List[str]] = {}
+        for record in batch.values():
+            for dep in record.dependencies:
+                if dep in batch:
+                    indegree[record.task_id] += 1
+                    children.setdefault(dep, []).append(record.task_id)
+        frontier = [task_id for task_id, degree in indegree.items() if degree == 0]
+        visited = 0
+        while frontier:
+            task_id = frontier.pop()
+            visited += 1
+            for child in children.get(task_id, ()):
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    frontier.append(child)
+        if visited != len(batch):
+            raise CycleError([task_id for task_id, degree in indegree.items() if degree > 0])
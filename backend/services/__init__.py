@@ -0,0 +1,3 @@
+"""
+Core business logic services organized by domain.
+"""
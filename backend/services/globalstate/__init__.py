@@ -0,0 +1,10 @@
+"""
+GlobalState service: versioned per-agent state with OCC commits.
+"""
+
+from backend.services.globalstate.commit_service import (
+    CommitServiceStats,
+    GlobalStateCommitService,
+)
+
+__all__ = ["CommitServiceStats", "GlobalStateCommitService"]
@@ -0,0 +1,83 @@
+"""
+Request and response schemas for the GlobalState and Judge commit APIs
+(specs/technical.md Sections 2.3.2 and 2.4).
+"""
+
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+ChangeAction = Literal["add", "update", "remove"]
+
+
+class Goal(BaseModel):
+    goal_id: str
+    description: str = ""
+    status: str = Field(default="active", pattern="^(active|completed|cancelled)$")
+    priority: str = "medium"
+
+
+class Campaign(BaseModel):
+    campaign_id: str
+    name: str = ""
+    status: str = Field(default="active", pattern="^(active|paused|completed)$")
+    budget_remaining: float = 0.0
+
+
+class GoalChange(BaseModel):
+    action: ChangeAction
+    goal: Goal
+
+
+class CampaignChange(BaseModel):
+    action: ChangeAction
+    campaign: Campaign
+
+
+class StateUpdates(BaseModel):
+    goals: List[GoalChange] = []
+    campaigns: List[CampaignChange] = []
+
+
+class UpdateStateRequest(BaseModel):
+    """``POST /globalstate/update`` request."""
+
+    agent_id: str
+    input_state_version: int
+    updates: StateUpdates
+    commit_hash: str
+
+
+class CommitError(BaseModel):
+    code: Literal["occ_conflict", "validation_failed", "internal_error"]
+    message: str
+
+
+class UpdateStateResponse(BaseModel):
+    """``POST /globalstate/update`` response."""
+
+    updated: bool
+    new_state_version: int
+    error: Optional[CommitError] = None
+
+
+class CommitResultRequest(BaseModel):
+    """``POST /judge/commit`` request."""
+
+    review_id: str
+    result_id: str
+    agent_id: str
+    task_id: str
+    input_state_version: int
+    output_state_version: int
+    commit_hash: str
+    routing_decision: Dict[str, Any] = {}
+
+
+class CommitResultResponse(BaseModel):
+    """``POST /judge/commit`` response."""
+
+    commit_id: str
+    committed: bool
+    new_state_version: int
+    error: Optional[CommitError] = None
@@ -0,0 +1,9 @@
+"""
+Judge service: quality validation, policy enforcement and HITL routing.
+"""
+
+from backend.services.judge.cfo import CFOJudge, CostRecorder
+from backend.services.judge.policy_engine import CompiledPolicy, PolicyEngine
+from backend.services.judge.status_judge import StatusJudge
+
+__all__ = ["CFOJudge", "CompiledPolicy", "CostRecorder", "PolicyEngine", "StatusJudge"]
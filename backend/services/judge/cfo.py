@@ -0,0 +1,195 @@
+"""
+CFO Judge
+
+Budget governance over the :class:`CostLedger` (specs/technical.md Section
+2.3.3, S-003):
+
+- :class:`CFOJudge` handles ``POST /judge/cfo/validate-transaction`` with one
+  atomic check-and-charge per transaction, so concurrent Judges sharing a
+  ledger never approve past a budget;
+- :class:`CostRecorder` logs the costs Workers incur after each MCP tool
+  call, buffering events and appending them to the ledger in batches.
+
+Pass an ``executor`` to run the blocking ledger calls off the event loop.
+"""
+
+import asyncio
+import uuid
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, TypeVar
+
+from backend.database.repositories.cost_ledger import CostEvent, CostLedger
+from backend.services.judge.models import (
+    BudgetContext,
+    ValidateTransactionRequest,
+    ValidateTransactionResponse,
+)
+
+T = TypeVar("T")
+
+SKILL_COST_CATEGORIES = {
+    "skill_generate_content": "inference",
+    "skill_transcribe_audio": "inference",
+    "skill_generate_image": "generation",
+    "skill_render_video": "generation",
+    "skill_download_youtube": "generation",
+}
+
+
+@dataclass
+class CFOStats:
+    validations: int = 0
+    approved: int = 0
+    rejected: int = 0
+
+    @property
+    def approval_rate(self) -> float:
+        return self.approved / self.validations if self.validations else 0.0
+
+
+class CFOJudge:
+    """
+    Validates transactions against agent, campaign and global budgets.
+
+    Args:
+        ledger: Cost ledger holding budgets and spend
+        executor: Run ledger calls in this executor instead of on the loop
+    """
+
+    def __init__(self, ledger: CostLedger, executor: Optional[Executor] = None):
+        self.ledger = ledger
+        self.executor = executor
+        self.stats = CFOStats()
+
+    async def validate_transaction(self, request: ValidateTransactionRequest) -> ValidateTransactionResponse:
+        """Handle ``POST /judge/cfo/validate-transaction``."""
+        transaction = request.transaction_request
+        approval_id = str(uuid.uuid4())
+        event = CostEvent(
+            agent_id=transaction.agent_id,
+            campaign_id=transaction.campaign_id,
+            cost_category="transactions",
+            cost_amount=transaction.amount,
+            currency=transaction.currency,
+            tool_name="mcp-server-coinbase" if transaction.on_chain else None,
+            metadata={
+                "approval_id": approval_id,
+                "purpose": transaction.purpose,
+                "recipient": transaction.recipient,
+            },
+            event_id=approval_id,
+        )
+        decision = await self._call(self.ledger.reserve, event)
+        self.stats.validations += 1
+        if decision.approved:
+            self.stats.approved += 1
+        else:
+            self.stats.rejected += 1
+        return ValidateTransactionResponse(
+            approval_id=approval_id,
+            approved=decision.approved,
+            reason=decision.reason,
+            budget_updates=BudgetContext(
+                agent_budget_remaining=decision.agent_remaining,
+                campaign_budget_remaining=decision.campaign_remaining,
+                global_budget_remaining=decision.global_remaining,
+            ),
+        )
+
+    async def _call(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.executor is None:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+
+class CostRecorder:
+    """
+    Batches cost events into :meth:`CostLedger.append`.
+
+    :meth:`record` returns once the event is durable; events recorded while a
+    batch is being written form the next batch.
+
+    Args:
+        ledger: Cost ledger
+        max_batch_size: Events per ledger transaction
+        max_delay: Seconds to linger for more events before writing a batch
+            that is not full
+        executor: Run ledger calls in this executor instead of on the loop
+    """
+
+    def __init__(
+        self,
+        ledger: CostLedger,
+        max_batch_size: int = 1024,
+        max_delay: float = 0.0,
+        executor: Optional[Executor] = None,
+    ):
+        self.ledger = ledger
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.executor = executor
+        self.batches = 0
+        self._pending: List[tuple] = []
+        self._flusher: Optional["asyncio.Task[None]"] = None
+
+    async def record(self, event: CostEvent) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((event, future))
+        if self._flusher is None:
+            self._flusher = loop.create_task(self._flush())
+        await future
+
+    async def record_output(
+        self, skill_name: str, output: Any, campaign_id: Optional[str] = None
+    ) -> Optional[CostEvent]:
+        """Record the ``tool_provenance.cost_estimate`` of a skill output, if any."""
+        provenance = output.tool_provenance
+        amount = provenance.get("cost_estimate")
+        if not amount:
+            return None
+        event = CostEvent(
+            agent_id=output.agent_id,
+            campaign_id=campaign_id,
+            task_id=output.task_id,
+            cost_category=SKILL_COST_CATEGORIES.get(skill_name, "inference"),
+            cost_amount=float(amount),
+            tool_name=provenance.get("mcp_tool"),
+            event_id=str(output.result_id),
+        )
+        await self.record(event)
+        return event
+
+    async def drain(self) -> None:
+        """Wait until every recorded event has been written."""
+        while self._flusher is not None:
+            await asyncio.gather(self._flusher, return_exceptions=True)
+
+    async def _flush(self) -> None:
+        try:
+            while self._pending:
+                if self.max_delay > 0 and len(self._pending) < self.max_batch_size:
+                    await asyncio.sleep(self.max_delay)
+                else:
+                    await asyncio.sleep(0)
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+                self.batches += 1
+                try:
+                    await self._call(self.ledger.append, [event for event, _ in batch])
+                except Exception as exc:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(exc)
+                    continue
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+        finally:
+            self._flusher = None
+
+    async def _call(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.executor is None:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
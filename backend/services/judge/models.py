@@ -0,0 +1,142 @@
+"""
+Policy and validation schemas for the Judge (specs/technical.md Sections
+2.3.1 and 2.3.3; J-002, J-003, S-002).
+"""
+
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+Severity = Literal["critical", "warning", "info"]
+
+
+class PolicyRule(BaseModel):
+    """
+    One policy rule.
+
+    ``prohibit`` rules fire when any pattern occurs in the artifact;
+    ``require`` rules (e.g. disclosure hashtags) fire when none does. Patterns
+    are case-insensitive phrases matched on word boundaries; ``regex`` holds
+    raw regular expressions for the cases phrases cannot express.
+    ``applies_when`` restricts the rule to artifacts whose metadata contains
+    the given key/value pairs.
+    """
+
+    rule: str
+    severity: Severity = "critical"
+    message: str = ""
+    kind: Literal["prohibit", "require"] = "prohibit"
+    patterns: List[str] = []
+    regex: List[str] = []
+    applies_when: Dict[str, Any] = {}
+
+
+class Policy(BaseModel):
+    """A versioned agent policy (AGENTS.md rules plus the sensitive-topic lexicon)."""
+
+    policy_version: str
+    rules: List[PolicyRule] = []
+    sensitive_topics: Dict[str, List[str]] = Field(default_factory=dict)
+
+
+class Violation(BaseModel):
+    rule: str
+    severity: Severity
+    message: str
+
+
+class PolicyCheck(BaseModel):
+    """Policy portion of the ``validation_result`` of ``POST /judge/validate``."""
+
+    policy_version: str
+    policy_compliant: bool
+    sensitive_topics_detected: List[str] = []
+    violations: List[Violation] = []
+
+
+class TransactionRequest(BaseModel):
+    agent_id: str
+    campaign_id: Optional[str] = None
+    amount: float = Field(ge=0)
+    currency: str = "USD"
+    purpose: str = ""
+    recipient: str = ""
+    on_chain: bool = False
+
+
+class BudgetContext(BaseModel):
+    agent_budget_remaining: Optional[float] = None
+    campaign_budget_remaining: Optional[float] = None
+    global_budget_remaining: Optional[float] = None
+
+
+class ValidateTransactionRequest(BaseModel):
+    """
+    ``POST /judge/cfo/validate-transaction`` request (specs/technical.md
+    Section 2.3.3). ``budget_context`` is the caller's view and is only
+    informational; the cost ledger is authoritative.
+    """
+
+    transaction_request: TransactionRequest
+    budget_context: Optional[BudgetContext] = None
+
+
+class ValidateTransactionResponse(BaseModel):
+    """``POST /judge/cfo/validate-transaction`` response."""
+
+    approval_id: str
+    approved: bool
+    reason: str
+    budget_updates: BudgetContext
+
+
+class Capacity(BaseModel):
+    current_load: int = Field(default=0, ge=0)
+    max_concurrent_interactions: int = Field(default=1, ge=0)
+
+
+class Availability(BaseModel):
+    status: Literal["active", "idle", "paused", "error"]
+    available: bool
+    capacity: Capacity = Capacity()
+
+
+class Capability(BaseModel):
+    capability_id: str
+    name: str
+    description: str = ""
+    endpoint: Optional[str] = None
+    rate_limit: Optional[int] = None
+    cost_per_use: Optional[float] = None
+
+
+class TrustSignals(BaseModel):
+    policy_compliance_score: float = Field(ge=0.0, le=1.0)
+    human_oversight_enabled: bool
+    budget_controls_active: bool
+    audit_trail_available: bool = False
+    verified_identity: bool = False
+
+
+class StatusUpdate(BaseModel):
+    """
+    An OpenClaw status payload with the metadata the Judge validates
+    (specs/openclaw_integration.md Sections 4.1 and 9.1).
+    """
+
+    agent_id: str
+    availability: Availability
+    capabilities: List[Capability] = []
+    current_activity: Optional[Dict[str, Any]] = None
+    trust_signals: Optional[TrustSignals] = None
+    confidence_score: float = Field(default=1.0, ge=0.0, le=1.0)
+    risk_tags: List[str] = []
+    disclosure_level: Optional[Literal["automated", "assisted", "none"]] = None
+    input_state_version: int = 0
+
+
+class StatusVerdict(BaseModel):
+    route: Literal["auto_publish", "hitl", "reject"]
+    reason: str
+    policy_version: str
+    risk_tags: List[str] = []
@@ -0,0 +1,247 @@
+"""
+Policy Engine
+
+Compiled policy matcher for the Judge's ``POST /judge/validate`` hot path
+(J-002 policy enforcement, J-003 sensitive topics, S-002 policy management).
+
+Instead of testing rules one by one, a :class:`Policy` is compiled once per
+``policy_version`` into a single regular expression over a character trie of
+every rule phrase and sensitive-topic keyword. One left-to-right scan of the
+lowercased artifact finds every phrase occurrence; each matched phrase maps
+to the rules and topics it triggers, including phrases that are word-prefixes
+of it, so overlapping phrases are never missed. Raw ``regex`` rule patterns
+are merged into a second combined expression.
+
+:class:`PolicyEngine` swaps compiled policies atomically: a batch is always
+validated against exactly one version, and the previous versions are kept for
+rollback.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+from backend import tracing
+from backend.services.judge.models import Policy, PolicyCheck, Violation
+
+_WORD = re.compile(r"\w")
+_RULE = "rule"
+_TOPIC = "topic"
+
+Target = Tuple[str, Any]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """Regex alternation of ``phrases`` factored into a trie, longest match first."""
+    root: Dict[str, Any] = {}
+    for phrase in phrases:
+        node = root
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Any]) -> str:
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + emit(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return "(?:" + body + ")?"
+        return body
+
+    return emit(root)
+
+
+class CompiledPolicy:
+    """A :class:`Policy` compiled into combined matchers."""
+
+    def __init__(self, policy: Policy):
+        self.policy = policy
+        self.policy_version = policy.policy_version
+        self._topics = list(policy.sensitive_topics)
+
+        direct: Dict[str, Set[Target]] = {}
+        for index, rule in enumerate(policy.rules):
+            for pattern in rule.patterns:
+                direct.setdefault(_normalize(pattern), set()).add((_RULE, index))
+        for topic, keywords in policy.sensitive_topics.items():
+            for keyword in keywords:
+                direct.setdefault(_normalize(keyword), set()).add((_TOPIC, topic))
+        direct.pop("", None)
+
+        # A phrase match at some position implies a match of every other
+        # phrase that is a prefix of it ending on a word boundary.
+        self._targets: Dict[str, FrozenSet[Target]] = {}
+        for phrase, targets in direct.items():
+            implied = set(targets)
+            for end in range(1, len(phrase)):
+                prefix = phrase[:end]
+                if prefix in direct and not _WORD.match(phrase[end]):
+                    implied |= direct[prefix]
+            self._targets[phrase] = frozenset(implied)
+
+        self._phrases: Optional[re.Pattern] = None
+        if direct:
+            self._phrases = re.compile(r"(?<!\w)(?=(" + _trie_pattern(direct) + r")(?!\w))")
+
+        self._regex_rules: Dict[str, int] = {}
+        self._regex_each: Dict[str, re.Pattern] = {}
+        alternatives = []
+        for index, rule in enumerate(policy.rules):
+            for n, pattern in enumerate(rule.regex):
+                name = f"r{index}_{n}"
+                self._regex_rules[name] = index
+                self._regex_each[name] = re.compile(pattern, re.IGNORECASE)
+                alternatives.append(f"(?P<{name}>{pattern})")
+        self._regex: Optional[re.Pattern] = None
+        if alternatives:
+            self._regex = re.compile("(?=" + "|".join(alternatives) + ")", re.IGNORECASE)
+
+    def scan(self, text: str) -> Tuple[Set[int], Set[str]]:
+        """Return the indexes of rules whose patterns occur and the topics detected."""
+        rules: Set[int] = set()
+        topics: Set[str] = set()
+        text = text.lower()
+        if self._phrases is not None:
+            seen: Set[str] = set()
+            for match in self._phrases.finditer(text):
+                phrase = match.group(1)
+                if phrase in seen:
+                    continue
+                seen.add(phrase)
+                for kind, value in self._targets[_normalize(phrase)]:
+                    if kind == _RULE:
+                        rules.add(value)
+                    else:
+                        topics.add(value)
+        if self._regex is not None:
+            pending = dict(self._regex_each)
+            for match in self._regex.finditer(text):
+                # The combined expression reports one alternative per position;
+                # re-test the rules not yet seen at that position.
+                for name in [match.lastgroup, *pending]:
+                    if name in pending and pending[name].match(text, match.start()):
+                        rules.add(self._regex_rules[name])
+                        del pending[name]
+                if not pending:
+                    break
+        return rules, topics
+
+    def check(self, content: str, metadata: Optional[Mapping[str, Any]] = None) -> PolicyCheck:
+        metadata = metadata or {}
+        found, topics = self.scan(content)
+        violations = []
+        for index, rule in enumerate(self.policy.rules):
+            if any(metadata.get(key) != value for key, value in rule.applies_when.items()):
+                continue
+            if (index in found) == (rule.kind == "prohibit"):
+                violations.append(
+                    Violation(
+                        rule=rule.rule,
+                        severity=rule.severity,
+                        message=rule.message or _default_message(rule.kind, rule.rule),
+                    )
+                )
+        return PolicyCheck(
+            policy_version=self.policy_version,
+            policy_compliant=not any(v.severity == "critical" for v in violations),
+            sensitive_topics_detected=[t for t in self._topics if t in topics],
+            violations=violations,
+        )
+
+
+def _default_message(kind: str, rule: str) -> str:
+    if kind == "prohibit":
+        return f"content matches prohibited pattern of {rule}"
+    return f"content is missing required pattern of {rule}"
+
+
+def artifact_text(artifact: Mapping[str, Any]) -> str:
+    """Text of a Worker artifact that policy applies to: content plus any caption."""
+    metadata = artifact.get("metadata") or {}
+    parts = [artifact.get("content") or ""]
+    if metadata.get("caption"):
+        parts.append(metadata["caption"])
+    return "\n".join(parts)
+
+
+class PolicyEngine:
+    """
+    Holds the active compiled policy and validates artifacts against it.
+
+    Args:
+        policy: Initial policy
+        history: Number of compiled versions kept for rollback
+    """
+
+    def __init__(self, policy: Optional[Policy] = None, history: int = 8):
+        self.history = history
+        self._versions: "OrderedDict[str, CompiledPolicy]" = OrderedDict()
+        self._active: Optional[CompiledPolicy] = None
+        self._lock = threading.Lock()
+        if policy is not None:
+            self.load(policy)
+
+    @property
+    def policy_version(self) -> Optional[str]:
+        active = self._active
+        return active.policy_version if active is not None else None
+
+    @property
+    def versions(self) -> List[str]:
+        return list(self._versions)
+
+    def load(self, policy: Policy) -> CompiledPolicy:
+        """
+        Compile ``policy`` and make it active.
+
+        Raises:
+            ValueError: If ``policy_version`` was already loaded with different
+                content (policy changes require a version bump)
+        """
+        with self._lock:
+            existing = self._versions.get(policy.policy_version)
+            if existing is not None:
+                if existing.policy != policy:
+                    raise ValueError(
+                        f"policy {policy.policy_version} changed without a version bump"
+                    )
+                compiled = existing
+            else:
+                compiled = CompiledPolicy(policy)
+            self._versions[policy.policy_version] = compiled
+            self._versions.move_to_end(policy.policy_version)
+            while len(self._versions) > self.history:
+                self._versions.popitem(last=False)
+            self._active = compiled
+            return compiled
+
+    def rollback(self, policy_version: str) -> None:
+        with self._lock:
+            try:
+                self._active = self._versions[policy_version]
+            except KeyError:
+                raise KeyError(f"policy version not retained: {policy_version}") from None
+
+    def validate(self, artifact: Mapping[str, Any]) -> PolicyCheck:
+        return self.validate_batch([artifact])[0]
+
+    def validate_batch(self, artifacts: Iterable[Mapping[str, Any]]) -> List[PolicyCheck]:
+        """Validate artifacts (``{type, content, metadata}``) against one policy version."""
+        compiled = self._active
+        if compiled is None:
+            raise RuntimeError("no policy loaded")
+        with tracing.span("judge_validate", compiled.policy_version):
+            return [
+                compiled.check(artifact_text(artifact), artifact.get("metadata"))
+                for artifact in artifacts
+            ]
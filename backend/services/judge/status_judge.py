@@ -0,0 +1,127 @@
+"""
+OpenClaw Status Judge
+
+Validation and routing of OpenClaw status updates (J-008,
+specs/openclaw_integration.md Section 4.3.3).
+
+The text an update exposes (capability names and descriptions, activity
+previews) is checked against the active :class:`PolicyEngine` policy, then
+routed on ``confidence_score`` and ``risk_tags`` exactly like content:
+auto-publish above 0.90 with no risk, HITL from 0.70 or when sensitive, reject
+below 0.70 or on a policy failure.
+
+Fleets re-publish the same payloads constantly (an agent flipping between
+``idle`` and ``active``, load cycling through a few values), so verdicts are
+cached by ``(payload_hash, policy_version)``. A policy change bumps the
+version and every payload is judged afresh.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from backend.services.judge.models import StatusUpdate, StatusVerdict
+from backend.services.judge.policy_engine import PolicyEngine
+
+
+def payload_hash(update: StatusUpdate) -> str:
+    """SHA-256 of the canonical JSON of everything a verdict depends on."""
+    body = update.model_dump(mode="json", exclude={"agent_id", "input_state_version"})
+    return hashlib.sha256(json.dumps(body, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def status_text(update: StatusUpdate) -> str:
+    parts = [f"{c.name}\n{c.description}" for c in update.capabilities]
+    activity = update.current_activity or {}
+    parts.extend(post.get("content_preview") or "" for post in activity.get("recent_posts") or [])
+    return "\n".join(parts)
+
+
+@dataclass
+class StatusJudgeStats:
+    validations: int = 0
+    cache_hits: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.validations + self.cache_hits
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache_hits / self.requests if self.requests else 0.0
+
+
+class StatusJudge:
+    """
+    Routes OpenClaw status updates, reusing verdicts for repeated payloads.
+
+    Args:
+        engine: Policy engine holding the active policy
+        auto_publish_above: Confidence above which risk-free updates publish
+        reject_below: Confidence below which updates are rejected
+        max_cached: Verdicts kept (least recently used are evicted)
+    """
+
+    def __init__(
+        self,
+        engine: PolicyEngine,
+        auto_publish_above: float = 0.90,
+        reject_below: float = 0.70,
+        max_cached: int = 65536,
+    ):
+        self.engine = engine
+        self.auto_publish_above = auto_publish_above
+        self.reject_below = reject_below
+        self.max_cached = max_cached
+        self.stats = StatusJudgeStats()
+        self._cache: "OrderedDict[Tuple[str, str], StatusVerdict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(self, update: StatusUpdate, digest: Optional[str] = None) -> StatusVerdict:
+        """
+        Verdict for ``update``.
+
+        Args:
+            update: Status update with its Judge metadata
+            digest: :func:`payload_hash` of ``update``, if the caller has it
+        """
+        policy_version = self.engine.policy_version
+        if policy_version is None:
+            raise RuntimeError("no policy loaded")
+        key = (digest or payload_hash(update), policy_version)
+        with self._lock:
+            verdict = self._cache.get(key)
+            if verdict is not None:
+                self._cache.move_to_end(key)
+                self.stats.cache_hits += 1
+                return verdict
+        verdict = self._judge(update)
+        with self._lock:
+            self.stats.validations += 1
+            self._cache[key] = verdict
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return verdict
+
+    def _judge(self, update: StatusUpdate) -> StatusVerdict:
+        metadata: Dict[str, Any] = {"platform": "openclaw"}
+        if update.disclosure_level:
+            metadata["disclosure_level"] = update.disclosure_level
+        check = self.engine.validate({"type": "text", "content": status_text(update), "metadata": metadata})
+        risk_tags = sorted(set(update.risk_tags) | set(check.sensitive_topics_detected))
+        if not check.policy_compliant:
+            route, reason = "reject", "; ".join(v.message for v in check.violations if v.severity == "critical")
+        elif update.confidence_score < self.reject_below:
+            route, reason = "reject", f"confidence {update.confidence_score:.2f} below {self.reject_below:.2f}"
+        elif risk_tags:
+            route, reason = "hitl", "sensitive: " + ", ".join(risk_tags)
+        elif update.confidence_score <= self.auto_publish_above:
+            route, reason = "hitl", f"confidence {update.confidence_score:.2f} needs review"
+        else:
+            route, reason = "auto_publish", "policy compliant"
+        return StatusVerdict(
+            route=route, reason=reason, policy_version=check.policy_version, risk_tags=risk_tags
+        )
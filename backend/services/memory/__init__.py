@@ -0,0 +1,19 @@
+"""
+Memory service: hierarchical episodic/semantic memory retrieval.
+"""
+
+from backend.services.memory.ann_index import IVFIndex
+from backend.services.memory.embedding import Embedder, HashingEmbedder
+from backend.services.memory.episodic import EpisodicMemory, EpisodicRingBuffer, MemoryEntry
+from backend.services.memory.service import MemoryService, SemanticBackend
+
+__all__ = [
+    "Embedder",
+    "EpisodicMemory",
+    "EpisodicRingBuffer",
+    "HashingEmbedder",
+    "IVFIndex",
+    "MemoryEntry",
+    "MemoryService",
+    "SemanticBackend",
+]
@@ -0,0 +1,227 @@
+"""
+Semantic Memory Index
+
+In-process approximate-nearest-neighbour index for long-term semantic memory
+(P-006), usable as a local stand-in for Weaviate or as a cache in front of it.
+
+The index is IVF (inverted file) over a single ``float32`` matrix of
+L2-normalised embeddings, optionally backed by a memory-mapped file. Spherical
+k-means centroids partition the space; each vector is appended to the posting
+list of its ``(agent_id, centroid)`` pair, so a query for one agent probes
+only that agent's postings in the ``nprobe`` nearest cells and never scans
+other agents' vectors. Agents with few memories are searched exactly. Inserts
+are incremental: vectors are assigned to existing centroids, and the
+centroids are retrained (and postings rebuilt) when the index has grown by
+``retrain_growth`` since the last training, which keeps inserts amortised O(1).
+"""
+
+import math
+import os
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.services.memory.episodic import MemoryEntry
+
+
+class _VectorMatrix:
+    """Growable ``float32`` row matrix in RAM or in a memory-mapped file."""
+
+    def __init__(self, dim: int, path: Optional[str] = None, capacity: int = 1024):
+        self.dim = dim
+        self.path = path
+        self.size = 0
+        self._data = self._allocate(capacity)
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._data[: self.size]
+
+    def append(self, vectors: np.ndarray) -> int:
+        start = self.size
+        needed = start + len(vectors)
+        if needed > len(self._data):
+            self._grow(max(needed, 2 * len(self._data)))
+        self._data[start:needed] = vectors
+        self.size = needed
+        return start
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if self.path is None:
+            return np.zeros((capacity, self.dim), dtype=np.float32)
+        with open(self.path, "ab") as f:
+            f.truncate(capacity * self.dim * 4)
+        return np.memmap(self.path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def _grow(self, capacity: int) -> None:
+        if self.path is None:
+            data = np.zeros((capacity, self.dim), dtype=np.float32)
+            data[: self.size] = self._data[: self.size]
+            self._data = data
+        else:
+            self._data.flush()
+            del self._data
+            self._data = self._allocate(capacity)
+
+    def close(self) -> None:
+        if self.path is not None:
+            self._data.flush()
+            del self._data
+            os.remove(self.path)
+
+
+class IVFIndex:
+    """
+    Per-agent filtered IVF index with cosine similarity.
+
+    Args:
+        dim: Embedding dimension
+        nprobe: Cells probed per query
+        nlist: Number of cells; defaults to ``sqrt(n)`` at training time
+        train_threshold: Vectors required before the first training; until
+            then every search is exact
+        exact_threshold: Agents with at most this many vectors are searched
+            exactly
+        retrain_growth: Retrain once the index is this many times larger
+            than at the last training
+        path: Memory-map the vector matrix to this file instead of RAM
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        nprobe: int = 8,
+        nlist: Optional[int] = None,
+        train_threshold: int = 4096,
+        exact_threshold: int = 1024,
+        retrain_growth: float = 4.0,
+        path: Optional[str] = None,
+        seed: int = 0,
+    ):
+        self.dim = dim
+        self.nprobe = nprobe
+        self.nlist = nlist
+        self.train_threshold = train_threshold
+        self.exact_threshold = exact_threshold
+        self.retrain_growth = retrain_growth
+        self._matrix = _VectorMatrix(dim, path)
+        self._entries: List[MemoryEntry] = []
+        self._agent_rows: Dict[str, array] = {}
+        self._postings: Dict[Tuple[str, int], array] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self._matrix.size
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    def agent_count(self, agent_id: str) -> int:
+        rows = self._agent_rows.get(agent_id)
+        return 0 if rows is None else len(rows)
+
+    def add(self, entries: Sequence[MemoryEntry], vectors: np.ndarray) -> None:
+        """Insert entries with their L2-normalised embeddings."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if len(entries) != len(vectors):
+            raise ValueError("entries and vectors differ in length")
+        start = self._matrix.append(vectors)
+        self._entries.extend(entries)
+        for offset, entry in enumerate(entries):
+            rows = self._agent_rows.get(entry.agent_id)
+            if rows is None:
+                rows = self._agent_rows[entry.agent_id] = array("q")
+            rows.append(start + offset)
+
+        size = len(self)
+        if self._centroids is None:
+            if size >= self.train_threshold:
+                self.train()
+        elif size >= self.retrain_growth * self._trained_size:
+            self.train()
+        else:
+            self._post(start, entries, self._assign(vectors))
+
+    def train(self, iterations: int = 8) -> None:
+        """(Re)build centroids with spherical k-means and rebuild postings."""
+        size = len(self)
+        data = self._matrix.rows
+        nlist = self.nlist or max(1, int(math.sqrt(size)))
+        nlist = min(nlist, size)
+        sample_size = min(size, 64 * nlist)
+        sample = data[np.sort(self._rng.choice(size, sample_size, replace=False))]
+        centroids = sample[self._rng.choice(sample_size, nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(labels, kind="stable")
+            counts = np.bincount(labels, minlength=nlist)
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            nonempty = counts > 0
+            sums = np.add.reduceat(sample[order], starts[nonempty], axis=0)
+            centroids[nonempty] = sums
+            empty = np.flatnonzero(~nonempty)
+            if empty.size:
+                centroids[empty] = sample[self._rng.choice(sample_size, empty.size)]
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            np.divide(centroids, norms, out=centroids, where=norms > 0)
+        self._centroids = centroids
+        self._trained_size = size
+        self._postings = {}
+        self._post(0, self._entries, self._assign(data))
+
+    def search(
+        self, agent_id: str, vector: np.ndarray, limit: int
+    ) -> List[Tuple[MemoryEntry, float]]:
+        """Return up to ``limit`` ``(entry, cosine similarity)`` pairs for one agent."""
+        agent_rows = self._agent_rows.get(agent_id)
+        if agent_rows is None or limit <= 0:
+            return []
+        if self._centroids is None or len(agent_rows) <= self.exact_threshold:
+            candidates = np.frombuffer(agent_rows, dtype=np.int64)
+        else:
+            cells = self._nearest_cells(vector)
+            lists = [
+                np.frombuffer(self._postings[(agent_id, int(cell))], dtype=np.int64)
+                for cell in cells
+                if (agent_id, int(cell)) in self._postings
+            ]
+            if not lists:
+                return []
+            candidates = np.concatenate(lists)
+        scores = self._matrix.rows[candidates] @ vector
+        if limit < len(scores):
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._entries[candidates[i]], float(scores[i])) for i in top]
+
+    def close(self) -> None:
+        self._matrix.close()
+
+    def _nearest_cells(self, vector: np.ndarray) -> np.ndarray:
+        sims = self._centroids @ vector
+        nprobe = min(self.nprobe, len(sims))
+        if nprobe == len(sims):
+            return np.arange(nprobe)
+        return np.argpartition(-sims, nprobe - 1)[:nprobe]
+
+    def _assign(self, vectors: np.ndarray, chunk: int = 16_384) -> np.ndarray:
+        labels = np.empty(len(vectors), dtype=np.int64)
+        for offset in range(0, len(vectors), chunk):
+            block = vectors[offset: offset + chunk]
+            labels[offset: offset + chunk] = np.argmax(block @ self._centroids.T, axis=1)
+        return labels
+
+    def _post(self, start: int, entries: Sequence[MemoryEntry], labels: np.ndarray) -> None:
+        postings = self._postings
+        for offset, (entry, label) in enumerate(zip(entries, labels.tolist())):
+            key = (entry.agent_id, label)
+            posting = postings.get(key)
+            if posting is None:
+                posting = postings[key] = array("q")
+            posting.append(start + offset)
@@ -0,0 +1,59 @@
+"""
+Text embeddings for in-process memory search.
+
+:class:`HashingEmbedder` is a dependency-free stand-in for the Weaviate
+embedding model: tokens and token bigrams are feature-hashed into a signed
+bag-of-words vector and L2-normalised, so cosine similarity reflects lexical
+overlap. Any object with the :class:`Embedder` shape can replace it.
+"""
+
+import hashlib
+import re
+from typing import List, Protocol, Sequence
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class Embedder(Protocol):
+    dim: int
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Return an L2-normalised ``float32`` array of shape ``(len(texts), dim)``."""
+        ...
+
+
+def _features(text: str) -> List[str]:
+    tokens = _TOKEN_RE.findall(text.lower())
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+class HashingEmbedder:
+    """Signed feature-hashing embedder."""
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+        self._cache: dict = {}
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in _features(text):
+                slot = self._cache.get(feature)
+                if slot is None:
+                    digest = int.from_bytes(
+                        hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+                    )
+                    slot = (digest % self.dim, 1.0 if digest >> 63 else -1.0)
+                    if len(self._cache) < 1_000_000:
+                        self._cache[feature] = slot
+                out[row, slot[0]] += slot[1]
+        return normalize(out)
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalise rows in place; zero rows stay zero."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
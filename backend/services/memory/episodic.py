@@ -0,0 +1,102 @@
+"""
+Episodic Memory
+
+Short-term memory (P-006: "last 1 hour of conversation/actions") held in a
+per-agent, array-backed ring buffer. Timestamps and embeddings live in
+preallocated NumPy arrays, so appends never allocate and a query scores the
+live window with one matrix-vector product.
+"""
+
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class MemoryEntry(NamedTuple):
+    memory_id: str
+    agent_id: str
+    memory_type: str
+    content: str
+    created_at: float
+    metadata: Optional[dict] = None
+
+
+class EpisodicRingBuffer:
+    """
+    Fixed-capacity ring of one agent's recent memories.
+
+    Entries older than ``window_seconds`` are ignored by queries and are
+    overwritten as new entries arrive.
+    """
+
+    def __init__(self, dim: int, capacity: int = 1024, window_seconds: float = 3600.0):
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self._times = np.full(capacity, -np.inf)
+        self._entries: List[Optional[MemoryEntry]] = [None] * capacity
+        self._next = 0
+
+    def __len__(self) -> int:
+        return sum(entry is not None for entry in self._entries)
+
+    def append(self, entry: MemoryEntry, vector: np.ndarray) -> None:
+        slot = self._next
+        self._vectors[slot] = vector
+        self._times[slot] = entry.created_at
+        self._entries[slot] = entry
+        self._next = (slot + 1) % self.capacity
+
+    def query(
+        self, vector: Optional[np.ndarray], limit: int, now: float
+    ) -> List[Tuple[MemoryEntry, float]]:
+        """
+        Return up to ``limit`` ``(entry, score)`` pairs from the live window.
+
+        With a query vector, entries are ranked by cosine similarity clipped
+        to ``[0, 1]``; without one, by recency with a score of 1.0.
+        """
+        live = np.flatnonzero(self._times >= now - self.window_seconds)
+        if live.size == 0 or limit <= 0:
+            return []
+        if vector is None:
+            scores = np.ones(live.size, dtype=np.float32)
+            order = np.argsort(-self._times[live], kind="stable")[:limit]
+        else:
+            scores = np.clip(self._vectors[live] @ vector, 0.0, 1.0)
+            # Ties (e.g. no lexical overlap) fall back to recency.
+            order = np.lexsort((-self._times[live], -scores))[:limit]
+        return [(self._entries[live[i]], float(scores[i])) for i in order]
+
+
+class EpisodicMemory:
+    """Ring buffers for every agent, created on first write."""
+
+    def __init__(
+        self,
+        dim: int,
+        capacity: int = 1024,
+        window_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.dim = dim
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._buffers: Dict[str, EpisodicRingBuffer] = {}
+
+    def append(self, entry: MemoryEntry, vector: np.ndarray) -> None:
+        buffer = self._buffers.get(entry.agent_id)
+        if buffer is None:
+            buffer = EpisodicRingBuffer(self.dim, self.capacity, self.window_seconds)
+            self._buffers[entry.agent_id] = buffer
+        buffer.append(entry, vector)
+
+    def query(
+        self, agent_id: str, vector: Optional[np.ndarray], limit: int, now: Optional[float] = None
+    ) -> List[Tuple[MemoryEntry, float]]:
+        buffer = self._buffers.get(agent_id)
+        if buffer is None:
+            return []
+        return buffer.query(vector, limit, self._clock() if now is None else now)
@@ -0,0 +1,54 @@
+"""
+Request and response schemas for the Memory API (specs/technical.md
+Sections 2.1.4 and 2.1.5).
+"""
+
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+MemoryType = Literal["episodic", "semantic"]
+
+
+class MemoryRetrieveRequest(BaseModel):
+    """``POST /memory/retrieve`` request."""
+
+    agent_id: str
+    query: str
+    memory_types: List[MemoryType] = ["episodic", "semantic"]
+    limit: Optional[int] = Field(default=None, ge=1)
+
+
+class RetrievedMemory(BaseModel):
+    memory_id: str
+    memory_type: MemoryType
+    content: str
+    relevance_score: float = Field(..., ge=0.0, le=1.0)
+    created_at: datetime
+    accessed_at: Optional[datetime] = None
+
+
+class MemoryRetrieveResponse(BaseModel):
+    """``POST /memory/retrieve`` response."""
+
+    memories: List[RetrievedMemory]
+    episodic_count: int
+    semantic_count: int
+
+
+class MemoryStoreRequest(BaseModel):
+    """``POST /memory/store`` request."""
+
+    agent_id: str
+    memory_type: MemoryType = "semantic"
+    content: str
+    metadata: Optional[dict] = None
+
+
+class MemoryStoreResponse(BaseModel):
+    """``POST /memory/store`` response."""
+
+    memory_id: str
+    stored: bool
+    embedding_created: bool
@@ -0,0 +1,139 @@
+"""
+Memory Service
+
+Hierarchical memory retrieval behind ``POST /memory/retrieve`` and
+``POST /memory/store`` (P-006, specs/technical.md Sections 2.1.4-2.1.5).
+
+Episodic memories go to per-agent ring buffers covering the last hour;
+semantic memories go to an in-process :class:`IVFIndex`. When a
+:class:`SemanticBackend` (e.g. Weaviate) is configured the index acts as a
+read-through cache: an agent's memories are loaded on first use and new
+memories are written to both.
+"""
+
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Iterable, List, Optional, Protocol, Set, Tuple
+
+import numpy as np
+
+from backend.services.memory.ann_index import IVFIndex
+from backend.services.memory.embedding import Embedder, HashingEmbedder
+from backend.services.memory.episodic import EpisodicMemory, MemoryEntry
+from backend.services.memory.models import (
+    MemoryRetrieveRequest,
+    MemoryRetrieveResponse,
+    MemoryStoreRequest,
+    MemoryStoreResponse,
+    RetrievedMemory,
+)
+
+DEFAULT_LIMITS = {"episodic": 10, "semantic": 5}
+
+
+class SemanticBackend(Protocol):
+    """Authoritative long-term store the local index caches."""
+
+    def upsert(self, entry: MemoryEntry, vector: np.ndarray) -> None:
+        ...
+
+    def fetch_agent(self, agent_id: str) -> Iterable[Tuple[MemoryEntry, np.ndarray]]:
+        ...
+
+
+class MemoryService:
+    """
+    Two-tier memory store and retriever.
+
+    Args:
+        embedder: Text embedder (default: :class:`HashingEmbedder`)
+        index: Semantic index (default: an :class:`IVFIndex` of the embedder's dim)
+        episodic: Episodic ring buffers (default: 1024 entries, 1 hour window)
+        backend: Optional long-term store the index caches
+        clock: Wall-clock time source
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        index: Optional[IVFIndex] = None,
+        episodic: Optional[EpisodicMemory] = None,
+        backend: Optional[SemanticBackend] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.embedder: Embedder = embedder if embedder is not None else HashingEmbedder()
+        self.index = index if index is not None else IVFIndex(self.embedder.dim)
+        self.episodic = (
+            episodic if episodic is not None else EpisodicMemory(self.embedder.dim, clock=clock)
+        )
+        self.backend = backend
+        self._clock = clock
+        self._resident: Set[str] = set()
+
+    def store(self, request: MemoryStoreRequest) -> MemoryStoreResponse:
+        entry = MemoryEntry(
+            memory_id=str(uuid.uuid4()),
+            agent_id=request.agent_id,
+            memory_type=request.memory_type,
+            content=request.content,
+            created_at=self._clock(),
+            metadata=request.metadata,
+        )
+        vector = self.embedder.embed([request.content])[0]
+        if request.memory_type == "episodic":
+            self.episodic.append(entry, vector)
+        else:
+            self._ensure_resident(request.agent_id)
+            self.index.add([entry], vector[None, :])
+            if self.backend is not None:
+                self.backend.upsert(entry, vector)
+        return MemoryStoreResponse(
+            memory_id=entry.memory_id, stored=True, embedding_created=bool(vector.any())
+        )
+
+    def retrieve(self, request: MemoryRetrieveRequest) -> MemoryRetrieveResponse:
+        now = self._clock()
+        vector: Optional[np.ndarray] = self.embedder.embed([request.query])[0]
+        if not vector.any():
+            vector = None
+        memories: List[RetrievedMemory] = []
+        counts = dict.fromkeys(DEFAULT_LIMITS, 0)
+        for memory_type in DEFAULT_LIMITS:
+            if memory_type not in request.memory_types:
+                continue
+            limit = request.limit or DEFAULT_LIMITS[memory_type]
+            if memory_type == "episodic":
+                hits = self.episodic.query(request.agent_id, vector, limit, now)
+            elif vector is None:
+                continue
+            else:
+                self._ensure_resident(request.agent_id)
+                hits = self.index.search(request.agent_id, vector, limit)
+            memories.extend(_to_response(entry, score, now) for entry, score in hits)
+            counts[memory_type] = len(hits)
+        return MemoryRetrieveResponse(
+            memories=memories,
+            episodic_count=counts["episodic"],
+            semantic_count=counts["semantic"],
+        )
+
+    def _ensure_resident(self, agent_id: str) -> None:
+        if self.backend is None or agent_id in self._resident:
+            return
+        rows = list(self.backend.fetch_agent(agent_id))
+        if rows:
+            entries, vectors = zip(*rows)
+            self.index.add(list(entries), np.stack(vectors))
+        self._resident.add(agent_id)
+
+
+def _to_response(entry: MemoryEntry, score: float, now: float) -> RetrievedMemory:
+    return RetrievedMemory(
+        memory_id=entry.memory_id,
+        memory_type=entry.memory_type,
+        content=entry.content,
+        relevance_score=min(max(score, 0.0), 1.0),
+        created_at=datetime.fromtimestamp(entry.created_at, timezone.utc),
+        accessed_at=datetime.fromtimestamp(now, timezone.utc),
+    )
@@ -0,0 +1,7 @@
+"""
+OpenClaw service: status publication to the OpenClaw agent network.
+"""
+
+from backend.services.openclaw.publisher import OpenClawPublisher, PublisherStats
+
+__all__ = ["OpenClawPublisher", "PublisherStats"]
@@ -0,0 +1,337 @@
+"""
+OpenClaw Status Publisher
+
+Fleet-level publisher for OpenClaw availability and status
+(specs/openclaw_integration.md Section 4.2, W-013).
+
+One ``openclaw_publish_status`` call per agent per heartbeat, plus one per
+change, each with its own Judge validation, does not scale to fleets of
+thousands. Agents instead :meth:`~OpenClawPublisher.submit` their status when
+it may have changed and :meth:`~OpenClawPublisher.touch` to signal liveness:
+
+- an unchanged payload costs a hash comparison and nothing else;
+- a changed payload is judged (the :class:`StatusJudge` reuses the verdict of
+  an identical earlier payload) and becomes a delta carrying only the sections
+  that differ from what OpenClaw has; a later change before the next flush
+  replaces it;
+- status, capability, activity and trust changes go out on the next flush,
+  while load-only changes ride along with the agent's next heartbeat;
+- heartbeats carry no content, so they are not re-judged; they are sent at
+  most once per ``heartbeat_interval`` for agents seen since their last one,
+  with per-agent jitter so a fleet started together does not stay in phase.
+
+Each flush sends every due entry in ``openclaw_publish_status_batch`` calls of
+up to ``max_batch`` entries. Entries of a failed call stay queued and are
+retried with the same ``status_update_id``, which OpenClaw deduplicates.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from backend.mcp.clients.base import MCPClient, MCPError
+from backend.services.judge.models import Availability, StatusUpdate, StatusVerdict
+from backend.services.judge.status_judge import StatusJudge
+
+SERVER = "mcp-server-openclaw"
+BATCH_TOOL = "openclaw_publish_status_batch"
+SECTIONS = ("availability", "capabilities", "current_activity", "trust_signals")
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _load_only(published: Optional[Availability], current: Availability) -> bool:
+    return published is not None and (
+        published.status == current.status
+        and published.available == current.available
+        and published.capacity.max_concurrent_interactions == current.capacity.max_concurrent_interactions
+    )
+
+
+@dataclass
+class PublisherStats:
+    submitted: int = 0
+    unchanged: int = 0
+    held: int = 0
+    deltas: int = 0
+    coalesced: int = 0
+    published: int = 0
+    heartbeats: int = 0
+    calls: int = 0
+    failed_calls: int = 0
+
+    @property
+    def entries(self) -> int:
+        return self.published + self.heartbeats
+
+    @property
+    def entries_per_call(self) -> float:
+        return self.entries / self.calls if self.calls else 0.0
+
+
+class _Delta:
+    __slots__ = ("status_update_id", "update", "sections", "hashes", "urgent")
+
+    def __init__(self, update: StatusUpdate, sections: Dict[str, Any], hashes: Dict[str, str], urgent: bool):
+        self.status_update_id = str(uuid.uuid4())
+        self.update = update
+        self.sections = sections
+        self.hashes = hashes
+        self.urgent = urgent
+
+    def entry(self, last_heartbeat: float) -> Dict[str, Any]:
+        update = self.update
+        entry: Dict[str, Any] = {
+            "agent_id": update.agent_id,
+            "status_update_id": self.status_update_id,
+            "input_state_version": update.input_state_version,
+            "confidence_score": update.confidence_score,
+            "risk_tags": update.risk_tags,
+        }
+        if update.disclosure_level is not None:
+            entry["disclosure_level"] = update.disclosure_level
+        entry.update(self.sections)
+        entry["commit_hash"] = _digest(entry)
+        entry["last_heartbeat"] = _iso(last_heartbeat)
+        return entry
+
+
+class _Agent:
+    __slots__ = (
+        "hashes", "availability", "pending", "inflight", "last_seen", "reported", "sent_at", "heartbeat_due"
+    )
+
+    def __init__(self):
+        self.hashes: Dict[str, str] = {}
+        self.availability: Optional[Availability] = None
+        self.pending: Optional[_Delta] = None
+        self.inflight: Optional[_Delta] = None
+        self.last_seen = 0.0
+        self.reported = float("-inf")
+        self.sent_at = float("-inf")
+        self.heartbeat_due: Optional[float] = None
+
+
+class OpenClawPublisher:
+    """
+    Coalesces a fleet's OpenClaw status into periodic bulk MCP calls.
+
+    Args:
+        client: MCP client reaching ``mcp-server-openclaw``
+        judge: Status Judge validating changed payloads
+        heartbeat_interval: Minimum seconds between an agent's heartbeats
+        flush_interval: Seconds between flushes in :meth:`run`
+        jitter: Fraction of random spread added to heartbeat intervals and
+            applied to flush intervals
+        max_batch: Entries per bulk call
+        clock: Time source (``time.time``)
+        seed: Seed for the jitter, for reproducible simulations
+    """
+
+    def __init__(
+        self,
+        client: MCPClient,
+        judge: StatusJudge,
+        heartbeat_interval: float = 60.0,
+        flush_interval: float = 5.0,
+        jitter: float = 0.1,
+        max_batch: int = 1000,
+        clock: Callable[[], float] = time.time,
+        seed: Optional[int] = None,
+    ):
+        self.client = client
+        self.judge = judge
+        self.heartbeat_interval = heartbeat_interval
+        self.flush_interval = flush_interval
+        self.jitter = jitter
+        self.max_batch = max_batch
+        self.clock = clock
+        self.stats = PublisherStats()
+        self._rng = random.Random(seed)
+        self._agents: Dict[str, _Agent] = {}
+        self._urgent: Set[str] = set()
+        self._heartbeats: List[Tuple[float, str]] = []
+
+    @property
+    def pending(self) -> int:
+        """Agents with a delta not yet acknowledged by OpenClaw."""
+        return sum(1 for agent in self._agents.values() if agent.pending is not None)
+
+    def submit(self, update: StatusUpdate, now: Optional[float] = None) -> Optional[StatusVerdict]:
+        """
+        Record an agent's current status.
+
+        Returns:
+            The Judge verdict, or ``None`` if the payload is unchanged. Updates
+            not routed to ``auto_publish`` are held back; OpenClaw keeps the
+            last published status.
+        """
+        now = self.clock() if now is None else now
+        self.stats.submitted += 1
+        agent_id = update.agent_id
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            agent = self._agents[agent_id] = _Agent()
+        agent.last_seen = now
+        body = update.model_dump(mode="json", include=set(SECTIONS))
+        hashes = {section: _digest(body.get(section)) for section in SECTIONS}
+        # Diff against what OpenClaw will have once the call in flight lands;
+        # _rebase corrects the delta if that call fails instead.
+        base = agent.inflight
+        base_hashes = base.hashes if base is not None else agent.hashes
+        base_availability = base.update.availability if base is not None else agent.availability
+        if hashes == (agent.pending.hashes if agent.pending is not None else base_hashes):
+            self.stats.unchanged += 1
+            self._schedule(agent_id, agent, now)
+            return None
+
+        verdict = self.judge.validate(update)
+        if verdict.route != "auto_publish":
+            self.stats.held += 1
+            self._schedule(agent_id, agent, now)
+            return verdict
+        if agent.pending is not None:
+            self.stats.coalesced += 1
+        changed = [section for section in SECTIONS if hashes[section] != base_hashes.get(section)]
+        if not changed:
+            # Back to what OpenClaw already has (or is about to).
+            agent.pending = None
+            self._urgent.discard(agent_id)
+            self._schedule(agent_id, agent, now)
+            return verdict
+        urgent = changed != ["availability"] or not _load_only(base_availability, update.availability)
+        agent.pending = _Delta(update, {section: body.get(section) for section in changed}, hashes, urgent)
+        self.stats.deltas += 1
+        if urgent:
+            self._urgent.add(agent_id)
+        else:
+            self._urgent.discard(agent_id)
+            self._schedule(agent_id, agent, now)
+        return verdict
+
+    def touch(self, agent_id: str, now: Optional[float] = None) -> None:
+        """Mark a previously submitted agent alive without a status payload."""
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            raise KeyError(f"agent {agent_id} has not submitted a status")
+        now = self.clock() if now is None else now
+        agent.last_seen = now
+        self._schedule(agent_id, agent, now)
+
+    async def flush(self, now: Optional[float] = None) -> int:
+        """Send every urgent delta and due heartbeat; return the entries acknowledged."""
+        now = self.clock() if now is None else now
+        entries: List[Tuple[str, Optional[_Delta], float]] = []
+        urgent, self._urgent = self._urgent, set()
+        for agent_id in urgent:
+            agent = self._agents[agent_id]
+            if agent.pending is not None:
+                entries.append((agent_id, agent.pending, agent.last_seen))
+        while self._heartbeats and self._heartbeats[0][0] <= now:
+            due, agent_id = heapq.heappop(self._heartbeats)
+            agent = self._agents[agent_id]
+            if agent.heartbeat_due != due:
+                continue
+            agent.heartbeat_due = None
+            if agent_id in urgent and agent.pending is not None:
+                continue
+            if agent.pending is not None:
+                entries.append((agent_id, agent.pending, agent.last_seen))
+            elif agent.last_seen > agent.reported:
+                entries.append((agent_id, None, agent.last_seen))
+            # Agents not seen since their last heartbeat go quiet until they
+            # touch or submit again.
+        if not entries:
+            return 0
+        chunks = [entries[i: i + self.max_batch] for i in range(0, len(entries), self.max_batch)]
+        return sum(await asyncio.gather(*(self._send(chunk, now) for chunk in chunks)))
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Flush every ``flush_interval`` (with jitter) until ``stop`` is set, then flush once more."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            await self.flush()
+            delay = self.flush_interval * (1 + self._rng.uniform(-self.jitter, self.jitter))
+            try:
+                await asyncio.wait_for(stop.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+        await self.flush()
+
+    async def _send(self, chunk: List[Tuple[str, Optional[_Delta], float]], now: float) -> int:
+        updates = [delta.entry(seen) for _, delta, seen in chunk if delta is not None]
+        heartbeats = [
+            {"agent_id": agent_id, "last_heartbeat": _iso(seen)} for agent_id, delta, seen in chunk if delta is None
+        ]
+        self.stats.calls += 1
+        for agent_id, delta, _ in chunk:
+            if delta is not None:
+                self._agents[agent_id].inflight = delta
+        try:
+            await self.client.call_tool(SERVER, BATCH_TOOL, {"updates": updates, "heartbeats": heartbeats})
+        except MCPError:
+            self.stats.failed_calls += 1
+            for agent_id, delta, _ in chunk:
+                agent = self._agents[agent_id]
+                if delta is not None and agent.inflight is delta:
+                    agent.inflight = None
+                if delta is not None and agent.pending is not None and agent.pending is not delta:
+                    self._rebase(agent_id, agent)
+                if delta is not None and agent.pending is delta and delta.urgent:
+                    self._urgent.add(agent_id)
+                else:
+                    self._schedule(agent_id, agent, now)
+            return 0
+        for agent_id, delta, seen in chunk:
+            agent = self._agents[agent_id]
+            agent.reported = seen
+            agent.sent_at = now
+            if delta is not None:
+                agent.hashes = delta.hashes
+                agent.availability = delta.update.availability
+                if agent.inflight is delta:
+                    agent.inflight = None
+                if agent.pending is delta:
+                    agent.pending = None
+                elif agent.pending is not None:
+                    self._rebase(agent_id, agent)
+                self.stats.published += 1
+            else:
+                self.stats.heartbeats += 1
+            agent.heartbeat_due = None
+            self._schedule(agent_id, agent, now)
+        return len(chunk)
+
+    def _rebase(self, agent_id: str, agent: _Agent) -> None:
+        """Re-diff a delta submitted while another was in flight against the acked state."""
+        pending = agent.pending
+        changed = [section for section in SECTIONS if pending.hashes[section] != agent.hashes.get(section)]
+        if not changed:
+            agent.pending = None
+            self._urgent.discard(agent_id)
+            return
+        body = pending.update.model_dump(mode="json", include=set(SECTIONS))
+        pending.sections = {section: body.get(section) for section in changed}
+        pending.urgent = changed != ["availability"] or not _load_only(agent.availability, pending.update.availability)
+        if pending.urgent:
+            self._urgent.add(agent_id)
+
+    def _schedule(self, agent_id: str, agent: _Agent, now: float) -> None:
+        if agent.heartbeat_due is not None:
+            return
+        interval = self.heartbeat_interval * (1 + self._rng.uniform(0, self.jitter))
+        agent.heartbeat_due = max(now, agent.sent_at + interval)
+        heapq.heappush(self._heartbeats, (agent.heartbeat_due, agent_id))
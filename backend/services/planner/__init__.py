@@ -0,0 +1,12 @@
+"""
+Planner service: goal decomposition and resource filtering.
+"""
+
+from backend.services.planner.semantic_filter import (
+    MCPRelevanceScorer,
+    RelevanceScorer,
+    SemanticFilter,
+    SemanticFilterStats,
+)
+
+__all__ = ["MCPRelevanceScorer", "RelevanceScorer", "SemanticFilter", "SemanticFilterStats"]
@@ -0,0 +1,38 @@
+"""
+Request and response schemas for the Planner semantic filter
+(specs/technical.md Section 2.1.3).
+"""
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class FilterContent(BaseModel):
+    type: Literal["text", "image", "video"] = "text"
+    content: str
+    source: str = ""
+
+
+class FilterContext(BaseModel):
+    active_goals: List[str] = []
+    relevance_threshold: float = Field(default=0.75, ge=0.0, le=1.0)
+
+
+class SemanticFilterRequest(BaseModel):
+    """``POST /planner/semantic-filter`` request."""
+
+    agent_id: str
+    content: FilterContent
+    context: FilterContext = FilterContext()
+
+
+class SemanticFilterResponse(BaseModel):
+    """``POST /planner/semantic-filter`` response."""
+
+    filtered: bool
+    relevance_score: float = Field(..., ge=0.0, le=1.0)
+    relevance_threshold: float
+    reasoning: str
+    should_create_task: bool
+    scored_by: Optional[Literal["prefilter", "llm"]] = None
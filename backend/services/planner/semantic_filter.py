@@ -0,0 +1,278 @@
+"""
+Semantic Filter
+
+Tiered relevance filter for MCP resource updates (P-007/P-008,
+``POST /planner/semantic-filter``).
+
+Scoring every mention with the LLM does not scale, so items first go through
+a vectorized pre-filter: each item embedding is compared with the agent's
+active-goal embeddings, one matrix multiply per agent for the whole batch.
+Items whose best cosine similarity is below ``reject_below`` are discarded
+and items at or above ``accept_above`` (raised to the request's
+``relevance_threshold`` if that is higher) pass; only the uncertain band in
+between is sent to the LLM scorer, which applies ``relevance_threshold``.
+Items of agents with no known goals to compare against go to the LLM too.
+
+A fraction ``audit_rate`` of pre-filter decisions is also sent to the LLM in
+shadow mode, which gives a running estimate of the pre-filter's recall.
+Audits never change a response, and a failed LLM call only affects its own
+item, which then falls back to the pre-filter score.
+"""
+
+import asyncio
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from backend.mcp.clients.base import MCPClient, MCPError
+from backend.services.memory.embedding import Embedder, HashingEmbedder
+from backend.services.planner.models import SemanticFilterRequest, SemanticFilterResponse
+
+
+class RelevanceScorer(Protocol):
+    """LLM relevance scorer (e.g. Gemini Flash)."""
+
+    async def score(
+        self, agent_id: str, content: str, goals: Sequence[str]
+    ) -> Tuple[float, str]:
+        """Return ``(relevance 0.0-1.0, reasoning)`` of ``content`` to ``goals``."""
+        ...
+
+
+class MCPRelevanceScorer:
+    """Scores relevance via ``mcp-server-gemini``'s ``score_relevance`` tool."""
+
+    def __init__(self, client: MCPClient, server: str = "mcp-server-gemini"):
+        self.client = client
+        self.server = server
+
+    async def score(
+        self, agent_id: str, content: str, goals: Sequence[str]
+    ) -> Tuple[float, str]:
+        response = await self.client.call_tool(
+            self.server,
+            "score_relevance",
+            {"agent_id": agent_id, "content": content, "goals": list(goals)},
+        )
+        if not isinstance(response, dict) or "relevance_score" not in response:
+            raise MCPError(f"{self.server}/score_relevance returned no relevance_score")
+        return float(response["relevance_score"]), str(response.get("reasoning", ""))
+
+
+@dataclass
+class SemanticFilterStats:
+    items: int = 0
+    prefilter_rejected: int = 0
+    prefilter_accepted: int = 0
+    llm_scored: int = 0
+    llm_accepted: int = 0
+    llm_failures: int = 0
+    audited: int = 0
+    audit_relevant: int = 0
+    audit_missed: int = 0
+    audit_failures: int = 0
+
+    @property
+    def passed(self) -> int:
+        return self.prefilter_accepted + self.llm_accepted
+
+    @property
+    def llm_call_rate(self) -> float:
+        return self.llm_scored / self.items if self.items else 0.0
+
+    @property
+    def estimated_recall(self) -> float:
+        """Share of audited LLM-relevant items the pre-filter also passed."""
+        if not self.audit_relevant:
+            return 1.0
+        return 1.0 - self.audit_missed / self.audit_relevant
+
+
+class _AgentGoals:
+    __slots__ = ("goal_ids", "texts", "rows", "matrix")
+
+    def __init__(self, goals: Mapping[str, str], matrix: np.ndarray):
+        self.goal_ids = list(goals)
+        self.texts = list(goals.values())
+        self.rows = {goal_id: row for row, goal_id in enumerate(self.goal_ids)}
+        self.matrix = matrix
+
+    def select(self, active_goals: Sequence[str]) -> Tuple[np.ndarray, List[str]]:
+        if not active_goals:
+            return self.matrix, self.texts
+        rows = [self.rows[g] for g in active_goals if g in self.rows]
+        return self.matrix[rows], [self.texts[r] for r in rows]
+
+
+class SemanticFilter:
+    """
+    Embedding pre-filter in front of an LLM relevance scorer.
+
+    Args:
+        scorer: LLM scorer for the uncertain band
+        embedder: Text embedder shared with goal embeddings
+        reject_below: Cosine similarity under which items are discarded
+        accept_above: Cosine similarity at or above which items pass; both
+            bounds are calibrated per embedder (see bench_semantic_filter)
+        max_llm_concurrency: Concurrent LLM calls per batch
+        audit_rate: Fraction of pre-filter decisions re-scored by the LLM
+            to estimate recall
+    """
+
+    def __init__(
+        self,
+        scorer: RelevanceScorer,
+        embedder: Optional[Embedder] = None,
+        reject_below: float = 0.05,
+        accept_above: float = 0.5,
+        max_llm_concurrency: int = 16,
+        audit_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        if not reject_below <= accept_above:
+            raise ValueError("reject_below must not exceed accept_above")
+        self.scorer = scorer
+        self.embedder: Embedder = embedder if embedder is not None else HashingEmbedder()
+        self.reject_below = reject_below
+        self.accept_above = accept_above
+        self.max_llm_concurrency = max_llm_concurrency
+        self.audit_rate = audit_rate
+        self.stats = SemanticFilterStats()
+        self.llm_error: Optional[BaseException] = None
+        self._goals: Dict[str, _AgentGoals] = {}
+        self._rng = random.Random(seed)
+
+    def set_goals(self, agent_id: str, goals: Mapping[str, str]) -> None:
+        """Replace an agent's active goals (``goal_id -> description``)."""
+        matrix = self.embedder.embed(list(goals.values()))
+        self._goals[agent_id] = _AgentGoals(goals, matrix)
+
+    def prefilter_scores(self, requests: Sequence[SemanticFilterRequest]) -> np.ndarray:
+        """
+        Best goal cosine similarity of every request, clipped to ``[0, 1]``;
+        NaN where the agent has no known goals to compare against.
+        """
+        scores = np.zeros(len(requests), dtype=np.float32)
+        if not requests:
+            return scores
+        vectors = self.embedder.embed([r.content.content for r in requests])
+        groups: Dict[Tuple[str, Tuple[str, ...]], List[int]] = {}
+        for i, request in enumerate(requests):
+            key = (request.agent_id, tuple(request.context.active_goals))
+            groups.setdefault(key, []).append(i)
+        for (agent_id, active_goals), indices in groups.items():
+            goals = self._goals.get(agent_id)
+            matrix = goals.select(active_goals)[0] if goals is not None else ()
+            if len(matrix):
+                scores[indices] = (vectors[indices] @ matrix.T).max(axis=1)
+            else:
+                scores[indices] = np.nan
+        return np.clip(scores, 0.0, 1.0, out=scores)
+
+    async def filter(self, request: SemanticFilterRequest) -> SemanticFilterResponse:
+        """Handle ``POST /planner/semantic-filter`` for one item."""
+        return (await self.filter_batch([request]))[0]
+
+    async def filter_batch(
+        self, requests: Sequence[SemanticFilterRequest]
+    ) -> List[SemanticFilterResponse]:
+        """Filter a batch of resource items, calling the LLM only for the uncertain band."""
+        scores = self.prefilter_scores(requests).tolist()
+        self.stats.items += len(requests)
+        responses: List[Optional[SemanticFilterResponse]] = [None] * len(requests)
+        slots = asyncio.Semaphore(self.max_llm_concurrency)
+        llm_calls = []
+        audits = []
+        for i, (request, score) in enumerate(zip(requests, scores)):
+            threshold = request.context.relevance_threshold
+            accept_above = max(self.accept_above, threshold)
+            if math.isnan(score) or self.reject_below <= score < accept_above:
+                llm_calls.append(self._score_with_llm(slots, i, request, score, responses))
+                continue
+            passed = score >= accept_above
+            if passed:
+                self.stats.prefilter_accepted += 1
+                reasoning = f"goal similarity {score:.2f} >= {accept_above:.2f}"
+            else:
+                self.stats.prefilter_rejected += 1
+                reasoning = f"goal similarity {score:.2f} < {self.reject_below:.2f}"
+            responses[i] = SemanticFilterResponse(
+                filtered=not passed,
+                relevance_score=score,
+                relevance_threshold=threshold,
+                reasoning=reasoning,
+                should_create_task=passed,
+                scored_by="prefilter",
+            )
+            if self.audit_rate and self._rng.random() < self.audit_rate:
+                audits.append(self._audit(slots, request, passed))
+        _, audited = await asyncio.gather(
+            asyncio.gather(*llm_calls), asyncio.gather(*audits, return_exceptions=True)
+        )
+        for outcome in audited:
+            if isinstance(outcome, Exception):
+                self.stats.audit_failures += 1
+                self.llm_error = outcome
+        return responses  # type: ignore[return-value]
+
+    async def _llm(
+        self, slots: asyncio.Semaphore, request: SemanticFilterRequest
+    ) -> Tuple[float, str]:
+        goals = self._goals.get(request.agent_id)
+        texts = goals.select(request.context.active_goals)[1] if goals is not None else []
+        if not texts:
+            texts = list(request.context.active_goals)
+        async with slots:
+            score, reasoning = await self.scorer.score(
+                request.agent_id, request.content.content, texts
+            )
+        return min(max(score, 0.0), 1.0), reasoning
+
+    async def _score_with_llm(
+        self,
+        slots: asyncio.Semaphore,
+        index: int,
+        request: SemanticFilterRequest,
+        prefilter_score: float,
+        responses: List[Optional[SemanticFilterResponse]],
+    ) -> None:
+        threshold = request.context.relevance_threshold
+        try:
+            score, reasoning = await self._llm(slots, request)
+        except Exception as exc:
+            self.stats.llm_failures += 1
+            self.llm_error = exc
+            score = 0.0 if math.isnan(prefilter_score) else prefilter_score
+            passed = score >= threshold
+            responses[index] = SemanticFilterResponse(
+                filtered=not passed,
+                relevance_score=score,
+                relevance_threshold=threshold,
+                reasoning=f"LLM scorer failed ({exc!r}); goal similarity {score:.2f}",
+                should_create_task=passed,
+                scored_by="prefilter",
+            )
+            return
+        passed = score >= threshold
+        self.stats.llm_scored += 1
+        self.stats.llm_accepted += passed
+        responses[index] = SemanticFilterResponse(
+            filtered=not passed,
+            relevance_score=score,
+            relevance_threshold=threshold,
+            reasoning=reasoning,
+            should_create_task=passed,
+            scored_by="llm",
+        )
+
+    async def _audit(
+        self, slots: asyncio.Semaphore, request: SemanticFilterRequest, passed: bool
+    ) -> None:
+        score, _ = await self._llm(slots, request)
+        self.stats.audited += 1
+        if score >= request.context.relevance_threshold:
+            self.stats.audit_relevant += 1
+            self.stats.audit_missed += not passed
@@ -0,0 +1,475 @@
+"""
+Latency Tracing
+
+End-to-end latency tracing for the S-008 SLO: high-priority interactions
+complete within 10 seconds from resource ingestion to response, excluding
+HITL.
+
+A trace is one task. :func:`trace` opens it (in a Worker, around each
+task, see :class:`chimera.handlers.SkillHandler`) with the task's
+``task_id``, ``agent_id``, ``task_type``, ``priority`` and ingestion time,
+and keeps that
+context in a :mod:`contextvars` variable, so every coroutine and task started
+underneath sees it, including coroutines handed to another loop with
+``run_coroutine_threadsafe``. Stages record a :func:`span` each:
+``detect_trends``, ``skill`` (the ``execute_*`` coroutine), ``mcp`` (every
+skill tool call), ``judge_validate`` and ``judge_commit``. A span given an
+explicit ``task_id`` outside any trace starts the context itself, which is how
+a service in another process (e.g. the Judge committing a Worker result)
+joins the trace: exported spans are merged on ``task_id``.
+
+Each thread records into its own ring buffer of recent spans and its own
+HDR-style histograms keyed by ``(stage, task_type, priority)``, so the hot
+path takes no lock; readers merge the per-thread state. Histograms keep two
+significant digits from 1 µs to an hour.
+
+Set ``CHIMERA_TRACING=0`` to disable tracing, and ``CHIMERA_TRACE_EXPORT`` to
+a path (``-`` for stdout) to export JSON lines when the interpreter exits.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, NamedTuple, Optional, TextIO, Tuple
+
+HistogramKey = Tuple[str, str, str]
+
+_clock = time.perf_counter_ns
+
+
+class TraceContext(NamedTuple):
+    task_id: str
+    agent_id: str
+    task_type: str = ""
+    priority: str = ""
+
+
+class SpanRecord(NamedTuple):
+    task_id: str
+    agent_id: str
+    stage: str
+    detail: str
+    start_ns: int
+    duration_ns: int
+    error: bool
+
+
+_context: ContextVar[Optional[TraceContext]] = ContextVar("chimera_trace", default=None)
+
+
+def current_context() -> Optional[TraceContext]:
+    return _context.get()
+
+
+class HdrHistogram:
+    """
+    Log-linear histogram of microsecond values.
+
+    Values below 256 µs are counted exactly; above that every power of two is
+    split into 128 sub-buckets, bounding the relative error at 1/128.
+
+    Args:
+        highest: Largest trackable value in µs; larger values are clamped
+    """
+
+    SUB_BITS = 8
+    SUB = 1 << SUB_BITS
+    HALF = SUB >> 1
+
+    def __init__(self, highest: int = 3_600_000_000):
+        self.highest = highest
+        self.counts = [0] * (self._index(highest) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        if value < cls.SUB:
+            return value
+        shift = value.bit_length() - cls.SUB_BITS
+        return cls.SUB + (shift - 1) * cls.HALF + (value >> shift) - cls.HALF
+
+    @classmethod
+    def _upper(cls, index: int) -> int:
+        if index < cls.SUB:
+            return index
+        shift, sub = divmod(index - cls.SUB, cls.HALF)
+        return ((sub + cls.HALF + 1) << (shift + 1)) - 1
+
+    def record(self, value: int) -> None:
+        if value > self.highest:
+            value = self.highest
+        elif value < 0:
+            value = 0
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def copy(self) -> "HdrHistogram":
+        histogram = HdrHistogram(self.highest)
+        histogram.merge(self)
+        return histogram
+
+    def merge(self, other: "HdrHistogram") -> None:
+        counts = self.counts
+        for index, n in enumerate(other.counts):
+            if n:
+                counts[index] += n
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> int:
+        """Highest value (µs) equivalent to the ``q``-th percentile (0-100)."""
+        if not self.count:
+            return 0
+        rank = max(1, q / 100 * self.count)
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return min(self._upper(index), self.max)
+        return self.max
+
+    def count_above(self, value: int) -> int:
+        """Observations in buckets entirely above ``value`` µs."""
+        return sum(self.counts[self._index(min(value, self.highest)) + 1:])
+
+
+class _WorkerBuffer:
+    """
+    One thread's recent spans. Only the owning thread writes. When the ring
+    fills it is folded into the histograms, bracketed by a sequence counter
+    that readers check (and retry on) instead of taking a lock.
+    """
+
+    __slots__ = ("worker", "size", "spans", "next", "wrapped", "histograms", "sequence")
+
+    def __init__(self, worker: str, size: int):
+        self.worker = worker
+        self.size = size
+        self.spans: List[Any] = [None] * size
+        self.next = 0
+        self.wrapped = False
+        self.histograms: Dict[HistogramKey, HdrHistogram] = {}
+        self.sequence = 0
+
+    def add(self, record: tuple) -> None:
+        index = self.next
+        self.spans[index] = record
+        if index + 1 < self.size:
+            self.next = index + 1
+        else:
+            self.fold()
+
+    def fold(self) -> None:
+        self.sequence += 1
+        _fold(self.histograms, self.spans)
+        self.next = 0
+        self.wrapped = True
+        self.sequence += 1
+
+    def snapshot(self) -> Tuple[Dict[HistogramKey, HdrHistogram], List[tuple]]:
+        """Copies of the folded histograms and of the spans not yet folded."""
+        while True:
+            sequence = self.sequence
+            if not sequence & 1:
+                histograms = {key: histogram.copy() for key, histogram in list(self.histograms.items())}
+                pending = self.spans[: self.next]
+                if self.sequence == sequence:
+                    return histograms, pending
+            time.sleep(0)
+
+    def recent(self) -> List[tuple]:
+        end = self.next
+        spans = self.spans[end:] + self.spans[:end] if self.wrapped else self.spans[:end]
+        return [s for s in spans if s is not None]
+
+
+def _fold(histograms: Dict[HistogramKey, HdrHistogram], spans: List[tuple]) -> None:
+    # HdrHistogram.record inlined: this runs for every span.
+    sub, half, sub_bits = HdrHistogram.SUB, HdrHistogram.HALF, HdrHistogram.SUB_BITS
+    for context, stage, _, _, duration, _ in spans:
+        key = (stage, context.task_type, context.priority)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = HdrHistogram()
+        value = duration // 1000
+        if value >= sub:
+            if value > histogram.highest:
+                value = histogram.highest
+            shift = value.bit_length() - sub_bits
+            histogram.counts[sub + (shift - 1) * half + (value >> shift) - half] += 1
+        else:
+            histogram.counts[value if value > 0 else 0] += 1
+        histogram.count += 1
+        histogram.total += value
+        if value > histogram.max:
+            histogram.max = value
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "context", "stage", "detail", "root", "start", "token")
+
+    def __init__(self, tracer: "Tracer", context: TraceContext, stage: str, detail: str, root: bool):
+        self.tracer = tracer
+        self.context = context
+        self.stage = stage
+        self.detail = detail
+        self.root = root
+
+    def __enter__(self) -> TraceContext:
+        if self.root:
+            self.token = _context.set(self.context)
+        self.start = _clock()
+        return self.context
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        duration = _clock() - self.start
+        if self.root:
+            _context.reset(self.token)
+        try:
+            buffer = self.tracer._local.buffer
+        except AttributeError:
+            buffer = self.tracer._register()
+        # _WorkerBuffer.add inlined.
+        index = buffer.next
+        buffer.spans[index] = (self.context, self.stage, self.detail, self.start, duration, exc_type is not None)
+        if index + 1 < buffer.size:
+            buffer.next = index + 1
+        else:
+            buffer.fold()
+        return False
+
+
+class _Trace(_Span):
+    __slots__ = ("ingested_at",)
+
+    def __init__(self, tracer: "Tracer", context: TraceContext, ingested_at: Optional[float]):
+        super().__init__(tracer, context, "total", "", root=True)
+        self.ingested_at = ingested_at
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        if self.ingested_at is not None:
+            self.start = _clock() - int((time.time() - self.ingested_at) * 1e9)
+        return super().__exit__(exc_type, exc, tb)
+
+
+class Tracer:
+    """
+    Span recorder with per-thread ring buffers and latency histograms.
+
+    Args:
+        enabled: Record spans; when ``False`` every span is a shared no-op
+        ring_size: Spans kept per thread
+        slo: End-to-end objective in seconds per priority, reported as
+            violation counts of the ``total`` stage
+    """
+
+    def __init__(self, enabled: bool = True, ring_size: int = 4096, slo: Optional[Dict[str, float]] = None):
+        self.enabled = enabled
+        self.ring_size = ring_size
+        self.slo = dict(slo if slo is not None else {"high": 10.0})
+        self._local = threading.local()
+        self._buffers: List[_WorkerBuffer] = []
+        self._lock = threading.Lock()
+
+    def trace(
+        self,
+        task_id: str,
+        agent_id: str,
+        task_type: str = "",
+        priority: str = "medium",
+        ingested_at: Optional[float] = None,
+    ) -> Any:
+        """
+        Context manager tracing one task; records its ``total`` span on exit.
+
+        Args:
+            ingested_at: Epoch seconds the triggering resource was ingested;
+                the ``total`` span starts there instead of at entry
+        """
+        if not self.enabled:
+            return _NOOP
+        return _Trace(self, TraceContext(str(task_id), agent_id, task_type, priority), ingested_at)
+
+    def span(
+        self,
+        stage: str,
+        detail: str = "",
+        task_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        task_type: str = "",
+        priority: str = "",
+    ) -> Any:
+        """
+        Context manager timing one stage of the current trace.
+
+        Outside a trace the span is only recorded when ``task_id`` is given, and
+        it then becomes the trace context of everything it encloses, keyed by
+        ``task_type`` and ``priority``.
+        """
+        if not self.enabled:
+            return _NOOP
+        context = _context.get()
+        if task_id is not None and (context is None or context.task_id != task_id):
+            context = TraceContext(str(task_id), agent_id or "", task_type, priority)
+            return _Span(self, context, stage, detail, root=True)
+        if context is None:
+            return _NOOP
+        return _Span(self, context, stage, detail, root=False)
+
+    def record(
+        self, context: TraceContext, stage: str, detail: str, start_ns: int, duration_ns: int, error: bool = False
+    ) -> None:
+        """Record a span measured elsewhere."""
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._register()
+        buffer.add((context, stage, detail, start_ns, duration_ns, error))
+
+    def spans(self) -> List[SpanRecord]:
+        """Recent spans of every thread, by start time."""
+        records = [
+            SpanRecord(context.task_id, context.agent_id, stage, detail, start, duration, error)
+            for buffer in list(self._buffers)
+            for context, stage, detail, start, duration, error in buffer.recent()
+        ]
+        records.sort(key=lambda r: r.start_ns)
+        return records
+
+    def histograms(self) -> Dict[HistogramKey, HdrHistogram]:
+        merged: Dict[HistogramKey, HdrHistogram] = {}
+        for buffer in list(self._buffers):
+            histograms, pending = buffer.snapshot()
+            for key, histogram in histograms.items():
+                target = merged.get(key)
+                if target is None:
+                    merged[key] = histogram
+                else:
+                    target.merge(histogram)
+            _fold(merged, pending)
+        return merged
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """p50/p95/p99 per ``(stage, task_type, priority)``, in milliseconds."""
+        rows = []
+        for (stage, task_type, priority), histogram in sorted(self.histograms().items()):
+            row: Dict[str, Any] = {
+                "stage": stage,
+                "task_type": task_type,
+                "priority": priority,
+                "count": histogram.count,
+                "mean_ms": histogram.mean / 1e3,
+                "p50_ms": histogram.percentile(50) / 1e3,
+                "p95_ms": histogram.percentile(95) / 1e3,
+                "p99_ms": histogram.percentile(99) / 1e3,
+                "max_ms": histogram.max / 1e3,
+            }
+            slo = self.slo.get(priority)
+            if stage == "total" and slo is not None:
+                row["slo_ms"] = slo * 1e3
+                row["slo_violations"] = histogram.count_above(int(slo * 1e6))
+            rows.append(row)
+        return rows
+
+    def export(self, out: TextIO, spans: bool = False) -> int:
+        """Write the summary (and recent spans) to ``out`` as JSON lines; return lines written."""
+        lines = 0
+        for row in self.summary():
+            out.write(json.dumps({"type": "latency", **row}) + "\n")
+            lines += 1
+        if spans:
+            for record in self.spans():
+                out.write(json.dumps({"type": "span", **record._asdict()}) + "\n")
+                lines += 1
+        out.flush()
+        return lines
+
+    def export_to(self, path: str, spans: bool = False) -> int:
+        """:meth:`export` to a file (appending), or to stdout for ``-``."""
+        if path == "-":
+            return self.export(sys.stdout, spans)
+        with open(path, "a", encoding="utf-8") as out:
+            return self.export(out, spans)
+
+    def reset(self) -> None:
+        """Drop every recorded span; only safe while no thread is recording."""
+        with self._lock:
+            for buffer in self._buffers:
+                buffer.sequence += 1
+                buffer.spans = [None] * buffer.size
+                buffer.next = 0
+                buffer.wrapped = False
+                buffer.histograms = {}
+                buffer.sequence += 1
+
+    def _register(self) -> _WorkerBuffer:
+        buffer = _WorkerBuffer(f"{os.getpid()}/{threading.current_thread().name}", self.ring_size)
+        self._local.buffer = buffer
+        with self._lock:
+            self._buffers.append(buffer)
+        return buffer
+
+
+tracer = Tracer(enabled=os.environ.get("CHIMERA_TRACING", "1") != "0")
+
+
+def trace(
+    task_id: str,
+    agent_id: str,
+    task_type: str = "",
+    priority: str = "medium",
+    ingested_at: Optional[float] = None,
+) -> Any:
+    """:meth:`Tracer.trace` on the process-wide tracer."""
+    return tracer.trace(task_id, agent_id, task_type, priority, ingested_at)
+
+
+def trace_task(task: Any, ingested_at: Optional[float] = None) -> Any:
+    """Trace a :class:`~backend.database.models.tasks.Task`, from its ``created_at`` by default."""
+    if ingested_at is None and task.created_at is not None:
+        ingested_at = task.created_at.timestamp()
+    return tracer.trace(str(task.task_id), task.agent_id, task.task_type, task.priority, ingested_at)
+
+
+def span(
+    stage: str,
+    detail: str = "",
+    task_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    task_type: str = "",
+    priority: str = "",
+) -> Any:
+    """:meth:`Tracer.span` on the process-wide tracer."""
+    return tracer.span(stage, detail, task_id, agent_id, task_type, priority)
+
+
+_export_path = os.environ.get("CHIMERA_TRACE_EXPORT")
+if _export_path:
+    atexit.register(tracer.export_to, _export_path)
@@ -0,0 +1,5 @@
+"""
+Project Chimera performance benchmarks.
+
+Each module is runnable with ``python -m benchmarks.<name>``.
+"""
@@ -0,0 +1,120 @@
+"""
+Benchmark: audit log append throughput and indexed query latency.
+
+Appends ``--events`` audit events (one per ``--interval`` seconds of
+simulated time, ``--agents`` agents, a handful of actions) to a fresh
+:class:`AuditLog` in batches, then measures fsynced appends from
+``--writers`` concurrent threads (group commit) and the latency of typical
+S-004 viewer queries: a one-hour window, one agent over a day, one action
+over a day, and a full-history scan for a rare agent. The sparse indexes
+make query cost depend on the matching blocks, not on history size, so the
+figures carry over to logs of 100M events (about 30 GB at ~300 bytes per
+event), which this benchmark does not write by default.
+
+Usage:
+    python -m benchmarks.bench_audit_log --events 1000000
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from typing import Callable
+
+from backend.database.repositories.audit_log import AuditEvent, AuditLog
+from backend.mcp.clients.pooled import LatencyHistogram
+
+ACTIONS = ("state_commit", "occ_conflict", "hitl_approve", "hitl_reject", "policy_update")
+START = 1_767_225_600.0  # 2026-01-01T00:00:00Z
+
+
+def make_event(i: int, agents: int, interval: float) -> AuditEvent:
+    return AuditEvent(
+        actor="judge",
+        action=ACTIONS[(i * 7) % len(ACTIONS)] if i % 97 else "policy_update",
+        agent_id=f"agent_{(i * 31) % agents}" if i % 50_000 else "agent_rare",
+        artifact_hash=f"{i:064x}",
+        policy_version="v12",
+        reasoning_trace="confidence 0.93 above auto-approve threshold",
+        timestamp=START + i * interval,
+    )
+
+
+def timed(fn: Callable[[], int], repeat: int) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        histogram.observe(time.perf_counter() - t0)
+    return histogram
+
+
+def run(events: int, agents: int, interval: float, writers: int, batch: int) -> dict:
+    with tempfile.TemporaryDirectory() as root:
+        log = AuditLog(root)
+        t0 = time.perf_counter()
+        for i in range(0, events, batch):
+            log.append_many([make_event(j, agents, interval) for j in range(i, min(events, i + batch))])
+        bulk_elapsed = time.perf_counter() - t0
+
+        per_writer = 500
+        fsyncs_before = log.stats.fsyncs
+
+        def writer(w: int) -> None:
+            for k in range(per_writer):
+                log.append(make_event(events + w * per_writer + k, agents, interval))
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+        t0 = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        concurrent_elapsed = time.perf_counter() - t0
+        fsyncs = log.stats.fsyncs - fsyncs_before
+
+        span = events * interval
+        mid = START + span / 2
+
+        def count(**filters) -> Callable[[], int]:
+            return lambda: sum(1 for _ in log.query(**filters))
+
+        queries = {
+            "hour_window": count(start=mid, end=mid + 3600),
+            "agent_day": count(start=mid, end=mid + 86400, agent_id="agent_7"),
+            "action_day": count(start=mid, end=mid + 86400, action="policy_update"),
+            "rare_agent_all_time": count(agent_id="agent_rare"),
+        }
+        result = {
+            "events": events,
+            "segments": log.stats.segments_sealed + 1,
+            "bulk_append_events_per_sec": events / bulk_elapsed,
+            "fsynced_appends_per_sec": writers * per_writer / concurrent_elapsed,
+            "events_per_fsync": writers * per_writer / max(1, fsyncs),
+        }
+        for name, query in queries.items():
+            latency = timed(query, repeat=5)
+            result[f"{name}_p50_ms"] = latency.percentile(50) * 1e3
+        t0 = time.perf_counter()
+        verified = log.verify()
+        result["verify_events_per_sec"] = verified.records / (time.perf_counter() - t0)
+        log.close()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--agents", type=int, default=1_000)
+    parser.add_argument("--interval", type=float, default=0.5)
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--batch", type=int, default=1_000)
+    args = parser.parse_args()
+
+    result = run(args.events, args.agents, args.interval, args.writers, args.batch)
+    for name, value in result.items():
+        print(f"{name:>32}: {value:,.3f}" if isinstance(value, float) else f"{name:>32}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Benchmark: character reference caching for 1,000 concurrently posting agents.
+
+Each of ``--agents`` agents posts ``--posts`` images at once, drawing its
+persona from ``--characters`` characters (a few popular personas are shared
+by many agents). A fake ``mcp-server-ideogram`` sleeps to fetch and encode a
+reference set and to generate. The baseline fetches and encodes the
+references for every image and generates one image per call; the cached run
+uses :class:`CharacterImageBatcher` over a :class:`CharacterReferenceCache`
+whose memory budget holds only part of the working set, so the spill file is
+exercised. The provider serves ``--provider-slots`` requests at a time.
+
+Usage:
+    python -m benchmarks.bench_character_cache --agents 1000 --posts 3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from uuid import uuid4
+
+import numpy as np
+
+from skills.generate_image import GenerateImageInput, execute_generate_image
+from worker.character_cache import (
+    CharacterImageBatcher,
+    CharacterReference,
+    CharacterReferenceCache,
+    ReferenceSpillStore,
+)
+
+ENCODE_SECONDS = 0.05
+GENERATE_SECONDS = 0.02
+BATCH_ITEM_SECONDS = 0.004
+IMAGES_PER_CHARACTER = 4
+EMBEDDING_DIM = 768
+IMAGE_BYTES = 64 * 1024
+
+
+class FakeIdeogram:
+    """Encodes references and generates images by sleeping."""
+
+    def __init__(self, slots: int):
+        self.slots = asyncio.Semaphore(slots)
+        self.encodes = 0
+        self.calls = 0
+
+    async def load(self, character_id: str) -> CharacterReference:
+        self.encodes += 1
+        async with self.slots:
+            await asyncio.sleep(ENCODE_SECONDS)
+        return CharacterReference(
+            character_id=character_id,
+            version="v1",
+            embeddings=np.zeros((IMAGES_PER_CHARACTER, EMBEDDING_DIM), dtype=np.float32),
+            images=tuple(bytes(IMAGE_BYTES) for _ in range(IMAGES_PER_CHARACTER)),
+        )
+
+    async def call_tool(self, server, tool, arguments):
+        self.calls += 1
+        if tool == "generate_images":
+            requests = arguments["requests"]
+            async with self.slots:
+                await asyncio.sleep(GENERATE_SECONDS + BATCH_ITEM_SECONDS * len(requests))
+            return {"results": [{"content": "s3://images/x.png", "cost_estimate": 0.04} for _ in requests]}
+        await self.load(arguments["character_reference_id"])
+        async with self.slots:
+            await asyncio.sleep(GENERATE_SECONDS + BATCH_ITEM_SECONDS)
+        return {"content": "s3://images/x.png", "cost_estimate": 0.04}
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+def workload(agents: int, posts: int, characters: int, seed: int):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(characters)]
+    personas = rng.choices(range(characters), weights=weights, k=agents)
+    return [
+        GenerateImageInput(
+            prompt=f"post {post} by agent {agent}",
+            character_reference_id=f"persona_{persona}",
+            agent_id=f"agent_{agent}",
+            task_id=str(uuid4()),
+        )
+        for agent, persona in enumerate(personas)
+        for post in range(posts)
+    ]
+
+
+async def baseline(inputs, slots: int) -> FakeIdeogram:
+    provider = FakeIdeogram(slots)
+    await asyncio.gather(*(execute_generate_image(i, provider) for i in inputs))
+    return provider
+
+
+async def cached(inputs, slots: int, rounds: int, max_bytes: int, spill_path: str):
+    provider = FakeIdeogram(slots)
+    spill = ReferenceSpillStore(spill_path)
+    cache = CharacterReferenceCache(provider, max_bytes=max_bytes, spill=spill)
+    batcher = CharacterImageBatcher(provider, cache, max_batch=16, max_delay=0.005)
+    for _ in range(rounds):
+        await asyncio.gather(*(execute_generate_image(i, provider, batcher=batcher) for i in inputs))
+    spill.close()
+    return provider, cache, batcher
+
+
+def run(agents: int, posts: int, characters: int, slots: int, rounds: int, memory_mb: int) -> dict:
+    inputs = workload(agents, posts, characters, seed=0)
+    t0 = time.perf_counter()
+    plain = asyncio.run(baseline(inputs, slots))
+    baseline_elapsed = time.perf_counter() - t0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        provider, cache, batcher = asyncio.run(
+            cached(inputs, slots, rounds, memory_mb * 2**20, os.path.join(tmp, "references.bin"))
+        )
+        cached_elapsed = time.perf_counter() - t0
+
+    return {
+        "images": len(inputs),
+        "baseline_images_per_sec": len(inputs) / baseline_elapsed,
+        "baseline_reference_encodes": plain.encodes,
+        "baseline_provider_calls": plain.calls,
+        "cached_images_per_sec": rounds * len(inputs) / cached_elapsed,
+        "cached_reference_encodes": provider.encodes,
+        "cached_provider_calls": provider.calls,
+        "hit_rate": cache.stats.hit_rate,
+        "memory_hits": cache.stats.memory_hits,
+        "spill_hits": cache.stats.spill_hits,
+        "spilled": cache.stats.spilled,
+        "mean_batch_size": batcher.stats.mean_batch_size,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, default=1_000)
+    parser.add_argument("--posts", type=int, default=3)
+    parser.add_argument("--characters", type=int, default=400)
+    parser.add_argument("--provider-slots", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--memory-mb", type=int, default=32)
+    args = parser.parse_args()
+
+    result = run(args.agents, args.posts, args.characters, args.provider_slots, args.rounds, args.memory_mb)
+    for name, value in result.items():
+        print(f"{name:>32}: {value:,.3f}" if isinstance(value, float) else f"{name:>32}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark: CFO budget validations against a cost ledger with history.
+
+Loads ``--history`` cost events for ``--agents`` agents and ``--campaigns``
+campaigns into a file-backed :class:`CostLedger`, then runs ``--validations``
+transaction validations from ``--judges`` concurrent Judge threads, each with
+its own connection. The baseline computes agent, campaign and global spend by
+summing ``cost_events`` for every validation, as a ledger without rollups
+would. Also reports batched append throughput.
+
+Usage:
+    python -m benchmarks.bench_cost_ledger --history 100000 --judges 4
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Callable, List
+
+from backend.database.repositories.cost_ledger import CostEvent, CostLedger
+
+CATEGORIES = ("inference", "generation", "posting", "transactions")
+
+
+def history(count: int, agents: int, campaigns: int, seed: int) -> List[CostEvent]:
+    rng = random.Random(seed)
+    start = time.time() - 90 * 86400
+    return [
+        CostEvent(
+            agent_id=f"agent_{rng.randrange(agents)}",
+            campaign_id=f"campaign_{rng.randrange(campaigns)}",
+            cost_category=rng.choice(CATEGORIES),
+            cost_amount=round(rng.uniform(0.001, 0.2), 4),
+            created_at=start + i * (90 * 86400 / count),
+        )
+        for i in range(count)
+    ]
+
+
+def in_threads(judges: int, per_judge: int, work: Callable[[int, int], None]) -> float:
+    threads = [threading.Thread(target=work, args=(j, per_judge)) for j in range(judges)]
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - t0
+
+
+def run(history_size: int, agents: int, campaigns: int, validations: int, judges: int) -> dict:
+    events = history(history_size, agents, campaigns, seed=0)
+    per_judge = validations // judges
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ledger.sqlite")
+        ledger = CostLedger(path)
+        ledger.set_budget("global", "*", 1e12)
+        for a in range(agents):
+            ledger.set_budget("agent", f"agent_{a}", 1e9)
+        t0 = time.perf_counter()
+        for i in range(0, len(events), 1000):
+            ledger.append(events[i: i + 1000])
+        append_elapsed = time.perf_counter() - t0
+
+        def naive(judge: int, count: int) -> None:
+            conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cost_events_agent ON cost_events (agent_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cost_events_campaign ON cost_events (campaign_id)")
+            rng = random.Random(judge)
+            for _ in range(count):
+                agent, campaign = f"agent_{rng.randrange(agents)}", f"campaign_{rng.randrange(campaigns)}"
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("SELECT SUM(cost_amount) FROM cost_events WHERE agent_id = ?", (agent,)).fetchone()
+                conn.execute(
+                    "SELECT SUM(cost_amount) FROM cost_events WHERE campaign_id = ?", (campaign,)
+                ).fetchone()
+                conn.execute("SELECT SUM(cost_amount) FROM cost_events").fetchone()
+                conn.execute("ROLLBACK")
+            conn.close()
+
+        def ledgered(judge: int, count: int) -> None:
+            own = CostLedger(path)
+            rng = random.Random(judge)
+            for _ in range(count):
+                own.reserve(
+                    CostEvent(
+                        agent_id=f"agent_{rng.randrange(agents)}",
+                        campaign_id=f"campaign_{rng.randrange(campaigns)}",
+                        cost_category="transactions",
+                        cost_amount=0.01,
+                    )
+                )
+            own.close()
+
+        naive_count = max(judges, validations // 100)  # the baseline is slow; sample it
+        naive_elapsed = in_threads(judges, naive_count // judges, naive)
+        ledger_elapsed = in_threads(judges, per_judge, ledgered)
+        t0 = time.perf_counter()
+        replayed = ledger.replay()
+        replay_elapsed = time.perf_counter() - t0
+        ledger.close()
+
+    return {
+        "append_events_per_sec": history_size / append_elapsed,
+        "naive_validations_per_sec": naive_count / naive_elapsed,
+        "ledger_validations_per_sec": per_judge * judges / ledger_elapsed,
+        "replay_events_per_sec": replayed / replay_elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--history", type=int, default=100_000)
+    parser.add_argument("--agents", type=int, default=1_000)
+    parser.add_argument("--campaigns", type=int, default=100)
+    parser.add_argument("--validations", type=int, default=20_000)
+    parser.add_argument("--judges", type=int, default=4)
+    args = parser.parse_args()
+
+    result = run(args.history, args.agents, args.campaigns, args.validations, args.judges)
+    for name, value in result.items():
+        print(f"{name:>32}: {value:,.3f}")
+
+
+if __name__ == "__main__":
+    main()
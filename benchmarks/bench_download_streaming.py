@@ -0,0 +1,116 @@
+"""
+Benchmark: streaming media download memory and throughput.
+
+Serves ``--size-mb`` of synthetic media from a local HTTP server and runs
+``skill_download_youtube`` into a temporary :class:`MediaStore`, reporting
+MB/s and peak traced Python memory. The baseline reads the whole body into
+memory, hashes it and writes it out, as a naive downloader would. A repeat
+request for the same video shows the duplicate check skipping the transfer.
+
+Usage:
+    python -m benchmarks.bench_download_streaming --size-mb 256
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+import urllib.request
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from uuid import uuid4
+
+from backend.database.repositories.media_store import MediaStore
+from skills.download_youtube import DownloadYouTubeInput, execute_download_youtube
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class ResolveOnly:
+    def __init__(self, url: str):
+        self.url = url
+
+    async def call_tool(self, server, tool, arguments):
+        return {"video_id": "bench", "streams": {"video": {"url": self.url, "mime_type": "video/mp4"}}}
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+def measure(fn) -> tuple:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def naive_download(url: str, target: Path) -> None:
+    body = urllib.request.urlopen(url).read()  # noqa: S310 - local server
+    hashlib.sha256(body).hexdigest()
+    target.write_bytes(body)
+
+
+def run(size_mb: int, buffer_kb: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "www").mkdir()
+        with open(root / "www" / "video.mp4", "wb") as f:
+            for _ in range(size_mb):
+                f.write(os.urandom(1024 * 1024))
+        server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), partial(QuietHandler, directory=str(root / "www"))
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/video.mp4"
+        try:
+            store = MediaStore(root / "store")
+            mcp = ResolveOnly(url)
+
+            def download():
+                input_data = DownloadYouTubeInput(
+                    video_url="https://youtube.com/watch?v=bench", agent_id="bench", task_id=str(uuid4())
+                )
+                return asyncio.run(
+                    execute_download_youtube(input_data, mcp, store=store, buffer_size=buffer_kb * 1024)
+                )
+
+            streaming_s, streaming_peak = measure(download)
+            repeat_s, _ = measure(download)
+            naive_s, naive_peak = measure(lambda: naive_download(url, root / "naive.mp4"))
+        finally:
+            server.shutdown()
+            server.server_close()
+            shutil.rmtree(root / "store", ignore_errors=True)
+    return {
+        "streaming_mb_per_sec": size_mb / streaming_s,
+        "streaming_peak_mb": streaming_peak,
+        "naive_mb_per_sec": size_mb / naive_s,
+        "naive_peak_mb": naive_peak,
+        "duplicate_request_ms": repeat_s * 1e3,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--buffer-kb", type=int, default=1024)
+    args = parser.parse_args()
+
+    for name, value in run(args.size_mb, args.buffer_kb).items():
+        print(f"{name:>32}: {value:,.3f}")
+
+
+if __name__ == "__main__":
+    main()
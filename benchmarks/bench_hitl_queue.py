@@ -0,0 +1,95 @@
+"""
+Benchmark: HITL queue pagination at depth.
+
+Enqueues ``--items`` reviews into :class:`backend.queues.hitl_queue.HITLQueue`
+(SQLite), then reports page latency for offset pagination at increasing
+depths versus keyset pagination, ``total_count`` from counters versus a COUNT
+scan, and approve latency.
+
+Usage:
+    python -m benchmarks.bench_hitl_queue --items 1000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from backend.queues.hitl_queue import HITLQueue
+
+TAGS = (["politics"], ["finance"], ["health"], [], [], [])
+
+
+def timed_ms(fn, repeats: int = 5) -> float:
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1e3)
+    return statistics.median(samples)
+
+
+def run(items: int, path: str, chunk: int) -> dict:
+    rng = random.Random(0)
+    now = [0.0]
+
+    def clock():
+        now[0] += 0.001
+        return now[0]
+
+    queue = HITLQueue(path, clock=clock)
+    t0 = time.perf_counter()
+    for offset in range(0, items, chunk):
+        queue.enqueue_many(
+            {
+                "review_id": f"review_{i:08d}",
+                "result_id": f"result_{i}",
+                "agent_id": f"agent_{i % 500}",
+                "artifact": {"type": "text", "content": "caption"},
+                "confidence_score": rng.uniform(0.7, 0.9),
+                "risk_tags": rng.choice(TAGS),
+            }
+            for i in range(offset, min(items, offset + chunk))
+        )
+    enqueue_rate = items / (time.perf_counter() - t0)
+
+    deep = max(0, queue.total_count("sensitive") - 100)
+    cursor_page = queue.list("sensitive", limit=50, offset=deep - 1 if deep else 0)
+    cursor = cursor_page.next_cursor
+
+    result = {
+        "items": items,
+        "enqueue_per_sec": enqueue_rate,
+        "first_page_ms": timed_ms(lambda: queue.list("sensitive", limit=50)),
+        "offset_mid_page_ms": timed_ms(lambda: queue.list("sensitive", limit=50, offset=deep // 2)),
+        "offset_deep_page_ms": timed_ms(lambda: queue.list("sensitive", limit=50, offset=deep)),
+        "keyset_deep_page_ms": timed_ms(lambda: queue.list("sensitive", limit=50, cursor=cursor)),
+        "total_count_counter_ms": timed_ms(lambda: queue.total_count("sensitive")),
+        "total_count_scan_ms": timed_ms(
+            lambda: queue._conn.execute(
+                "SELECT COUNT(*) FROM hitl_queue WHERE status = 'pending' AND is_sensitive = 1"
+            ).fetchone()
+        ),
+    }
+    ids = [f"review_{rng.randrange(items):08d}" for _ in range(200)]
+    t0 = time.perf_counter()
+    for review_id in set(ids):
+        queue.approve(review_id, reviewer_id="bench")
+    result["approve_ms"] = (time.perf_counter() - t0) * 1e3 / len(set(ids))
+    queue.close()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--path", default=":memory:")
+    parser.add_argument("--chunk", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for name, value in run(args.items, args.path, args.chunk).items():
+        print(f"{name:>24}: {value:,.3f}" if isinstance(value, float) else f"{name:>24}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark: pooled MCP client against session-per-call.
+
+Runs ``--calls`` tool calls with ``--concurrency`` workers against the local
+fake MCP server (``backend.mcp.fake_server``). The baseline opens, handshakes
+and closes a fresh session for every call, as a per-task client does; the
+pooled client keeps ``--pool-size`` pipelined sessions open. Reports calls/sec
+and p50/p99 latency for both, plus how many fetches ``--readers`` concurrent
+reads of one resource cost.
+
+Usage:
+    python -m benchmarks.bench_mcp_pool --calls 2000 --concurrency 64 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from backend.mcp.clients.pooled import LatencyHistogram, PooledMCPClient, ServerConfig, StdioSession
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVER = "mcp-server-fake"
+
+
+def server_config(latency_ms: float, pool_size: int) -> ServerConfig:
+    return ServerConfig(
+        command=[sys.executable, "-m", "backend.mcp.fake_server", "--latency-ms", str(latency_ms)],
+        cwd=str(ROOT),
+        pool_size=pool_size,
+    )
+
+
+async def drive(calls: int, concurrency: int, call) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+    remaining = iter(range(calls))
+
+    async def worker():
+        for i in remaining:
+            started = time.perf_counter()
+            await call(i)
+            histogram.observe(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return histogram
+
+
+async def session_per_call(config: ServerConfig, calls: int, concurrency: int) -> LatencyHistogram:
+    async def call(i):
+        session = StdioSession(SERVER, config)
+        try:
+            await session.start()
+            await session.request("tools/call", {"name": "echo", "arguments": {"i": i}})
+        finally:
+            await session.close()
+
+    return await drive(calls, concurrency, call)
+
+
+async def pooled(config: ServerConfig, calls: int, concurrency: int, readers: int):
+    async with PooledMCPClient({SERVER: config}, resource_servers={"fake": SERVER}) as client:
+        histogram = await drive(
+            calls, concurrency, lambda i: client.call_tool(SERVER, "echo", {"i": i})
+        )
+        await asyncio.gather(*(client.read_resource("fake://mentions/recent") for _ in range(readers)))
+        return histogram, client.stats
+
+
+def run(calls: int, concurrency: int, latency_ms: float, pool_size: int, readers: int) -> dict:
+    config = server_config(latency_ms, pool_size)
+    baseline_calls = max(1, calls // 10)
+    t0 = time.perf_counter()
+    baseline = asyncio.run(session_per_call(config, baseline_calls, min(concurrency, 8)))
+    baseline_rate = baseline_calls / (time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    histogram, stats = asyncio.run(pooled(config, calls, concurrency, readers))
+    pooled_rate = calls / (time.perf_counter() - t0)
+
+    return {
+        "per_call_calls_per_sec": baseline_rate,
+        "per_call_p50_ms": baseline.percentile(50) * 1e3,
+        "per_call_p99_ms": baseline.percentile(99) * 1e3,
+        "pooled_calls_per_sec": pooled_rate,
+        "pooled_p50_ms": histogram.percentile(50) * 1e3,
+        "pooled_p99_ms": histogram.percentile(99) * 1e3,
+        "speedup": pooled_rate / baseline_rate,
+        "sessions_opened": stats.sessions_opened,
+        "resource_fetches": stats.resource_fetches,
+        "resource_reads_coalesced": stats.resource_coalesced,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--readers", type=int, default=100)
+    args = parser.parse_args()
+
+    result = run(args.calls, args.concurrency, args.latency_ms, args.pool_size, args.readers)
+    for name, value in result.items():
+        print(f"{name:>32}: {value:,.3f}" if isinstance(value, float) else f"{name:>32}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: hierarchical memory retrieval latency.
+
+Loads ``--vectors`` clustered embeddings spread over ``--agents`` agents into
+:class:`backend.services.memory.IVFIndex` with incremental inserts, fills each
+agent's episodic ring, then reports p50/p99 latency of semantic search,
+episodic search and recall@10 against exact per-agent search.
+
+Usage:
+    python -m benchmarks.bench_memory --vectors 1000000 --dim 64 --agents 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from backend.services.memory import EpisodicMemory, IVFIndex, MemoryEntry
+from backend.services.memory.embedding import normalize
+
+
+def clustered(rng, means, n):
+    dim = means.shape[1]
+    points = means[rng.integers(0, len(means), n)] + 0.5 * rng.normal(size=(n, dim)).astype(np.float32)
+    return normalize(points)
+
+
+def percentiles(samples_ms):
+    return float(np.percentile(samples_ms, 50)), float(np.percentile(samples_ms, 99))
+
+
+def run(vectors: int, dim: int, agents: int, nprobe: int, queries: int, chunk: int, path) -> dict:
+    rng = np.random.default_rng(0)
+    means = rng.normal(size=(256, dim)).astype(np.float32)
+    index = IVFIndex(dim, nprobe=nprobe, exact_threshold=256, path=path)
+    agent_ids = [f"agent_{i}" for i in range(agents)]
+
+    t0 = time.perf_counter()
+    for offset in range(0, vectors, chunk):
+        size = min(chunk, vectors - offset)
+        entries = [
+            MemoryEntry(str(i), agent_ids[i % agents], "semantic", "", 0.0)
+            for i in range(offset, offset + size)
+        ]
+        index.add(entries, clustered(rng, means, size))
+    insert_seconds = time.perf_counter() - t0
+
+    episodic = EpisodicMemory(dim, capacity=1024)
+    now = time.time()
+    for agent_id in agent_ids:
+        for vector in clustered(rng, means, 1024):
+            episodic.append(MemoryEntry("e", agent_id, "episodic", "", now), vector)
+
+    query_vectors = clustered(rng, means, queries)
+    semantic_ms, episodic_ms, recall = [], [], []
+    agent_matrix = {}
+    for n, q in enumerate(query_vectors):
+        agent_id = agent_ids[n % agents]
+        t0 = time.perf_counter()
+        hits = index.search(agent_id, q, 10)
+        semantic_ms.append((time.perf_counter() - t0) * 1e3)
+        t0 = time.perf_counter()
+        episodic.query(agent_id, q, 10, now)
+        episodic_ms.append((time.perf_counter() - t0) * 1e3)
+
+        if n < 100:
+            if agent_id not in agent_matrix:
+                rows = np.frombuffer(index._agent_rows[agent_id], dtype=np.int64).copy()
+                agent_matrix[agent_id] = (rows, index._matrix.rows[rows])
+            rows, matrix = agent_matrix[agent_id]
+            exact = set(rows[np.argsort(-(matrix @ q))[:10]].tolist())
+            recall.append(len(exact & {int(e.memory_id) for e, _ in hits}) / 10)
+
+    semantic_p50, semantic_p99 = percentiles(semantic_ms)
+    episodic_p50, episodic_p99 = percentiles(episodic_ms)
+    index.close()
+    return {
+        "vectors": vectors,
+        "insert_vectors_per_sec": vectors / insert_seconds,
+        "semantic_p50_ms": semantic_p50,
+        "semantic_p99_ms": semantic_p99,
+        "episodic_p50_ms": episodic_p50,
+        "episodic_p99_ms": episodic_p99,
+        "recall_at_10": float(np.mean(recall)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vectors", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=64)
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument("--nprobe", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--chunk", type=int, default=10_000)
+    parser.add_argument("--mmap", default=None, help="memory-map vectors to this file")
+    args = parser.parse_args()
+
+    result = run(args.vectors, args.dim, args.agents, args.nprobe, args.queries, args.chunk, args.mmap)
+    for name, value in result.items():
+        print(f"{name:>24}: {value:,.3f}" if isinstance(value, float) else f"{name:>24}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
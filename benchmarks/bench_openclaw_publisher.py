@@ -0,0 +1,154 @@
+"""
+Benchmark: OpenClaw status calls per minute for simulated fleets.
+
+Simulates ``--minutes`` of a fleet on a virtual clock in ``--tick`` second
+steps. Each tick an agent's load changes with probability ``--load-change``,
+its status flips between active and idle with ``--status-change``, and it
+re-reports an unchanged status with ``--resubmit``; otherwise it only
+signals liveness. The publisher flushes every tick. Agents fall into 50
+niches with distinct capability text, so Judge verdicts are shared within a
+niche only.
+
+The baseline is specs/openclaw_integration.md taken literally: one
+``openclaw_publish_status`` call and one Judge validation per change and per
+agent heartbeat (one a minute). Reported per fleet size (``--agents``, a
+comma-separated list): MCP calls and Judge validations per minute for both,
+and the publisher's CPU time per simulated minute.
+
+Usage:
+    python -m benchmarks.bench_openclaw_publisher --agents 1000,10000 --minutes 5
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from backend.services.judge import PolicyEngine, StatusJudge
+from backend.services.judge.models import Policy, StatusUpdate
+from backend.services.openclaw import OpenClawPublisher
+
+POLICY = Policy(
+    policy_version="v1",
+    rules=[{"rule": "no_gambling", "patterns": ["bet now", "free money"]}],
+    sensitive_topics={"politics": ["election"], "finance": ["crypto"]},
+)
+NICHES = 50
+
+
+class CountingMCP:
+    def __init__(self):
+        self.calls = 0
+        self.entries = 0
+
+    async def call_tool(self, server, tool, arguments):
+        self.calls += 1
+        self.entries += len(arguments["updates"]) + len(arguments["heartbeats"])
+        return {"published": True}
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+def status(agent_id: str, state: str, load: int) -> StatusUpdate:
+    niche = int(agent_id.rsplit("_", 1)[1]) % NICHES
+    return StatusUpdate(
+        agent_id=agent_id,
+        availability={
+            "status": state,
+            "available": True,
+            "capacity": {"current_load": load, "max_concurrent_interactions": 4},
+        },
+        capabilities=[
+            {
+                "capability_id": "content_generation",
+                "name": "Content generation",
+                "description": f"Short-form posts for niche {niche}",
+            },
+            {"capability_id": "trend_analysis", "name": "Trend analysis", "description": "Culture trends"},
+        ],
+        trust_signals={
+            "policy_compliance_score": 0.98,
+            "human_oversight_enabled": True,
+            "budget_controls_active": True,
+        },
+    )
+
+
+async def simulate(agents: int, minutes: int, tick: float, load_change: float, status_change: float,
+                   resubmit: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    clock = [0.0]
+    judge = StatusJudge(PolicyEngine(POLICY))
+    client = CountingMCP()
+    publisher = OpenClawPublisher(
+        client, judge, flush_interval=tick, jitter=0.1, clock=lambda: clock[0], seed=seed
+    )
+    ids = [f"agent_{n}" for n in range(agents)]
+    state = {agent_id: ["active", rng.randrange(5)] for agent_id in ids}
+    naive_calls = 0
+    cpu = 0.0
+
+    t0 = time.perf_counter()
+    for agent_id in ids:
+        publisher.submit(status(agent_id, *state[agent_id]))
+    await publisher.flush()
+    cpu += time.perf_counter() - t0
+    naive_calls += agents
+
+    for step in range(1, int(minutes * 60 / tick) + 1):
+        clock[0] = step * tick
+        t0 = time.perf_counter()
+        for agent_id in ids:
+            current = state[agent_id]
+            changed = False
+            if rng.random() < status_change:
+                current[0] = "idle" if current[0] == "active" else "active"
+                changed = True
+            if rng.random() < load_change:
+                load = rng.randrange(5)
+                changed = changed or load != current[1]
+                current[1] = load
+            if changed:
+                naive_calls += 1
+            if changed or rng.random() < resubmit:
+                publisher.submit(status(agent_id, *current))
+            else:
+                publisher.touch(agent_id)
+        await publisher.flush()
+        cpu += time.perf_counter() - t0
+    naive_calls += agents * minutes  # one heartbeat call per agent per minute
+
+    return {
+        "naive_calls_per_min": naive_calls / minutes,
+        "naive_judge_per_min": naive_calls / minutes,
+        "calls_per_min": client.calls / minutes,
+        "judge_per_min": judge.stats.validations / minutes,
+        "judge_cache_hit_rate": judge.stats.hit_rate,
+        "entries_per_call": client.entries / client.calls,
+        "publisher_cpu_ms_per_min": cpu * 1e3 / minutes,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", default="1000,10000")
+    parser.add_argument("--minutes", type=int, default=5)
+    parser.add_argument("--tick", type=float, default=5.0)
+    parser.add_argument("--load-change", type=float, default=0.2)
+    parser.add_argument("--status-change", type=float, default=0.01)
+    parser.add_argument("--resubmit", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for agents in (int(n) for n in args.agents.split(",")):
+        result = asyncio.run(
+            simulate(agents, args.minutes, args.tick, args.load_change, args.status_change, args.resubmit, args.seed)
+        )
+        print(f"agents={agents:,}")
+        for name, value in result.items():
+            print(f"{name:>32}: {value:,.3f}")
+
+
+if __name__ == "__main__":
+    main()
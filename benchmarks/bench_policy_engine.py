@@ -0,0 +1,104 @@
+"""
+Benchmark: Judge policy validation throughput.
+
+Builds a synthetic policy (``--rules`` rules of several phrases each plus a
+sensitive-topic lexicon) and validates generated post-length artifacts with
+:class:`backend.services.judge.PolicyEngine`, reporting artifacts/sec on one
+core alongside a rule-by-rule baseline that runs one regex per phrase.
+
+Usage:
+    python -m benchmarks.bench_policy_engine --rules 500 --artifacts 5000
+"""
+
+import argparse
+import random
+import re
+import time
+
+from backend.services.judge import PolicyEngine
+from backend.services.judge.models import Policy
+
+TOPICS = ("politics", "health", "finance", "religion", "violence", "adult")
+
+
+def synthetic_policy(rules: int, rng: random.Random, vocab) -> Policy:
+    return Policy(
+        policy_version="bench",
+        rules=[
+            {
+                "rule": f"rule_{i}",
+                "patterns": [" ".join(rng.sample(vocab, rng.randint(1, 3))) for _ in range(5)],
+            }
+            for i in range(rules)
+        ],
+        sensitive_topics={topic: rng.sample(vocab, 40) for topic in TOPICS},
+    )
+
+
+def rule_by_rule(policy: Policy):
+    compiled = [
+        [re.compile(rf"(?<!\w){re.escape(p)}(?!\w)", re.IGNORECASE) for p in rule.patterns]
+        for rule in policy.rules
+    ]
+    topics = {
+        topic: [re.compile(rf"(?<!\w){re.escape(k)}(?!\w)", re.IGNORECASE) for k in keywords]
+        for topic, keywords in policy.sensitive_topics.items()
+    }
+
+    def check(content: str):
+        violations = [i for i, patterns in enumerate(compiled) if any(p.search(content) for p in patterns)]
+        detected = [t for t, patterns in topics.items() if any(p.search(content) for p in patterns)]
+        return violations, detected
+
+    return check
+
+
+def run(rules: int, artifacts: int, words: int, batch: int) -> dict:
+    rng = random.Random(0)
+    vocab = [f"word{i}" for i in range(20_000)]
+    policy = synthetic_policy(rules, rng, vocab)
+    posts = [
+        {"type": "text", "content": " ".join(rng.choice(vocab) for _ in range(words)), "metadata": {}}
+        for _ in range(artifacts)
+    ]
+
+    t0 = time.perf_counter()
+    engine = PolicyEngine(policy)
+    compile_ms = (time.perf_counter() - t0) * 1e3
+
+    t0 = time.perf_counter()
+    for offset in range(0, artifacts, batch):
+        engine.validate_batch(posts[offset: offset + batch])
+    compiled_rate = artifacts / (time.perf_counter() - t0)
+
+    baseline = rule_by_rule(policy)
+    sample = posts[: max(1, artifacts // 10)]
+    t0 = time.perf_counter()
+    for post in sample:
+        baseline(post["content"])
+    baseline_rate = len(sample) / (time.perf_counter() - t0)
+
+    return {
+        "rules": rules,
+        "phrases": sum(len(r.patterns) for r in policy.rules),
+        "compile_ms": compile_ms,
+        "compiled_artifacts_per_sec": compiled_rate,
+        "rule_by_rule_artifacts_per_sec": baseline_rate,
+        "speedup": compiled_rate / baseline_rate,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rules", type=int, default=500)
+    parser.add_argument("--artifacts", type=int, default=5_000)
+    parser.add_argument("--words", type=int, default=60)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    for name, value in run(args.rules, args.artifacts, args.words, args.batch).items():
+        print(f"{name:>32}: {value:,.3f}" if isinstance(value, float) else f"{name:>32}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
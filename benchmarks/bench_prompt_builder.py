@@ -0,0 +1,102 @@
+"""
+Benchmark: generate_content prompt assembly throughput.
+
+Builds ``--prompts`` reply prompts for ``--agents`` agents, each with a
+SOUL.md, campaign context, a sliding window of recent activity and a few
+long-term memories drawn from a shared pool. The baseline re-parses SOUL.md,
+re-renders every block and tokenizes the whole prompt for each reply, as an
+uncached assembler would; the cached run uses
+:class:`skills.prompt_builder.PromptBuilder`.
+
+Usage:
+    python -m benchmarks.bench_prompt_builder --prompts 50000
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple
+
+from skills.prompt_builder import PromptBuilder, estimate_tokens, parse_soul, render_soul
+
+BELIEFS = ["Sustainability first", "Never discuss politics", "Celebrate local makers", "Be kind"]
+
+
+def soul_text(agent: int) -> str:
+    beliefs = "\n".join(f"- {b}" for b in BELIEFS)
+    return (
+        f"---\nname: Agent {agent}\nversion: 1\n---\n"
+        f"## Backstory\n{'A designer who moved to the city and fell for street food. ' * 20}\n\n"
+        f"## Voice/Tone\nWitty, warm, a little self-deprecating.\n\n"
+        f"## Core Beliefs & Values\n{beliefs}\n\n"
+        "## Directives\n- Disclose AI status when asked\n- Never give medical advice\n"
+    )
+
+
+def workload(agents: int, prompts: int, seed: int) -> Tuple[Dict[str, str], List[tuple]]:
+    rng = random.Random(seed)
+    souls = {f"agent_{a}": soul_text(a) for a in range(agents)}
+    pool = [f"Long-term memory {i}: a fan asked about recipe {i} and loved it" for i in range(500)]
+    history: Dict[str, List[str]] = {agent: [] for agent in souls}
+    requests = []
+    for i in range(prompts):
+        agent = f"agent_{rng.randrange(agents)}"
+        history[agent] = (history[agent] + [f"replied to mention {i}"])[-20:]
+        requests.append(
+            (
+                agent,
+                f"Reply to mention {i} in your voice",
+                {"persona_constraints": BELIEFS[:2], "tone": "witty", "max_length": 280},
+                {"episodic_memory": list(history[agent]), "semantic_memory": rng.sample(pool, 5)},
+            )
+        )
+    return souls, requests
+
+
+def naive_build(soul: str, prompt: str, context: dict, memory: dict) -> Tuple[str, int]:
+    parts = [render_soul(parse_soul(soul))]
+    lines = ["Persona constraints:"] + [f"- {c}" for c in context["persona_constraints"]]
+    lines += [f"Tone: {context['tone']}", f"Maximum length: {context['max_length']} characters"]
+    parts.append("\n".join(lines))
+    parts.append("## Recent Activity\n" + "\n".join(f"- {m}" for m in memory["episodic_memory"]))
+    parts.append("## Relevant Long-Term Memories\n" + "\n".join(f"- {m}" for m in memory["semantic_memory"]))
+    system = "\n\n".join(parts)
+    return system, estimate_tokens(system) + estimate_tokens(prompt)
+
+
+def run(agents: int, prompts: int) -> dict:
+    souls, requests = workload(agents, prompts, seed=0)
+
+    t0 = time.perf_counter()
+    for agent, prompt, context, memory in requests:
+        naive_build(souls[agent], prompt, context, memory)
+    naive_elapsed = time.perf_counter() - t0
+
+    builder = PromptBuilder(lambda agent: ("1", souls[agent]))
+    t0 = time.perf_counter()
+    for agent, prompt, context, memory in requests:
+        builder.build(agent, prompt, context, memory)
+    cached_elapsed = time.perf_counter() - t0
+
+    return {
+        "naive_prompts_per_sec": prompts / naive_elapsed,
+        "cached_prompts_per_sec": prompts / cached_elapsed,
+        "speedup": naive_elapsed / cached_elapsed,
+        "souls_parsed": builder.stats.souls_parsed,
+        "segment_hit_rate": builder.stats.segment_hit_rate,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument("--prompts", type=int, default=50_000)
+    args = parser.parse_args()
+
+    result = run(args.agents, args.prompts)
+    for name, value in result.items():
+        print(f"{name:>32}: {value:,.3f}" if isinstance(value, float) else f"{name:>32}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
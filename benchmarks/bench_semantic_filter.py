@@ -0,0 +1,131 @@
+"""
+Benchmark: tiered semantic filter on a synthetic mention stream.
+
+Generates mentions that are either on-goal (a few goal words among noise) or
+off-goal (noise only), and filters them with an oracle LLM scorer that sleeps
+``--llm-latency-ms`` per call. Compares sending every item to the LLM with the
+embedding pre-filter, reporting throughput, LLM call rate, recall and
+precision against the generated labels.
+
+Usage:
+    python -m benchmarks.bench_semantic_filter --items 20000 --llm-latency-ms 2
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from backend.services.memory import HashingEmbedder
+from backend.services.planner import SemanticFilter
+from backend.services.planner.models import SemanticFilterRequest
+
+GOALS = {
+    "g1": "launch the summer sneaker collection with streetwear creators",
+    "g2": "grow coverage of addis ababa fashion week runway shows",
+    "g3": "promote sustainable cotton fabrics from local weavers",
+}
+
+
+class OracleScorer:
+    def __init__(self, labels, latency: float):
+        self.labels = labels
+        self.latency = latency
+
+    async def score(self, agent_id, content, goals):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return (0.9, "relevant") if self.labels[content] else (0.1, "irrelevant")
+
+
+def synthetic_mentions(items: int, relevant_share: float, seed: int = 0):
+    rng = random.Random(seed)
+    goal_words = sorted({w for text in GOALS.values() for w in text.split() if len(w) > 3})
+    noise = [f"word{i}" for i in range(5_000)]
+    mentions, labels = [], {}
+    for i in range(items):
+        relevant = rng.random() < relevant_share
+        words = rng.sample(noise, rng.randint(4, 12))
+        if relevant:
+            words += rng.sample(goal_words, rng.randint(2, 5))
+        rng.shuffle(words)
+        text = " ".join(words) + f" #{i}"
+        mentions.append(text)
+        labels[text] = relevant
+    return mentions, labels
+
+
+def run(
+    items: int,
+    batch: int,
+    latency: float,
+    tiered: bool,
+    relevant_share: float,
+    dim: int,
+    band: tuple,
+) -> dict:
+    mentions, labels = synthetic_mentions(items, relevant_share)
+    # llm-only: an empty reject tier and an unreachable accept tier.
+    reject_below, accept_above = band if tiered else (0.0, 1.01)
+    semantic_filter = SemanticFilter(
+        OracleScorer(labels, latency),
+        embedder=HashingEmbedder(dim),
+        reject_below=reject_below,
+        accept_above=accept_above,
+        max_llm_concurrency=64,
+    )
+    semantic_filter.set_goals("agent_1", GOALS)
+    requests = [
+        SemanticFilterRequest(agent_id="agent_1", content={"content": text}) for text in mentions
+    ]
+
+    async def main():
+        out = []
+        for offset in range(0, items, batch):
+            out.extend(await semantic_filter.filter_batch(requests[offset: offset + batch]))
+        return out
+
+    t0 = time.perf_counter()
+    responses = asyncio.run(main())
+    elapsed = time.perf_counter() - t0
+
+    truth = [labels[text] for text in mentions]
+    passed = [r.should_create_task for r in responses]
+    tp = sum(p and t for p, t in zip(passed, truth))
+    return {
+        "mode": "tiered" if tiered else "llm-only",
+        "items_per_sec": items / elapsed,
+        "llm_call_rate": semantic_filter.stats.llm_call_rate,
+        "recall": tp / max(1, sum(truth)),
+        "precision": tp / max(1, sum(passed)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--llm-latency-ms", type=float, default=2.0)
+    parser.add_argument("--relevant-share", type=float, default=0.1)
+    parser.add_argument("--dim", type=int, default=2048)
+    parser.add_argument("--reject-below", type=float, default=0.04)
+    parser.add_argument("--accept-above", type=float, default=0.2)
+    args = parser.parse_args()
+
+    for tiered in (False, True):
+        result = run(
+            args.items,
+            args.batch,
+            args.llm_latency_ms / 1e3,
+            tiered,
+            args.relevant_share,
+            args.dim,
+            (args.reject_below, args.accept_above),
+        )
+        for name, value in result.items():
+            print(f"{name:>24}: {value:,.3f}" if isinstance(value, float) else f"{name:>24}: {value}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: skill cold-start import cost.
+
+Spawns a fresh interpreter per scenario (as an ephemeral Worker would be) and
+measures, with ``python -X importtime``, the cumulative import time of the
+``skills`` package plus the modules resolved for one skill. Also reports which
+``skills.*`` modules ended up loaded, showing that a text-only Worker never
+imports the media skills.
+
+Usage:
+    python -m benchmarks.bench_skill_imports --repeats 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from skills import SKILL_REGISTRY
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+import skills
+name = {name!r}
+if name:
+    skills.load_skill(name)
+elapsed = (time.perf_counter() - t0) * 1e3
+print(json.dumps({{
+    "elapsed_ms": elapsed,
+    "modules": sorted(m for m in sys.modules if m.startswith("skills.")),
+}}))
+"""
+
+
+def measure(skill_name: Optional[str]) -> Dict[str, object]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _SCRIPT.format(name=skill_name or "")],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report = json.loads(result.stdout)
+    # -X importtime lines: "import time: self [us] | cumulative | imported package",
+    # with nested imports indented; sum the top-level skills.* entries.
+    ours = {"skills", *report["modules"]}
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) != 3 or fields[2][1:2] == " ":
+            continue
+        if fields[2].strip() in ours:
+            cumulative_us += int(fields[1])
+    report["importtime_ms"] = cumulative_us / 1e3
+    return report
+
+
+def run(repeats: int) -> List[Dict[str, object]]:
+    rows = []
+    for name in [None, *SKILL_REGISTRY]:
+        samples = [measure(name) for _ in range(repeats)]
+        rows.append(
+            {
+                "skill": name or "(package only)",
+                "wall_ms_p50": statistics.median(s["elapsed_ms"] for s in samples),
+                "importtime_ms_p50": statistics.median(s["importtime_ms"] for s in samples),
+                "modules": samples[-1]["modules"],
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for row in run(args.repeats):
+        print(
+            f"{row['skill']:>24}: wall {row['wall_ms_p50']:7.2f} ms  "
+            f"importtime {row['importtime_ms_p50']:7.2f} ms  loaded={row['modules']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
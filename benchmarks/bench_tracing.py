@@ -0,0 +1,173 @@
+"""
+Benchmark: tracing overhead on a synthetic Planner -> Worker -> Judge pipeline.
+
+Each task runs trend detection (a warm :class:`TrendEngine`),
+``skill_generate_content`` through :func:`execute_skill` against an
+in-process MCP stub that answers after ``--mcp-latency-ms``, a Judge policy
+check and a GlobalState commit, under one trace (six spans). ``--tasks``
+tasks run with ``--concurrency`` in flight, alternately with tracing on and
+off for ``--rounds`` rounds; ``overhead_pct`` compares the median round
+times.
+
+The stub latency stands in for the model call that dominates a real task.
+As a worst case with no I/O at all, ``cpu_overhead_pct`` relates the
+measured cost of a span to the pipeline's CPU time per task at zero latency.
+``--export`` writes the latency summary as JSON lines (``-`` for stdout).
+
+Usage:
+    python -m benchmarks.bench_tracing --tasks 2000 --mcp-latency-ms 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from backend import tracing
+from backend.database.repositories.global_state import InMemoryStateStore
+from backend.services.globalstate import GlobalStateCommitService
+from backend.services.globalstate.models import CommitResultRequest
+from backend.services.judge import PolicyEngine
+from backend.services.judge.models import Policy
+from skills import execute_skill
+from worker.trend_fetcher import TrendEngine
+
+POLICY = Policy(
+    policy_version="v1",
+    rules=[{"rule": "no_gambling", "patterns": ["bet now", "free money"]}],
+    sensitive_topics={"politics": ["election"]},
+)
+PRIORITIES = ("high", "medium", "low")
+
+
+class StubGemini:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def call_tool(self, server, tool, arguments):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return {"content": "The summer drop is live #fashion @chimera", "confidence_score": 0.95}
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+class StaticSource:
+    async def fetch_trends(self, platform, query, time_window):
+        return [{"topic": "summer drop", "trend_score": 0.9}]
+
+
+async def run_round(tasks: int, concurrency: int, latency: float, agents: int) -> float:
+    trends = TrendEngine(source=StaticSource())
+    store = InMemoryStateStore()
+    for a in range(agents):
+        store.create_agent(f"agent_{a}")
+    commits = GlobalStateCommitService(store)
+    policy = PolicyEngine(POLICY)
+    client = StubGemini(latency)
+    versions = [0] * agents
+    slots = asyncio.Semaphore(concurrency)
+
+    async def task(n: int) -> None:
+        agent = n % agents
+        agent_id, task_id = f"agent_{agent}", f"task_{n}"
+        async with slots:
+            with tracing.trace(task_id, agent_id, "generate_text", PRIORITIES[n % 3]):
+                await trends.adetect_trends(agent_id, "twitter", "fashion")
+                output = await execute_skill(
+                    "skill_generate_content",
+                    {
+                        "content_type": "post",
+                        "prompt": "announce the summer drop",
+                        "context": {"tone": "playful"},
+                        "agent_id": agent_id,
+                        "task_id": task_id,
+                    },
+                    client,
+                )
+                policy.validate(output.artifact)
+                version = versions[agent]
+                versions[agent] += 1
+                await commits.commit_result(
+                    CommitResultRequest(
+                        review_id=f"review_{n}",
+                        result_id=str(output.result_id),
+                        agent_id=agent_id,
+                        task_id=task_id,
+                        input_state_version=version,
+                        output_state_version=version + 1,
+                        commit_hash=f"{n:064x}",
+                    )
+                )
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(task(n) for n in range(tasks)))
+    return time.perf_counter() - t0
+
+
+def span_cost(iterations: int) -> float:
+    with tracing.trace("t", "agent", "generate_text", "high"):
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            with tracing.span("mcp", "server/tool"):
+                pass
+        traced = time.perf_counter() - t0
+    tracing.tracer.enabled = False
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        with tracing.span("mcp", "server/tool"):
+            pass
+    untraced = time.perf_counter() - t0
+    tracing.tracer.enabled = True
+    return (traced - untraced) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--agents", type=int, default=1_000)
+    parser.add_argument("--mcp-latency-ms", type=float, default=50.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--export", default=None)
+    args = parser.parse_args()
+
+    latency = args.mcp_latency_ms / 1e3
+    asyncio.run(run_round(args.tasks // 10, args.concurrency, 0.0, args.agents))  # warm up
+    tracing.tracer.enabled = False
+    cpu_per_task = min(asyncio.run(run_round(args.tasks, args.concurrency, 0.0, args.agents)) for _ in range(3))
+    cpu_per_task /= args.tasks
+
+    times = {True: [], False: []}
+    for _ in range(args.rounds):
+        for enabled in (False, True):
+            tracing.tracer.enabled = enabled
+            tracing.tracer.reset()
+            times[enabled].append(asyncio.run(run_round(args.tasks, args.concurrency, latency, args.agents)))
+    tracing.tracer.enabled = True
+    summary = tracing.tracer.summary()
+
+    traced, untraced = statistics.median(times[True]), statistics.median(times[False])
+    spans_per_task = sum(row["count"] for row in summary) / args.tasks
+    cost = span_cost(100_000)
+    high = next(r for r in summary if (r["stage"], r["priority"]) == ("total", "high"))
+    result = {
+        "tasks_per_sec_untraced": args.tasks / untraced,
+        "tasks_per_sec_traced": args.tasks / traced,
+        "overhead_pct": (traced - untraced) / untraced * 100,
+        "spans_per_task": spans_per_task,
+        "span_cost_us": cost * 1e6,
+        "cpu_us_per_task": cpu_per_task * 1e6,
+        "cpu_overhead_pct": spans_per_task * cost / cpu_per_task * 100,
+        "high_total_p50_ms": high["p50_ms"],
+        "high_total_p99_ms": high["p99_ms"],
+    }
+    for name, value in result.items():
+        print(f"{name:>32}: {value:,.3f}")
+    if args.export:
+        tracing.tracer.export_to(args.export)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark: streaming transcription memory and throughput.
+
+Writes synthetic 16 kHz mono WAV files of ``--minutes`` lengths and runs
+``skill_transcribe_audio`` over each with a fake transcriber that sleeps
+``--latency-ms`` per chunk. Reports peak traced Python memory and audio
+seconds transcribed per wall second; peak memory should not grow with the
+file length. A whole-file baseline (read every frame, then transcribe) is
+reported for comparison.
+
+Usage:
+    python -m benchmarks.bench_transcribe_streaming --minutes 5 20 60 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+import wave
+from pathlib import Path
+from typing import List
+from uuid import uuid4
+
+from skills.transcribe_audio import TranscribeAudioInput, execute_transcribe_audio
+
+RATE = 16_000
+
+
+def write_wav(path: Path, seconds: int) -> None:
+    second = b"\x01\x00" * RATE
+    with wave.open(str(path), "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(RATE)
+        for _ in range(seconds):
+            out.writeframes(second)
+
+
+def fake_transcriber(latency: float):
+    async def transcribe(chunk, input_data):
+        await asyncio.sleep(latency)
+        words = int(chunk.duration)
+        return {
+            "segments": [
+                {"start": float(k), "end": k + 1.0, "text": f"word{k}"} for k in range(words)
+            ]
+        }
+
+    return transcribe
+
+
+async def whole_file(path: Path, latency: float) -> None:
+    with wave.open(str(path), "rb") as wav:
+        pcm = wav.readframes(wav.getnframes())
+    await asyncio.sleep(latency)
+    " ".join(f"word{k}" for k in range(len(pcm) // 2 // RATE))
+
+
+def measure(coroutine_factory) -> tuple:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    asyncio.run(coroutine_factory())
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def run(minutes: List[int], chunk_seconds: float, concurrency: int, latency_ms: float) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for length in minutes:
+            path = Path(tmp) / f"{length}min.wav"
+            write_wav(path, length * 60)
+            input_data = TranscribeAudioInput(
+                audio_source=str(path),
+                source_type="object_storage",
+                format="srt",
+                timestamps=False,
+                agent_id="bench",
+                task_id=str(uuid4()),
+            )
+            elapsed, peak = measure(
+                lambda: execute_transcribe_audio(
+                    input_data,
+                    mcp_client=None,
+                    transcriber=fake_transcriber(latency_ms / 1e3),
+                    output_path=str(Path(tmp) / "out.srt"),
+                    chunk_seconds=chunk_seconds,
+                    max_concurrency=concurrency,
+                )
+            )
+            results[f"{length}min_streaming_peak_mb"] = peak
+            results[f"{length}min_audio_sec_per_sec"] = length * 60 / elapsed
+            _, peak = measure(lambda: whole_file(path, latency_ms / 1e3))
+            results[f"{length}min_whole_file_peak_mb"] = peak
+            path.unlink()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--minutes", type=int, nargs="+", default=[5, 20, 60])
+    parser.add_argument("--chunk-seconds", type=float, default=30.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    args = parser.parse_args()
+
+    for name, value in run(args.minutes, args.chunk_seconds, args.concurrency, args.latency_ms).items():
+        print(f"{name:>32}: {value:,.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: streaming trend scorer.
+
+Feeds a synthetic Zipf-distributed mention stream into
+:class:`worker.trend_scoring.StreamingTrendScorer` and reports ingest
+throughput plus the latency of scoring and ranking every tracked topic.
+
+Usage:
+    python -m benchmarks.bench_trend_scoring --topics 100000 --events 2000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from worker.trend_scoring import StreamingTrendScorer
+
+
+def synthetic_stream(topics: int, events: int, batch: int, start: float, seed: int = 0):
+    """Yield ``(topic_names, timestamps)`` batches spanning the last 7 days."""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"topic {i}" for i in range(topics)], dtype=object)
+    span = 7 * 86_400.0
+    for offset in range(0, events, batch):
+        size = min(batch, events - offset)
+        ids = (rng.zipf(1.3, size=size) - 1) % topics
+        # Timestamps advance monotonically through the window, as a live stream would.
+        base = start + span * offset / events
+        stamps = base + rng.uniform(0.0, span * size / events, size=size)
+        yield names[ids].tolist(), stamps
+
+
+def run(topics: int, events: int, batch: int, repeats: int) -> dict:
+    now = time.time()
+    start = now - 7 * 86_400.0
+    scorer = StreamingTrendScorer("mcp-server-twitter", max_topics=topics, clock=lambda: now)
+
+    # Make sure every topic has a slot so ranking is measured at full size.
+    scorer.ingest_arrays([f"topic {i}" for i in range(topics)], np.full(topics, start))
+
+    ingest_seconds = 0.0
+    for names, stamps in synthetic_stream(topics, events, batch, start):
+        t0 = time.perf_counter()
+        scorer.ingest_arrays(names, stamps)
+        ingest_seconds += time.perf_counter() - t0
+
+    score_ms = []
+    rank_ms = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        scorer.scores(now)
+        score_ms.append((time.perf_counter() - t0) * 1e3)
+        t0 = time.perf_counter()
+        scorer.top_trends("24h", limit=20, now=now)
+        rank_ms.append((time.perf_counter() - t0) * 1e3)
+
+    return {
+        "topics": len(scorer),
+        "events": events,
+        "ingest_events_per_sec": events / ingest_seconds,
+        "score_all_ms_p50": float(np.median(score_ms)),
+        "rank_top20_ms_p50": float(np.median(rank_ms)),
+        "rank_top20_ms_max": float(np.max(rank_ms)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--topics", type=int, default=100_000)
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, value in run(args.topics, args.events, args.batch, args.repeats).items():
+        print(f"{name:>24}: {value:,.3f}" if isinstance(value, float) else f"{name:>24}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
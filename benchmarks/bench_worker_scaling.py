@@ -0,0 +1,104 @@
+"""
+Benchmark: Worker pool throughput as the number of processes grows.
+
+Each task runs ``skill_generate_content`` through :func:`execute_skill`
+against a stub MCP client that burns ``--cpu-ms`` of CPU (standing in for
+the prompt assembly, validation and Judge work of a real task) and then
+waits ``--io-ms``. ``--tasks`` tasks run on a fixed pool of each size in
+``--workers`` (default: 1, 2, 4, ... up to the usable cores), one Worker per
+core. ``efficiency`` is throughput relative to ``n`` times the one-Worker
+throughput; near 1.0 is linear scaling. Runs beyond the core count measure
+oversubscription, not scaling.
+
+Usage:
+    python -m benchmarks.bench_worker_scaling --tasks 4000 --cpu-ms 2
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from chimera import Supervisor
+from skills import execute_skill
+
+
+class StubMCP:
+    def __init__(self, cpu_ms: float, io_ms: float):
+        self.cpu = cpu_ms / 1e3
+        self.io = io_ms / 1e3
+
+    async def call_tool(self, server, tool, arguments):
+        deadline = time.thread_time() + self.cpu
+        while time.thread_time() < deadline:
+            pass
+        if self.io:
+            await asyncio.sleep(self.io)
+        return {"content": "The summer drop is live #fashion", "confidence_score": 0.95}
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+def stub_skills(cpu_ms: float, io_ms: float):
+    def factory():
+        client = StubMCP(cpu_ms, io_ms)
+
+        async def handle(payload):
+            output = await execute_skill("skill_generate_content", payload, client)
+            return output.confidence_score
+
+        return handle
+
+    return factory
+
+
+def run_pool(workers: int, tasks: int, cpu_ms: float, io_ms: float, concurrency: int) -> float:
+    supervisor = Supervisor(
+        stub_skills(cpu_ms, io_ms), workers=workers, min_workers=workers, max_workers=workers,
+        concurrency=concurrency, preload=["skills.generate_content"],
+    )
+    supervisor.scheduler.add_many(
+        (
+            f"task_{n}",
+            "medium",
+            (),
+            {
+                "content_type": "post",
+                "prompt": "announce the summer drop",
+                "context": {"tone": "playful"},
+                "agent_id": f"agent_{n % 1000}",
+                "task_id": f"task_{n}",
+            },
+        )
+        for n in range(tasks)
+    )
+    t0 = time.perf_counter()
+    stats = supervisor.run()
+    elapsed = time.perf_counter() - t0
+    assert stats.completed == tasks, stats
+    return tasks / elapsed
+
+
+def main() -> None:
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=4_000)
+    parser.add_argument("--cpu-ms", type=float, default=2.0)
+    parser.add_argument("--io-ms", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", default=",".join(str(1 << k) for k in range(cores.bit_length())))
+    args = parser.parse_args()
+
+    print(f"usable cores: {cores}")
+    base = None
+    for workers in (int(n) for n in args.workers.split(",")):
+        rate = run_pool(workers, args.tasks, args.cpu_ms, args.io_ms, args.concurrency)
+        base = base or rate
+        print(f"workers={workers}")
+        print(f"{'tasks_per_sec':>32}: {rate:,.3f}")
+        print(f"{'efficiency':>32}: {rate / (workers * base):,.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: Worker process startup, pre-forked versus cold.
+
+``cold_start_ms`` is a fresh interpreter importing the skill handler and
+every skill module, i.e. what each Worker would pay if spawned rather than
+forked. ``fork_ready_ms_*`` is the time from ``fork()`` to a child's event
+loop reporting ready, over ``--workers`` Workers started ``--rounds`` times
+by a :class:`Supervisor` that imported everything once beforehand.
+``cli_exit_ms`` runs the ``chimera`` entry point end to end on an empty task
+file (interpreter start, imports, fork, drain, exit).
+
+Usage:
+    python -m benchmarks.bench_worker_startup --workers 8 --rounds 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+from chimera import Supervisor
+from chimera.handlers import skills
+
+COLD_IMPORT = "from chimera.handlers import skills; skills.preload()"
+
+
+def wall_ms(command, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run(command, check=True, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - t0) * 1e3)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    startup = []
+    pool_ready = []
+    for _ in range(args.rounds):
+        supervisor = Supervisor(skills, workers=args.workers, max_workers=args.workers, pin=False)
+        t0 = time.perf_counter()
+        supervisor.start()
+        forked = time.perf_counter()
+        supervisor.run()
+        startup.extend(supervisor.stats.startup_ns)
+        pool_ready.append((forked - t0) * 1e3)
+    startup_ms = sorted(ns / 1e6 for ns in startup)
+
+    result = {
+        "cold_start_ms": wall_ms([sys.executable, "-c", COLD_IMPORT], args.rounds),
+        "interpreter_only_ms": wall_ms([sys.executable, "-c", "pass"], args.rounds),
+        "fork_ready_ms_p50": startup_ms[len(startup_ms) // 2],
+        "fork_ready_ms_max": startup_ms[-1],
+        "pool_fork_ms": statistics.median(pool_ready),
+        "cli_exit_ms": wall_ms(
+            [sys.executable, "-m", "chimera", "--tasks", "/dev/null", "--workers", str(args.workers)],
+            args.rounds,
+        ),
+    }
+    for name, value in result.items():
+        print(f"{name:>32}: {value:,.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+"""
+Benchmark suite: Chimera contracts under a synthetic fleet, with a baseline gate.
+
+Generates a seeded fleet of ``--agents`` agents and its workload
+(:mod:`benchmarks.workload`), then times each case:
+
+- ``pydantic_validation``: cost of every hop that re-validates a payload,
+  per item (Task, skill input, Worker Result built, dumped to JSON and
+  re-validated by the Judge, commit request); ``per_result_us`` sums the
+  hops one Worker Result goes through
+- ``task_dag``: inserting the fleet's task DAGs into the scheduler and
+  draining them in dependency order
+- ``trend_detection``: ingesting a mention stream and serving one Detect
+  Trends lookup per agent, coalesced and through a fake MCP server
+- ``skill_dispatch``: ``skill_generate_content`` via :func:`execute_skill`
+  against a fake ``mcp-server-gemini``
+- ``judge_validation``: policy checks over generated Worker Results
+- ``fleet_pipeline``: trends, skill, Judge re-validation and policy check,
+  and GlobalState commit per task, ``--concurrency`` in flight
+
+Each metric is the best of ``--repeat`` runs. Names ending in ``_per_sec``
+are higher-is-better and in ``_us``/``_ms`` lower-is-better; others are
+informational. Results are written as JSON (``--out``, ``-`` for stdout)
+and compared against ``--baseline``: a compared metric more than
+``--tolerance`` worse than its baseline is a regression and the exit code
+is 1. ``--update-baseline`` rewrites the baseline from this run. Baselines
+are machine-specific; refresh them when the benchmark host changes.
+
+Usage:
+    python -m benchmarks.suite --agents 1000 --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+from backend.database.models.tasks import Task
+from backend.database.repositories.global_state import InMemoryStateStore
+from backend.queues.task_queue import TaskScheduler
+from backend.services.globalstate import GlobalStateCommitService
+from backend.services.globalstate.models import CommitResultRequest
+from backend.services.judge import PolicyEngine
+from benchmarks import workload
+from skills import execute_skill
+from skills.generate_content import GenerateContentInput, GenerateContentOutput
+from worker.trend_fetcher import MCPTrendSource, TrendEngine
+from worker.trend_scoring import TrendScoringStage
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+Metrics = Dict[str, float]
+
+
+@dataclass
+class Workload:
+    agents: List[workload.Agent]
+    tasks: List[Task]
+    task_dicts: List[Dict[str, Any]]
+    skill_inputs: List[Dict[str, Any]]
+    results: List[Dict[str, Any]]
+    mentions: List[Tuple[str, Any]]
+    concurrency: int
+
+
+def build_workload(agents: int, seed: int, concurrency: int) -> Workload:
+    fleet = workload.fleet(agents, seed)
+    tasks = workload.task_dags(fleet, workload.goals(fleet, 2, seed), seed)
+    return Workload(
+        agents=fleet,
+        tasks=tasks,
+        task_dicts=[task.model_dump() for task in tasks],
+        skill_inputs=workload.skill_inputs(fleet, 2 * agents, seed),
+        results=workload.worker_results(fleet, 2 * agents, seed=seed),
+        mentions=list(workload.mention_stream(50 * agents, time.time() - 3600, seed=seed)),
+        concurrency=concurrency,
+    )
+
+
+def per_item_us(fn: Callable[[Any], Any], items: List[Any]) -> float:
+    t0 = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - t0) / len(items) * 1e6
+
+
+def bench_pydantic_validation(w: Workload) -> Metrics:
+    built = [GenerateContentOutput.model_validate(r) for r in w.results]
+    dumped = [output.model_dump_json() for output in built]
+    commits = [
+        {
+            "review_id": f"review_{n}",
+            "result_id": r["result_id"],
+            "agent_id": r["agent_id"],
+            "task_id": r["task_id"],
+            "input_state_version": 0,
+            "output_state_version": 1,
+            "commit_hash": f"{n:064x}",
+        }
+        for n, r in enumerate(w.results)
+    ]
+    metrics = {
+        "task_validate_us": per_item_us(Task.model_validate, w.task_dicts),
+        "skill_input_validate_us": per_item_us(GenerateContentInput.model_validate, w.skill_inputs),
+        "result_build_us": per_item_us(GenerateContentOutput.model_validate, w.results),
+        "result_dump_json_us": per_item_us(GenerateContentOutput.model_dump_json, built),
+        "result_validate_json_us": per_item_us(GenerateContentOutput.model_validate_json, dumped),
+        "commit_request_validate_us": per_item_us(CommitResultRequest.model_validate, commits),
+    }
+    metrics["per_result_us"] = sum(
+        metrics[name]
+        for name in ("skill_input_validate_us", "result_build_us", "result_dump_json_us",
+                     "result_validate_json_us", "commit_request_validate_us")
+    )
+    return metrics
+
+
+def bench_task_dag(w: Workload) -> Metrics:
+    scheduler = TaskScheduler()
+    t0 = time.perf_counter()
+    for task in w.tasks:
+        scheduler.submit(task)
+    inserted = time.perf_counter()
+    while len(scheduler):
+        task_id, _ = scheduler.get_nowait()
+        scheduler.complete(task_id)
+    drained = time.perf_counter()
+    return {
+        "insert_per_sec": len(w.tasks) / (inserted - t0),
+        "drain_per_sec": len(w.tasks) / (drained - inserted),
+    }
+
+
+async def _trend_lookups(w: Workload) -> Tuple[float, float, int]:
+    stage = TrendScoringStage()
+    by_platform: Dict[str, List[Any]] = {}
+    for platform_name, event in w.mentions:
+        by_platform.setdefault(platform_name, []).append(event)
+    t0 = time.perf_counter()
+    for platform_name, events in by_platform.items():
+        stage.ingest(platform_name, events)
+    ingest = time.perf_counter() - t0
+
+    requests = [
+        {"agent_id": a.agent_id, "platform": a.platform, "query": a.niche} for a in w.agents
+    ]
+    local, remote = TrendEngine(source=stage), TrendEngine(source=MCPTrendSource(workload.FakeMCP(w.agents)))
+    t0 = time.perf_counter()
+    await local.adetect_trends_many(requests)
+    await asyncio.gather(*(remote.adetect_trends(**request) for request in requests))
+    lookups = time.perf_counter() - t0
+    return ingest, lookups, remote.stats.upstream_calls
+
+
+def bench_trend_detection(w: Workload) -> Metrics:
+    ingest, lookups, upstream = asyncio.run(_trend_lookups(w))
+    return {
+        "ingest_events_per_sec": len(w.mentions) / ingest,
+        "lookups_per_sec": 2 * len(w.agents) / lookups,
+        "upstream_calls": upstream,
+    }
+
+
+async def _dispatch(w: Workload) -> float:
+    client = workload.FakeMCP(w.agents)
+    t0 = time.perf_counter()
+    for skill_input in w.skill_inputs:
+        await execute_skill("skill_generate_content", skill_input, client)
+    return time.perf_counter() - t0
+
+
+def bench_skill_dispatch(w: Workload) -> Metrics:
+    elapsed = asyncio.run(_dispatch(w))
+    return {
+        "tasks_per_sec": len(w.skill_inputs) / elapsed,
+        "task_us": elapsed / len(w.skill_inputs) * 1e6,
+    }
+
+
+def bench_judge_validation(w: Workload) -> Metrics:
+    engine = PolicyEngine(workload.POLICY)
+    artifacts = [r["artifact"] for r in w.results]
+    t0 = time.perf_counter()
+    checks = engine.validate_batch(artifacts)
+    elapsed = time.perf_counter() - t0
+    return {
+        "artifacts_per_sec": len(artifacts) / elapsed,
+        "flagged_pct": sum(not c.policy_compliant or bool(c.sensitive_topics_detected) for c in checks)
+        / len(checks) * 100,
+    }
+
+
+async def _pipeline(w: Workload) -> float:
+    client = workload.FakeMCP(w.agents)
+    trends = TrendEngine(source=MCPTrendSource(client))
+    store = InMemoryStateStore()
+    for agent in w.agents:
+        store.create_agent(agent.agent_id)
+    commits = GlobalStateCommitService(store)
+    policy = PolicyEngine(workload.POLICY)
+    niches = {a.agent_id: a for a in w.agents}
+    versions = {a.agent_id: 0 for a in w.agents}
+    slots = asyncio.Semaphore(w.concurrency)
+
+    async def task(n: int, skill_input: Dict[str, Any]) -> None:
+        agent = niches[skill_input["agent_id"]]
+        async with slots:
+            await trends.adetect_trends(agent.agent_id, agent.platform, agent.niche)
+            output = await execute_skill("skill_generate_content", skill_input, client)
+            received = GenerateContentOutput.model_validate_json(output.model_dump_json())
+            policy.validate(received.artifact)
+            version = versions[agent.agent_id]
+            versions[agent.agent_id] += 1
+            await commits.commit_result(
+                CommitResultRequest(
+                    review_id=f"review_{n}",
+                    result_id=str(received.result_id),
+                    agent_id=agent.agent_id,
+                    task_id=received.task_id,
+                    input_state_version=version,
+                    output_state_version=version + 1,
+                    commit_hash=f"{n:064x}",
+                )
+            )
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(task(n, s) for n, s in enumerate(w.skill_inputs)))
+    return time.perf_counter() - t0
+
+
+def bench_fleet_pipeline(w: Workload) -> Metrics:
+    elapsed = asyncio.run(_pipeline(w))
+    return {
+        "tasks_per_sec": len(w.skill_inputs) / elapsed,
+        "task_us": elapsed / len(w.skill_inputs) * 1e6,
+    }
+
+
+CASES: Dict[str, Callable[[Workload], Metrics]] = {
+    "pydantic_validation": bench_pydantic_validation,
+    "task_dag": bench_task_dag,
+    "trend_detection": bench_trend_detection,
+    "skill_dispatch": bench_skill_dispatch,
+    "judge_validation": bench_judge_validation,
+    "fleet_pipeline": bench_fleet_pipeline,
+}
+
+
+def direction(metric: str) -> int:
+    """+1 if higher is better, -1 if lower is better, 0 if not compared."""
+    if metric.endswith("_per_sec"):
+        return 1
+    if metric.endswith(("_us", "_ms")):
+        return -1
+    return 0
+
+
+def best_of(runs: List[Metrics]) -> Metrics:
+    best = dict(runs[0])
+    for run in runs[1:]:
+        for name, value in run.items():
+            sign = direction(name)
+            if sign > 0:
+                best[name] = max(best[name], value)
+            elif sign < 0:
+                best[name] = min(best[name], value)
+    return best
+
+
+def compare(
+    results: Dict[str, Metrics], baseline: Dict[str, Metrics], tolerance: float
+) -> List[Dict[str, Any]]:
+    """
+    Return one entry per compared metric worse than its baseline by more
+    than ``tolerance`` (a fraction); metrics absent from either side are
+    skipped.
+    """
+    regressions = []
+    for case, metrics in results.items():
+        for name, value in metrics.items():
+            sign = direction(name)
+            base = baseline.get(case, {}).get(name)
+            if not sign or not base:
+                continue
+            change = (value - base) / base * sign  # negative is worse
+            if change < -tolerance:
+                regressions.append(
+                    {"case": case, "metric": name, "baseline": base, "value": value, "change_pct": change * 100}
+                )
+    return regressions
+
+
+def run_suite(agents: int, seed: int, repeat: int, concurrency: int, cases: List[str]) -> Dict[str, Metrics]:
+    w = build_workload(agents, seed, concurrency)
+    results = {}
+    for name in cases:
+        CASES[name](w)  # warm up imports and caches
+        results[name] = best_of([CASES[name](w) for _ in range(repeat)])
+    if "pydantic_validation" in results and "fleet_pipeline" in results:
+        results["pydantic_validation"]["pipeline_share_pct"] = (
+            results["pydantic_validation"]["per_result_us"] / results["fleet_pipeline"]["task_us"] * 100
+        )
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agents", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--out", default=None)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    cases = [name for name in args.cases.split(",") if name]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+    results = run_suite(args.agents, args.seed, args.repeat, args.concurrency, cases)
+    report: Dict[str, Any] = {
+        "meta": {
+            "agents": args.agents,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+    for case, metrics in results.items():
+        print(case, file=sys.stderr)
+        for name, value in metrics.items():
+            print(f"{name:>32}: {value:,.3f}", file=sys.stderr)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+        report["regressions"] = []
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["meta"]["agents"] != args.agents:
+            print(f"baseline is for {baseline['meta']['agents']} agents; not compared", file=sys.stderr)
+        else:
+            report["regressions"] = compare(results, baseline["results"], args.tolerance)
+    for regression in report.get("regressions", []):
+        print(
+            "REGRESSION {case}.{metric}: {value:,.3f} vs baseline {baseline:,.3f} ({change_pct:+.1f}%)".format(
+                **regression
+            ),
+            file=sys.stderr,
+        )
+
+    if args.out == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
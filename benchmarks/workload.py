@@ -0,0 +1,234 @@
+"""
+Synthetic fleet and workload generators for the benchmark suite.
+
+Everything is derived from one seed, so two runs with the same arguments
+produce the same agents, goals, task DAGs, mention streams and Worker
+results. Shapes follow the spec contracts: tasks are
+:class:`~backend.database.models.tasks.Task` models (specs/technical.md
+Section 4.1), results are Worker Result dicts (Section 4.2) ready for
+``GenerateContentOutput.model_validate``.
+
+:class:`FakeMCP` stands in for the MCP servers the skills and the trend
+source call; a fraction of its generated content trips :data:`POLICY`.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Tuple
+from uuid import UUID
+
+from backend.database.models.tasks import Task
+from backend.services.globalstate.models import Goal
+from backend.services.judge.models import Policy
+from worker.trend_scoring import TrendEvent
+
+PLATFORMS = ("twitter", "instagram", "tiktok")
+NICHES = ("fashion", "fitness", "gaming", "food", "travel", "beauty", "tech", "music")
+TONES = ("playful", "earnest", "witty", "calm")
+TOPICS_PER_NICHE = 50
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+POLICY = Policy(
+    policy_version="bench-v1",
+    rules=[
+        {"rule": "no_gambling", "patterns": ["bet now", "free money", "guaranteed win"]},
+        {"rule": "no_medical_claims", "patterns": ["cures", "miracle pill"]},
+    ],
+    sensitive_topics={"politics": ["election", "senator"], "finance": ["crypto", "stock tip"]},
+)
+RISKY_PHRASES = ("bet now", "free money", "the election", "a crypto stock tip", "this miracle pill")
+
+
+@dataclass(frozen=True)
+class Agent:
+    agent_id: str
+    niche: str
+    platform: str
+    tone: str
+
+
+def fleet(agents: int, seed: int = 0) -> List[Agent]:
+    rng = random.Random(seed)
+    return [
+        Agent(f"agent_{n}", rng.choice(NICHES), rng.choice(PLATFORMS), rng.choice(TONES))
+        for n in range(agents)
+    ]
+
+
+def goals(agents: List[Agent], per_agent: int = 2, seed: int = 0) -> Dict[str, List[Goal]]:
+    rng = random.Random(seed)
+    return {
+        agent.agent_id: [
+            Goal(
+                goal_id=f"{agent.agent_id}_goal_{n}",
+                description=f"Grow {agent.niche} audience on {agent.platform} by {rng.randint(5, 40)}%",
+                priority=rng.choice(("high", "medium", "low")),
+            )
+            for n in range(per_agent)
+        ]
+        for agent in agents
+    }
+
+
+def task_dags(
+    agents: List[Agent], goals_by_agent: Dict[str, List[Goal]], seed: int = 0
+) -> List[Task]:
+    """
+    One DAG per goal: ``generate_text`` and ``generate_image`` fan in to
+    ``post_content``, and ``engage_reply`` follows the post. Tasks are
+    listed dependencies-first.
+    """
+    rng = random.Random(seed)
+    tasks: List[Task] = []
+    for agent in agents:
+        for goal in goals_by_agent[agent.agent_id]:
+            def make(task_type: str, dependencies: List[Task]) -> Task:
+                task = Task(
+                    task_id=UUID(int=rng.getrandbits(128), version=4),
+                    agent_id=agent.agent_id,
+                    task_type=task_type,
+                    priority=goal.priority,
+                    parameters={"goal_id": goal.goal_id, "platform": agent.platform},
+                    context={"goal_description": goal.description, "tone": agent.tone},
+                    dependencies=[d.task_id for d in dependencies],
+                    state_version_snapshot=0,
+                    created_at=EPOCH,
+                )
+                tasks.append(task)
+                return task
+
+            text = make("generate_text", [])
+            image = make("generate_image", [])
+            post = make("post_content", [text, image])
+            make("engage_reply", [post])
+    return tasks
+
+
+def mention_stream(
+    events: int, start: float, per_second: float = 1_000.0, seed: int = 0
+) -> Iterator[Tuple[str, TrendEvent]]:
+    """``(platform, event)`` pairs with Zipf-like topic popularity per niche."""
+    rng = random.Random(seed)
+    ranks = range(1, TOPICS_PER_NICHE + 1)
+    weights = [1 / rank for rank in ranks]
+    for n in range(events):
+        niche = rng.choice(NICHES)
+        rank = rng.choices(ranks, weights)[0]
+        topic = f"{niche} topic {rank}"
+        yield rng.choice(PLATFORMS), TrendEvent(
+            topic, start + n / per_second, 1.0, f"loving this {topic} today"
+        )
+
+
+def content(agent: Agent, n: int, risky_rate: float, rng: random.Random) -> str:
+    text = f"Day {n} of our {agent.niche} journey, the {agent.tone} way #{agent.niche} @chimera"
+    if rng.random() < risky_rate:
+        text += f" - {rng.choice(RISKY_PHRASES)}"
+    return text
+
+
+def skill_inputs(agents: List[Agent], tasks: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Raw ``skill_generate_content`` inputs, round-robin over the fleet."""
+    rng = random.Random(seed)
+    inputs = []
+    for n in range(tasks):
+        agent = agents[n % len(agents)]
+        inputs.append({
+            "content_type": rng.choice(("post", "reply", "caption")),
+            "platform": agent.platform,
+            "prompt": f"Write about {agent.niche} topic {rng.randint(1, TOPICS_PER_NICHE)}",
+            "context": {"tone": agent.tone, "max_length": 280},
+            "agent_id": agent.agent_id,
+            "task_id": f"task_{n}",
+        })
+    return inputs
+
+
+def worker_results(
+    agents: List[Agent], results: int, risky_rate: float = 0.05, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Worker Result dicts as a Judge receives them (JSON-mode dumps)."""
+    rng = random.Random(seed)
+    out = []
+    for n in range(results):
+        agent = agents[n % len(agents)]
+        text = content(agent, n, risky_rate, rng)
+        words = text.split()
+        started = EPOCH + timedelta(seconds=n)
+        out.append({
+            "result_id": str(UUID(int=rng.getrandbits(128), version=4)),
+            "task_id": f"task_{n}",
+            "agent_id": agent.agent_id,
+            "artifact": {
+                "type": "text",
+                "content": text,
+                "metadata": {
+                    "content_type": "post",
+                    "platform": agent.platform,
+                    "word_count": len(words),
+                    "character_count": len(text),
+                    "hashtags": [w for w in words if w.startswith("#")],
+                    "mentions": [w for w in words if w.startswith("@")],
+                },
+            },
+            "confidence_score": round(rng.uniform(0.6, 1.0), 3),
+            "risk_tags": [],
+            "disclosure_level": "automated",
+            "tool_provenance": {
+                "mcp_tool": "mcp-server-gemini/generate_text",
+                "tool_version": "1.0.0",
+                "parameters_used": {"model": "gemini-2.0", "temperature": 0.7},
+                "cost_estimate": round(rng.uniform(0.0005, 0.004), 5),
+            },
+            "execution_metadata": {
+                "started_at": started.isoformat(),
+                "completed_at": (started + timedelta(milliseconds=850)).isoformat(),
+                "duration_ms": 850,
+            },
+        })
+    return out
+
+
+class FakeMCP:
+    """
+    In-process MCP servers: ``mcp-server-gemini`` generation and
+    ``mcp-server-<platform>`` trend lookups.
+
+    Args:
+        agents: Fleet whose niche and tone shape generated content
+        latency: Seconds each call waits before answering
+        risky_rate: Share of generated content that trips :data:`POLICY`
+    """
+
+    def __init__(self, agents: List[Agent], latency: float = 0.0, risky_rate: float = 0.05, seed: int = 0):
+        self.agents = agents
+        self.latency = latency
+        self.risky_rate = risky_rate
+        self.calls = 0
+        self._rng = random.Random(seed)
+
+    async def call_tool(self, server: str, tool: str, arguments: Dict[str, Any]) -> Any:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if server == "mcp-server-gemini":
+            agent = self.agents[self.calls % len(self.agents)]
+            return {
+                "content": content(agent, self.calls, self.risky_rate, self._rng),
+                "confidence_score": 0.9,
+                "model": "gemini-2.0",
+                "temperature": 0.7,
+                "cost_estimate": 0.002,
+            }
+        niche = arguments.get("query") or NICHES[self.calls % len(NICHES)]
+        return {
+            "trends": [
+                {"topic": f"{niche} topic {rank}", "trend_score": round(1 / rank, 3)}
+                for rank in range(1, 11)
+            ]
+        }
+
+    async def read_resource(self, uri: str) -> Any:
+        raise NotImplementedError(uri)
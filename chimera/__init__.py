@@ -0,0 +1,10 @@
+"""
+Project Chimera runtime.
+
+Process entry point and Worker supervisor; ``chimera`` on the command line
+runs :func:`chimera.cli.main`.
+"""
+
+from chimera.supervisor import ScalingPolicy, Supervisor, SupervisorStats
+
+__all__ = ["ScalingPolicy", "Supervisor", "SupervisorStats"]
@@ -0,0 +1,87 @@
+"""
+``chimera`` console entry point.
+
+Starts a :class:`Supervisor` over a pool of Worker processes. Tasks arrive
+as JSON lines (see :func:`chimera.supervisor.parse_task`) on ``--tasks``, a
+file or ``-`` for stdin; results are written as JSON lines to ``--results``
+and final pool statistics to stderr. Without ``--serve`` the supervisor
+drains and exits once the input is exhausted and every task has finished;
+with it, it runs until SIGTERM. The exit status is non-zero if any task
+failed, was rejected or was left undispatched by a drain.
+
+Usage:
+    chimera --tasks tasks.jsonl --results results.jsonl --max-workers 8
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import sys
+from typing import IO, Any, List, Optional
+
+from chimera.supervisor import Supervisor
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="chimera", description=__doc__.splitlines()[1])
+    parser.add_argument("--handler", default="chimera.handlers:skills",
+                        help="module:factory returning the task coroutine function")
+    parser.add_argument("--preload", default="", help="comma-separated modules to import before forking")
+    parser.add_argument("--tasks", default="-", help="JSON-lines task file, - for stdin")
+    parser.add_argument("--results", default=None, help="JSON-lines result file, - for stdout")
+    parser.add_argument("--workers", type=int, default=None, help="pool size at start")
+    parser.add_argument("--min-workers", type=int, default=1)
+    parser.add_argument("--max-workers", type=int, default=None, help="default: usable cores")
+    parser.add_argument("--concurrency", type=int, default=16, help="tasks in flight per Worker")
+    parser.add_argument("--prefetch", type=int, default=None)
+    parser.add_argument("--target-load", type=int, default=None, help="outstanding tasks per Worker")
+    parser.add_argument("--scale-down-after", type=float, default=10.0)
+    parser.add_argument("--drain-timeout", type=float, default=30.0)
+    parser.add_argument("--no-pin", action="store_true", help="do not pin Workers to cores")
+    parser.add_argument("--serve", action="store_true", help="keep running after the input ends")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    out: Optional[IO[str]] = None
+    if args.results == "-":
+        out = sys.stdout
+    elif args.results:
+        out = open(args.results, "w")
+
+    def on_result(task_id: str, ok: bool, result: Any) -> None:
+        out.write(json.dumps({"task_id": task_id, "ok": ok, "result": result}, default=str) + "\n")
+
+    supervisor = Supervisor(
+        args.handler,
+        workers=args.workers,
+        min_workers=args.min_workers,
+        max_workers=args.max_workers,
+        concurrency=args.concurrency,
+        prefetch=args.prefetch,
+        target_load=args.target_load,
+        scale_down_after=args.scale_down_after,
+        preload=[name for name in args.preload.split(",") if name],
+        pin=not args.no_pin,
+        drain_timeout=args.drain_timeout,
+        on_result=on_result if out is not None else None,
+    )
+    feed = sys.stdin.fileno() if args.tasks == "-" else os.open(args.tasks, os.O_RDONLY)
+    try:
+        stats = supervisor.run(until_idle=not args.serve, feed=feed)
+    finally:
+        if args.tasks != "-":
+            os.close(feed)
+        if out is not None and out is not sys.stdout:
+            out.close()
+    report = dataclasses.asdict(stats)
+    del report["startup_ns"]
+    report.update(startup_ms_p50=stats.startup_ms_p50, startup_ms_max=stats.startup_ms_max)
+    print(json.dumps(report), file=sys.stderr)
+    return 1 if stats.failed or stats.rejected or stats.drained else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Task handlers for the Worker runtime.
+
+A handler factory runs once per Worker process and returns the coroutine
+function that executes one task payload (see :class:`chimera.supervisor.Supervisor`).
+:func:`skills` executes ``execute_skill`` tasks, whose payload carries the
+``skill_name``/``skill_input`` pair, through a pooled MCP client.
+
+Every task runs inside a latency trace (:func:`backend.tracing.trace`) keyed
+by the payload's optional ``task_type`` (default: the skill name) and
+``priority`` (default ``medium``); ``ingested_at``, in epoch seconds, starts
+the trace's ``total`` span at resource ingestion for the S-008 SLO.
+"""
+
+import json
+import os
+from typing import Any, Dict, Mapping, Optional
+
+from backend import tracing
+from backend.mcp.clients.pooled import PooledMCPClient, ServerConfig
+from skills import SKILL_REGISTRY, execute_skill, load_skill
+
+
+def load_servers(path: Optional[str]) -> Dict[str, ServerConfig]:
+    """Read ``{server: ServerConfig fields}`` from a JSON file."""
+    if not path:
+        return {}
+    with open(path) as f:
+        return {name: ServerConfig(**config) for name, config in json.load(f).items()}
+
+
+class SkillHandler:
+    """
+    Executes ``execute_skill`` payloads with one MCP client per process.
+
+    Args:
+        mcp_client: Client shared by the process's tasks
+    """
+
+    def __init__(self, mcp_client: Any):
+        self.mcp_client = mcp_client
+
+    async def __call__(self, payload: Mapping[str, Any]) -> Dict[str, Any]:
+        skill_name, skill_input = payload["skill_name"], payload["skill_input"]
+        with tracing.trace(
+            str(skill_input.get("task_id", "")),
+            str(skill_input.get("agent_id", "")),
+            payload.get("task_type") or skill_name,
+            payload.get("priority") or "medium",
+            payload.get("ingested_at"),
+        ):
+            output = await execute_skill(skill_name, skill_input, self.mcp_client)
+        return output.model_dump(mode="json")
+
+    async def aclose(self) -> None:
+        close = getattr(self.mcp_client, "aclose", None)
+        if close is not None:
+            await close()
+
+
+def skills() -> SkillHandler:
+    """Skill handler whose MCP servers come from ``$CHIMERA_MCP_CONFIG``."""
+    return SkillHandler(PooledMCPClient(load_servers(os.environ.get("CHIMERA_MCP_CONFIG"))))
+
+
+def _preload_skills() -> None:
+    for name in SKILL_REGISTRY:
+        load_skill(name)
+
+
+# Imported by the supervisor before forking, so Workers never import a skill.
+skills.preload = _preload_skills
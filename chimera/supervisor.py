@@ -0,0 +1,597 @@
+"""
+Multi-process Worker runtime.
+
+A :class:`Supervisor` owns the :class:`TaskScheduler` and a pool of forked
+Worker processes (specs/technical.md Section 2.2). Shared modules (skills,
+Pydantic models, the handler) are imported and the heap frozen before the
+first fork, so a child is ready in milliseconds and shares those pages
+copy-on-write. Each child is pinned to one core and runs its own asyncio
+loop with ``concurrency`` tasks in flight; the supervisor streams ready tasks
+to it over a pipe, at most ``prefetch`` at a time, and feeds completions
+back into the scheduler so dependents are released.
+
+The pool follows queue depth between ``min_workers`` and ``max_workers``
+(S-007, see :class:`ScalingPolicy`). SIGTERM or SIGINT drains: no new task
+is dispatched, every Worker finishes what it already holds and exits, and
+undispatched tasks stay ``pending`` in the scheduler's store for the next
+start (:meth:`TaskScheduler.restore`); they are also reported as
+``drained`` results, since with the default in-memory store they are gone
+once the process exits. A Worker that dies has its in-flight tasks requeued.
+"""
+
+import asyncio
+import gc
+import importlib
+import json
+import math
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, Pipe, wait
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from backend import tracing
+from backend.queues.task_queue import TaskScheduler, UnknownDependencyError
+
+Handler = Callable[[Any], Awaitable[Any]]
+HandlerFactory = Callable[[], Handler]
+ResultCallback = Callable[[str, bool, Any], None]
+
+
+def resolve(spec: str) -> Any:
+    """Import ``module:attribute`` and return the attribute."""
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"expected module:attribute, got {spec!r}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def parse_task(line: str) -> Tuple[str, str, Sequence[str], Any]:
+    """
+    Parse one JSON task line into a :meth:`TaskScheduler.add_many` entry.
+
+    Fields: ``task_id`` (required), ``priority`` (default ``medium``),
+    ``dependencies`` (task_ids) and ``payload`` handed to the handler.
+
+    Raises:
+        ValueError: If the line is not a JSON object with a ``task_id`` and
+            a list of ``dependencies``
+    """
+    task = json.loads(line)
+    if not isinstance(task, dict) or "task_id" not in task:
+        raise ValueError("expected a JSON object with a task_id")
+    dependencies = task.get("dependencies", [])
+    if not isinstance(dependencies, list):
+        raise ValueError("dependencies must be a list of task_ids")
+    return (
+        str(task["task_id"]),
+        task.get("priority", "medium"),
+        [str(dep) for dep in dependencies],
+        task.get("payload"),
+    )
+
+
+class _LineReader:
+    """Non-blocking line splitter over a pipe or file descriptor."""
+
+    def __init__(self, fd: int):
+        self.fd = fd
+        self.eof = False
+        self._partial = b""
+
+    def read(self) -> List[str]:
+        chunk = os.read(self.fd, 1 << 16)
+        if not chunk:
+            self.eof = True
+            chunk, self._partial = self._partial + b"\n", b""
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        return [line.decode() for line in lines if line.strip()]
+
+
+@dataclass
+class ScalingPolicy:
+    """
+    Queue-depth autoscaling with scale-down hysteresis.
+
+    The desired pool size is the outstanding load (ready plus in-flight
+    tasks) divided by ``target_load``, clamped to the bounds. Growth is
+    applied at once, since a fork is cheap; the pool shrinks by one Worker
+    per decision, and only after the desired size has stayed below the
+    current size for ``scale_down_after`` seconds.
+
+    Args:
+        min_workers: Lower bound on live Workers
+        max_workers: Upper bound on live Workers
+        target_load: Outstanding tasks one Worker should carry
+        scale_down_after: Seconds of sustained low load before shrinking
+    """
+
+    min_workers: int = 1
+    max_workers: int = 1
+    target_load: int = 64
+    scale_down_after: float = 10.0
+    _low_since: Optional[float] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if not 0 <= self.min_workers <= self.max_workers or self.max_workers < 1:
+            raise ValueError("need 0 <= min_workers <= max_workers and max_workers >= 1")
+        if self.target_load < 1:
+            raise ValueError("target_load must be positive")
+
+    def desired(self, load: int) -> int:
+        return max(self.min_workers, min(self.max_workers, math.ceil(load / self.target_load)))
+
+    def decide(self, current: int, load: int, now: float) -> int:
+        """Return the pool size to run now, given ``current`` live Workers."""
+        want = self.desired(load)
+        if want >= current:
+            self._low_since = None
+            return want
+        if self._low_since is None:
+            self._low_since = now
+        if now - self._low_since < self.scale_down_after:
+            return current
+        self._low_since = now
+        return current - 1
+
+
+@dataclass
+class SupervisorStats:
+    """Pool and task counters of one :class:`Supervisor`."""
+
+    spawned: int = 0
+    exited: int = 0
+    crashed: int = 0
+    dispatched: int = 0
+    completed: int = 0
+    failed: int = 0
+    requeued: int = 0
+    rejected: int = 0
+    drained: int = 0
+    scale_ups: int = 0
+    scale_downs: int = 0
+    peak_workers: int = 0
+    startup_ns: List[int] = field(default_factory=list)
+
+    @property
+    def startup_ms_p50(self) -> float:
+        if not self.startup_ns:
+            return 0.0
+        return sorted(self.startup_ns)[len(self.startup_ns) // 2] / 1e6
+
+    @property
+    def startup_ms_max(self) -> float:
+        return max(self.startup_ns, default=0) / 1e6
+
+
+@dataclass
+class _WorkerProc:
+    pid: int
+    slot: int
+    conn: Connection
+    forked_ns: int
+    cpu: Optional[int]
+    ready: bool = False
+    draining: bool = False
+    inflight: Dict[str, None] = field(default_factory=dict)
+
+
+class _WorkerLoop:
+    """Child side: one asyncio loop, ``concurrency`` consumers."""
+
+    def __init__(self, conn: Connection, factory: HandlerFactory, concurrency: int):
+        self.conn = conn
+        self.factory = factory
+        self.concurrency = concurrency
+        self._done: List[Tuple[str, bool, Any]] = []
+        self._draining = False
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        handler = self.factory()
+        loop.add_reader(self.conn.fileno(), self._on_readable)
+        loop.add_signal_handler(signal.SIGTERM, self._drain)
+        consumers = [asyncio.create_task(self._consume(handler)) for _ in range(self.concurrency)]
+        self.conn.send(("ready", time.perf_counter_ns()))
+        try:
+            await asyncio.gather(*consumers)
+        finally:
+            loop.remove_reader(self.conn.fileno())
+            close = getattr(handler, "aclose", None)
+            if close is not None:
+                await close()
+        self._flush()
+        self.conn.send(("exit", None))
+
+    def _on_readable(self) -> None:
+        try:
+            while self.conn.poll():
+                kind, body = self.conn.recv()
+                if kind == "tasks":
+                    for item in body:
+                        self._queue.put_nowait(item)
+                elif kind == "drain":
+                    self._drain()
+        except (EOFError, OSError):  # supervisor is gone
+            asyncio.get_running_loop().remove_reader(self.conn.fileno())
+            self._drain()
+
+    def _drain(self) -> None:
+        if self._draining:
+            return
+        self._draining = True
+        for _ in range(self.concurrency):  # behind every task already received
+            self._queue.put_nowait(None)
+
+    async def _consume(self, handler: Handler) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            task_id, payload = item
+            try:
+                result = await handler(payload)
+            except Exception as exc:
+                to_dict = getattr(exc, "to_dict", None)
+                outcome = (task_id, False, to_dict() if to_dict else {"message": repr(exc)})
+            else:
+                outcome = (task_id, True, result)
+            if not self._done:
+                asyncio.get_running_loop().call_soon(self._flush)
+            self._done.append(outcome)
+
+    def _flush(self) -> None:
+        if self._done:
+            done, self._done = self._done, []
+            try:
+                self.conn.send(("done", done))
+            except OSError:
+                pass
+
+
+class Supervisor:
+    """
+    Pre-forking Worker pool fed by a :class:`TaskScheduler`.
+
+    Args:
+        handler: Factory called once in each Worker process, inside its
+            event loop, returning the coroutine function that executes one
+            task payload; a ``module:attribute`` string is imported before
+            forking. An ``aclose`` coroutine on the handler runs at exit.
+        scheduler: Task source (default: a fresh in-memory scheduler)
+        workers: Pool size at start (default: ``min_workers``)
+        min_workers: Autoscaling lower bound
+        max_workers: Autoscaling upper bound (default: usable cores)
+        concurrency: Tasks in flight per Worker event loop
+        prefetch: Tasks handed to one Worker ahead of completion
+            (default: ``2 * concurrency``)
+        target_load: Outstanding tasks per Worker before scaling up
+        scale_down_after: Seconds of low load before a Worker is retired
+        scale_interval: Seconds between autoscaling decisions
+        preload: Modules to import before forking
+        pin: Pin each Worker to one core where the OS supports it
+        drain_timeout: Seconds to wait for draining Workers before SIGKILL
+        on_result: Called with ``(task_id, ok, result)`` per finished task,
+            and with ``ok=False`` and ``{"message": ...}`` per rejected input
+            line that names a task_id (other rejects go to stderr) and per
+            task left unfinished by a drain
+    """
+
+    def __init__(
+        self,
+        handler: Union[str, HandlerFactory],
+        scheduler: Optional[TaskScheduler] = None,
+        workers: Optional[int] = None,
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        concurrency: int = 16,
+        prefetch: Optional[int] = None,
+        target_load: Optional[int] = None,
+        scale_down_after: float = 10.0,
+        scale_interval: float = 0.5,
+        preload: Sequence[str] = (),
+        pin: bool = True,
+        drain_timeout: float = 30.0,
+        on_result: Optional[ResultCallback] = None,
+    ):
+        self.handler = handler
+        self.scheduler = scheduler if scheduler is not None else TaskScheduler()
+        self.cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+        self.concurrency = concurrency
+        self.prefetch = prefetch or 2 * concurrency
+        self.policy = ScalingPolicy(
+            min_workers=min_workers,
+            max_workers=max_workers or max(len(self.cpus), os.cpu_count() or 1, min_workers),
+            target_load=target_load or self.prefetch,
+            scale_down_after=scale_down_after,
+        )
+        self.initial_workers = self.policy.min_workers if workers is None else workers
+        self.scale_interval = scale_interval
+        self.preload = tuple(preload)
+        self.pin = pin and bool(self.cpus)
+        self.drain_timeout = drain_timeout
+        self.on_result = on_result
+        self.stats = SupervisorStats()
+        self._factory: Optional[HandlerFactory] = None
+        self._workers: Dict[int, _WorkerProc] = {}
+        self._draining = False
+        self._drain_started: Optional[float] = None
+        self._held: Dict[str, List[Tuple[str, str, Sequence[str], Any]]] = {}
+
+    @property
+    def workers(self) -> int:
+        """Live Workers that still accept tasks."""
+        return sum(1 for w in self._workers.values() if not w.draining)
+
+    @property
+    def inflight(self) -> int:
+        return sum(len(w.inflight) for w in self._workers.values())
+
+    def submit(
+        self,
+        task_id: str,
+        payload: Any,
+        priority: str = "medium",
+        dependencies: Iterable[str] = (),
+    ) -> None:
+        self.scheduler.add(task_id, priority, dependencies, payload)
+
+    def start(self) -> None:
+        """Import shared modules, freeze the heap and fork the initial pool."""
+        if self._factory is not None:
+            return
+        for module in self.preload:
+            importlib.import_module(module)
+        factory = resolve(self.handler) if isinstance(self.handler, str) else self.handler
+        warm = getattr(factory, "preload", None)
+        if warm is not None:
+            warm()
+        self._factory = factory
+        gc.collect()
+        gc.freeze()  # children never touch these objects' refcount pages for GC
+        for _ in range(self.initial_workers):
+            self._spawn()
+
+    def drain(self) -> None:
+        """Stop dispatching and let every Worker finish what it holds."""
+        if self._draining:
+            return
+        self._draining = True
+        self._drain_started = time.monotonic()
+        for worker in list(self._workers.values()):
+            self._retire(worker)
+
+    def run(self, until_idle: bool = True, feed: Optional[int] = None) -> SupervisorStats:
+        """
+        Supervise until drained.
+
+        Args:
+            until_idle: Drain once the scheduler has no unfinished task (and
+                ``feed`` is exhausted); otherwise run until SIGTERM/SIGINT or
+                :meth:`drain`
+            feed: File descriptor streaming tasks as JSON lines
+                (see :func:`parse_task`), read until EOF. Each line is
+                admitted on its own: a malformed or invalid line is rejected
+                without affecting its neighbours, and a task whose dependency
+                has not arrived yet is held until it does (or rejected at EOF)
+        """
+        reader = _LineReader(feed) if feed is not None else None
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_w, False)
+        previous = {sig: signal.getsignal(sig) for sig in (signal.SIGTERM, signal.SIGINT)}
+        previous_fd = signal.set_wakeup_fd(wake_w, warn_on_full_buffer=False)
+        for sig in previous:
+            signal.signal(sig, lambda signum, frame: self.drain())
+        try:
+            self.start()
+            next_scale = time.monotonic()
+            while self._workers or not self._draining:
+                self._dispatch()
+                now = time.monotonic()
+                if reader is not None and reader.eof:
+                    reader = None
+                    self._reject_held()
+                if until_idle and reader is None and not self._draining and len(self.scheduler) == 0:
+                    self.drain()
+                if not self._draining and now >= next_scale:
+                    self._autoscale(now)
+                    next_scale = now + self.scale_interval
+                if self._draining and now - self._drain_started > self.drain_timeout:
+                    for worker in list(self._workers.values()):
+                        os.kill(worker.pid, signal.SIGKILL)
+                sources: List[Any] = [wake_r, *(w.conn for w in self._workers.values())]
+                if reader is not None and not self._draining:
+                    sources.append(reader.fd)
+                for ready in wait(sources, timeout=self.scale_interval):
+                    if ready == wake_r:
+                        os.read(wake_r, 512)
+                    elif reader is not None and ready == reader.fd:
+                        self._ingest(reader.read())
+                    else:
+                        self._receive(ready)
+            self._report_unfinished()
+        finally:
+            self._reject_held()
+            signal.set_wakeup_fd(previous_fd)
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            os.close(wake_r)
+            os.close(wake_w)
+        return self.stats
+
+    def _report_unfinished(self) -> None:
+        for task_id in self.scheduler.unfinished():
+            self.stats.drained += 1
+            if self.on_result is not None:
+                self.on_result(task_id, False, {"message": "drained before dispatch"})
+
+    def _ingest(self, lines: List[str]) -> None:
+        for line in lines:
+            try:
+                entry = parse_task(line)
+            except ValueError as exc:
+                self._reject(None, f"{exc}: {line[:200]}")
+                continue
+            self._admit(entry)
+
+    def _admit(self, entry: Tuple[str, str, Sequence[str], Any]) -> None:
+        pending = [entry]
+        while pending:
+            task_id, priority, dependencies, payload = entry = pending.pop()
+            try:
+                self.scheduler.add(task_id, priority, dependencies, payload)
+            except UnknownDependencyError as exc:
+                self._held.setdefault(exc.args[0], []).append(entry)
+                continue
+            except ValueError as exc:
+                self._reject(task_id, str(exc))
+                continue
+            pending.extend(self._held.pop(task_id, ()))
+
+    def _reject_held(self) -> None:
+        held, self._held = self._held, {}
+        for dependency, entries in held.items():
+            for entry in entries:
+                self._reject(entry[0], f"unknown dependency: {dependency}")
+
+    def _reject(self, task_id: Optional[str], message: str) -> None:
+        self.stats.rejected += 1
+        if task_id is not None and self.on_result is not None:
+            self.on_result(task_id, False, {"message": message})
+        else:
+            print(f"chimera: rejected task {task_id or '(no task_id)'}: {message}", file=sys.stderr)
+
+    def _spawn(self) -> None:
+        used = {w.slot for w in self._workers.values()}
+        slot = next(n for n in range(len(used) + 1) if n not in used)
+        cpu = self.cpus[slot % len(self.cpus)] if self.pin else None
+        parent_conn, child_conn = Pipe()
+        forked_ns = time.perf_counter_ns()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                parent_conn.close()
+                for worker in self._workers.values():
+                    worker.conn.close()
+                self._child(child_conn, cpu)
+                code = 0
+            finally:
+                os._exit(code)
+        child_conn.close()
+        self._workers[pid] = _WorkerProc(pid, slot, parent_conn, forked_ns, cpu)
+        self.stats.spawned += 1
+        self.stats.peak_workers = max(self.stats.peak_workers, len(self._workers))
+
+    def _child(self, conn: Connection, cpu: Optional[int]) -> None:
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # the supervisor drains on ^C
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        if cpu is not None:
+            os.sched_setaffinity(0, {cpu})
+        tracing.tracer.reset()
+        asyncio.run(_WorkerLoop(conn, self._factory, self.concurrency).run())
+
+    def _retire(self, worker: _WorkerProc) -> None:
+        if worker.draining:
+            return
+        worker.draining = True
+        try:
+            worker.conn.send(("drain", None))
+        except OSError:
+            pass
+
+    def _dispatch(self) -> None:
+        if self._draining:
+            return
+        live = [w for w in self._workers.values() if w.ready and not w.draining]
+        while live and self.scheduler.ready_count:
+            worker = min(live, key=lambda w: len(w.inflight))
+            room = self.prefetch - len(worker.inflight)
+            if room <= 0:
+                return
+            batch = []
+            for _ in range(min(room, max(1, self.scheduler.ready_count // len(live)))):
+                item = self.scheduler.get_nowait()
+                if item is None:
+                    break
+                batch.append(item)
+                worker.inflight[item[0]] = None
+            if not batch:
+                return
+            self.stats.dispatched += len(batch)
+            try:
+                worker.conn.send(("tasks", batch))
+            except OSError:
+                self._lost(worker)
+                live.remove(worker)
+
+    def _receive(self, conn: Connection) -> None:
+        worker = next(w for w in self._workers.values() if w.conn is conn)
+        try:
+            while conn.poll():
+                kind, body = conn.recv()
+                if kind == "done":
+                    self._finish(worker, body)
+                elif kind == "ready":
+                    worker.ready = True
+                    self.stats.startup_ns.append(body - worker.forked_ns)
+                elif kind == "exit":
+                    self._reap(worker, crashed=False)
+                    return
+        except (EOFError, OSError):
+            self._lost(worker)
+
+    def _finish(self, worker: _WorkerProc, done: List[Tuple[str, bool, Any]]) -> None:
+        for task_id, ok, result in done:
+            worker.inflight.pop(task_id, None)
+            if ok:
+                self.scheduler.complete(task_id)
+                self.stats.completed += 1
+            else:
+                self.scheduler.fail(task_id)
+                self.stats.failed += 1
+            if self.on_result is not None:
+                self.on_result(task_id, ok, result)
+
+    def _lost(self, worker: _WorkerProc) -> None:
+        for task_id in worker.inflight:
+            self.scheduler.requeue(task_id)
+            self.stats.requeued += 1
+        worker.inflight.clear()
+        self._reap(worker, crashed=True)
+
+    def _reap(self, worker: _WorkerProc, crashed: bool) -> None:
+        del self._workers[worker.pid]
+        worker.conn.close()
+        _, status = os.waitpid(worker.pid, 0)
+        if crashed or os.waitstatus_to_exitcode(status) != 0:
+            self.stats.crashed += 1
+        else:
+            self.stats.exited += 1
+
+    def _autoscale(self, now: float) -> None:
+        current = self.workers
+        target = self.policy.decide(current, self.scheduler.ready_count + self.inflight, now)
+        for _ in range(target - current):
+            self._spawn()
+            self.stats.scale_ups += 1
+        if target < current:
+            live = [w for w in self._workers.values() if not w.draining]
+            self._retire(min(live, key=lambda w: len(w.inflight)))
+            self.stats.scale_downs += 1
@@ -1,6 +1,6 @@
-def main():
-    print("Hello from 10-academy-chimera!")
+import sys
 
+from chimera.cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Chimera Agent Skills
+
+Registry and single dispatch entry point for the skills documented in
+skills/README.md. Workers invoke skills through :func:`execute_skill` using
+the ``skill_name``/``skill_input`` pair of an ``execute_skill`` task.
+
+Skill modules are imported lazily on first dispatch: Workers are ephemeral,
+so a text-only Worker must not pay the cold-start cost of the media skills'
+dependencies. Importing this package loads no skill module.
+"""
+
+import importlib
+import threading
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from backend import tracing
+from skills.base import DatabaseClient, SkillExecutionError, SkillOutput
+
+if TYPE_CHECKING:
+    from backend.database.repositories.skill_results import SkillResultStore
+
+SKILL_REGISTRY: Dict[str, Dict[str, str]] = {
+    "skill_transcribe_audio": {
+        "module": "skills.transcribe_audio",
+        "function": "execute_transcribe_audio",
+        "input_model": "TranscribeAudioInput",
+        "output_model": "TranscribeAudioOutput",
+    },
+    "skill_download_youtube": {
+        "module": "skills.download_youtube",
+        "function": "execute_download_youtube",
+        "input_model": "DownloadYouTubeInput",
+        "output_model": "DownloadYouTubeOutput",
+    },
+    "skill_generate_content": {
+        "module": "skills.generate_content",
+        "function": "execute_generate_content",
+        "input_model": "GenerateContentInput",
+        "output_model": "GenerateContentOutput",
+    },
+    "skill_generate_image": {
+        "module": "skills.generate_image",
+        "function": "execute_generate_image",
+        "input_model": "GenerateImageInput",
+        "output_model": "GenerateImageOutput",
+    },
+    "skill_render_video": {
+        "module": "skills.render_video",
+        "function": "execute_render_video",
+        "input_model": "RenderVideoInput",
+        "output_model": "RenderVideoOutput",
+    },
+}
+
+
+@dataclass(frozen=True)
+class LoadedSkill:
+    """A resolved registry entry: the ``execute_*`` coroutine and its models."""
+
+    name: str
+    execute: Callable[..., Awaitable[SkillOutput]]
+    input_model: Type[BaseModel]
+    output_model: Type[SkillOutput]
+
+    def validate_input(self, skill_input: Union[BaseModel, Mapping[str, Any]]) -> BaseModel:
+        if isinstance(skill_input, self.input_model):
+            return skill_input
+        return self.input_model.model_validate(skill_input)
+
+
+_loaded: Dict[str, LoadedSkill] = {}
+_load_lock = threading.Lock()
+
+
+def load_skill(skill_name: str) -> LoadedSkill:
+    """
+    Resolve ``skill_name``, importing its module on first use.
+
+    Raises:
+        SkillExecutionError: If ``skill_name`` is not registered
+    """
+    skill = _loaded.get(skill_name)
+    if skill is not None:
+        return skill
+    entry = SKILL_REGISTRY.get(skill_name)
+    if entry is None:
+        raise SkillExecutionError(
+            f"unknown skill: {skill_name}", code="validation_failed", retryable=False
+        )
+    with _load_lock:
+        skill = _loaded.get(skill_name)
+        if skill is None:
+            module = importlib.import_module(entry["module"])
+            skill = LoadedSkill(
+                name=skill_name,
+                execute=getattr(module, entry["function"]),
+                input_model=getattr(module, entry["input_model"]),
+                output_model=getattr(module, entry["output_model"]),
+            )
+            _loaded[skill_name] = skill
+    return skill
+
+
+def loaded_skills() -> List[str]:
+    """Names of skills whose modules have been imported in this process."""
+    return sorted(_loaded)
+
+
+async def execute_skill(
+    skill_name: str,
+    skill_input: Union[BaseModel, Mapping[str, Any]],
+    mcp_client: Any,
+    db_client: Optional[DatabaseClient] = None,
+    result_store: Optional["SkillResultStore"] = None,
+) -> SkillOutput:
+    """
+    Validate ``skill_input`` and run the named skill.
+
+    Args:
+        skill_name: Registry key, e.g. ``skill_generate_content``
+        skill_input: Raw ``skill_input`` payload or an already-validated model
+        mcp_client: MCP client for external tool access
+        db_client: Database client for idempotency checks
+        result_store: Content-addressed result cache; retries with the same
+            ``task_id`` and input are answered from it, and concurrent
+            identical executions share one run
+
+    Raises:
+        SkillExecutionError: If the skill is unknown or execution fails
+        pydantic.ValidationError: If ``skill_input`` violates the input contract
+    """
+    skill = load_skill(skill_name)
+    input_data = skill.validate_input(skill_input)
+    with tracing.span("skill", skill_name, input_data.task_id, input_data.agent_id):
+        if result_store is None:
+            return await skill.execute(input_data, mcp_client, db_client)
+        return await result_store.get_or_execute(
+            skill_name,
+            input_data,
+            skill.output_model,
+            lambda: skill.execute(input_data, mcp_client, db_client),
+        )
+
+
+__all__ = [
+    "SKILL_REGISTRY",
+    "LoadedSkill",
+    "SkillExecutionError",
+    "execute_skill",
+    "load_skill",
+    "loaded_skills",
+]
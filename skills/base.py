@@ -0,0 +1,135 @@
+"""
+Shared building blocks for Chimera skills.
+
+Every skill module defines an Input model, an Output model derived from
+:class:`SkillOutput` (the Worker Result schema, specs/technical.md Section
+4.2) and an ``execute_*`` coroutine. This module only depends on Pydantic so
+that importing it never pulls in a skill's heavier dependencies.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Literal, Optional, Protocol, Type, TypeVar
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, Field
+
+from backend import tracing
+from backend.mcp.clients.base import MCPClient
+
+
+class SkillExecutionError(Exception):
+    """
+    Structured, retry-safe skill failure.
+
+    Attributes:
+        code: Error code from specs/technical.md Section 5
+        retryable: Whether re-running the task may succeed
+    """
+
+    def __init__(self, message: str, code: str = "internal_error", retryable: bool = True):
+        super().__init__(message)
+        self.code = code
+        self.retryable = retryable
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"code": self.code, "message": str(self), "retryable": self.retryable}
+
+
+class DatabaseClient(Protocol):
+    """State access used by skills for idempotency checks."""
+
+    async def get_result(self, task_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    async def save_result(self, task_id: str, result: Dict[str, Any]) -> None:
+        ...
+
+
+class SkillOutput(BaseModel):
+    """Worker Result schema shared by every skill output contract."""
+
+    result_id: UUID = Field(default_factory=uuid4)
+    task_id: str
+    agent_id: str
+    artifact: Dict[str, Any]
+    confidence_score: float = Field(..., ge=0.0, le=1.0)
+    risk_tags: List[str] = []
+    disclosure_level: Literal["automated", "assisted", "none"] = "automated"
+    tool_provenance: Dict[str, Any]
+    execution_metadata: Dict[str, Any]
+
+
+OutputT = TypeVar("OutputT", bound=SkillOutput)
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+async def load_existing_result(
+    db_client: Optional[DatabaseClient], task_id: str, output_model: Type[OutputT]
+) -> Optional[OutputT]:
+    """Idempotency check: return the stored result for ``task_id`` if any."""
+    if db_client is None:
+        return None
+    existing = await db_client.get_result(task_id)
+    if existing is None:
+        return None
+    return output_model.model_validate(existing)
+
+
+async def call_skill_tool(
+    mcp_client: MCPClient, server: str, tool: str, arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Invoke an MCP tool, normalising failures into :class:`SkillExecutionError`."""
+    try:
+        with tracing.span("mcp", f"{server}/{tool}"):
+            response = await mcp_client.call_tool(server, tool, arguments)
+    except SkillExecutionError:
+        raise
+    except Exception as exc:
+        raise SkillExecutionError(f"{server}/{tool} failed: {exc}") from exc
+    if not isinstance(response, dict):
+        raise SkillExecutionError(
+            f"{server}/{tool} returned {type(response).__name__}, expected an object",
+            code="validation_failed",
+            retryable=False,
+        )
+    return response
+
+
+async def finish(
+    output_model: Type[OutputT],
+    input_data: Any,
+    artifact: Dict[str, Any],
+    response: Dict[str, Any],
+    mcp_tool: str,
+    parameters_used: Dict[str, Any],
+    started_at: datetime,
+    db_client: Optional[DatabaseClient],
+    default_confidence: float = 0.9,
+) -> OutputT:
+    """Assemble a skill output from an MCP tool response and persist it."""
+    completed_at = utc_now()
+    output = output_model(
+        task_id=input_data.task_id,
+        agent_id=input_data.agent_id,
+        artifact=artifact,
+        confidence_score=response.get("confidence_score", default_confidence),
+        risk_tags=response.get("risk_tags", []),
+        disclosure_level=response.get("disclosure_level", "automated"),
+        tool_provenance={
+            "mcp_tool": mcp_tool,
+            "tool_version": response.get("tool_version", "1.0.0"),
+            "parameters_used": parameters_used,
+            "cost_estimate": response.get("cost_estimate"),
+        },
+        execution_metadata={
+            "started_at": started_at.isoformat(),
+            "completed_at": completed_at.isoformat(),
+            "duration_ms": int((completed_at - started_at).total_seconds() * 1000),
+        },
+    )
+    if db_client is not None:
+        await db_client.save_result(input_data.task_id, output.model_dump(mode="json"))
+    return output
@@ -0,0 +1,265 @@
+"""
+skill_download_youtube
+
+Downloads YouTube video/audio for remixing and analysis via
+``mcp-server-youtube`` (skills/README.md, Skill 2).
+
+With a :class:`MediaStore` configured, the Worker streams the media itself:
+``resolve_streams`` returns the stream URLs, and the bytes go straight to the
+store through one reusable buffer, hashed on the way. For ``audio`` and
+``both`` the audio track is extracted from the same pass. Media already in
+the store (by video id, ETag or content hash) is not downloaded again, and an
+interrupted download resumes from its partial file on retry. Without a store,
+the server-side ``download`` tool does the work.
+"""
+
+import asyncio
+import http.client
+import urllib.error
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional
+
+from pydantic import BaseModel
+
+from backend.database.repositories.media_store import (
+    BUFFER_SIZE,
+    MediaStore,
+    StoredMedia,
+    file_sha256,
+)
+from backend.mcp.clients.base import MCPClient
+from skills.base import (
+    DatabaseClient,
+    SkillExecutionError,
+    SkillOutput,
+    call_skill_tool,
+    finish,
+    load_existing_result,
+    utc_now,
+)
+from skills.media_stream import FfmpegAudioSink, Sink, file_extension, stream_download
+
+SKILL_NAME = "skill_download_youtube"
+MCP_SERVER = "mcp-server-youtube"
+MCP_TOOL = "download"
+MCP_RESOLVE_TOOL = "resolve_streams"
+
+AUDIO_MIME_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav", "m4a": "audio/mp4"}
+
+AudioExtractor = Callable[[Path, str], Sink]
+
+
+class DownloadYouTubeInput(BaseModel):
+    video_url: str  # YouTube video URL (full URL or video ID)
+    download_type: Literal["video", "audio", "both"] = "video"
+    quality: Literal["highest", "medium", "lowest"] = "medium"
+    format: Optional[str] = None  # None = auto-select
+    extract_audio_format: Literal["mp3", "wav", "m4a"] = "mp3"
+    agent_id: str  # Required for logging and cost tracking
+    task_id: str  # Required for idempotency checks
+    purpose: Optional[str] = None  # Purpose description for audit trail
+
+
+class DownloadYouTubeOutput(SkillOutput):
+    pass
+
+
+async def execute_download_youtube(
+    input_data: DownloadYouTubeInput,
+    mcp_client: MCPClient,
+    db_client: Optional[DatabaseClient] = None,
+    *,
+    store: Optional[MediaStore] = None,
+    audio_extractor: AudioExtractor = FfmpegAudioSink,
+    buffer_size: int = BUFFER_SIZE,
+) -> DownloadYouTubeOutput:
+    """
+    Execute skill_download_youtube.
+
+    Args:
+        input_data: Validated input contract
+        mcp_client: MCP client for external tool access
+        db_client: Database client for idempotency checks
+        store: Media store to stream into (default: server-side download)
+        audio_extractor: Builds the sink that writes the audio track to a
+            path in the given format from the piped source bytes
+        buffer_size: Size of the reusable download buffer
+
+    Returns:
+        DownloadYouTubeOutput: Structured output matching Worker Result schema
+
+    Raises:
+        SkillExecutionError: If the video is unavailable or the download fails
+    """
+    existing = await load_existing_result(db_client, input_data.task_id, DownloadYouTubeOutput)
+    if existing is not None:
+        return existing
+
+    started_at = utc_now()
+    if store is not None:
+        return await _download_streaming(
+            input_data, mcp_client, db_client, store, audio_extractor, buffer_size, started_at
+        )
+    parameters = {
+        "video_url": input_data.video_url,
+        "download_type": input_data.download_type,
+        "quality": input_data.quality,
+        "format": input_data.format,
+        "extract_audio_format": input_data.extract_audio_format,
+    }
+    response = await call_skill_tool(mcp_client, MCP_SERVER, MCP_TOOL, parameters)
+
+    return await finish(
+        DownloadYouTubeOutput,
+        input_data,
+        {
+            "type": input_data.download_type,
+            "content": response.get("content", ""),
+            "metadata": response.get("metadata", {}),
+        },
+        response,
+        f"{MCP_SERVER}/{MCP_TOOL}",
+        {"quality": input_data.quality, "format": input_data.format},
+        started_at,
+        db_client,
+    )
+
+
+def _stream_source(resolved: Dict[str, Any], download_type: str) -> str:
+    streams = resolved.get("streams") or {}
+    kind = "audio" if download_type == "audio" and "audio" in streams else "video"
+    if "url" not in (streams.get(kind) or {}):
+        raise SkillExecutionError(
+            f"{MCP_SERVER}/{MCP_RESOLVE_TOOL} returned no {kind} stream",
+            code="validation_failed",
+            retryable=False,
+        )
+    return kind
+
+
+def _replay(path: Path, sink: Sink, buffer_size: int) -> None:
+    """Feed a stored file to ``sink`` (audio for media downloaded earlier)."""
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    try:
+        with open(path, "rb") as f:
+            while n := f.readinto(buffer):
+                sink.write(view[:n])
+        sink.close()
+    except BaseException:
+        sink.abort()
+        raise
+
+
+async def _download_streaming(
+    input_data: DownloadYouTubeInput,
+    mcp_client: MCPClient,
+    db_client: Optional[DatabaseClient],
+    store: MediaStore,
+    audio_extractor: AudioExtractor,
+    buffer_size: int,
+    started_at: datetime,
+) -> DownloadYouTubeOutput:
+    parameters = {
+        "video_url": input_data.video_url,
+        "download_type": input_data.download_type,
+        "quality": input_data.quality,
+        "format": input_data.format,
+    }
+    resolved = await call_skill_tool(mcp_client, MCP_SERVER, MCP_RESOLVE_TOOL, parameters)
+    video_id = resolved.get("video_id") or input_data.video_url
+    kind = _stream_source(resolved, input_data.download_type)
+    stream = resolved["streams"][kind]
+    variant = f"{input_data.quality}:{input_data.format or 'auto'}"
+    source_keys = [f"youtube:{video_id}:{kind}:{variant}"]
+    if stream.get("etag"):
+        source_keys.append(f"etag:{stream['etag']}")
+    if stream.get("sha256"):
+        source_keys.append(f"sha256:{stream['sha256']}")
+    audio_format = input_data.extract_audio_format
+    audio_key = f"youtube:{video_id}:audio:{variant}:{audio_format}"
+    source_ext = file_extension(stream.get("mime_type"), input_data.format or "mp4")
+    wants_audio = input_data.download_type in ("audio", "both")
+    transcode = wants_audio and not (kind == "audio" and source_ext == audio_format)
+
+    source = store.lookup(*source_keys)
+    audio = store.lookup(audio_key) if transcode else None
+    audio_part = store.partial_path(audio_key, f".{audio_format}")
+    downloaded = source is None
+    resumed_from = 0
+    try:
+        if source is None:
+            sinks: List[Sink] = (
+                [_audio_sink(audio_extractor, audio_part, audio_format)] if transcode else []
+            )
+            result = await asyncio.to_thread(
+                stream_download,
+                stream["url"],
+                store.partial_path(source_keys[0]),
+                sinks,
+                stream.get("headers"),
+                buffer_size,
+            )
+            resumed_from = result.resumed_from
+            source, _ = store.commit(
+                result.path,
+                result.sha256,
+                result.size,
+                file_extension(result.content_type, source_ext),
+                source_keys,
+                stream.get("mime_type") or result.content_type,
+            )
+            if transcode:
+                audio = await asyncio.to_thread(
+                    _commit_audio, store, audio_part, audio_format, audio_key
+                )
+        elif transcode and audio is None:
+            sink = _audio_sink(audio_extractor, audio_part, audio_format)
+            await asyncio.to_thread(_replay, source.path, sink, buffer_size)
+            audio = await asyncio.to_thread(_commit_audio, store, audio_part, audio_format, audio_key)
+    except urllib.error.HTTPError as exc:
+        if exc.code in (403, 404, 410, 451):
+            raise SkillExecutionError(
+                f"{video_id} is unavailable: HTTP {exc.code}", code="not_found", retryable=False
+            ) from exc
+        raise SkillExecutionError(f"download of {video_id} failed: {exc}") from exc
+    except (OSError, http.client.HTTPException) as exc:
+        # The partial file is kept, so a retry resumes where this one stopped.
+        raise SkillExecutionError(f"download of {video_id} failed: {exc}") from exc
+
+    main = source if audio is None or input_data.download_type != "audio" else audio
+    metadata: Dict[str, Any] = {
+        **(resolved.get("metadata") or {}),
+        "video_id": video_id,
+        "file_size": main.size,
+        "mime_type": main.mime_type,
+        "sha256": main.sha256,
+        "deduplicated": not downloaded,
+        "resumed_from_bytes": resumed_from,
+    }
+    if wants_audio:
+        metadata["audio_url"] = (audio or source).url
+    return await finish(
+        DownloadYouTubeOutput,
+        input_data,
+        {"type": input_data.download_type, "content": main.url, "metadata": metadata},
+        resolved,
+        f"{MCP_SERVER}/{MCP_RESOLVE_TOOL}",
+        {"quality": input_data.quality, "format": input_data.format},
+        started_at,
+        db_client,
+    )
+
+
+def _audio_sink(audio_extractor: AudioExtractor, part: Path, audio_format: str) -> Sink:
+    try:
+        return audio_extractor(part, audio_format)
+    except FileNotFoundError as exc:
+        raise SkillExecutionError(str(exc), retryable=False) from exc
+
+
+def _commit_audio(store: MediaStore, part: Path, audio_format: str, key: str) -> StoredMedia:
+    sha256, size = file_sha256(part)
+    stored, _ = store.commit(part, sha256, size, audio_format, [key], AUDIO_MIME_TYPES[audio_format])
+    return stored
@@ -0,0 +1,124 @@
+"""
+skill_generate_content
+
+Generates text content (posts, replies, captions) in the agent's persona via
+``mcp-server-gemini`` (skills/README.md, Skill 3).
+
+With a :class:`skills.prompt_builder.PromptBuilder`, the Worker assembles the
+system prompt itself (SOUL.md, task context and memories; P-005/P-006) from
+cached segments instead of sending the raw context to the provider.
+"""
+
+from typing import TYPE_CHECKING, Literal, Optional
+
+from pydantic import BaseModel
+
+from backend.mcp.clients.base import MCPClient
+from skills.base import (
+    DatabaseClient,
+    SkillOutput,
+    call_skill_tool,
+    finish,
+    load_existing_result,
+    utc_now,
+)
+
+if TYPE_CHECKING:
+    from skills.prompt_builder import PromptBuilder
+
+SKILL_NAME = "skill_generate_content"
+MCP_SERVER = "mcp-server-gemini"
+MCP_TOOL = "generate_text"
+
+
+class GenerateContentInput(BaseModel):
+    content_type: Literal["post", "reply", "caption", "article", "thread"]
+    platform: Optional[Literal["twitter", "instagram", "tiktok", "openclaw"]] = None
+    prompt: str  # Base prompt/instruction for content generation
+    context: dict  # goal_description, persona_constraints, tone, max_length, ...
+    agent_id: str  # Required for persona loading
+    task_id: str  # Required for idempotency checks
+    memory_context: Optional[dict] = None  # episodic_memory, semantic_memory
+
+
+class GenerateContentOutput(SkillOutput):
+    pass
+
+
+async def execute_generate_content(
+    input_data: GenerateContentInput,
+    mcp_client: MCPClient,
+    db_client: Optional[DatabaseClient] = None,
+    *,
+    prompt_builder: Optional["PromptBuilder"] = None,
+) -> GenerateContentOutput:
+    """
+    Execute skill_generate_content.
+
+    Args:
+        input_data: Validated input contract
+        mcp_client: MCP client for external tool access
+        db_client: Database client for idempotency checks
+        prompt_builder: Shared prompt builder; without one, prompt, context and
+            memories are passed to ``mcp-server-gemini`` unassembled
+
+    Returns:
+        GenerateContentOutput: Structured output matching Worker Result schema
+
+    Raises:
+        SkillExecutionError: If generation fails (retry-safe)
+    """
+    existing = await load_existing_result(db_client, input_data.task_id, GenerateContentOutput)
+    if existing is not None:
+        return existing
+
+    started_at = utc_now()
+    prompt = None
+    if prompt_builder is not None:
+        prompt = prompt_builder.build(
+            input_data.agent_id, input_data.prompt, input_data.context, input_data.memory_context
+        )
+        parameters = {
+            "prompt": prompt.prompt,
+            "system_prompt": prompt.system,
+            "content_type": input_data.content_type,
+            "platform": input_data.platform,
+            "context": input_data.context,
+        }
+    else:
+        parameters = {
+            "prompt": input_data.prompt,
+            "content_type": input_data.content_type,
+            "platform": input_data.platform,
+            "context": input_data.context,
+            "memory_context": input_data.memory_context,
+        }
+    response = await call_skill_tool(mcp_client, MCP_SERVER, MCP_TOOL, parameters)
+
+    content = response.get("content", "")
+    words = content.split()
+    metadata = {
+        "content_type": input_data.content_type,
+        "platform": input_data.platform,
+        "word_count": len(words),
+        "character_count": len(content),
+        "hashtags": [w for w in words if w.startswith("#")],
+        "mentions": [w for w in words if w.startswith("@")],
+    }
+    if "tone_score" in response:
+        metadata["tone_score"] = response["tone_score"]
+    if prompt is not None:
+        metadata["persona_version"] = prompt.persona_version
+        metadata["prompt_tokens"] = prompt.tokens
+        metadata["memories_dropped"] = prompt.dropped_memories
+
+    return await finish(
+        GenerateContentOutput,
+        input_data,
+        {"type": "text", "content": content, "metadata": metadata},
+        response,
+        f"{MCP_SERVER}/{MCP_TOOL}",
+        {key: response[key] for key in ("model", "temperature") if key in response},
+        started_at,
+        db_client,
+    )
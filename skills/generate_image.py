@@ -0,0 +1,111 @@
+"""
+skill_generate_image
+
+Generates character-consistent images via ``mcp-server-ideogram``
+(skills/README.md, Skill 4; W-008).
+
+Workers generating for many personas pass a shared
+:class:`worker.character_cache.CharacterImageBatcher`, which keeps each
+character's encoded reference set cached and sends concurrent requests for
+the same character as one batch.
+"""
+
+from typing import TYPE_CHECKING, Literal, Optional
+
+from pydantic import BaseModel
+
+from backend.mcp.clients.base import MCPClient
+from skills.base import (
+    DatabaseClient,
+    SkillOutput,
+    call_skill_tool,
+    finish,
+    load_existing_result,
+    utc_now,
+)
+
+if TYPE_CHECKING:
+    from worker.character_cache import CharacterImageBatcher
+
+SKILL_NAME = "skill_generate_image"
+MCP_SERVER = "mcp-server-ideogram"
+MCP_TOOL = "generate_image"
+
+
+class GenerateImageInput(BaseModel):
+    prompt: str
+    character_reference_id: str  # REQUIRED: character consistency lock
+    style: Optional[str] = None
+    aspect_ratio: Literal["1:1", "16:9", "9:16", "4:3", "3:4"] = "1:1"
+    resolution: Literal["standard", "high", "ultra"] = "standard"
+    negative_prompt: Optional[str] = None
+    agent_id: str  # Required for character reference lookup
+    task_id: str  # Required for idempotency checks
+    context: Optional[dict] = None  # campaign_id, goal_description, reference_images
+
+
+class GenerateImageOutput(SkillOutput):
+    pass
+
+
+async def execute_generate_image(
+    input_data: GenerateImageInput,
+    mcp_client: MCPClient,
+    db_client: Optional[DatabaseClient] = None,
+    *,
+    batcher: Optional["CharacterImageBatcher"] = None,
+) -> GenerateImageOutput:
+    """
+    Execute skill_generate_image.
+
+    Args:
+        input_data: Validated input contract
+        mcp_client: MCP client for external tool access
+        db_client: Database client for idempotency checks
+        batcher: Shared per-character batcher; each request goes straight to
+            ``mcp-server-ideogram`` without one
+
+    Returns:
+        GenerateImageOutput: Structured output matching Worker Result schema
+
+    Raises:
+        SkillExecutionError: If generation fails (retry-safe)
+    """
+    existing = await load_existing_result(db_client, input_data.task_id, GenerateImageOutput)
+    if existing is not None:
+        return existing
+
+    started_at = utc_now()
+    if batcher is not None:
+        response = await batcher.generate(input_data)
+    else:
+        parameters = {
+            "prompt": input_data.prompt,
+            "character_reference_id": input_data.character_reference_id,
+            "style": input_data.style,
+            "aspect_ratio": input_data.aspect_ratio,
+            "resolution": input_data.resolution,
+            "negative_prompt": input_data.negative_prompt,
+        }
+        response = await call_skill_tool(mcp_client, MCP_SERVER, MCP_TOOL, parameters)
+
+    metadata = dict(response.get("metadata", {}))
+    metadata.setdefault("style", input_data.style)
+    if "reference_version" in response:
+        metadata["reference_version"] = response["reference_version"]
+
+    return await finish(
+        GenerateImageOutput,
+        input_data,
+        {"type": "image", "content": response.get("content", ""), "metadata": metadata},
+        response,
+        f"{MCP_SERVER}/{MCP_TOOL}",
+        {
+            "prompt": input_data.prompt,
+            "character_reference_id": input_data.character_reference_id,
+            "aspect_ratio": input_data.aspect_ratio,
+            "resolution": input_data.resolution,
+        },
+        started_at,
+        db_client,
+    )
@@ -0,0 +1,201 @@
+"""
+Streaming media download helpers for the media skills.
+
+:func:`stream_download` copies an HTTP body to disk through one reusable
+buffer, hashing it and feeding every extra :class:`Sink` (such as an audio
+extractor) in the same pass. An interrupted transfer leaves a ``.part`` file
+that the next call resumes with a ``Range`` request guarded by ``If-Range``;
+the bytes already on disk are replayed through the hash and sinks from local
+disk rather than downloaded again.
+
+Beyond the media store it uses only the standard library, so importing a
+media skill stays cheap.
+"""
+
+import hashlib
+import json
+import re
+import shutil
+import subprocess
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Protocol, Sequence
+
+from backend.database.repositories.media_store import BUFFER_SIZE
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+class Sink(Protocol):
+    """Consumer of a byte stream fed in order, one buffer view at a time."""
+
+    def write(self, data: memoryview) -> None:
+        ...
+
+    def close(self) -> None:
+        """Finish the output after the last byte."""
+        ...
+
+    def abort(self) -> None:
+        """Discard the output after a failed transfer."""
+        ...
+
+
+class FfmpegAudioSink:
+    """Extracts the audio track of a piped container into ``output`` with ffmpeg."""
+
+    CODECS = {"mp3": "libmp3lame", "wav": "pcm_s16le", "m4a": "aac"}
+    MUXERS = {"mp3": "mp3", "wav": "wav", "m4a": "ipod"}
+
+    def __init__(self, output: Path, audio_format: str, ffmpeg: Optional[str] = None):
+        executable = ffmpeg or shutil.which("ffmpeg")
+        if executable is None:
+            raise FileNotFoundError("ffmpeg is required to extract audio")
+        self.output = output
+        self._process = subprocess.Popen(
+            [
+                executable, "-hide_banner", "-loglevel", "error", "-y", "-i", "pipe:0", "-vn",
+                "-codec:a", self.CODECS[audio_format], "-f", self.MUXERS[audio_format], str(output),
+            ],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def write(self, data: memoryview) -> None:
+        assert self._process.stdin is not None
+        self._process.stdin.write(data)
+
+    def close(self) -> None:
+        assert self._process.stdin is not None
+        self._process.stdin.close()
+        stderr = self._process.stderr.read() if self._process.stderr else b""
+        if self._process.wait() != 0:
+            raise OSError(f"ffmpeg failed: {stderr.decode(errors='replace').strip()}")
+
+    def abort(self) -> None:
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.wait()
+        self.output.unlink(missing_ok=True)
+
+
+@dataclass
+class DownloadResult:
+    path: Path
+    sha256: str
+    size: int
+    resumed_from: int
+    content_type: Optional[str]
+    etag: Optional[str]
+
+
+def _validator_path(part: Path) -> Path:
+    return part.with_name(part.name + ".json")
+
+
+def stream_download(
+    url: str,
+    part: Path,
+    sinks: Sequence[Sink] = (),
+    headers: Optional[Dict[str, str]] = None,
+    buffer_size: int = BUFFER_SIZE,
+    timeout: float = 30.0,
+) -> DownloadResult:
+    """
+    Download ``url`` into ``part``, resuming a previous partial download.
+
+    Args:
+        url: HTTP(S) URL of the media stream
+        part: Partial file; kept on failure so the next call resumes it
+        sinks: Extra consumers fed every byte in order; closed on success and
+            aborted on failure
+        headers: Extra request headers
+        buffer_size: Size of the single reusable read buffer
+        timeout: Socket timeout in seconds
+
+    Raises:
+        urllib.error.URLError: If the server cannot be reached or errors
+        OSError: If the body ends before ``Content-Length``
+    """
+    validator = _validator_path(part)
+    offset = part.stat().st_size if part.exists() else 0
+    etag = None
+    if offset and validator.exists():
+        etag = json.loads(validator.read_text()).get("etag")
+    request = urllib.request.Request(url, headers=dict(headers or {}))
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+        if etag:
+            request.add_header("If-Range", etag)
+
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    digest = hashlib.sha256()
+    try:
+        try:
+            response = urllib.request.urlopen(request, timeout=timeout)  # noqa: S310
+        except urllib.error.HTTPError as exc:
+            if exc.code != 416 or not offset:
+                raise
+            if exc.headers.get("Content-Range") != f"bytes */{offset}":
+                part.unlink()  # stale partial file: start over
+                validator.unlink(missing_ok=True)
+                return stream_download(url, part, sinks, headers, buffer_size, timeout)
+            response = None  # the partial file already holds the whole body
+        resumed_from = 0
+        expected = None
+        content_type = None
+        if response is not None:
+            content_type = response.headers.get("Content-Type")
+            match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+            if response.status == 206 and match and int(match.group(1)) == offset:
+                resumed_from = offset
+                if match.group(2) != "*":
+                    expected = int(match.group(2))
+            elif response.headers.get("Content-Length"):
+                expected = int(response.headers["Content-Length"])
+            etag = response.headers.get("ETag") or etag
+            validator.write_text(json.dumps({"url": url, "etag": etag}))
+        else:
+            resumed_from = offset
+
+        size = 0
+        if resumed_from:
+            with open(part, "rb") as existing:
+                while size < resumed_from and (n := existing.readinto(buffer)):
+                    n = min(n, resumed_from - size)
+                    digest.update(view[:n])
+                    for sink in sinks:
+                        sink.write(view[:n])
+                    size += n
+        if response is not None:
+            with response, open(part, "r+b" if resumed_from else "wb") as out:
+                out.seek(resumed_from)
+                out.truncate()
+                while n := response.readinto(buffer):
+                    chunk = view[:n]
+                    out.write(chunk)
+                    digest.update(chunk)
+                    for sink in sinks:
+                        sink.write(chunk)
+                    size += n
+        if expected is not None and size != expected:
+            raise OSError(f"{url}: body ended at {size} of {expected} bytes")
+        for sink in sinks:
+            sink.close()
+    except BaseException:
+        for sink in sinks:
+            sink.abort()
+        raise
+    validator.unlink(missing_ok=True)
+    return DownloadResult(part, digest.hexdigest(), size, resumed_from, content_type, etag)
+
+
+def file_extension(content_type: Optional[str], default: str) -> str:
+    subtype = (content_type or "").split(";")[0].split("/")[-1].strip()
+    return {"mpeg": "mp3", "mp4": "mp4", "webm": "webm", "x-m4a": "m4a", "wav": "wav"}.get(
+        subtype, default
+    )
+
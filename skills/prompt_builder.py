@@ -0,0 +1,367 @@
+"""
+Prompt assembly for ``skill_generate_content``
+
+Builds the system prompt of P-005/P-006 (SOUL.md + short-term + long-term
+memory) from interned, immutable :class:`Segment` objects:
+
+- SOUL.md is parsed once per ``(agent_id, version)`` and the rendered persona
+  block is reused until the version changes;
+- identical text (persona constraints, memory items) maps to one segment
+  whose token count is computed once, so enforcing the budget never
+  re-tokenizes unchanged text;
+- segments are ordered from most to least stable (persona, task context,
+  recent activity, which only grows at its end, long-term memories retrieved
+  for this query, instruction), so consecutive prompts of an agent share the
+  longest possible prefix for provider-side prompt caching.
+
+Besides :mod:`skills.base` it only depends on the standard library, like the
+other text skills.
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from skills.base import SkillExecutionError
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.*?)\s*#*\s*$")
+_BULLET_RE = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+")
+
+_MEMORY_HEADINGS = {
+    "episodic": "## Recent Activity",
+    "semantic": "## Relevant Long-Term Memories",
+}
+
+SoulLoader = Callable[[str], Tuple[str, str]]  # agent_id -> (version, SOUL.md text)
+
+
+def estimate_tokens(text: str) -> int:
+    """Word-and-punctuation count, a provider-independent token estimate."""
+    return len(_TOKEN_RE.findall(text))
+
+
+@dataclass(frozen=True)
+class Soul:
+    """Parsed SOUL.md: Backstory, Voice/Tone, Core Beliefs & Values, Directives."""
+
+    version: str
+    name: Optional[str] = None
+    backstory: str = ""
+    voice: str = ""
+    beliefs: Tuple[str, ...] = ()
+    directives: Tuple[str, ...] = ()
+    sections: Tuple[Tuple[str, str], ...] = ()  # any other headings, in file order
+
+
+def parse_soul(text: str, version: Optional[str] = None) -> Soul:
+    """
+    Parse SOUL.md.
+
+    An optional ``---`` front matter block supplies ``name`` and ``version``;
+    without a version, the SHA-256 of the text stands in for it.
+    """
+    meta, lines = _front_matter(text)
+    sections: List[Tuple[str, List[str]]] = []
+    for line in lines:
+        heading = _HEADING_RE.match(line)
+        if heading:
+            sections.append((heading.group(1), []))
+        elif sections:
+            sections[-1][1].append(line)
+
+    fields: Dict[str, Any] = {}
+    extra: List[Tuple[str, str]] = []
+    for heading, body in sections:
+        lowered = heading.lower()
+        content = "\n".join(body).strip()
+        if "backstory" in lowered:
+            fields["backstory"] = content
+        elif "voice" in lowered or "tone" in lowered:
+            fields["voice"] = content
+        elif "belief" in lowered or "value" in lowered:
+            fields["beliefs"] = _items(body)
+        elif "directive" in lowered:
+            fields["directives"] = _items(body)
+        elif content:
+            extra.append((heading, content))
+    return Soul(
+        version=version or soul_version(text, meta),
+        name=meta.get("name"),
+        sections=tuple(extra),
+        **fields,
+    )
+
+
+def soul_version(text: str, meta: Optional[Dict[str, str]] = None) -> str:
+    """Front matter ``version`` of SOUL.md, else a content hash."""
+    if meta is None:
+        meta, _ = _front_matter(text)
+    return meta.get("version") or hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _front_matter(text: str) -> Tuple[Dict[str, str], List[str]]:
+    lines = text.splitlines()
+    meta: Dict[str, str] = {}
+    if lines and lines[0].strip() == "---":
+        for end in range(1, len(lines)):
+            if lines[end].strip() == "---":
+                for line in lines[1:end]:
+                    key, sep, value = line.partition(":")
+                    if sep:
+                        meta[key.strip().lower()] = value.strip().strip("\"'")
+                return meta, lines[end + 1:]
+    return meta, lines
+
+
+def _items(body: Iterable[str]) -> Tuple[str, ...]:
+    items: List[str] = []
+    for line in body:
+        if _BULLET_RE.match(line):
+            items.append(_BULLET_RE.sub("", line, count=1).strip())
+        elif line.strip() and items:
+            items[-1] = f"{items[-1]} {line.strip()}"  # wrapped bullet
+        elif line.strip():
+            items.append(line.strip())
+    return tuple(items)
+
+
+def render_soul(soul: Soul) -> str:
+    """Persona block of the system prompt."""
+    parts = [f"You are {soul.name}." if soul.name else "You are the persona described below."]
+    if soul.backstory:
+        parts.append(f"## Backstory\n{soul.backstory}")
+    if soul.voice:
+        parts.append(f"## Voice and Tone\n{soul.voice}")
+    if soul.beliefs:
+        parts.append("## Core Beliefs and Values\n" + "\n".join(f"- {b}" for b in soul.beliefs))
+    if soul.directives:
+        parts.append("## Directives\n" + "\n".join(f"- {d}" for d in soul.directives))
+    for heading, content in soul.sections:
+        parts.append(f"## {heading}\n{content}")
+    return "\n\n".join(parts)
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Immutable prompt fragment with its token count."""
+
+    kind: str  # persona | context | heading | semantic | episodic | instruction
+    text: str
+    tokens: int
+
+
+@dataclass(frozen=True)
+class Prompt:
+    """An assembled prompt; ``system`` is the stable, cacheable prefix."""
+
+    system: str
+    prompt: str
+    segments: Tuple[Segment, ...]
+    tokens: int
+    persona_version: str
+    dropped_memories: int = 0
+
+    @property
+    def prefix_hash(self) -> str:
+        """SHA-256 of the persona block, the prefix shared across an agent's prompts."""
+        return hashlib.sha256(self.segments[0].text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class PromptBuilderStats:
+    prompts: int = 0
+    souls_parsed: int = 0
+    persona_hits: int = 0
+    segments_interned: int = 0
+    segment_hits: int = 0
+    memories_dropped: int = 0
+
+    @property
+    def segment_hit_rate(self) -> float:
+        lookups = self.segments_interned + self.segment_hits
+        return self.segment_hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Persona:
+    soul: Soul
+    segment: Segment
+
+
+class PromptBuilder:
+    """
+    Assembles ``generate_content`` prompts within a token budget.
+
+    Args:
+        soul_loader: ``agent_id -> (version, SOUL.md text)``; the text is only
+            parsed when the version changes
+        max_prompt_tokens: Budget for system prompt plus instruction; memories
+            are dropped (least relevant long-term first, then oldest recent)
+            until the prompt fits
+        tokenizer: Token counter (default: :func:`estimate_tokens`)
+        max_segments: Interned segments kept
+    """
+
+    def __init__(
+        self,
+        soul_loader: SoulLoader,
+        max_prompt_tokens: int = 8192,
+        tokenizer: Callable[[str], int] = estimate_tokens,
+        max_segments: int = 100_000,
+    ):
+        self.soul_loader = soul_loader
+        self.max_prompt_tokens = max_prompt_tokens
+        self.tokenizer = tokenizer
+        self.max_segments = max_segments
+        self.stats = PromptBuilderStats()
+        self._personas: Dict[str, Tuple[str, _Persona]] = {}
+        self._segments: "OrderedDict[Tuple[str, str], Segment]" = OrderedDict()
+
+    def persona(self, agent_id: str) -> Soul:
+        """Current parsed SOUL.md of ``agent_id``."""
+        return self._persona(agent_id).soul
+
+    def build(
+        self,
+        agent_id: str,
+        prompt: str,
+        context: Optional[Dict[str, Any]] = None,
+        memory_context: Optional[Dict[str, Any]] = None,
+    ) -> Prompt:
+        """
+        Assemble the prompt of a ``GenerateContentInput``.
+
+        Raises:
+            SkillExecutionError: If persona, task context and instruction alone
+                exceed the token budget
+        """
+        persona = self._persona(agent_id)
+        context_segment = self._context_segment(context or {})
+        memory = memory_context or {}
+        semantic = [self._memory_segment("semantic", m) for m in memory.get("semantic_memory") or ()]
+        episodic = [self._memory_segment("episodic", m) for m in memory.get("episodic_memory") or ()]
+        instruction = self.intern("instruction", prompt)
+
+        fixed = [persona.segment] + ([context_segment] if context_segment else [])
+        tokens = sum(s.tokens for s in fixed) + instruction.tokens
+        if tokens > self.max_prompt_tokens:
+            raise SkillExecutionError(
+                f"prompt needs {tokens} tokens without memories, budget is {self.max_prompt_tokens}",
+                code="validation_failed",
+                retryable=False,
+            )
+        headings = {kind: self.intern("heading", text) for kind, text in _MEMORY_HEADINGS.items()}
+        for kind, items in (("semantic", semantic), ("episodic", episodic)):
+            if items:
+                tokens += headings[kind].tokens + sum(s.tokens for s in items)
+        dropped = 0
+        while tokens > self.max_prompt_tokens and semantic:
+            tokens -= semantic.pop().tokens  # ranked by relevance: drop the tail
+            tokens -= 0 if semantic else headings["semantic"].tokens
+            dropped += 1
+        while tokens > self.max_prompt_tokens and episodic:
+            tokens -= episodic.pop(0).tokens  # chronological: drop the oldest
+            tokens -= 0 if episodic else headings["episodic"].tokens
+            dropped += 1
+
+        parts = [s.text for s in fixed]
+        for kind, items in (("episodic", episodic), ("semantic", semantic)):
+            if items:
+                parts.append("\n".join([headings[kind].text] + [s.text for s in items]))
+        self.stats.prompts += 1
+        self.stats.memories_dropped += dropped
+        return Prompt(
+            system="\n\n".join(parts),
+            prompt=instruction.text,
+            segments=tuple(fixed + episodic + semantic + [instruction]),
+            tokens=tokens,
+            persona_version=persona.soul.version,
+            dropped_memories=dropped,
+        )
+
+    def intern(self, kind: str, text: str) -> Segment:
+        """The shared :class:`Segment` for ``text``; tokenized on first use only."""
+        key = (kind, text)
+        segment = self._segments.get(key)
+        if segment is not None:
+            self._segments.move_to_end(key)
+            self.stats.segment_hits += 1
+            return segment
+        segment = Segment(kind, text, self.tokenizer(text))
+        self._segments[key] = segment
+        self.stats.segments_interned += 1
+        while len(self._segments) > self.max_segments:
+            self._segments.popitem(last=False)
+        return segment
+
+    def _persona(self, agent_id: str) -> _Persona:
+        version, text = self.soul_loader(agent_id)
+        cached = self._personas.get(agent_id)
+        if cached is not None and cached[0] == version:
+            self.stats.persona_hits += 1
+            return cached[1]
+        soul = parse_soul(text, version)
+        self.stats.souls_parsed += 1
+        persona = _Persona(soul, self.intern("persona", render_soul(soul)))
+        self._personas[agent_id] = (version, persona)
+        return persona
+
+    def _memory_segment(self, kind: str, memory: Any) -> Segment:
+        return self.intern(kind, f"- {_memory_text(memory)}")
+
+    def _context_segment(self, context: Dict[str, Any]) -> Optional[Segment]:
+        lines = [f"- {c}" for c in context.get("persona_constraints") or ()]
+        if lines:
+            lines.insert(0, "Persona constraints:")
+        if context.get("tone"):
+            lines.append(f"Tone: {context['tone']}")
+        if context.get("max_length"):
+            lines.append(f"Maximum length: {context['max_length']} characters")
+        if context.get("goal_description"):
+            lines.append(f"Campaign goal: {context['goal_description']}")
+        return self.intern("context", "\n".join(lines)) if lines else None
+
+
+class SoulCache:
+    """
+    :data:`SoulLoader` over ``<root>/<agent_id>/SOUL.md``.
+
+    The file is re-read only when its size or mtime changes; the version is
+    the front matter ``version`` or the content hash.
+    """
+
+    def __init__(self, root: str, filename: str = "SOUL.md"):
+        self.root = root
+        self.filename = filename
+        self._entries: Dict[str, Tuple[Tuple[int, int], str, str]] = {}
+
+    def __call__(self, agent_id: str) -> Tuple[str, str]:
+        path = os.path.join(self.root, agent_id, self.filename)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError as exc:
+            raise SkillExecutionError(
+                f"no {self.filename} for agent {agent_id}", code="not_found", retryable=False
+            ) from exc
+        signature = (stat.st_size, stat.st_mtime_ns)
+        cached = self._entries.get(agent_id)
+        if cached is None or cached[0] != signature:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+            cached = (signature, soul_version(text), text)
+            self._entries[agent_id] = cached
+        return cached[1], cached[2]
+
+
+def _memory_text(memory: Any) -> str:
+    if isinstance(memory, str):
+        return memory
+    if isinstance(memory, dict) and isinstance(memory.get("content"), str):
+        return memory["content"]
+    return json.dumps(memory, sort_keys=True, default=str)
+
@@ -0,0 +1,118 @@
+"""
+skill_render_video
+
+Renders videos with the tiered quality strategy via ``mcp-server-runway``
+(skills/README.md, Skill 5; W-003).
+
+Workers that render many videos pass a shared
+:class:`worker.render_scheduler.RenderScheduler`, which gives each tier its
+own capacity pool and reuses keyframes and identical renders.
+"""
+
+from typing import TYPE_CHECKING, Literal, Optional
+
+from pydantic import BaseModel, model_validator
+
+from backend.mcp.clients.base import MCPClient
+from skills.base import (
+    DatabaseClient,
+    SkillOutput,
+    call_skill_tool,
+    finish,
+    load_existing_result,
+    utc_now,
+)
+
+if TYPE_CHECKING:
+    from worker.render_scheduler import RenderScheduler
+
+SKILL_NAME = "skill_render_video"
+MCP_SERVER = "mcp-server-runway"
+MCP_TOOL = "render_video"
+
+
+class RenderVideoInput(BaseModel):
+    script: str
+    tier: Literal["tier_1_daily", "tier_2_hero"]
+    # Tier 1: Image-to-Video (static image + motion brush) - cost-effective
+    # Tier 2: Full Text-to-Video - high quality, expensive
+    source_image: Optional[str] = None  # Required for tier_1_daily
+    style: Optional[str] = None
+    duration_seconds: Optional[int] = None  # None = auto-determine from script
+    aspect_ratio: Literal["16:9", "9:16", "1:1"] = "9:16"
+    agent_id: str  # Required for logging and cost tracking
+    task_id: str  # Required for idempotency checks
+    campaign_id: Optional[str] = None  # For budget tracking
+    context: Optional[dict] = None  # goal_description, character_reference_id
+
+    @model_validator(mode="after")
+    def _tier_1_needs_source_image(self) -> "RenderVideoInput":
+        if self.tier == "tier_1_daily" and not self.source_image:
+            raise ValueError("source_image is required for tier_1_daily renders")
+        return self
+
+
+class RenderVideoOutput(SkillOutput):
+    pass
+
+
+async def execute_render_video(
+    input_data: RenderVideoInput,
+    mcp_client: MCPClient,
+    db_client: Optional[DatabaseClient] = None,
+    *,
+    scheduler: Optional["RenderScheduler"] = None,
+) -> RenderVideoOutput:
+    """
+    Execute skill_render_video.
+
+    Args:
+        input_data: Validated input contract
+        mcp_client: MCP client for external tool access
+        db_client: Database client for idempotency checks
+        scheduler: Shared tier-aware scheduler; renders go straight to
+            ``mcp-server-runway`` without one
+
+    Returns:
+        RenderVideoOutput: Structured output matching Worker Result schema
+
+    Raises:
+        SkillExecutionError: If rendering fails (retry-safe)
+    """
+    existing = await load_existing_result(db_client, input_data.task_id, RenderVideoOutput)
+    if existing is not None:
+        return existing
+
+    started_at = utc_now()
+    if scheduler is not None:
+        response = await scheduler.submit(input_data)
+    else:
+        parameters = {
+            "script": input_data.script,
+            "tier": input_data.tier,
+            "source_image": input_data.source_image,
+            "style": input_data.style,
+            "duration_seconds": input_data.duration_seconds,
+            "aspect_ratio": input_data.aspect_ratio,
+        }
+        response = await call_skill_tool(mcp_client, MCP_SERVER, MCP_TOOL, parameters)
+
+    metadata = dict(response.get("metadata", {}))
+    metadata["tier"] = input_data.tier
+    if "scheduling" in response:
+        metadata["scheduling"] = response["scheduling"]
+
+    return await finish(
+        RenderVideoOutput,
+        input_data,
+        {"type": "video", "content": response.get("content", ""), "metadata": metadata},
+        response,
+        f"{MCP_SERVER}/{MCP_TOOL}",
+        {
+            "tier": input_data.tier,
+            "script": input_data.script,
+            "source_image": input_data.source_image,
+        },
+        started_at,
+        db_client,
+    )
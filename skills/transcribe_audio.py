@@ -0,0 +1,288 @@
+"""
+skill_transcribe_audio
+
+Transcribes audio (videos, podcasts, voice messages) into text via
+``mcp-server-whisper`` (skills/README.md, Skill 1).
+
+WAV sources the Worker can open (URLs, mounted object storage paths) are
+streamed: overlapping chunks are transcribed concurrently with the
+``transcribe_chunk`` tool and the merged segments are written out as they
+arrive, so memory stays flat however long the recording is. Other sources
+(``mcp_resource``, compressed formats) are transcribed whole by the server.
+"""
+
+import asyncio
+import base64
+import io
+import wave
+from datetime import datetime
+from typing import IO, Any, Awaitable, Callable, Dict, List, Literal, Optional
+
+from pydantic import BaseModel
+
+from backend.mcp.clients.base import MCPClient
+from skills.audio_stream import (
+    AudioChunk,
+    Segment,
+    WavChunkReader,
+    open_audio_stream,
+    transcribe_chunks,
+)
+from skills.base import (
+    DatabaseClient,
+    SkillExecutionError,
+    SkillOutput,
+    call_skill_tool,
+    finish,
+    load_existing_result,
+    utc_now,
+)
+
+SKILL_NAME = "skill_transcribe_audio"
+MCP_SERVER = "mcp-server-whisper"
+MCP_TOOL = "transcribe"
+MCP_CHUNK_TOOL = "transcribe_chunk"
+
+
+class TranscribeAudioInput(BaseModel):
+    audio_source: str  # URL to audio file or object storage path
+    source_type: Literal["url", "object_storage", "mcp_resource"]
+    language: Optional[str] = "en"  # ISO 639-1 language code
+    format: Literal["text", "srt", "vtt"] = "text"
+    speaker_diarization: bool = False
+    timestamps: bool = True
+    agent_id: str  # Required for logging and cost tracking
+    task_id: str  # Required for idempotency checks
+
+
+class TranscribeAudioOutput(SkillOutput):
+    pass
+
+
+ChunkTranscriber = Callable[[AudioChunk, TranscribeAudioInput], Awaitable[Dict[str, Any]]]
+
+
+def mcp_chunk_transcriber(mcp_client: MCPClient) -> ChunkTranscriber:
+    """Transcribe chunks with ``mcp-server-whisper``'s ``transcribe_chunk`` tool."""
+
+    async def transcribe(chunk: AudioChunk, input_data: TranscribeAudioInput) -> Dict[str, Any]:
+        return await call_skill_tool(
+            mcp_client,
+            MCP_SERVER,
+            MCP_CHUNK_TOOL,
+            {
+                "audio_base64": base64.b64encode(chunk.to_wav()).decode("ascii"),
+                "chunk_index": chunk.index,
+                "language": input_data.language,
+                "speaker_diarization": input_data.speaker_diarization,
+            },
+        )
+
+    return transcribe
+
+
+def _timestamp(seconds: float, separator: str) -> str:
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+class TranscriptWriter:
+    """Writes segments to ``out`` as plain text, SRT or WebVTT as they arrive."""
+
+    def __init__(self, out: IO[str], format: str):
+        self.out = out
+        self.format = format
+        self.cues = 0
+        self.words = 0
+        if format == "vtt":
+            out.write("WEBVTT\n\n")
+
+    def write(self, segments: List[Segment]) -> None:
+        for segment in segments:
+            text = segment["text"].strip()
+            if not text:
+                continue
+            self.words += len(text.split())
+            self.cues += 1
+            if self.format == "text":
+                self.out.write(text if self.cues == 1 else " " + text)
+                continue
+            separator = "," if self.format == "srt" else "."
+            if self.format == "srt":
+                self.out.write(f"{self.cues}\n")
+            start = _timestamp(segment["start"], separator)
+            end = _timestamp(segment["end"], separator)
+            self.out.write(f"{start} --> {end}\n{text}\n\n")
+
+    def close(self) -> None:
+        if self.format == "text" and self.cues:
+            self.out.write("\n")
+        self.out.flush()
+
+
+async def execute_transcribe_audio(
+    input_data: TranscribeAudioInput,
+    mcp_client: MCPClient,
+    db_client: Optional[DatabaseClient] = None,
+    *,
+    transcriber: Optional[ChunkTranscriber] = None,
+    output_path: Optional[str] = None,
+    chunk_seconds: float = 30.0,
+    overlap_seconds: float = 1.0,
+    max_concurrency: int = 4,
+) -> TranscribeAudioOutput:
+    """
+    Execute skill_transcribe_audio.
+
+    Args:
+        input_data: Validated input contract
+        mcp_client: MCP client for external tool access
+        db_client: Database client for idempotency checks
+        transcriber: Chunk transcriber for streamed sources
+            (default: :func:`mcp_chunk_transcriber`)
+        output_path: File the transcript is streamed to; the artifact content
+            is then this path instead of the transcript
+        chunk_seconds: Stride between streamed chunks
+        overlap_seconds: Audio shared by consecutive chunks
+        max_concurrency: Chunks transcribed or buffered at once
+
+    Returns:
+        TranscribeAudioOutput: Structured output matching Worker Result schema
+
+    Raises:
+        SkillExecutionError: If transcription fails (retry-safe)
+    """
+    existing = await load_existing_result(db_client, input_data.task_id, TranscribeAudioOutput)
+    if existing is not None:
+        return existing
+
+    started_at = utc_now()
+    try:
+        stream = await asyncio.to_thread(
+            open_audio_stream, input_data.audio_source, input_data.source_type
+        )
+    except OSError as exc:
+        raise SkillExecutionError(f"cannot open {input_data.audio_source}: {exc}") from exc
+    reader = None
+    if stream is not None:
+        try:
+            reader = WavChunkReader(stream, chunk_seconds, overlap_seconds)
+        except (wave.Error, EOFError):
+            stream.close()  # not PCM WAV: let the server decode it
+    if reader is not None:
+        try:
+            return await _transcribe_streaming(
+                input_data,
+                reader,
+                transcriber or mcp_chunk_transcriber(mcp_client),
+                output_path,
+                max_concurrency,
+                started_at,
+                db_client,
+            )
+        finally:
+            reader.close()
+
+    parameters = {
+        "audio_source": input_data.audio_source,
+        "source_type": input_data.source_type,
+        "language": input_data.language,
+        "format": input_data.format,
+        "speaker_diarization": input_data.speaker_diarization,
+        "timestamps": input_data.timestamps,
+    }
+    response = await call_skill_tool(mcp_client, MCP_SERVER, MCP_TOOL, parameters)
+
+    content = response.get("content", "")
+    metadata = {
+        "format": input_data.format,
+        "language": input_data.language,
+        "duration_seconds": response.get("duration_seconds"),
+        "word_count": len(content.split()),
+    }
+    if input_data.speaker_diarization:
+        metadata["speaker_count"] = response.get("speaker_count", 1)
+    if input_data.timestamps:
+        metadata["timestamps"] = response.get("segments", [])
+
+    return await finish(
+        TranscribeAudioOutput,
+        input_data,
+        {"type": "text", "content": content, "metadata": metadata},
+        response,
+        f"{MCP_SERVER}/{MCP_TOOL}",
+        {"language": input_data.language, "format": input_data.format},
+        started_at,
+        db_client,
+    )
+
+
+async def _transcribe_streaming(
+    input_data: TranscribeAudioInput,
+    reader: WavChunkReader,
+    transcriber: ChunkTranscriber,
+    output_path: Optional[str],
+    max_concurrency: int,
+    started_at: datetime,
+    db_client: Optional[DatabaseClient],
+) -> TranscribeAudioOutput:
+    out: IO[str] = open(output_path, "w", encoding="utf-8") if output_path else io.StringIO()
+    writer = TranscriptWriter(out, input_data.format)
+    timestamps: List[Segment] = []
+    speakers = set()
+
+    def emit(segments: List[Segment]) -> None:
+        writer.write(segments)
+        if input_data.timestamps:
+            timestamps.extend(segments)
+        speakers.update(s["speaker"] for s in segments if s.get("speaker") is not None)
+
+    try:
+        responses = await transcribe_chunks(
+            reader, lambda chunk: transcriber(chunk, input_data), emit, max_concurrency
+        )
+        writer.close()
+        content = output_path if output_path else out.getvalue()  # type: ignore[attr-defined]
+    finally:
+        out.close()
+
+    metadata: Dict[str, Any] = {
+        "format": input_data.format,
+        "language": input_data.language,
+        "duration_seconds": reader.duration,
+        "word_count": writer.words,
+        "chunks": len(responses),
+    }
+    if output_path:
+        metadata["output_path"] = output_path
+    if input_data.speaker_diarization:
+        metadata["speaker_count"] = len(speakers) or 1
+    if input_data.timestamps:
+        metadata["timestamps"] = timestamps
+
+    confidences = [r["confidence_score"] for r in responses if "confidence_score" in r]
+    costs = [r["cost_estimate"] for r in responses if r.get("cost_estimate") is not None]
+    summary: Dict[str, Any] = {
+        "tool_version": next((r["tool_version"] for r in responses if "tool_version" in r), "1.0.0"),
+        "cost_estimate": sum(costs) if costs else None,
+    }
+    if confidences:
+        summary["confidence_score"] = min(confidences)
+    return await finish(
+        TranscribeAudioOutput,
+        input_data,
+        {"type": "text", "content": content, "metadata": metadata},
+        summary,
+        f"{MCP_SERVER}/{MCP_CHUNK_TOOL}",
+        {
+            "language": input_data.language,
+            "format": input_data.format,
+            "chunk_seconds": reader.chunk_seconds,
+            "overlap_seconds": reader.overlap_seconds,
+        },
+        started_at,
+        db_client,
+    )
@@ -0,0 +1,211 @@
+"""
+Test suite for the hash-chained audit log (S-004).
+
+These tests assert that appends are chained and group-committed, that
+queries use the sparse indexes across sealed and open segments, that
+tampering is detected, and that a crashed tail segment is recovered.
+"""
+
+import asyncio
+import io
+import json
+import os
+import threading
+
+from backend.database.repositories.audit_log import AuditEvent, AuditLog
+from backend.database.repositories.global_state import InMemoryStateStore
+from backend.services.globalstate import GlobalStateCommitService
+from backend.services.globalstate.models import CommitResultRequest
+
+
+def events(count, start=1_000.0, agents=4, actions=("state_commit", "hitl_approve")):
+    return [
+        AuditEvent(
+            actor="judge",
+            action=actions[i % len(actions)],
+            agent_id=f"agent_{i % agents}",
+            artifact_hash=f"{i:064x}",
+            policy_version="v1",
+            reasoning_trace=f"decision {i}",
+            timestamp=start + i,
+        )
+        for i in range(count)
+    ]
+
+
+def small_log(path, **overrides):
+    options = {"segment_bytes": 16 * 1024, "block_records": 16, "fsync": False}
+    options.update(overrides)
+    return AuditLog(str(path), **options)
+
+
+class TestAppendAndQuery:
+    """Sparse-indexed range scans over sealed and open segments."""
+
+    def test_filters_across_segments(self, tmp_path):
+        log = small_log(tmp_path)
+        log.append_many(events(1000))
+        assert log.stats.segments_sealed > 3
+        hits = list(log.query(start=1100, end=1299, agent_id="agent_1", action="hitl_approve"))
+        assert [r.event.timestamp for r in hits] == [1000.0 + i for i in range(101, 300, 4)]
+        everything = list(log.query())
+        assert len(everything) == 1000
+        assert [r.event.timestamp for r in everything] == sorted(r.event.timestamp for r in everything)
+
+    def test_time_range_reads_only_matching_blocks(self, tmp_path):
+        log = small_log(tmp_path)
+        log.append_many(events(1000))
+        list(log.query(start=1500, end=1510))
+        assert log.stats.blocks_read <= 2
+        log.stats.blocks_read = 0
+        assert list(log.query(agent_id="agent_9")) == []
+        assert log.stats.blocks_read == 0
+
+    def test_export_streams_jsonl_and_csv(self, tmp_path):
+        log = small_log(tmp_path)
+        hashes = log.append_many(events(50))
+        out = io.StringIO()
+        assert log.export(out, agent_id="agent_2") == 12
+        first = json.loads(out.getvalue().splitlines()[0])
+        assert first["record_hash"] == hashes[2] and first["agent_id"] == "agent_2"
+        out = io.StringIO()
+        assert log.export(out, format="csv", start=1000, end=1004) == 5
+        assert out.getvalue().splitlines()[0].startswith("record_hash,actor,action")
+
+    def test_concurrent_appends_share_fsyncs(self, tmp_path):
+        log = AuditLog(str(tmp_path), block_records=16)
+
+        def writer(n):
+            for event in events(50, start=n * 1000):
+                log.append(event)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert log.stats.appended == 400
+        assert log.stats.fsyncs <= 400
+        assert log.verify().ok
+
+
+class TestIntegrity:
+    """Chain verification and recovery."""
+
+    def test_tampering_is_detected(self, tmp_path):
+        log = small_log(tmp_path)
+        log.append_many(events(600))
+        assert log.verify() == (True, 600, None)
+        path = os.path.join(str(tmp_path), "segment-00000002.log")
+        os.chmod(path, 0o644)
+        with open(path, "r+b") as f:
+            data = f.read()
+            f.seek(0)
+            f.write(data.replace(b"decision", b"Decision", 1))
+        result = log.verify()
+        assert not result.ok and "segment 2: record 0 altered" == result.error
+
+    def test_reopen_recovers_tail_and_continues_chain(self, tmp_path):
+        log = small_log(tmp_path)
+        log.append_many(events(300))
+        log.close()
+        tail = sorted(name for name in os.listdir(tmp_path) if name.endswith(".log"))[-1]
+        with open(os.path.join(str(tmp_path), tail), "ab") as f:
+            f.write(b"f00d {\"torn")  # crash mid-write
+        reopened = small_log(tmp_path)
+        reopened.append_many(events(10, start=5000))
+        assert reopened.verify() == (True, 310, None)
+        assert len(list(reopened.query(start=5000))) == 10
+        assert len(list(reopened.query(agent_id="agent_0"))) == 78
+
+
+class TestConcurrency:
+    """Concurrent appenders and queries against the open segment."""
+
+    def test_concurrent_batches_stay_contiguous(self, tmp_path):
+        log = small_log(tmp_path, segment_bytes=20_000, fsync=True)
+
+        def writer(n):
+            for batch in range(10):
+                log.append_many(events(20, start=n * 1_000_000 + batch * 100, agents=1))
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert log.verify() == (True, 1600, None)
+        sealed = sorted(tmp_path.glob("segment-*.log"))[:-1]
+        assert sealed and all(path.stat().st_size > 0 for path in sealed)
+        timestamps = [r.event.timestamp for r in log.query()]
+        runs = [timestamps[i:i + 20] for i in range(0, 1600, 20)]
+        assert all(run == [run[0] + i for i in range(20)] for run in runs)
+
+    def test_open_segment_query_sees_partial_block(self, tmp_path):
+        log = small_log(tmp_path, segment_bytes=1 << 30)
+        log.append_many(events(40))
+        assert len(list(log.query(agent_id="agent_1"))) == 10
+        log.stats.blocks_read = 0
+        assert [r.event.timestamp for r in log.query(start=1038)] == [1038.0, 1039.0]
+        assert log.stats.blocks_read == 1
+
+
+class TestCommitServiceAudit:
+    """Judge commits land in the audit trail."""
+
+    def test_commits_and_conflicts_are_audited(self, tmp_path):
+        log = small_log(tmp_path)
+        store = InMemoryStateStore()
+        store.create_agent("agent_1")
+        service = GlobalStateCommitService(store, audit=log)
+
+        def commit(task_id, version=0):
+            return CommitResultRequest(
+                review_id=f"r_{task_id}",
+                result_id=f"res_{task_id}",
+                agent_id="agent_1",
+                task_id=task_id,
+                input_state_version=version,
+                output_state_version=version + 1,
+                commit_hash=f"hash_{task_id}",
+                routing_decision={"policy_version": "v7", "reasoning_trace": "auto-approved"},
+            )
+
+        async def run():
+            await asyncio.gather(service.commit_result(commit("t1")), service.commit_result(commit("t2")))
+            await service.commit_result(commit("t3", version=0))
+
+        asyncio.run(run())
+        records = [r.event for r in log.query(agent_id="agent_1")]
+        assert [(e.action, e.artifact_hash) for e in records] == [
+            ("state_commit", "hash_t1"),
+            ("state_commit", "hash_t2"),
+            ("occ_conflict", "hash_t3"),
+        ]
+        assert records[0].policy_version == "v7" and records[0].reasoning_trace == "auto-approved"
+
+    def test_audit_runs_off_loop_and_failures_do_not_fail_commits(self):
+        store = InMemoryStateStore()
+        store.create_agent("agent_1")
+
+        class BrokenLog:
+            threads = []
+
+            def append_many(self, events):
+                self.threads.append(threading.get_ident())
+                raise OSError("disk full")
+
+        service = GlobalStateCommitService(store, audit=BrokenLog())
+        request = CommitResultRequest(
+            review_id="r1",
+            result_id="res1",
+            agent_id="agent_1",
+            task_id="t1",
+            input_state_version=0,
+            output_state_version=1,
+            commit_hash="h1",
+        )
+        response = asyncio.run(service.commit_result(request))
+        assert response.committed and response.new_state_version == 1
+        assert service.stats.audit_failures == 1 and isinstance(service.audit_error, OSError)
+        assert BrokenLog.threads and BrokenLog.threads[0] != threading.get_ident()
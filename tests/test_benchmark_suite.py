@@ -0,0 +1,49 @@
+"""
+Test suite for the benchmark harness and workload generators.
+
+These tests assert that the synthetic workload is deterministic and valid
+against the spec models, and that the baseline comparison flags only
+compared metrics that moved the wrong way beyond the tolerance.
+"""
+
+from backend.database.models.tasks import Task
+from benchmarks import workload
+from benchmarks.suite import best_of, compare, main
+from skills.generate_content import GenerateContentOutput
+
+
+class TestWorkload:
+    """Seeded generators produce contract-valid payloads."""
+
+    def test_deterministic_and_valid(self):
+        agents = workload.fleet(10, seed=3)
+        assert agents == workload.fleet(10, seed=3)
+        tasks = workload.task_dags(agents, workload.goals(agents, 2, seed=3), seed=3)
+        assert len(tasks) == 10 * 2 * 4
+        seen = set()
+        for task in tasks:
+            assert set(task.dependencies) <= seen  # dependencies-first
+            seen.add(task.task_id)
+            Task.model_validate(task.model_dump())
+        results = workload.worker_results(agents, 50, risky_rate=0.5, seed=3)
+        assert results == workload.worker_results(agents, 50, risky_rate=0.5, seed=3)
+        for result in results:
+            GenerateContentOutput.model_validate(result)
+        assert any(phrase in r["artifact"]["content"] for r in results for phrase in workload.RISKY_PHRASES)
+
+
+class TestBaseline:
+    """Regression detection against a stored baseline."""
+
+    def test_compare_respects_direction_and_tolerance(self):
+        baseline = {"case": {"ops_per_sec": 100.0, "op_us": 10.0, "flagged_pct": 5.0}}
+        assert compare({"case": {"ops_per_sec": 80.0, "op_us": 12.0, "flagged_pct": 50.0}}, baseline, 0.25) == []
+        regressions = compare({"case": {"ops_per_sec": 70.0, "op_us": 13.0, "new_us": 1.0}}, baseline, 0.25)
+        assert [(r["metric"], round(r["change_pct"])) for r in regressions] == [("ops_per_sec", -30), ("op_us", -30)]
+        assert best_of([{"a_per_sec": 1.0, "b_us": 5.0}, {"a_per_sec": 3.0, "b_us": 7.0}]) == {"a_per_sec": 3.0, "b_us": 5.0}
+
+    def test_main_writes_baseline_then_passes_against_it(self, tmp_path):
+        baseline = str(tmp_path / "baseline.json")
+        args = ["--agents", "20", "--repeat", "1", "--cases", "task_dag,judge_validation", "--baseline", baseline]
+        assert main(args + ["--update-baseline"]) == 0
+        assert main(args + ["--tolerance", "100"]) == 0
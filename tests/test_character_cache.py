@@ -0,0 +1,223 @@
+"""
+Test suite for the character reference cache (W-008).
+
+These tests assert that reference sets are loaded once per character and
+version, that memory is bounded with evicted entries served from the spill
+file, that a new reference version invalidates old data, and that concurrent
+generations for one character share a batch.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from skills.base import SkillExecutionError
+from skills.generate_image import GenerateImageInput, execute_generate_image
+from worker.character_cache import (
+    CharacterImageBatcher,
+    CharacterReference,
+    CharacterReferenceCache,
+    MCPReferenceLoader,
+    ReferenceSpillStore,
+)
+
+
+def reference(character_id, version="v1", images=2, image_bytes=1000):
+    seed = sum(map(ord, character_id + version))
+    return CharacterReference(
+        character_id=character_id,
+        version=version,
+        embeddings=np.random.default_rng(seed).random((images, 16), dtype=np.float32),
+        images=tuple(bytes([seed % 256]) * image_bytes for _ in range(images)),
+    )
+
+
+class FakeLoader:
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.versions = {}
+        self.loads = []
+
+    async def load(self, character_id):
+        self.loads.append(character_id)
+        await asyncio.sleep(self.delay)
+        return reference(character_id, self.versions.get(character_id, "v1"))
+
+
+class FakeIdeogram:
+    """Answers the encode and batch tools."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    async def call_tool(self, server, tool, arguments):
+        self.calls.append((tool, arguments))
+        await asyncio.sleep(0.001)
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        if tool == "encode_character_reference":
+            return {"version": "v3", "embeddings": [[0.5] * 8] * 2, "images": ["AAEC"]}
+        return {
+            "results": [
+                {"content": f"s3://images/{request['prompt']}.png", "cost_estimate": 0.04}
+                for request in arguments["requests"]
+            ]
+        }
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+def image_input(character="persona_a", prompt="sunset", **context):
+    return GenerateImageInput(
+        prompt=prompt,
+        character_reference_id=character,
+        agent_id="agent_1",
+        task_id=str(uuid4()),
+        context=context or None,
+    )
+
+
+class TestReferenceCache:
+    """Loads, eviction, spill and invalidation."""
+
+    def test_concurrent_lookups_load_once(self):
+        async def run():
+            loader = FakeLoader()
+            cache = CharacterReferenceCache(loader)
+            results = await asyncio.gather(*(cache.get("persona_a") for _ in range(5)))
+            await cache.get("persona_a")
+            return loader, cache, results
+
+        loader, cache, results = asyncio.run(run())
+        assert loader.loads == ["persona_a"]
+        assert all(result is results[0] for result in results)
+        assert (cache.stats.loads, cache.stats.coalesced, cache.stats.memory_hits) == (1, 4, 1)
+
+    def test_byte_budget_spills_and_promotes(self, tmp_path):
+        async def run():
+            loader = FakeLoader(delay=0)
+            size = reference("x").nbytes
+            spill = ReferenceSpillStore(str(tmp_path / "spill.bin"))
+            cache = CharacterReferenceCache(loader, max_bytes=2 * size, spill=spill)
+            first = await cache.get("a")
+            await cache.get("b")
+            await cache.get("c")  # evicts "a" to disk
+            assert cache.memory_bytes <= 2 * size
+            promoted = await cache.get("a")
+            spill.close()
+            return loader, cache, first, promoted
+
+        loader, cache, first, promoted = asyncio.run(run())
+        assert loader.loads == ["a", "b", "c"]
+        assert cache.stats.spill_hits == 1
+        assert cache.stats.hit_rate == pytest.approx(0.25)
+        np.testing.assert_array_equal(promoted.embeddings, first.embeddings)
+        assert promoted.images == first.images
+
+    def test_spill_store_compacts_dead_records(self, tmp_path):
+        size = reference("x").nbytes
+        spill = ReferenceSpillStore(str(tmp_path / "spill.bin"), max_bytes=10 * size)
+        maps = []
+        for i in range(50):
+            spill.put(reference("a", version=f"v{i}"))
+            assert spill.get("a").version == f"v{i}"
+            maps.append(spill._map)
+        assert all(m.closed for m in maps[:-1])  # each put/compaction released the old map
+        assert spill.live_bytes == size
+        assert spill.file_bytes <= 11 * size
+        spill.close()
+
+    def test_new_version_invalidates_cached_reference(self):
+        async def run():
+            loader = FakeLoader(delay=0)
+            cache = CharacterReferenceCache(loader)
+            old = await cache.get("persona_a")
+            loader.versions["persona_a"] = "v2"
+            stale = await cache.get("persona_a")
+            cache.invalidate("persona_a", "v2")
+            fresh = await cache.get("persona_a")
+            pinned = await cache.get("persona_a", "v2")
+            return loader, old, stale, fresh, pinned
+
+        loader, old, stale, fresh, pinned = asyncio.run(run())
+        assert stale is old  # not yet told about v2
+        assert (fresh.version, pinned.version) == ("v2", "v2")
+        assert len(loader.loads) == 2
+
+    def test_version_bump_during_a_load(self):
+        class GatedLoader(FakeLoader):
+            async def load(self, character_id):
+                version = self.versions.get(character_id, "v1")  # read before the slow fetch
+                self.loads.append(version)
+                await self.gate.wait()
+                return reference(character_id, version)
+
+        async def run(invalidate):
+            loader = GatedLoader()
+            loader.gate = asyncio.Event()
+            cache = CharacterReferenceCache(loader)
+            first = asyncio.ensure_future(cache.get("persona_a"))
+            while not loader.loads:
+                await asyncio.sleep(0)
+            loader.versions["persona_a"] = "v2"
+            if invalidate:
+                cache.invalidate("persona_a", "v2")
+            second = asyncio.ensure_future(cache.get("persona_a", "v2"))
+            await asyncio.sleep(0)
+            loader.gate.set()
+            results = await asyncio.gather(first, second)
+            return loader, cache, results, await cache.get("persona_a")
+
+        for invalidate in (False, True):
+            loader, cache, (old, pinned), cached = asyncio.run(run(invalidate))
+            assert loader.loads == ["v1", "v2"]
+            assert old.version == "v1" and pinned.version == cached.version == "v2"
+            assert cache.stats.memory_hits == 1 and not cache._loading
+            assert cache.stats.coalesced == (not invalidate)
+
+    def test_mcp_loader_decodes_references(self):
+        reference = asyncio.run(MCPReferenceLoader(FakeIdeogram()).load("persona_a"))
+        assert reference.version == "v3"
+        assert reference.embeddings.shape == (2, 8)
+        assert reference.images == (b"\x00\x01\x02",)
+
+
+class TestBatching:
+    """Concurrent generations for one character share a call."""
+
+    def test_requests_batched_per_character(self):
+        async def run():
+            client = FakeIdeogram()
+            cache = CharacterReferenceCache(FakeLoader(delay=0))
+            batcher = CharacterImageBatcher(client, cache, max_batch=4, max_delay=0.01)
+            inputs = [image_input("persona_a", f"a{i}") for i in range(6)]
+            inputs += [image_input("persona_b", f"b{i}") for i in range(2)]
+            outputs = await asyncio.gather(
+                *(execute_generate_image(i, mcp_client=client, batcher=batcher) for i in inputs)
+            )
+            return client, batcher, inputs, outputs
+
+        client, batcher, inputs, outputs = asyncio.run(run())
+        sizes = sorted(len(arguments["requests"]) for _, arguments in client.calls)
+        assert sizes == [2, 2, 4]
+        assert (batcher.stats.requests, batcher.stats.batches) == (8, 3)
+        for input_data, output in zip(inputs, outputs):
+            assert output.artifact["content"] == f"s3://images/{input_data.prompt}.png"
+            assert output.artifact["metadata"]["reference_version"] == "v1"
+
+    def test_batch_failure_reaches_every_request(self):
+        async def run():
+            batcher = CharacterImageBatcher(
+                FakeIdeogram(fail=True), CharacterReferenceCache(FakeLoader(delay=0))
+            )
+            return await asyncio.gather(
+                *(batcher.generate(image_input(prompt=str(i))) for i in range(3)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(result, SkillExecutionError) for result in results)
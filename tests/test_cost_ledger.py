@@ -0,0 +1,179 @@
+"""
+Test suite for the cost ledger and CFO Judge (S-003, specs/technical.md
+Section 2.3.3).
+
+These tests assert that rollups are maintained per scope, category and time
+bucket as events are appended, that budget checks are atomic under
+concurrent Judges, and that replaying the event log rebuilds the rollups.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.database.repositories.cost_ledger import CostEvent, CostLedger, time_buckets
+from backend.services.judge import CFOJudge, CostRecorder
+from backend.services.judge.models import ValidateTransactionRequest
+from skills.generate_image import GenerateImageOutput
+
+DAY_1 = datetime(2026, 3, 30, 12, tzinfo=timezone.utc).timestamp()  # Monday, ISO week 14
+DAY_2 = datetime(2026, 4, 2, 12, tzinfo=timezone.utc).timestamp()  # same week, next month
+
+
+def event(amount, agent="agent_1", campaign=None, category="inference", at=DAY_1, **extra):
+    return CostEvent(
+        agent_id=agent,
+        campaign_id=campaign,
+        cost_category=category,
+        cost_amount=amount,
+        created_at=at,
+        **extra,
+    )
+
+
+def transaction(amount, agent="agent_1", campaign=None):
+    return ValidateTransactionRequest(
+        transaction_request={"agent_id": agent, "campaign_id": campaign, "amount": amount},
+        budget_context={"agent_budget_remaining": 1e9, "global_budget_remaining": 1e9},
+    )
+
+
+class TestRollups:
+    """Pre-aggregated breakdowns match the event log."""
+
+    def test_rollups_by_scope_category_and_period(self):
+        ledger = CostLedger()
+        ledger.append([
+            event(1.0, campaign="c1"),
+            event(2.0, category="generation", campaign="c1"),
+            event(4.0, agent="agent_2", at=DAY_2),
+        ])
+        assert time_buckets(DAY_1) == {"day": "2026-03-30", "week": "2026-W14", "month": "2026-03"}
+        daily = ledger.rollup("global", "*", "day", category="*")
+        assert [(r.bucket, r.total, r.events) for r in daily] == [
+            ("2026-03-30", 3.0, 2),
+            ("2026-04-02", 4.0, 1),
+        ]
+        assert [r.total for r in ledger.rollup("global", "*", "week", category="*")] == [7.0]
+        assert [r.total for r in ledger.rollup("global", "*", "month", category="*")] == [3.0, 4.0]
+        by_category = ledger.rollup("campaign", "c1", "month")
+        assert [(r.category, r.total) for r in by_category] == [
+            ("*", 3.0), ("generation", 2.0), ("inference", 1.0)
+        ]
+        assert ledger.rollup("agent", "agent_2", "day", start="2026-04-01", category="*")[0].total == 4.0
+
+    def test_duplicate_event_ids_are_ignored(self):
+        ledger = CostLedger()
+        first = event(1.0, event_id="e1")
+        assert ledger.append([first]) == 1
+        assert ledger.append([first, event(2.0)]) == 1
+        assert ledger.rollup("global", "*", "week", category="*")[0].total == 3.0
+
+    def test_replay_rebuilds_rollups_and_budgets(self, tmp_path):
+        ledger = CostLedger(str(tmp_path / "ledger.sqlite"))
+        ledger.set_budget("agent", "agent_1", 100.0)
+        ledger.append([event(float(i % 7), category=("inference", "posting")[i % 2]) for i in range(500)])
+        before = (ledger.rollup("agent", "agent_1", "day"), ledger.budget("agent", "agent_1"))
+        ledger._conn.execute("UPDATE cost_rollups SET total = 0")
+        ledger._conn.execute("UPDATE budgets SET spent = 0")
+        assert ledger.replay(batch_size=64) == 500
+        assert (ledger.rollup("agent", "agent_1", "day"), ledger.budget("agent", "agent_1")) == before
+        ledger.close()
+
+    def test_budget_set_after_spend_counts_history(self):
+        ledger = CostLedger()
+        ledger.append([event(3.0, at=DAY_1), event(2.0, at=DAY_2)])
+        ledger.set_budget("agent", "agent_1", 10.0)
+        assert ledger.remaining("agent", "agent_1") == pytest.approx(5.0)
+
+
+class TestCFOJudge:
+    """Atomic check-and-charge against every budget."""
+
+    def ledger(self, agent=10.0, campaign=None, total=100.0):
+        ledger = CostLedger()
+        ledger.set_budget("global", "*", total)
+        ledger.set_budget("agent", "agent_1", agent)
+        if campaign is not None:
+            ledger.set_budget("campaign", "c1", campaign)
+        return ledger
+
+    def test_approval_charges_all_scopes(self):
+        ledger = self.ledger(campaign=5.0)
+        judge = CFOJudge(ledger)
+        response = asyncio.run(judge.validate_transaction(transaction(4.0, campaign="c1")))
+        assert response.approved
+        assert response.budget_updates.agent_budget_remaining == pytest.approx(6.0)
+        assert response.budget_updates.campaign_budget_remaining == pytest.approx(1.0)
+        assert response.budget_updates.global_budget_remaining == pytest.approx(96.0)
+        rejected = asyncio.run(judge.validate_transaction(transaction(2.0, campaign="c1")))
+        assert not rejected.approved and "campaign budget exceeded" in rejected.reason
+        assert ledger.remaining("agent", "agent_1") == pytest.approx(6.0)
+        assert ledger.rollup("agent", "agent_1", "month", category="transactions")[0].events == 1
+
+    def test_agent_without_budget_is_rejected(self):
+        ledger = self.ledger()
+        response = asyncio.run(CFOJudge(ledger).validate_transaction(transaction(1.0, agent="agent_9")))
+        assert not response.approved
+        assert response.reason == "no agent budget configured"
+
+    def test_concurrent_judges_never_overspend(self, tmp_path):
+        path = str(tmp_path / "ledger.sqlite")
+        setup = CostLedger(path)
+        setup.set_budget("global", "*", 1000.0)
+        setup.set_budget("agent", "agent_1", 25.0)
+        approved = []
+        lock = threading.Lock()
+
+        def judge_process():
+            judge = CFOJudge(CostLedger(path))
+
+            async def run():
+                return await asyncio.gather(*(judge.validate_transaction(transaction(1.0)) for _ in range(20)))
+
+            results = asyncio.run(run())
+            with lock:
+                approved.extend(r for r in results if r.approved)
+            judge.ledger.close()
+
+        threads = [threading.Thread(target=judge_process) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(approved) == 25
+        assert setup.budget("agent", "agent_1") == (25.0, pytest.approx(25.0))
+        setup.close()
+
+
+class TestCostRecorder:
+    """Worker cost events are appended in batches."""
+
+    def test_batches_and_records_skill_outputs(self):
+        ledger = CostLedger()
+        ledger.set_budget("agent", "agent_1", 10.0)
+        output = GenerateImageOutput(
+            task_id="t1",
+            agent_id="agent_1",
+            artifact={"type": "image", "content": "s3://x.png"},
+            confidence_score=0.9,
+            tool_provenance={"mcp_tool": "mcp-server-ideogram/generate_image", "cost_estimate": 0.5},
+            execution_metadata={},
+        )
+
+        async def run():
+            with ThreadPoolExecutor(1) as executor:
+                recorder = CostRecorder(ledger, max_delay=0.01, executor=executor)
+                await asyncio.gather(*(recorder.record(event(0.1)) for _ in range(50)))
+                recorded = await recorder.record_output("skill_generate_image", output, campaign_id="c1")
+                await recorder.drain()
+                return recorder, recorded
+
+        recorder, recorded = asyncio.run(run())
+        assert recorder.batches == 2
+        assert recorded.cost_category == "generation"
+        assert ledger.remaining("agent", "agent_1") == pytest.approx(4.5)
+        assert ledger.rollup("campaign", "c1", "day", category="generation")[0].total == 0.5
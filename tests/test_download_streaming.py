@@ -0,0 +1,213 @@
+"""
+Test suite for streaming downloads in skill_download_youtube.
+
+These tests serve media from a local HTTP stand-in with range support and
+assert that downloads stream into the content-addressed media store, resume
+after a dropped connection, extract audio in the same pass, and are not
+repeated for media already stored.
+"""
+
+import asyncio
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+import pytest
+
+from backend.database.repositories.media_store import MediaStore
+from skills.base import SkillExecutionError
+from skills.download_youtube import DownloadYouTubeInput, execute_download_youtube
+
+VIDEO = bytes(range(256)) * 4096  # 1 MiB
+
+
+class MediaHandler(BaseHTTPRequestHandler):
+    """Serves ``VIDEO`` with ETag and Range support; can cut a body short."""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if self.path != "/video.mp4":
+            self.send_error(404)
+            return
+        start = 0
+        if "Range" in self.headers and self.headers.get("If-Range") in (None, server.etag):
+            start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(VIDEO) - 1}/{len(VIDEO)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Content-Length", str(len(VIDEO) - start))
+        self.send_header("ETag", server.etag)
+        self.end_headers()
+        body = VIDEO[start:]
+        if server.cut_after is not None:
+            body, server.cut_after = body[: server.cut_after], None
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def media_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MediaHandler)
+    server.requests = []
+    server.etag = '"v1"'
+    server.cut_after = None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class FakeYouTubeMCP:
+    def __init__(self, url, video_id="dQw4w9WgXcQ"):
+        self.url = url
+        self.video_id = video_id
+        self.calls = []
+
+    async def call_tool(self, server, tool, arguments):
+        self.calls.append((server, tool))
+        return {
+            "video_id": self.video_id,
+            "streams": {"video": {"url": self.url, "mime_type": "video/mp4"}},
+            "metadata": {"title": "Video Title", "duration_seconds": 180},
+            "risk_tags": ["copyright"],
+        }
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+class RecordingAudioSink:
+    """Stand-in extractor: writes every source byte it is fed to ``output``."""
+
+    def __init__(self, output, audio_format):
+        self.output = output
+        self.file = open(output, "wb")
+        self.aborted = False
+
+    def write(self, data):
+        self.file.write(data)
+
+    def close(self):
+        self.file.close()
+
+    def abort(self):
+        self.aborted = True
+        self.file.close()
+        self.output.unlink(missing_ok=True)
+
+
+def download_input(**overrides):
+    payload = {
+        "video_url": "https://youtube.com/watch?v=dQw4w9WgXcQ",
+        "agent_id": "agent_1",
+        "task_id": str(uuid4()),
+    }
+    payload.update(overrides)
+    return DownloadYouTubeInput(**payload)
+
+
+def url(server, path="/video.mp4"):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def download(store, mcp, **overrides):
+    return asyncio.run(
+        execute_download_youtube(
+            download_input(**overrides),
+            mcp,
+            store=store,
+            audio_extractor=RecordingAudioSink,
+            buffer_size=64 * 1024,
+        )
+    )
+
+
+class TestStreamingDownload:
+    """Media streams into the content-addressed store."""
+
+    def test_video_is_stored_under_its_hash(self, tmp_path, media_server):
+        store = MediaStore(tmp_path)
+        output = download(store, FakeYouTubeMCP(url(media_server)))
+        digest = hashlib.sha256(VIDEO).hexdigest()
+        metadata = output.artifact["metadata"]
+        assert output.artifact["content"] == str(tmp_path / digest[:2] / f"{digest}.mp4")
+        assert (tmp_path / digest[:2] / f"{digest}.mp4").read_bytes() == VIDEO
+        assert metadata["sha256"] == digest
+        assert metadata["file_size"] == len(VIDEO)
+        assert metadata["title"] == "Video Title"
+        assert metadata["deduplicated"] is False
+        assert output.risk_tags == ["copyright"]
+        assert output.tool_provenance["mcp_tool"] == "mcp-server-youtube/resolve_streams"
+        assert list(store.partial_dir.iterdir()) == []
+
+    def test_both_extracts_audio_in_the_same_pass(self, tmp_path, media_server):
+        store = MediaStore(tmp_path, base_url="s3://media")
+        output = download(store, FakeYouTubeMCP(url(media_server)), download_type="both")
+        assert len(media_server.requests) == 1
+        audio_digest = hashlib.sha256(VIDEO).hexdigest()  # the recording sink copies its input
+        assert output.artifact["metadata"]["audio_url"].startswith("s3://media/")
+        assert output.artifact["content"].startswith("s3://media/")
+        assert store.lookup(f"sha256:{audio_digest}") is not None
+
+    def test_already_stored_video_is_not_downloaded_again(self, tmp_path, media_server):
+        store = MediaStore(tmp_path)
+        mcp = FakeYouTubeMCP(url(media_server))
+        first = download(store, mcp)
+        second = download(store, mcp)
+        assert len(media_server.requests) == 1
+        assert second.artifact["content"] == first.artifact["content"]
+        assert second.artifact["metadata"]["deduplicated"] is True
+
+    def test_identical_content_under_another_id_shares_one_file(self, tmp_path, media_server):
+        store = MediaStore(tmp_path)
+        first = download(store, FakeYouTubeMCP(url(media_server), video_id="a"))
+        second = download(store, FakeYouTubeMCP(url(media_server), video_id="b"))
+        assert second.artifact["content"] == first.artifact["content"]
+        assert len(list(tmp_path.glob("*/*.mp4"))) == 1
+
+
+class TestResume:
+    """Interrupted downloads resume with a range request."""
+
+    def test_dropped_connection_resumes_from_partial_file(self, tmp_path, media_server):
+        store = MediaStore(tmp_path)
+        mcp = FakeYouTubeMCP(url(media_server))
+        media_server.cut_after = 300_000
+        with pytest.raises(SkillExecutionError) as info:
+            download(store, mcp, download_type="both")
+        assert info.value.retryable
+        output = download(store, mcp, download_type="both")
+        assert media_server.requests[-1]["Range"] == "bytes=300000-"
+        assert media_server.requests[-1]["If-Range"] == '"v1"'
+        metadata = output.artifact["metadata"]
+        assert metadata["resumed_from_bytes"] == 300_000
+        assert metadata["sha256"] == hashlib.sha256(VIDEO).hexdigest()
+        audio = store.lookup(f"sha256:{hashlib.sha256(VIDEO).hexdigest()}")
+        assert audio.path.read_bytes() == VIDEO  # prefix replayed into the extractor
+
+    def test_changed_source_restarts_the_download(self, tmp_path, media_server):
+        store = MediaStore(tmp_path)
+        mcp = FakeYouTubeMCP(url(media_server))
+        media_server.cut_after = 300_000
+        with pytest.raises(SkillExecutionError):
+            download(store, mcp)
+        media_server.etag = '"v2"'
+        output = download(store, mcp)
+        assert output.artifact["metadata"]["resumed_from_bytes"] == 0
+        assert output.artifact["metadata"]["sha256"] == hashlib.sha256(VIDEO).hexdigest()
+
+
+class TestErrors:
+    """Unavailable media is a non-retryable failure."""
+
+    def test_missing_video(self, tmp_path, media_server):
+        with pytest.raises(SkillExecutionError) as info:
+            download(MediaStore(tmp_path), FakeYouTubeMCP(url(media_server, "/gone.mp4")))
+        assert (info.value.code, info.value.retryable) == ("not_found", False)
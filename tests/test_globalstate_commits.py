@@ -0,0 +1,183 @@
+"""
+Test suite for the batched GlobalState commit service.
+
+These tests assert OCC semantics (J-005): non-conflicting commits that read
+the same ``state_version`` share one version bump, while conflicting or stale
+commits are rejected with ``occ_conflict``.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.database.repositories.global_state import (
+    InMemoryStateStore,
+    SQLiteStateStore,
+    StateVersionConflict,
+    UnknownAgentError,
+)
+from backend.services.globalstate import GlobalStateCommitService
+from backend.services.globalstate.models import CommitResultRequest, UpdateStateRequest
+
+
+def goal_update(version, goal_id, action="add", agent_id="agent_1"):
+    return UpdateStateRequest(
+        agent_id=agent_id,
+        input_state_version=version,
+        updates={"goals": [{"action": action, "goal": {"goal_id": goal_id, "description": goal_id}}]},
+        commit_hash="h",
+    )
+
+
+def judge_commit(version, task_id, agent_id="agent_1"):
+    return CommitResultRequest(
+        review_id=f"review_{task_id}",
+        result_id=f"result_{task_id}",
+        agent_id=agent_id,
+        task_id=task_id,
+        input_state_version=version,
+        output_state_version=version + 1,
+        commit_hash="h",
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request):
+    store = InMemoryStateStore() if request.param == "memory" else SQLiteStateStore()
+    store.create_agent("agent_1")
+    store.create_agent("agent_2")
+    return store
+
+
+class TestGlobalStateCommitService:
+    """Test micro-batched OCC commits against both stores."""
+
+    def test_disjoint_commits_share_one_version_bump(self, store):
+        service = GlobalStateCommitService(store)
+
+        async def run():
+            return await asyncio.gather(*(service.commit_result(judge_commit(0, f"t{i}")) for i in range(10)))
+
+        responses = asyncio.run(run())
+
+        assert all(r.committed and r.new_state_version == 1 for r in responses)
+        assert store.read("agent_1")[0] == 1
+        assert service.stats.batches == 1
+        assert service.stats.commits_per_version == 10
+
+    def test_same_entity_in_batch_conflicts(self, store):
+        service = GlobalStateCommitService(store)
+
+        async def run():
+            return await asyncio.gather(
+                service.update_state(goal_update(0, "g1")),
+                service.update_state(goal_update(0, "g1")),
+                service.update_state(goal_update(0, "g2")),
+            )
+
+        first, second, third = asyncio.run(run())
+
+        assert first.updated and third.updated
+        assert not second.updated
+        assert second.error.code == "occ_conflict"
+        assert second.new_state_version == 1
+        assert service.stats.conflict_rate == pytest.approx(1 / 3)
+
+    def test_stale_version_is_rejected(self, store):
+        service = GlobalStateCommitService(store)
+
+        async def run():
+            await service.update_state(goal_update(0, "g1"))
+            return await service.update_state(goal_update(0, "g2"))
+
+        response = asyncio.run(run())
+
+        assert response.error.code == "occ_conflict"
+        assert response.new_state_version == 1
+        version, entities = store.read("agent_1")
+        assert version == 1 and ("goal", "g2") not in entities
+
+    def test_validation_failures(self, store):
+        service = GlobalStateCommitService(store)
+
+        async def run():
+            missing = await service.update_state(goal_update(0, "nope", action="update"))
+            bad_version = await service.commit_result(
+                judge_commit(0, "t1").model_copy(update={"output_state_version": 5})
+            )
+            unknown = await service.update_state(goal_update(0, "g1", agent_id="ghost"))
+            return missing, bad_version, unknown
+
+        for response in asyncio.run(run()):
+            assert response.error.code == "validation_failed"
+        assert store.read("agent_1")[0] == 0
+
+    def test_agent_removed_before_write_fails_validation(self):
+        store = InMemoryStateStore()
+        store.create_agent("agent_1")
+        service = GlobalStateCommitService(store)
+
+        def vanished(*args):
+            raise UnknownAgentError("agent_1")
+
+        store.apply = store.record_commits = vanished
+
+        async def run():
+            applied = await asyncio.gather(
+                service.update_state(goal_update(0, "g1")),
+                service.commit_result(judge_commit(1, "t1")),
+            )
+            return applied + [await service.commit_result(judge_commit(5, "t2"))]  # conflict record only
+
+        for response in asyncio.run(run()):
+            assert response.error.code == "validation_failed"
+            assert response.error.message == "unknown agent: agent_1"
+        assert service.stats.validation_failures == 3
+
+    def test_update_and_remove_apply_to_state(self, store):
+        service = GlobalStateCommitService(store)
+
+        async def run():
+            await service.update_state(goal_update(0, "g1"))
+            await service.update_state(goal_update(1, "g1", action="remove"))
+
+        asyncio.run(run())
+
+        version, entities = store.read("agent_1")
+        assert version == 2 and entities == {}
+
+    def test_agents_batch_independently(self, store):
+        service = GlobalStateCommitService(store, executor=ThreadPoolExecutor(4))
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    service.commit_result(judge_commit(0, f"t{i}", agent_id=f"agent_{i % 2 + 1}"))
+                    for i in range(8)
+                )
+            )
+
+        assert all(r.committed for r in asyncio.run(run()))
+        assert store.read("agent_1")[0] == 1
+        assert store.read("agent_2")[0] == 1
+        assert service.stats.batches == 2
+
+    def test_replans_when_another_writer_advances_version(self):
+        store = InMemoryStateStore()
+        store.create_agent("agent_1")
+        service = GlobalStateCommitService(store)
+        original_apply = store.apply
+
+        def racing_apply(agent_id, expected, writes, commits):
+            store.apply = original_apply
+            original_apply(agent_id, expected, {}, [])
+            raise StateVersionConflict(agent_id, expected, expected + 1)
+
+        store.apply = racing_apply
+        response = asyncio.run(service.commit_result(judge_commit(0, "t1")))
+
+        assert response.error.code == "occ_conflict"
+        assert response.new_state_version == 1
+        assert service.stats.store_conflicts == 1
+        assert store.commits[-1].occ_conflict
@@ -0,0 +1,94 @@
+"""
+Test suite for the HITL queue store (GET /dashboard/hitl-queue).
+
+These tests assert that filtered pages come back oldest first, that keyset
+and offset pagination agree, and that counters track approve/reject.
+"""
+
+import pytest
+
+from backend.queues.hitl_queue import HITLQueue
+
+
+def review(i, confidence=0.85, tags=()):
+    return {
+        "review_id": f"review_{i:04d}",
+        "result_id": f"result_{i}",
+        "agent_id": "agent_1",
+        "artifact": {"type": "text", "content": f"post {i}"},
+        "confidence_score": confidence,
+        "risk_tags": list(tags),
+        "policy_version": "v1",
+    }
+
+
+@pytest.fixture
+def queue():
+    now = [1000.0]
+
+    def clock():
+        now[0] += 1.0
+        return now[0]
+
+    queue = HITLQueue(clock=clock)
+    for i in range(30):
+        tags = ["politics"] if i % 3 == 0 else ["finance"] if i % 5 == 0 else []
+        queue.enqueue(review(i, confidence=0.75 if i % 2 else 0.88, tags=tags))
+    return queue
+
+
+class TestHITLQueue:
+    """Test filtered pagination, counters and decisions."""
+
+    def test_counters_match_filters(self, queue):
+        assert queue.total_count("all") == 30
+        assert queue.total_count("low_confidence") == 15
+        assert queue.total_count("sensitive") == 10 + 4  # politics, plus finance not divisible by 3
+        assert queue.total_count("financial") == 4
+
+    def test_keyset_and_offset_pages_agree(self, queue):
+        keyset, cursor = [], None
+        while True:
+            page = queue.list("sensitive", limit=4, cursor=cursor)
+            keyset.extend(item.review_id for item in page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        offset = []
+        for start in range(0, 14, 4):
+            offset.extend(i.review_id for i in queue.list("sensitive", limit=4, offset=start).items)
+
+        assert keyset == offset
+        assert keyset == sorted(keyset)
+        assert len(keyset) == 14
+
+    def test_approve_and_reject(self, queue):
+        decision = queue.approve("review_0000", reviewer_id="mod_1", notes="ok")
+        queue.reject("review_0003", reviewer_id="mod_1", reason="off brand")
+
+        assert decision.decision == "approved" and decision.policy_version == "v1"
+        assert len(decision.artifact_hash) == 64
+        assert queue.total_count("all") == 28
+        assert queue.total_count("sensitive") == 12
+        assert queue.list("all", limit=1).items[0].review_id == "review_0001"
+
+        with pytest.raises(ValueError):
+            queue.approve("review_0000", reviewer_id="mod_2")
+        with pytest.raises(KeyError):
+            queue.reject("missing", reviewer_id="mod_2")
+
+    def test_page_shape(self, queue):
+        page = queue.list("financial", limit=10)
+
+        assert page.total_count == 4 and not page.has_more and page.next_cursor is None
+        item = page.items[0]
+        assert item.artifact == {"type": "text", "content": "post 5"}
+        assert item.risk_tags == ["finance"]
+        assert item.pending_since.timestamp() == 1006.0
+
+    def test_invalid_arguments(self, queue):
+        with pytest.raises(ValueError):
+            queue.list("urgent")
+        with pytest.raises(ValueError):
+            queue.list(cursor="not a cursor")
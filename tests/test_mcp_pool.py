@@ -0,0 +1,179 @@
+"""
+Test suite for the pooled MCP client.
+
+These tests run the client against the local fake MCP server process and
+assert that sessions are reused and pipelined, rate limits hold, concurrent
+resource reads are coalesced, and tool errors surface as MCPError.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from backend.mcp.clients import MCPClient, MCPError
+from backend.mcp.clients.pooled import LatencyHistogram, PooledMCPClient, ServerConfig, TokenBucket
+
+ROOT = Path(__file__).resolve().parent.parent
+FAKE = "mcp-server-fake"
+
+
+def client(pool_size=2, **kwargs):
+    config = ServerConfig(
+        command=[sys.executable, "-m", "backend.mcp.fake_server"], cwd=str(ROOT), pool_size=pool_size
+    )
+    return PooledMCPClient({FAKE: config}, resource_servers={"fake": FAKE}, **kwargs)
+
+
+class TestSessions:
+    """Persistent sessions are reused and pipelined."""
+
+    def test_satisfies_protocol_and_returns_structured_content(self):
+        async def run():
+            async with client() as mcp:
+                assert isinstance(mcp, MCPClient)
+                return await mcp.call_tool(FAKE, "echo", {"text": "hi"})
+
+        assert asyncio.run(run()) == {"text": "hi"}
+
+    def test_sequential_calls_reuse_one_session(self):
+        async def run():
+            async with client() as mcp:
+                for i in range(20):
+                    await mcp.call_tool(FAKE, "echo", {"i": i})
+                stats = await mcp.call_tool(FAKE, "stats", {})
+                return mcp.stats.sessions_opened, stats
+
+        opened, stats = asyncio.run(run())
+        assert opened == 1
+        assert stats["initialize"] == 1
+        assert stats["tool:echo"] == 20
+
+    def test_concurrent_calls_are_pipelined_within_pool_size(self):
+        async def run():
+            async with client(pool_size=2) as mcp:
+                started = time.perf_counter()
+                await asyncio.gather(
+                    *(mcp.call_tool(FAKE, "sleep", {"seconds": 0.2}) for _ in range(40))
+                )
+                return time.perf_counter() - started, mcp.stats.sessions_opened
+
+        elapsed, opened = asyncio.run(run())
+        assert opened <= 2
+        assert elapsed < 2.0  # 40 x 0.2 s would take 8 s unpipelined
+
+    def test_dead_session_is_replaced(self):
+        async def run():
+            async with client(pool_size=1) as mcp:
+                await mcp.call_tool(FAKE, "echo", {})
+                session = mcp._pools[FAKE].sessions[0]
+                session._process.kill()
+                await session._process.wait()
+                await asyncio.sleep(0.05)
+                result = await mcp.call_tool(FAKE, "echo", {"again": True})
+                return result, mcp.stats.sessions_opened
+
+        assert asyncio.run(run()) == ({"again": True}, 2)
+
+
+    def test_stray_output_lines_are_ignored(self):
+        async def run():
+            async with client(pool_size=1) as mcp:
+                lines = ["42", '"ready"', "[1, 2]", "null", "starting up"]
+                await mcp.call_tool(FAKE, "log", {"lines": lines})
+                result = await mcp.call_tool(FAKE, "echo", {"after": True})
+                return result, mcp.stats.sessions_opened
+
+        assert asyncio.run(run()) == ({"after": True}, 1)
+
+
+class TestErrors:
+    """Tool and transport failures raise MCPError."""
+
+    def test_tool_error_result(self):
+        async def run():
+            async with client() as mcp:
+                await mcp.call_tool(FAKE, "fail", {"message": "quota exceeded"})
+
+        with pytest.raises(MCPError, match="quota exceeded"):
+            asyncio.run(run())
+
+    def test_unknown_server(self):
+        async def run():
+            async with client() as mcp:
+                await mcp.call_tool("mcp-server-missing", "echo", {})
+
+        with pytest.raises(MCPError) as info:
+            asyncio.run(run())
+        assert info.value.code == "unknown_server"
+
+
+class TestRateLimits:
+    """Token buckets throttle per server and per tool."""
+
+    def test_token_bucket_reserves_future_tokens(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=10, burst=2, clock=lambda: now[0])
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, pytest.approx(0.1)]
+        now[0] = 1.0
+        assert bucket.reserve() == 0.0
+
+    def test_per_tool_limit_throttles_only_that_tool(self):
+        async def run():
+            async with client(rate_limits={f"{FAKE}/echo": (20, 1)}) as mcp:
+                await mcp.call_tool(FAKE, "stats", {})
+                started = time.perf_counter()
+                await asyncio.gather(*(mcp.call_tool(FAKE, "echo", {}) for _ in range(6)))
+                echo_elapsed = time.perf_counter() - started
+                started = time.perf_counter()
+                await asyncio.gather(*(mcp.call_tool(FAKE, "stats", {}) for _ in range(6)))
+                return echo_elapsed, time.perf_counter() - started, mcp.stats.throttled
+
+        echo_elapsed, stats_elapsed, throttled = asyncio.run(run())
+        assert echo_elapsed >= 0.24  # 5 waits of 50 ms
+        assert stats_elapsed < echo_elapsed
+        assert throttled == 5
+
+
+class TestResources:
+    """Concurrent identical resource reads share one fetch."""
+
+    def test_concurrent_reads_are_coalesced(self):
+        async def run():
+            async with client() as mcp:
+                uri = "fake://mentions/recent"
+                first = await asyncio.gather(*(mcp.read_resource(uri) for _ in range(25)))
+                second = await mcp.read_resource(uri)
+                return first, second, mcp.stats
+
+        first, second, stats = asyncio.run(run())
+        assert all(r == {"uri": "fake://mentions/recent", "read": 1} for r in first)
+        assert second["read"] == 2
+        assert (stats.resource_fetches, stats.resource_coalesced) == (2, 24)
+
+
+class TestLatency:
+    """Per-tool latency histograms."""
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for ms in [1] * 90 + [100] * 10:
+            histogram.observe(ms / 1000)
+        assert histogram.count == 100
+        assert histogram.percentile(50) < 0.002
+        assert 0.1 <= histogram.percentile(99) < 0.15
+        assert sum(n for _, n in histogram.buckets()) == 100
+
+    def test_calls_are_recorded_per_tool(self):
+        async def run():
+            async with client() as mcp:
+                await mcp.call_tool(FAKE, "echo", {})
+                await mcp.call_tool(FAKE, "sleep", {"seconds": 0.05})
+                await mcp.read_resource("fake://x")
+                return mcp.latency
+
+        latency = asyncio.run(run())
+        assert set(latency) == {f"{FAKE}/echo", f"{FAKE}/sleep", f"{FAKE}/resources/read"}
+        assert latency[f"{FAKE}/sleep"].percentile(50) >= 0.05
@@ -0,0 +1,145 @@
+"""
+Test suite for hierarchical memory retrieval (P-006).
+
+These tests assert that episodic memory honours the 1 hour window, that the
+semantic index only returns the requesting agent's memories, and that IVF
+search agrees with exact search on clustered data.
+"""
+
+import numpy as np
+
+from backend.services.memory import (
+    EpisodicRingBuffer,
+    HashingEmbedder,
+    IVFIndex,
+    MemoryEntry,
+    MemoryService,
+)
+from backend.services.memory.embedding import normalize
+from backend.services.memory.models import MemoryRetrieveRequest, MemoryStoreRequest
+
+
+def entry(i, agent_id="agent_1", created_at=0.0):
+    return MemoryEntry(f"m{i}", agent_id, "semantic", f"memory {i}", created_at)
+
+
+def clustered(n, dim, centers=32, seed=0):
+    rng = np.random.default_rng(seed)
+    means = rng.normal(size=(centers, dim)).astype(np.float32)
+    points = means[rng.integers(0, centers, n)] + 0.3 * rng.normal(size=(n, dim)).astype(np.float32)
+    return normalize(points)
+
+
+class TestEpisodicRingBuffer:
+    """Test the per-agent short-term ring."""
+
+    def test_window_and_wraparound(self):
+        buffer = EpisodicRingBuffer(dim=4, capacity=3, window_seconds=60.0)
+        vector = np.zeros(4, dtype=np.float32)
+        for i, t in enumerate([0.0, 50.0, 100.0, 110.0]):
+            buffer.append(entry(i, created_at=t), vector)
+
+        hits = buffer.query(None, limit=10, now=120.0)
+
+        # m0 was overwritten, m1 is outside the window; newest first.
+        assert [e.memory_id for e, _ in hits] == ["m3", "m2"]
+
+    def test_ranks_by_similarity(self):
+        embedder = HashingEmbedder(dim=64)
+        buffer = EpisodicRingBuffer(dim=64, capacity=8)
+        texts = ["posted a sneaker review", "answered a fan question", "sneaker unboxing live"]
+        for i, text in enumerate(texts):
+            buffer.append(entry(i)._replace(content=text), embedder.embed([text])[0])
+
+        hits = buffer.query(embedder.embed(["sneaker"])[0], limit=2, now=1.0)
+
+        assert {e.content for e, _ in hits} == {texts[0], texts[2]}
+
+
+class TestIVFIndex:
+    """Test approximate search against exact search."""
+
+    def test_recall_against_exact_search(self):
+        dim, n = 32, 8000
+        vectors = clustered(n, dim)
+        index = IVFIndex(dim, nprobe=8, train_threshold=2000, exact_threshold=0)
+        for offset in range(0, n, 500):  # incremental inserts across (re)training
+            index.add([entry(i) for i in range(offset, offset + 500)], vectors[offset: offset + 500])
+        assert index.trained
+
+        queries = clustered(50, dim, seed=1)
+        recall = []
+        for q in queries:
+            exact = set(np.argsort(-(vectors @ q))[:10].tolist())
+            found = {int(e.memory_id[1:]) for e, _ in index.search("agent_1", q, 10)}
+            recall.append(len(exact & found) / 10)
+        assert np.mean(recall) >= 0.9
+
+    def test_search_is_filtered_per_agent(self):
+        dim = 16
+        vectors = clustered(3000, dim)
+        index = IVFIndex(dim, train_threshold=1000, exact_threshold=100)
+        index.add([entry(i, agent_id=f"agent_{i % 3}") for i in range(3000)], vectors)
+
+        hits = index.search("agent_2", vectors[2], 20)
+
+        assert hits[0][0].memory_id == "m2"
+        assert all(e.agent_id == "agent_2" for e, _ in hits)
+        assert index.search("unknown", vectors[0], 5) == []
+
+    def test_memory_mapped_matrix(self, tmp_path):
+        dim = 8
+        vectors = clustered(3000, dim)
+        index = IVFIndex(dim, train_threshold=1000, path=str(tmp_path / "vectors.f32"))
+        index.add([entry(i) for i in range(3000)], vectors)
+
+        assert index.search("agent_1", vectors[7], 1)[0][0].memory_id == "m7"
+        index.close()
+        assert not (tmp_path / "vectors.f32").exists()
+
+
+class FakeWeaviate:
+    def __init__(self):
+        self.rows = {}
+
+    def upsert(self, entry, vector):
+        self.rows.setdefault(entry.agent_id, []).append((entry, vector))
+
+    def fetch_agent(self, agent_id):
+        return list(self.rows.get(agent_id, []))
+
+
+class TestMemoryService:
+    """Test the /memory/store and /memory/retrieve handlers."""
+
+    def test_store_and_retrieve_both_tiers(self):
+        now = [10_000.0]
+        service = MemoryService(clock=lambda: now[0])
+        service.store(MemoryStoreRequest(agent_id="a", content="summer sneaker campaign results"))
+        service.store(MemoryStoreRequest(agent_id="b", content="sneaker campaign for agent b"))
+        service.store(
+            MemoryStoreRequest(agent_id="a", memory_type="episodic", content="replied about sneaker sizes")
+        )
+
+        response = service.retrieve(MemoryRetrieveRequest(agent_id="a", query="sneaker campaign"))
+        assert response.episodic_count == 1 and response.semantic_count == 1
+        assert all(0.0 <= m.relevance_score <= 1.0 for m in response.memories)
+
+        now[0] += 7200
+        later = service.retrieve(MemoryRetrieveRequest(agent_id="a", query="sneaker campaign"))
+        assert later.episodic_count == 0 and later.semantic_count == 1
+
+    def test_backend_is_read_through_cache(self):
+        backend = FakeWeaviate()
+        writer = MemoryService(backend=backend)
+        writer.store(MemoryStoreRequest(agent_id="a", content="collab with running brand"))
+
+        reader = MemoryService(backend=backend)
+        response = reader.retrieve(
+            MemoryRetrieveRequest(agent_id="a", query="running brand", memory_types=["semantic"])
+        )
+        assert [m.content for m in response.memories] == ["collab with running brand"]
+
+        reader.store(MemoryStoreRequest(agent_id="a", content="second running post"))
+        assert len(backend.rows["a"]) == 2
+        assert reader.index.agent_count("a") == 2
@@ -0,0 +1,187 @@
+"""
+Test suite for the OpenClaw status publisher and Status Judge (W-013, J-008).
+
+These tests assert that only changed sections are published, that heartbeats
+are batched and sent at most once per interval for live agents, that repeated
+payloads reuse Judge verdicts until the policy version changes, and that
+failed bulk calls are retried.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.mcp.clients.base import MCPError
+from backend.services.judge import PolicyEngine, StatusJudge
+from backend.services.judge.models import Policy, StatusUpdate
+from backend.services.openclaw import OpenClawPublisher
+
+POLICY = Policy(
+    policy_version="v1",
+    rules=[{"rule": "no_gambling", "patterns": ["bet now"]}],
+    sensitive_topics={"politics": ["election"]},
+)
+
+
+class RecordingMCP:
+    def __init__(self):
+        self.calls = []
+        self.fail = 0
+
+    async def call_tool(self, server, tool, arguments):
+        assert (server, tool) == ("mcp-server-openclaw", "openclaw_publish_status_batch")
+        if self.fail:
+            self.fail -= 1
+            raise MCPError("unavailable", code="unavailable")
+        self.calls.append(arguments)
+        return {"published": len(arguments["updates"]) + len(arguments["heartbeats"])}
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+def status(agent_id="agent_1", state="active", load=0, description="Writes posts", **extra):
+    return StatusUpdate(
+        agent_id=agent_id,
+        availability={
+            "status": state,
+            "available": state in ("active", "idle"),
+            "capacity": {"current_load": load, "max_concurrent_interactions": 4},
+        },
+        capabilities=[{"capability_id": "c1", "name": "content_generation", "description": description}],
+        **extra,
+    )
+
+
+def publisher(client=None, **options):
+    judge = StatusJudge(PolicyEngine(POLICY))
+    options = {"heartbeat_interval": 60.0, "jitter": 0.0, "max_batch": 100, "seed": 0, **options}
+    return OpenClawPublisher(client or RecordingMCP(), judge, **options)
+
+
+class TestDeltas:
+    """Only changed sections are sent, coalesced per flush."""
+
+    def test_first_status_then_only_changed_sections(self):
+        pub = publisher()
+        pub.submit(status(), now=0)
+        asyncio.run(pub.flush(now=0))
+        first = pub.client.calls[0]["updates"][0]
+        assert set(first) >= {"availability", "capabilities", "commit_hash", "status_update_id"}
+
+        assert pub.submit(status(), now=1) is None
+        pub.submit(status(state="idle"), now=2)
+        pub.submit(status(state="paused"), now=3)
+        asyncio.run(pub.flush(now=5))
+        (update,) = pub.client.calls[1]["updates"]
+        assert "capabilities" not in update and update["availability"]["status"] == "paused"
+        assert pub.stats.coalesced == 1 and pub.stats.unchanged == 1
+
+    def test_load_only_changes_wait_for_the_heartbeat(self):
+        pub = publisher()
+        pub.submit(status(), now=0)
+        asyncio.run(pub.flush(now=0))
+        pub.submit(status(load=3), now=10)
+        assert asyncio.run(pub.flush(now=10)) == 0
+        assert asyncio.run(pub.flush(now=60)) == 1
+        (update,) = pub.client.calls[1]["updates"]
+        assert update["availability"]["capacity"]["current_load"] == 3
+
+    def test_reverting_before_flush_sends_nothing(self):
+        pub = publisher()
+        pub.submit(status(), now=0)
+        asyncio.run(pub.flush(now=0))
+        pub.submit(status(state="idle"), now=1)
+        pub.submit(status(), now=2)
+        assert asyncio.run(pub.flush(now=5)) == 0 and pub.pending == 0
+
+
+    def test_change_while_in_flight_is_rediffed_on_ack(self):
+        class GatedMCP(RecordingMCP):
+            async def call_tool(self, server, tool, arguments):
+                await self.gate.wait()
+                return await super().call_tool(server, tool, arguments)
+
+        async def scenario(fail):
+            client = GatedMCP()
+            client.gate = asyncio.Event()
+            client.gate.set()
+            pub = publisher(client)
+            pub.submit(status(), now=0)
+            await pub.flush(now=0)
+            pub.submit(status(state="idle", description="Writes threads"), now=1)
+            client.gate.clear()
+            client.fail = fail
+            flushing = asyncio.create_task(pub.flush(now=2))
+            await asyncio.sleep(0)
+            pub.submit(status(description="Writes threads"), now=3)  # back to active mid-call
+            client.gate.set()
+            await flushing
+            return pub, client
+
+        pub, client = asyncio.run(scenario(fail=0))
+        assert pub.pending == 1
+        asyncio.run(pub.flush(now=5))
+        (update,) = client.calls[-1]["updates"]
+        assert update["availability"]["status"] == "active" and "capabilities" not in update
+
+        pub, client = asyncio.run(scenario(fail=1))  # idle never landed: send both sections
+        assert pub.pending == 1
+        asyncio.run(pub.flush(now=5))
+        (update,) = client.calls[-1]["updates"]
+        assert update["capabilities"][0]["description"] == "Writes threads"
+        assert pub.pending == 0
+
+
+class TestHeartbeats:
+    """Heartbeats are bulk, rate-limited and only for live agents."""
+
+    def test_live_agents_share_one_call_per_interval(self):
+        pub = publisher(max_batch=40)
+        for n in range(100):
+            pub.submit(status(agent_id=f"agent_{n}"), now=0)
+        asyncio.run(pub.flush(now=0))
+        assert len(pub.client.calls) == 3
+        for n in range(60):
+            pub.touch(f"agent_{n}", now=30)
+        assert asyncio.run(pub.flush(now=59)) == 0
+        assert asyncio.run(pub.flush(now=61)) == 60
+        heartbeats = [h for call in pub.client.calls[3:] for h in call["heartbeats"]]
+        assert len(heartbeats) == 60 and pub.stats.heartbeats == 60
+        assert heartbeats[0]["last_heartbeat"].startswith("1970-01-01T00:00:30")
+        assert asyncio.run(pub.flush(now=200)) == 0  # nobody seen since
+
+    def test_failed_call_is_retried_with_same_id(self):
+        client = RecordingMCP()
+        client.fail = 1
+        pub = publisher(client)
+        pub.submit(status(), now=0)
+        assert asyncio.run(pub.flush(now=0)) == 0
+        assert asyncio.run(pub.flush(now=5)) == 1
+        assert pub.stats.failed_calls == 1 and pub.pending == 0
+
+
+class TestStatusJudge:
+    """Routing and verdict reuse."""
+
+    def test_routes_and_holds_non_auto_updates(self):
+        pub = publisher()
+        assert pub.submit(status(confidence_score=0.95), now=0).route == "auto_publish"
+        hitl = pub.submit(status(description="Covers the election", confidence_score=0.95), now=1)
+        assert hitl.route == "hitl" and hitl.risk_tags == ["politics"]
+        assert pub.submit(status(description="bet now", load=1), now=2).route == "reject"
+        assert pub.submit(status(confidence_score=0.8, load=2), now=3).route == "hitl"
+        assert pub.stats.held == 3
+        asyncio.run(pub.flush(now=5))
+        assert pub.client.calls[0]["updates"][0]["capabilities"][0]["description"] == "Writes posts"
+
+    def test_verdicts_are_cached_per_policy_version(self):
+        engine = PolicyEngine(POLICY)
+        judge = StatusJudge(engine)
+        for state in ("active", "idle", "active", "idle"):
+            judge.validate(status(state=state))
+        assert (judge.stats.validations, judge.stats.cache_hits) == (2, 2)
+        engine.load(POLICY.model_copy(update={"policy_version": "v2"}))
+        judge.validate(status(state="idle"))
+        assert judge.stats.validations == 3
+        assert judge.stats.hit_rate == pytest.approx(2 / 5)
@@ -0,0 +1,177 @@
+"""
+Test suite for generate_content prompt assembly (P-005/P-006).
+
+These tests assert that SOUL.md is parsed once per version, that segments are
+interned and tokenized once, that prompts keep a stable persona-first order,
+and that the token budget drops memories instead of re-tokenizing.
+"""
+
+import asyncio
+import os
+from uuid import uuid4
+
+import pytest
+
+from skills.base import SkillExecutionError
+from skills.generate_content import GenerateContentInput, execute_generate_content
+from skills.prompt_builder import PromptBuilder, SoulCache, estimate_tokens, parse_soul
+
+SOUL = """---
+name: Zara
+version: 3
+---
+# Zara
+
+## Backstory
+Grew up in Addis Ababa and studied design.
+
+## Voice/Tone
+Witty and warm.
+
+## Core Beliefs & Values
+- Sustainability first
+- Never discuss politics
+
+## Directives
+1. Disclose AI status
+   when asked.
+"""
+
+
+class StaticSouls:
+    def __init__(self, text=SOUL, version="3"):
+        self.text = text
+        self.version = version
+        self.calls = 0
+
+    def __call__(self, agent_id):
+        self.calls += 1
+        return self.version, self.text
+
+
+class CountingTokenizer:
+    def __init__(self):
+        self.texts = []
+
+    def __call__(self, text):
+        self.texts.append(text)
+        return estimate_tokens(text)
+
+
+class TestSoulParsing:
+    """SOUL.md sections map to the persona fields."""
+
+    def test_sections_and_front_matter(self):
+        soul = parse_soul(SOUL)
+        assert (soul.name, soul.version) == ("Zara", "3")
+        assert soul.voice == "Witty and warm."
+        assert soul.beliefs == ("Sustainability first", "Never discuss politics")
+        assert soul.directives == ("Disclose AI status when asked.",)
+
+    def test_version_defaults_to_content_hash(self):
+        text = SOUL.split("---\n", 2)[2]
+        assert parse_soul(text).version == parse_soul(text).version
+        assert parse_soul(text).version != parse_soul(text + "\nmore").version
+
+    def test_soul_cache_rereads_only_changed_files(self, tmp_path):
+        (tmp_path / "agent_1").mkdir()
+        path = tmp_path / "agent_1" / "SOUL.md"
+        path.write_text(SOUL)
+        souls = SoulCache(str(tmp_path))
+        assert souls("agent_1") == ("3", SOUL)
+        updated = SOUL.replace("version: 3", "version: 4")
+        path.write_text(updated)
+        os.utime(path, ns=(1, 1))
+        assert souls("agent_1") == ("4", updated)
+        with pytest.raises(SkillExecutionError) as exc:
+            souls("agent_2")
+        assert exc.value.code == "not_found"
+
+
+class TestPromptBuilder:
+    """Cached, ordered, budgeted assembly."""
+
+    def test_soul_parsed_once_per_version(self):
+        souls = StaticSouls()
+        builder = PromptBuilder(souls)
+        first = builder.build("agent_1", "reply to @fan")
+        second = builder.build("agent_1", "post about recycling")
+        souls.version = "4"
+        souls.text = SOUL.replace("Witty", "Earnest")
+        third = builder.build("agent_1", "post again")
+        assert builder.stats.souls_parsed == 2
+        assert builder.stats.persona_hits == 1
+        assert first.segments[0] is second.segments[0]
+        assert first.prefix_hash == second.prefix_hash != third.prefix_hash
+        assert third.persona_version == "4" and "Earnest" in third.system
+
+    def test_stable_order_and_single_tokenization(self):
+        tokenizer = CountingTokenizer()
+        builder = PromptBuilder(StaticSouls(), tokenizer=tokenizer)
+        context = {"persona_constraints": ["no politics"], "tone": "witty", "max_length": 280}
+        memory = {"episodic_memory": ["liked a post"], "semantic_memory": [{"content": "loves coffee"}]}
+        first = builder.build("agent_1", "reply", context, memory)
+        tokenized = len(tokenizer.texts)
+        second = builder.build("agent_1", "another reply", context, memory)
+        assert tokenizer.texts[tokenized:] == ["another reply"]
+        assert second.system == first.system
+        system = first.system
+        assert system.index("You are Zara") < system.index("no politics") < system.index(
+            "liked a post"
+        ) < system.index("loves coffee")
+        assert first.tokens == estimate_tokens(first.system) + estimate_tokens("reply")
+
+    def test_budget_drops_least_relevant_then_oldest(self):
+        builder = PromptBuilder(StaticSouls())
+        memory = {
+            "episodic_memory": ["old event", "new event"],
+            "semantic_memory": ["most relevant", "least relevant"],
+        }
+        full = builder.build("agent_1", "reply", None, memory)
+        tight = PromptBuilder(StaticSouls(), max_prompt_tokens=full.tokens - 1)
+        prompt = tight.build("agent_1", "reply", None, memory)
+        assert prompt.dropped_memories == 1
+        assert "least relevant" not in prompt.system and "most relevant" in prompt.system
+        base = builder.build("agent_1", "reply").tokens
+        tighter = PromptBuilder(StaticSouls(), max_prompt_tokens=base + 7)
+        prompt = tighter.build("agent_1", "reply", None, memory)
+        assert "Long-Term" not in prompt.system and "old event" not in prompt.system
+        assert "new event" in prompt.system
+        assert prompt.tokens == estimate_tokens(prompt.system) + 1 == base + 7
+
+    def test_budget_too_small_for_persona(self):
+        builder = PromptBuilder(StaticSouls(), max_prompt_tokens=5)
+        with pytest.raises(SkillExecutionError) as exc:
+            builder.build("agent_1", "reply")
+        assert exc.value.code == "validation_failed"
+
+
+class TestSkillIntegration:
+    """execute_generate_content sends the assembled prompt."""
+
+    def test_system_prompt_sent_to_provider(self):
+        calls = []
+
+        class Gemini:
+            async def call_tool(self, server, tool, arguments):
+                calls.append(arguments)
+                return {"content": "Hello #green", "model": "gemini"}
+
+            async def read_resource(self, uri):
+                raise NotImplementedError
+
+        input_data = GenerateContentInput(
+            content_type="reply",
+            prompt="thank the fan",
+            context={"tone": "warm"},
+            agent_id="agent_1",
+            task_id=str(uuid4()),
+            memory_context={"episodic_memory": ["fan said hi"]},
+        )
+        builder = PromptBuilder(StaticSouls())
+        output = asyncio.run(execute_generate_content(input_data, Gemini(), prompt_builder=builder))
+        assert calls[0]["prompt"] == "thank the fan"
+        assert "fan said hi" in calls[0]["system_prompt"] and "memory_context" not in calls[0]
+        metadata = output.artifact["metadata"]
+        assert metadata["persona_version"] == "3"
+        assert metadata["prompt_tokens"] > 0
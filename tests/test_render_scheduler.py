@@ -0,0 +1,185 @@
+"""
+Test suite for the tier-aware render scheduler (W-003).
+
+These tests assert that each tier renders from its own capacity pool, that
+cost-weighted admission bounds in-flight spend, and that keyframes and
+identical renders are shared instead of repeated.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from skills.render_video import RenderVideoInput, execute_render_video
+from worker.render_scheduler import RenderScheduler, TierConfig
+
+
+class FakeRenderer:
+    """Renders by sleeping; tier 1 renders can be held until released."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.prepared = []
+        self.rendered = []
+        self.running = {"tier_1_daily": 0, "tier_2_hero": 0}
+        self.peak = dict(self.running)
+
+    async def prepare(self, source_image, style, aspect_ratio):
+        self.prepared.append((source_image, style, aspect_ratio))
+        await asyncio.sleep(self.delay)
+        return {"asset_url": f"keyframe://{source_image}/{style}/{aspect_ratio}"}
+
+    async def render(self, input_data, keyframe):
+        tier = input_data.tier
+        self.running[tier] += 1
+        self.peak[tier] = max(self.peak[tier], self.running[tier])
+        try:
+            if tier == "tier_1_daily":
+                await self.gate.wait()
+            await asyncio.sleep(self.delay)
+            self.rendered.append((input_data.script, keyframe))
+            return {
+                "content": f"s3://videos/{input_data.task_id}.mp4",
+                "cost_estimate": 0.15,
+                "metadata": {"duration_seconds": input_data.duration_seconds},
+            }
+        finally:
+            self.running[tier] -= 1
+
+
+def render_input(tier="tier_1_daily", script="wave hello", **overrides):
+    payload = {
+        "script": script,
+        "tier": tier,
+        "source_image": "s3://images/persona.jpg" if tier == "tier_1_daily" else None,
+        "style": "cinematic",
+        "duration_seconds": 15,
+        "agent_id": "agent_1",
+        "task_id": str(uuid4()),
+    }
+    payload.update(overrides)
+    return RenderVideoInput(**payload)
+
+
+TIERS = {
+    "tier_1_daily": TierConfig(
+        capacity=2, max_inflight_cost=1.0, cost_per_second=0.01, default_duration=15
+    ),
+    "tier_2_hero": TierConfig(
+        capacity=1, max_inflight_cost=20.0, cost_per_second=0.25, default_duration=30
+    ),
+}
+
+
+class TestTierPools:
+    """Tiers do not share capacity."""
+
+    def test_daily_burst_does_not_block_hero_render(self):
+        async def run():
+            renderer = FakeRenderer()
+            renderer.gate.clear()  # tier 1 renders hang until released
+            scheduler = RenderScheduler(renderer, TIERS)
+            burst = [
+                asyncio.ensure_future(scheduler.submit(render_input(script=f"daily {i}")))
+                for i in range(20)
+            ]
+            await asyncio.sleep(0.02)
+            hero = await asyncio.wait_for(scheduler.submit(render_input("tier_2_hero")), 1.0)
+            assert not any(task.done() for task in burst)
+            renderer.gate.set()
+            await asyncio.gather(*burst)
+            return renderer, scheduler, hero
+
+        renderer, scheduler, hero = asyncio.run(run())
+        assert hero["scheduling"]["source"] == "rendered"
+        assert renderer.peak == {"tier_1_daily": 2, "tier_2_hero": 1}
+        assert scheduler.stats["tier_1_daily"].rendered == 20
+        assert scheduler.stats["tier_1_daily"].queue_wait.count == 20
+
+    def test_cost_budget_limits_expensive_renders(self):
+        async def run():
+            renderer = FakeRenderer()
+            tiers = dict(TIERS)
+            tiers["tier_2_hero"] = TierConfig(
+                capacity=4, max_inflight_cost=20.0, cost_per_second=0.25, default_duration=30
+            )
+            scheduler = RenderScheduler(renderer, tiers)
+            # 60 s at 0.25/s = 15 USD each: only one fits the 20 USD budget.
+            await asyncio.gather(
+                *(scheduler.submit(render_input("tier_2_hero", script=f"hero {i}", duration_seconds=60))
+                  for i in range(3))
+            )
+            long_peak = renderer.peak["tier_2_hero"]
+            renderer.peak["tier_2_hero"] = 0
+            await asyncio.gather(
+                *(scheduler.submit(render_input("tier_2_hero", script=f"short {i}", duration_seconds=20))
+                  for i in range(4))
+            )
+            return long_peak, renderer.peak["tier_2_hero"]
+
+        long_peak, short_peak = asyncio.run(run())
+        assert long_peak == 1
+        assert short_peak == 4  # 4 x 5 USD fit the budget
+
+
+class TestReuse:
+    """Keyframes and identical renders are shared."""
+
+    def test_keyframe_prepared_once_per_image_style_and_ratio(self):
+        async def run():
+            renderer = FakeRenderer()
+            scheduler = RenderScheduler(renderer, TIERS)
+            await asyncio.gather(
+                *(scheduler.submit(render_input(script=f"post {i}")) for i in range(6)),
+                scheduler.submit(render_input(script="square", aspect_ratio="1:1")),
+            )
+            return renderer, scheduler
+
+        renderer, scheduler = asyncio.run(run())
+        assert len(renderer.prepared) == 2
+        assert all(keyframe is not None for _, keyframe in renderer.rendered)
+        stats = scheduler.stats["tier_1_daily"]
+        assert (stats.keyframes_prepared, stats.keyframes_reused) == (2, 5)
+
+    def test_duplicate_tier_1_renders_are_answered_from_cache(self):
+        async def run():
+            renderer = FakeRenderer()
+            scheduler = RenderScheduler(renderer, TIERS)
+            concurrent = await asyncio.gather(*(scheduler.submit(render_input()) for _ in range(3)))
+            later = await scheduler.submit(render_input())
+            return renderer, scheduler, concurrent, later
+
+        renderer, scheduler, concurrent, later = asyncio.run(run())
+        assert len(renderer.rendered) == 1
+        assert [r["scheduling"]["source"] for r in concurrent] == ["rendered", "coalesced", "coalesced"]
+        assert later["scheduling"]["source"] == "cache"
+        assert later["cost_estimate"] == 0.0
+        assert scheduler.stats["tier_1_daily"].reuse_rate == pytest.approx(0.75)
+
+    def test_hero_renders_are_not_cached(self):
+        async def run():
+            renderer = FakeRenderer()
+            scheduler = RenderScheduler(renderer, TIERS)
+            await scheduler.submit(render_input("tier_2_hero"))
+            await scheduler.submit(render_input("tier_2_hero"))
+            return renderer
+
+        assert len(asyncio.run(run()).rendered) == 2
+
+
+class TestSkillIntegration:
+    """execute_render_video routes through a scheduler when given one."""
+
+    def test_scheduling_metadata_in_artifact(self):
+        async def run():
+            scheduler = RenderScheduler(FakeRenderer(), TIERS)
+            return await execute_render_video(render_input(), mcp_client=None, scheduler=scheduler)
+
+        output = asyncio.run(run())
+        metadata = output.artifact["metadata"]
+        assert metadata["tier"] == "tier_1_daily"
+        assert metadata["scheduling"]["source"] == "rendered"
+        assert output.tool_provenance["cost_estimate"] == 0.15
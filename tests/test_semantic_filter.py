@@ -0,0 +1,150 @@
+"""
+Test suite for the tiered Planner semantic filter (P-008).
+
+These tests assert that only the uncertain similarity band reaches the LLM
+scorer and that the configured relevance threshold governs LLM decisions.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.planner import MCPRelevanceScorer, SemanticFilter
+from backend.services.planner.models import SemanticFilterRequest
+
+
+class KeywordScorer:
+    """Stand-in LLM: relevant if the content mentions 'sneaker'."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def score(self, agent_id, content, goals):
+        self.calls.append(content)
+        return (0.9, "mentions sneakers") if "sneaker" in content else (0.1, "off topic")
+
+
+class FakeMCP:
+    async def call_tool(self, server, tool, arguments):
+        assert (server, tool) == ("mcp-server-gemini", "score_relevance")
+        return {"relevance_score": 0.8, "reasoning": "on brand"}
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+def mention(text, agent_id="agent_1", **context):
+    return SemanticFilterRequest(
+        agent_id=agent_id,
+        content={"type": "text", "content": text, "source": "twitter://mentions/recent"},
+        context=context,
+    )
+
+
+@pytest.fixture
+def semantic_filter():
+    scorer = KeywordScorer()
+    f = SemanticFilter(scorer, reject_below=0.2, accept_above=0.8)
+    f.set_goals(
+        "agent_1",
+        {"g1": "launch the summer sneaker collection", "g2": "grow fashion week coverage"},
+    )
+    return f
+
+
+class TestSemanticFilter:
+    """Test pre-filter tiers and LLM routing."""
+
+    def test_tiers(self, semantic_filter):
+        requests = [
+            mention("launch the summer sneaker collection"),  # near-duplicate of g1
+            mention("bitcoin price crash today"),  # no overlap
+            mention("loving the new sneaker collection drop"),  # partial overlap
+        ]
+
+        accepted, rejected, uncertain = asyncio.run(semantic_filter.filter_batch(requests))
+
+        assert accepted.should_create_task and accepted.scored_by == "prefilter"
+        assert rejected.filtered and rejected.scored_by == "prefilter"
+        assert uncertain.scored_by == "llm" and uncertain.should_create_task
+        assert semantic_filter.scorer.calls == ["loving the new sneaker collection drop"]
+        assert semantic_filter.stats.llm_call_rate == pytest.approx(1 / 3)
+
+    def test_threshold_applies_to_llm_scores(self, semantic_filter):
+        request = mention("loving the new sneaker collection drop", relevance_threshold=0.95)
+
+        response = asyncio.run(semantic_filter.filter(request))
+
+        assert response.relevance_score == pytest.approx(0.9)
+        assert response.relevance_threshold == 0.95
+        assert response.filtered and not response.should_create_task
+
+    def test_active_goals_restrict_the_goal_matrix(self, semantic_filter):
+        text = "launch the summer sneaker collection"
+        all_goals, only_g2 = semantic_filter.prefilter_scores(
+            [mention(text), mention(text, active_goals=["g2"])]
+        )
+        assert all_goals > 0.99
+        assert only_g2 < 0.2
+
+    def test_agent_without_known_goals_goes_to_llm(self, semantic_filter):
+        requests = [
+            mention("sneaker", agent_id="agent_2"),
+            mention("new sneaker drop", active_goals=["g9"]),
+        ]
+        no_goals, unknown_goals = asyncio.run(semantic_filter.filter_batch(requests))
+        assert no_goals.scored_by == unknown_goals.scored_by == "llm"
+        assert no_goals.should_create_task and unknown_goals.relevance_score == pytest.approx(0.9)
+        assert semantic_filter.stats.prefilter_rejected == 0
+
+    def test_prefilter_never_accepts_below_threshold(self):
+        f = SemanticFilter(KeywordScorer(), reject_below=0.05, accept_above=0.5)
+        f.set_goals("agent_1", {"g1": "launch the summer sneaker collection"})
+        request = mention("launch the summer sneaker", relevance_threshold=0.95)
+        assert 0.5 <= f.prefilter_scores([request])[0] < 0.95
+
+        response = asyncio.run(f.filter(request))
+
+        assert response.scored_by == "llm" and response.relevance_threshold == 0.95
+        assert f.stats.prefilter_accepted == 0
+
+    def test_audit_estimates_recall(self, semantic_filter):
+        semantic_filter.audit_rate = 1.0
+        requests = [mention("bitcoin crash"), mention("sneakers!"), mention("weather is nice")]
+
+        asyncio.run(semantic_filter.filter_batch(requests))
+
+        stats = semantic_filter.stats
+        assert stats.audited == 3
+        assert stats.audit_relevant == 1 and stats.audit_missed == 1
+        assert stats.estimated_recall == 0.0
+
+    def test_llm_failures_stay_with_their_item(self, semantic_filter):
+        class FlakyScorer(KeywordScorer):
+            async def score(self, agent_id, content, goals):
+                if "bitcoin" in content or "drop" in content:
+                    raise RuntimeError("gemini unavailable")
+                return await super().score(agent_id, content, goals)
+
+        semantic_filter.scorer = FlakyScorer()
+        semantic_filter.audit_rate = 1.0
+        requests = [
+            mention("launch the summer sneaker collection"),  # accepted, audit succeeds
+            mention("bitcoin price crash today"),  # rejected, audit fails
+            mention("loving the new sneaker collection drop"),  # uncertain, LLM fails
+            mention("sneaker"),  # uncertain, LLM succeeds
+        ]
+
+        accepted, rejected, failed, scored = asyncio.run(semantic_filter.filter_batch(requests))
+
+        assert accepted.should_create_task and rejected.filtered
+        assert failed.scored_by == "prefilter" and failed.filtered
+        assert "gemini unavailable" in failed.reasoning
+        assert scored.scored_by == "llm" and scored.should_create_task
+        stats = semantic_filter.stats
+        assert stats.llm_failures == 1 and stats.audit_failures == 1 and stats.audited == 1
+        assert isinstance(semantic_filter.llm_error, RuntimeError)
+
+    def test_mcp_scorer(self):
+        score = asyncio.run(MCPRelevanceScorer(FakeMCP()).score("agent_1", "x", ["goal"]))
+        assert score == (0.8, "on brand")
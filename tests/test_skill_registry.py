@@ -0,0 +1,139 @@
+"""
+Test suite for the skills registry and dispatch entry point.
+
+These tests assert that skills are resolved lazily by ``skill_name`` (as in
+the ``execute_skill`` task payload of skills/README.md) and that a text-only
+Worker never imports the media skill modules.
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+import skills
+from skills import SKILL_REGISTRY, SkillExecutionError, execute_skill, load_skill
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+MEDIA_MODULES = {
+    "skills.transcribe_audio",
+    "skills.download_youtube",
+    "skills.generate_image",
+    "skills.render_video",
+}
+
+
+class FakeMCPClient:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    async def call_tool(self, server, tool, arguments):
+        self.calls.append((server, tool, arguments))
+        return self.response
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+class InMemoryDB:
+    def __init__(self):
+        self.results = {}
+
+    async def get_result(self, task_id):
+        return self.results.get(task_id)
+
+    async def save_result(self, task_id, result):
+        self.results[task_id] = result
+
+
+def content_input(**overrides):
+    payload = {
+        "content_type": "post",
+        "platform": "twitter",
+        "prompt": "Say hi",
+        "context": {"tone": "witty"},
+        "agent_id": "agent_1",
+        "task_id": str(uuid4()),
+    }
+    payload.update(overrides)
+    return payload
+
+
+class TestSkillRegistry:
+    """Test lazy resolution and dispatch of registered skills."""
+
+    def test_text_only_worker_never_imports_media_skills(self):
+        script = (
+            "import asyncio, json, sys\n"
+            "import skills\n"
+            "before = sorted(m for m in sys.modules if m.startswith('skills.'))\n"
+            "skills.load_skill('skill_generate_content')\n"
+            "after = sorted(m for m in sys.modules if m.startswith('skills.'))\n"
+            "print(json.dumps({'before': before, 'after': after}))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        loaded = json.loads(result.stdout)
+
+        assert loaded["before"] == ["skills.base"]
+        assert loaded["after"] == ["skills.base", "skills.generate_content"]
+        assert not MEDIA_MODULES & set(loaded["after"])
+
+    def test_every_registry_entry_resolves(self):
+        for name, entry in SKILL_REGISTRY.items():
+            skill = load_skill(name)
+            assert skill.execute.__name__ == entry["function"]
+            assert skill.input_model.__name__ == entry["input_model"]
+            assert skill.output_model.__name__ == entry["output_model"]
+            assert load_skill(name) is skill
+
+    def test_unknown_skill_is_not_retryable(self):
+        with pytest.raises(SkillExecutionError) as excinfo:
+            load_skill("skill_does_not_exist")
+        assert excinfo.value.retryable is False
+
+    def test_execute_skill_validates_and_dispatches(self):
+        client = FakeMCPClient({"content": "hello #ai @you", "confidence_score": 0.95})
+
+        output = asyncio.run(
+            execute_skill("skill_generate_content", content_input(), client)
+        )
+
+        assert client.calls[0][:2] == ("mcp-server-gemini", "generate_text")
+        assert output.artifact["content"] == "hello #ai @you"
+        assert output.artifact["metadata"]["hashtags"] == ["#ai"]
+        assert output.confidence_score == 0.95
+        assert "skill_generate_content" in skills.loaded_skills()
+
+    def test_execute_skill_rejects_invalid_input(self):
+        with pytest.raises(ValidationError):
+            asyncio.run(
+                execute_skill(
+                    "skill_generate_content",
+                    content_input(content_type="poem"),
+                    FakeMCPClient({}),
+                )
+            )
+
+    def test_retry_returns_stored_result_without_mcp_call(self):
+        db = InMemoryDB()
+        client = FakeMCPClient({"content": "first"})
+        payload = content_input()
+
+        first = asyncio.run(execute_skill("skill_generate_content", payload, client, db))
+        second = asyncio.run(execute_skill("skill_generate_content", payload, client, db))
+
+        assert len(client.calls) == 1
+        assert second.result_id == first.result_id
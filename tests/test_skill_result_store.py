@@ -0,0 +1,163 @@
+"""
+Test suite for the content-addressed skill result store.
+
+These tests assert that retried and concurrent skill executions with the
+same task_id and input are served from one execution (skills/README.md
+idempotency requirement), against in-memory and SQLite backends.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from backend.database.repositories.skill_results import (
+    InMemoryBlobStore,
+    SQLiteBlobStore,
+    SkillResultStore,
+    canonical_input_hash,
+    decode_blob,
+    encode_blob,
+)
+from skills import execute_skill
+from skills.render_video import RenderVideoInput
+
+
+class SlowRenderClient:
+    """Fake mcp-server-runway that takes a while to render."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def call_tool(self, server, tool, arguments):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {
+            "content": f"s3://renders/{uuid4()}.mp4",
+            "metadata": {"duration": 30, "fps": 30},
+            "cost_estimate": 0.5,
+        }
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+def render_input(task_id=None, **overrides):
+    payload = {
+        "script": "A day in the life",
+        "tier": "tier_1_daily",
+        "source_image": "s3://bucket/portrait.jpg",
+        "agent_id": "agent_1",
+        "task_id": task_id or str(uuid4()),
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request):
+    if request.param == "memory":
+        yield SkillResultStore(InMemoryBlobStore())
+    else:
+        blobs = SQLiteBlobStore(":memory:")
+        yield SkillResultStore(blobs)
+        blobs.close()
+
+
+class TestSkillResultStore:
+    """Test idempotent execution through execute_skill."""
+
+    def test_retry_is_served_from_store(self, store):
+        client = SlowRenderClient()
+        payload = render_input()
+
+        first = asyncio.run(execute_skill("skill_render_video", payload, client, result_store=store))
+        retry = asyncio.run(execute_skill("skill_render_video", payload, client, result_store=store))
+
+        assert client.calls == 1
+        assert retry == first
+        assert store.stats.hits == 1
+
+    def test_concurrent_identical_executions_share_one_future(self, store):
+        client = SlowRenderClient()
+        payload = render_input()
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    execute_skill("skill_render_video", payload, client, result_store=store)
+                    for _ in range(20)
+                )
+            )
+
+        outputs = asyncio.run(run())
+
+        assert client.calls == 1
+        assert len({o.result_id for o in outputs}) == 1
+        assert store.stats.inflight_joins == 19
+
+    def test_changed_input_for_same_task_executes_again(self, store):
+        client = SlowRenderClient()
+        task_id = str(uuid4())
+
+        asyncio.run(
+            execute_skill("skill_render_video", render_input(task_id), client, result_store=store)
+        )
+        asyncio.run(
+            execute_skill(
+                "skill_render_video",
+                render_input(task_id, style="cinematic"),
+                client,
+                result_store=store,
+            )
+        )
+
+        assert client.calls == 2
+
+    def test_failures_are_not_cached(self, store):
+        class FlakyClient(SlowRenderClient):
+            async def call_tool(self, server, tool, arguments):
+                self.calls += 1
+                if self.calls == 1:
+                    raise ConnectionError("runway unavailable")
+                return await super().call_tool(server, tool, arguments)
+
+        client = FlakyClient()
+        payload = render_input()
+
+        with pytest.raises(Exception, match="runway unavailable"):
+            asyncio.run(execute_skill("skill_render_video", payload, client, result_store=store))
+        output = asyncio.run(execute_skill("skill_render_video", payload, client, result_store=store))
+
+        assert output.artifact["type"] == "video"
+
+
+class TestBlobStores:
+    """Test hashing, blob encoding and byte-bounded eviction."""
+
+    def test_canonical_hash_ignores_field_order(self):
+        a = RenderVideoInput(**render_input("t1", context={"a": 1, "b": 2}))
+        reordered = dict(reversed(list(render_input("t1", context={"b": 2, "a": 1}).items())))
+        b = RenderVideoInput(**reordered)
+
+        assert canonical_input_hash(a) == canonical_input_hash(b)
+
+    def test_large_blobs_are_compressed(self):
+        result = {"artifact": {"content": "x" * 10_000}}
+        blob = encode_blob(result)
+
+        assert len(blob) < 1_000
+        assert decode_blob(blob) == result
+
+    @pytest.mark.parametrize("factory", [InMemoryBlobStore, SQLiteBlobStore])
+    def test_eviction_keeps_total_under_budget(self, factory):
+        blobs = factory(max_bytes=1_000)
+        blobs.put("a", b"a" * 400)
+        blobs.put("b", b"b" * 400)
+        blobs.get("a")  # "b" is now least recently used
+        evicted = blobs.put("c", b"c" * 400)
+
+        assert evicted == 1
+        assert blobs.get("b") is None
+        assert blobs.get("a") is not None
+        assert blobs.total_bytes <= 1_000
@@ -0,0 +1,177 @@
+"""
+Test suite for the DAG-gated Worker task queue.
+
+These tests assert that tasks are released only after their dependencies
+complete (P-004), dispatched by priority with aging, and that cycles are
+rejected at insertion.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from backend.database.models import Task
+from backend.queues.task_queue import (
+    CycleError,
+    InMemoryTaskStore,
+    TaskScheduler,
+    UnknownDependencyError,
+)
+
+
+def drain(scheduler):
+    order = []
+    while (item := scheduler.get_nowait()) is not None:
+        order.append(item[0])
+        scheduler.complete(item[0])
+    return order
+
+
+class TestTaskScheduler:
+    """Test dependency gating, priority dispatch and persistence."""
+
+    def test_tasks_release_only_after_dependencies_complete(self):
+        scheduler = TaskScheduler()
+        scheduler.add_many(
+            [
+                ("post", "high", ["caption", "image"], None),
+                ("caption", "medium", [], None),
+                ("image", "medium", [], None),
+            ]
+        )
+
+        first = scheduler.get_nowait()[0]
+        second = scheduler.get_nowait()[0]
+        assert {first, second} == {"caption", "image"}
+        assert scheduler.get_nowait() is None
+
+        assert scheduler.complete(first) == []
+        assert scheduler.complete(second) == ["post"]
+        assert scheduler.get_nowait()[0] == "post"
+
+    def test_priority_order_with_aging(self):
+        now = [0.0]
+        scheduler = TaskScheduler(aging_seconds=10.0, clock=lambda: now[0])
+        scheduler.add("old_low", "low")
+        now[0] = 15.0
+        scheduler.add("new_high", "high")
+        scheduler.add("new_medium", "medium")
+
+        # high (15) < low (0 + 20) < medium (15 + 10)
+        assert drain(scheduler) == ["new_high", "old_low", "new_medium"]
+
+    def test_low_priority_does_not_starve(self):
+        now = [0.0]
+        scheduler = TaskScheduler(aging_seconds=1.0, clock=lambda: now[0])
+        scheduler.add("low", "low")
+        dispatched = []
+        for i in range(10):
+            now[0] = float(i)
+            scheduler.add(f"high_{i}", "high")
+            task_id = scheduler.get_nowait()[0]
+            scheduler.complete(task_id)
+            dispatched.append(task_id)
+
+        assert "low" in dispatched
+
+    def test_cycle_is_rejected_without_partial_insert(self):
+        scheduler = TaskScheduler()
+        scheduler.add("root")
+
+        with pytest.raises(CycleError) as excinfo:
+            scheduler.add_many(
+                [
+                    ("a", "medium", ["root", "c"], None),
+                    ("b", "medium", ["a"], None),
+                    ("c", "medium", ["b"], None),
+                    ("d", "medium", [], None),
+                ]
+            )
+
+        assert set(excinfo.value.task_ids) == {"a", "b", "c"}
+        assert len(scheduler) == 1
+
+    def test_unknown_dependency_is_rejected(self):
+        scheduler = TaskScheduler()
+        with pytest.raises(UnknownDependencyError):
+            scheduler.add("child", dependencies=["missing"])
+
+    def test_failure_cancels_descendants(self):
+        scheduler = TaskScheduler()
+        scheduler.add_many(
+            [
+                ("a", "medium", [], None),
+                ("b", "medium", ["a"], None),
+                ("c", "medium", ["b"], None),
+                ("x", "medium", [], None),
+            ]
+        )
+        scheduler.get_nowait()
+
+        assert sorted(scheduler.fail("a")) == ["b", "c"]
+        assert scheduler.status("c") == "cancelled"
+        # Late additions depending on a failed task are cancelled immediately.
+        scheduler.add("d", dependencies=["c"])
+        assert scheduler.status("d") == "cancelled"
+        assert drain(scheduler) == ["x"]
+        assert len(scheduler) == 0
+
+    def test_async_workers_drain_the_dag(self):
+        scheduler = TaskScheduler()
+        scheduler.add_many(
+            [(f"t{i}", "medium", [f"t{i - 1}"] if i else [], None) for i in range(50)]
+        )
+        order = []
+
+        async def worker():
+            while True:
+                task_id, _ = await scheduler.get()
+                order.append(task_id)
+                await asyncio.sleep(0)
+                scheduler.complete(task_id)
+
+        async def run():
+            workers = [asyncio.create_task(worker()) for _ in range(4)]
+            await scheduler.join()
+            for w in workers:
+                w.cancel()
+
+        asyncio.run(run())
+        assert order == [f"t{i}" for i in range(50)]
+
+    def test_submit_accepts_spec_task_model(self):
+        scheduler = TaskScheduler()
+        now = datetime.now(timezone.utc)
+        parent = Task(
+            task_id=uuid4(),
+            agent_id="agent_1",
+            task_type="generate_text",
+            parameters={},
+            state_version_snapshot=1,
+            created_at=now,
+        )
+        child = parent.model_copy(
+            update={"task_id": uuid4(), "task_type": "post_content", "dependencies": [parent.task_id]}
+        )
+        scheduler.submit(parent)
+        scheduler.submit(child)
+
+        task_id, payload = scheduler.get_nowait()
+        assert payload is parent
+        assert scheduler.complete(task_id) == [str(child.task_id)]
+
+    def test_restore_from_store_requeues_executing_tasks(self):
+        store = InMemoryTaskStore()
+        scheduler = TaskScheduler(store=store)
+        scheduler.add_many(
+            [("a", "medium", [], None), ("b", "medium", [], None), ("c", "medium", ["a", "b"], None)]
+        )
+        scheduler.complete(scheduler.get_nowait()[0])
+        scheduler.get_nowait()  # in flight when the process dies
+
+        restored = TaskScheduler.restore(store)
+
+        assert len(restored) == 2
+        assert drain(restored)[-1] == "c"
@@ -0,0 +1,233 @@
+"""
+Test suite for end-to-end latency tracing (S-008).
+
+These tests assert that one trace context follows a task through trend
+detection, skill execution, MCP calls and the Judge, that spans land in
+per-thread ring buffers, and that the HDR histograms report percentiles per
+task_type and priority with SLO violations.
+"""
+
+import asyncio
+import io
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from backend import tracing
+from backend.database.models.tasks import Task
+from backend.database.repositories.global_state import InMemoryStateStore
+from backend.services.globalstate import GlobalStateCommitService
+from backend.services.globalstate.models import CommitResultRequest
+from backend.services.judge import PolicyEngine
+from backend.services.judge.models import Policy
+from backend.tracing import HdrHistogram, Tracer
+from chimera.handlers import SkillHandler
+from skills import execute_skill
+from worker import trend_fetcher
+
+
+class FakeGemini:
+    async def call_tool(self, server, tool, arguments):
+        return {"content": "New drop is live #fashion", "confidence_score": 0.95}
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+class StaticSource:
+    async def fetch_trends(self, platform, query, time_window):
+        return [{"topic": "sneakers", "trend_score": 0.9}]
+
+
+@pytest.fixture
+def tracer():
+    tracing.tracer.reset()
+    yield tracing.tracer
+    tracing.tracer.reset()
+
+
+class TestPropagation:
+    """One context follows the task across stages."""
+
+    def test_pipeline_spans_share_the_task(self, tracer):
+        original = trend_fetcher.get_trend_engine()
+        trend_fetcher.configure_trend_engine(source=StaticSource())
+        store = InMemoryStateStore()
+        store.create_agent("agent_1")
+        commits = GlobalStateCommitService(store)
+        engine = PolicyEngine(Policy(policy_version="v3"))
+
+        async def pipeline():
+            with tracing.trace("task_1", "agent_1", "generate_text", "high"):
+                await trend_fetcher.adetect_trends("agent_1", "twitter")  # runs on the engine loop
+                output = await execute_skill(
+                    "skill_generate_content",
+                    {
+                        "content_type": "post",
+                        "prompt": "announce the drop",
+                        "context": {},
+                        "agent_id": "agent_1",
+                        "task_id": "task_1",
+                    },
+                    FakeGemini(),
+                )
+                engine.validate(output.artifact)
+                await commits.commit_result(
+                    CommitResultRequest(
+                        review_id="r1",
+                        result_id=str(output.result_id),
+                        agent_id="agent_1",
+                        task_id="task_1",
+                        input_state_version=0,
+                        output_state_version=1,
+                        commit_hash="h1",
+                    )
+                )
+
+        try:
+            asyncio.run(pipeline())
+        finally:
+            trend_fetcher._default_engine = original
+        spans = tracer.spans()
+        assert {s.task_id for s in spans} == {"task_1"}
+        assert [s.stage for s in spans] == [
+            "total", "detect_trends", "skill", "mcp", "judge_validate", "judge_commit"
+        ]
+        by_stage = {s.stage: s for s in spans}
+        assert by_stage["mcp"].detail == "mcp-server-gemini/generate_text"
+        assert by_stage["judge_validate"].detail == "v3"
+        assert by_stage["total"].duration_ns >= by_stage["skill"].duration_ns
+        keys = {key for key in tracer.histograms()}
+        assert ("skill", "generate_text", "high") in keys and ("total", "generate_text", "high") in keys
+
+    def test_worker_handler_traces_each_task(self, tracer):
+        handler = SkillHandler(FakeGemini())
+        skill_input = {
+            "content_type": "reply",
+            "prompt": "thank them",
+            "context": {},
+            "agent_id": "agent_1",
+        }
+        payloads = [
+            {
+                "skill_name": "skill_generate_content",
+                "skill_input": {**skill_input, "task_id": f"task_{n}"},
+                "task_type": "engage_reply",
+                "priority": "high",
+                "ingested_at": time.time() - age,
+            }
+            for n, age in enumerate([0.0, 12.0])
+        ]
+        payloads.append({"skill_name": "skill_generate_content", "skill_input": {**skill_input, "task_id": "t"}})
+
+        async def worker():
+            for payload in payloads:
+                await handler(payload)
+
+        asyncio.run(worker())
+        rows = {(r["stage"], r["task_type"], r["priority"]): r for r in tracer.summary()}
+        total = rows["total", "engage_reply", "high"]
+        assert total["count"] == 2 and total["slo_violations"] == 1
+        assert rows["skill", "engage_reply", "high"]["count"] == 2
+        assert rows["total", "skill_generate_content", "medium"]["count"] == 1
+        assert {s.task_id for s in tracer.spans()} == {"task_0", "task_1", "t"}
+
+    def test_explicit_task_id_starts_a_context(self, tracer):
+        async def judge_process():
+            assert tracing.current_context() is None
+            with tracing.span("judge_commit", task_id="task_9", agent_id="agent_2", priority="high"):
+                with tracing.span("mcp", "x/y"):
+                    pass
+            with tracing.span("mcp", "untraced"):
+                pass
+
+        asyncio.run(judge_process())
+        assert [(s.task_id, s.agent_id, s.stage) for s in tracer.spans()] == [
+            ("task_9", "agent_2", "judge_commit"),
+            ("task_9", "agent_2", "mcp"),
+        ]
+        assert set(tracer.histograms()) == {("judge_commit", "", "high"), ("mcp", "", "high")}
+
+
+class TestRecording:
+    """Per-thread buffers and histogram aggregation."""
+
+    def test_ring_buffers_are_per_thread_and_bounded(self):
+        tracer = Tracer(ring_size=8)
+
+        def worker(n):
+            with tracer.trace(f"t{n}", "agent", "generate_text", "medium"):
+                for _ in range(20):
+                    with tracer.span("mcp"):
+                        pass
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(tracer._buffers) == 4
+        assert len(tracer.spans()) == 32
+        assert tracer.histograms()[("mcp", "generate_text", "medium")].count == 80
+
+    def test_summary_reports_slo_violations_from_ingestion(self):
+        tracer = Tracer(slo={"high": 10.0})
+        now = time.time()
+        for n, age in enumerate([1.0, 2.0, 12.0, 30.0]):
+            with tracer.trace(f"t{n}", "agent", "engage_reply", "high", ingested_at=now - age):
+                pass
+        task = Task(
+            task_id=uuid4(),
+            agent_id="agent",
+            task_type="post_content",
+            parameters={},
+            state_version_snapshot=0,
+            created_at=datetime.now(timezone.utc),
+        )
+        with tracer.trace(str(task.task_id), task.agent_id, task.task_type, task.priority):
+            pass
+        totals = {r["priority"]: r for r in tracer.summary() if r["stage"] == "total"}
+        high, medium = totals["high"], totals["medium"]
+        assert high["count"] == 4 and high["slo_violations"] == 2
+        assert high["p50_ms"] == pytest.approx(2000, rel=0.01)
+        assert high["p99_ms"] == pytest.approx(30000, rel=0.01)
+        assert "slo_ms" not in medium and medium["task_type"] == "post_content"
+
+    def test_export_and_disabled_tracer(self, tmp_path):
+        tracer = Tracer()
+        with tracer.trace("t1", "agent", "generate_text", "low"):
+            with tracer.span("skill", "skill_generate_content"):
+                pass
+        out = io.StringIO()
+        assert tracer.export(out, spans=True) == 4
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [line["type"] for line in lines] == ["latency", "latency", "span", "span"]
+        path = tmp_path / "trace.jsonl"
+        tracer.export_to(str(path))
+        assert len(path.read_text().splitlines()) == 2
+
+        disabled = Tracer(enabled=False)
+        with disabled.trace("t1", "agent"):
+            with disabled.span("mcp", task_id="t1"):
+                assert tracing.current_context() is None
+        assert disabled.spans() == [] and disabled.histograms() == {}
+
+
+class TestHdrHistogram:
+    """Two significant digits across the range."""
+
+    def test_percentiles_within_one_percent(self):
+        histogram = HdrHistogram()
+        for value in range(1, 100_001):
+            histogram.record(value * 37)
+        for q in (50, 95, 99):
+            assert histogram.percentile(q) == pytest.approx(q / 100 * 100_000 * 37, rel=0.01)
+        assert histogram.percentile(100) == histogram.max == 3_700_000
+        other = HdrHistogram()
+        other.record(10**12)  # clamped to an hour
+        histogram.merge(other)
+        assert histogram.max == 3_600_000_000 and histogram.count_above(3_700_000) == 1
@@ -0,0 +1,193 @@
+"""
+Test suite for streaming transcription in skill_transcribe_audio.
+
+These tests stream synthetic WAV files through a deterministic fake
+transcriber and assert that overlapping chunks merge into one ordered
+transcript with re-based timestamps, that concurrency stays bounded, and that
+non-WAV sources still go to the whisper server whole.
+"""
+
+import asyncio
+import math
+import wave
+from array import array
+from uuid import uuid4
+
+import pytest
+
+from skills.audio_stream import WavChunkReader
+from skills.base import SkillExecutionError
+from skills.transcribe_audio import TranscribeAudioInput, execute_transcribe_audio
+
+RATE = 8000
+
+
+def write_wav(path, seconds):
+    """Mono 16-bit WAV whose n-th second is the constant sample value n + 1."""
+    with wave.open(str(path), "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(RATE)
+        for n in range(math.ceil(seconds)):
+            frames = min(RATE, round((seconds - n) * RATE))
+            out.writeframes(array("h", [n + 1] * frames).tobytes())
+    return str(path)
+
+
+class FakeTranscriber:
+    """Emits word ``w<n>`` for every second of audio it hears."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.inflight = 0
+        self.max_inflight = 0
+        self.chunks = []
+
+    async def __call__(self, chunk, input_data):
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep((chunk.index * 7 % 5) / 1000)  # finish out of order
+            if chunk.index == self.fail_on:
+                raise SkillExecutionError("whisper unavailable")
+            self.chunks.append((chunk.index, chunk.start, chunk.duration))
+            samples = array("h", chunk.pcm)
+            segments = []
+            for k in range(math.ceil(chunk.duration)):
+                segments.append({
+                    "start": float(k),
+                    "end": min(k + 1.0, chunk.duration),
+                    "text": f"w{samples[k * RATE] - 1}",
+                })
+            return {"segments": segments, "confidence_score": 0.95, "cost_estimate": 0.01}
+        finally:
+            self.inflight -= 1
+
+
+class FakeMCPClient:
+    def __init__(self):
+        self.calls = []
+
+    async def call_tool(self, server, tool, arguments):
+        self.calls.append((server, tool))
+        return {"content": "whole file", "duration_seconds": 3.0, "segments": []}
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+def transcribe_input(source, **overrides):
+    payload = {
+        "audio_source": source,
+        "source_type": "object_storage",
+        "agent_id": "agent_1",
+        "task_id": str(uuid4()),
+    }
+    payload.update(overrides)
+    return TranscribeAudioInput(**payload)
+
+
+class TestWavChunkReader:
+    """Chunks overlap and cover the stream exactly once."""
+
+    def test_chunks_overlap_and_flag_the_last(self, tmp_path):
+        path = write_wav(tmp_path / "a.wav", 25.5)
+        with open(path, "rb") as stream:
+            reader = WavChunkReader(stream, chunk_seconds=10, overlap_seconds=1)
+            chunks = []
+            while (chunk := reader.read()) is not None:
+                chunks.append(chunk)
+        assert [(c.start, c.duration, c.last) for c in chunks] == [
+            (0.0, 11.0, False),
+            (10.0, 11.0, False),
+            (20.0, 5.5, True),
+        ]
+        assert array("h", chunks[1].pcm)[0] == 11  # overlap carried from chunk 0
+
+
+class TestStreamingTranscription:
+    """Chunked transcripts merge in order with re-based timestamps."""
+
+    def test_text_transcript_has_every_word_once(self, tmp_path):
+        path = write_wav(tmp_path / "podcast.wav", 95)
+        transcriber = FakeTranscriber()
+        output = asyncio.run(
+            execute_transcribe_audio(
+                transcribe_input(path),
+                FakeMCPClient(),
+                transcriber=transcriber,
+                chunk_seconds=10,
+                overlap_seconds=1,
+                max_concurrency=3,
+            )
+        )
+        assert output.artifact["content"] == " ".join(f"w{n}" for n in range(95)) + "\n"
+        metadata = output.artifact["metadata"]
+        assert metadata["duration_seconds"] == 95
+        assert metadata["word_count"] == 95
+        assert metadata["chunks"] == 10
+        assert [s["start"] for s in metadata["timestamps"]] == [float(n) for n in range(95)]
+        assert output.tool_provenance["mcp_tool"] == "mcp-server-whisper/transcribe_chunk"
+        assert output.tool_provenance["cost_estimate"] == pytest.approx(0.10)
+        assert 1 < transcriber.max_inflight <= 3
+
+    def test_srt_cues_are_rebased(self, tmp_path):
+        path = write_wav(tmp_path / "clip.wav", 45)
+        output = asyncio.run(
+            execute_transcribe_audio(
+                transcribe_input(path, format="srt", timestamps=False),
+                FakeMCPClient(),
+                transcriber=FakeTranscriber(),
+                chunk_seconds=20,
+                overlap_seconds=2,
+            )
+        )
+        cues = output.artifact["content"].strip().split("\n\n")
+        assert len(cues) == 45
+        assert cues[41] == "42\n00:00:41,000 --> 00:00:42,000\nw41"
+        assert "timestamps" not in output.artifact["metadata"]
+
+    def test_vtt_is_streamed_to_output_path(self, tmp_path):
+        path = write_wav(tmp_path / "clip.wav", 12)
+        target = tmp_path / "clip.vtt"
+        output = asyncio.run(
+            execute_transcribe_audio(
+                transcribe_input(f"file://{path}", source_type="url", format="vtt"),
+                FakeMCPClient(),
+                transcriber=FakeTranscriber(),
+                output_path=str(target),
+                chunk_seconds=5,
+            )
+        )
+        assert output.artifact["content"] == str(target)
+        text = target.read_text()
+        assert text.startswith("WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nw0\n")
+        assert text.count(" --> ") == 12
+
+    def test_chunk_failure_propagates(self, tmp_path):
+        path = write_wav(tmp_path / "clip.wav", 60)
+        with pytest.raises(SkillExecutionError, match="whisper unavailable"):
+            asyncio.run(
+                execute_transcribe_audio(
+                    transcribe_input(path),
+                    FakeMCPClient(),
+                    transcriber=FakeTranscriber(fail_on=1),
+                    chunk_seconds=5,
+                    max_concurrency=2,
+                )
+            )
+
+
+class TestServerSideFallback:
+    """Sources the Worker cannot stream go to mcp-server-whisper whole."""
+
+    @pytest.mark.parametrize("source_type", ["mcp_resource", "object_storage"])
+    def test_non_streamable_source(self, tmp_path, source_type):
+        source = tmp_path / "voice.mp3"
+        source.write_bytes(b"ID3 not a wav file")
+        client = FakeMCPClient()
+        output = asyncio.run(
+            execute_transcribe_audio(transcribe_input(str(source), source_type=source_type), client)
+        )
+        assert client.calls == [("mcp-server-whisper", "transcribe")]
+        assert output.artifact["content"] == "whole file"
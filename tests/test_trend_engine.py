@@ -0,0 +1,196 @@
+"""
+Test suite for the coalescing trend-detection engine.
+
+These tests assert that identical trend lookups from many agents share a
+single upstream MCP call and that the batch API bounds upstream concurrency
+per platform.
+"""
+
+import asyncio
+
+import pytest
+
+from worker import trend_fetcher
+from worker.trend_fetcher import MCPTrendSource, TrendEngine
+
+
+class CountingSource:
+    """Fake upstream that records calls and tracks peak concurrency."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def fetch_trends(self, platform, query, time_window):
+        self.calls.append((platform, query, time_window))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if query == "nothing":
+            return []
+        return [
+            {
+                "topic": f"{query or 'all'} on {platform}",
+                "trend_score": 0.8,
+                "sample_content": "sample",
+            }
+        ]
+
+
+class FakeMCPClient:
+    def __init__(self):
+        self.calls = []
+
+    async def call_tool(self, server, tool, arguments):
+        self.calls.append((server, tool, arguments))
+        return {"trends": [{"topic": "ai", "trend_score": 0.5}], "total_trends": 1}
+
+    async def read_resource(self, uri):
+        raise NotImplementedError
+
+
+class TestTrendEngine:
+    """Test coalescing, batching and response shape of TrendEngine."""
+
+    def test_identical_requests_share_one_upstream_call(self):
+        source = CountingSource()
+        engine = TrendEngine(source=source)
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    engine.adetect_trends(f"agent_{i}", "twitter", "AI", "24h")
+                    for i in range(1000)
+                )
+            )
+
+        responses = asyncio.run(run())
+
+        assert len(source.calls) == 1
+        assert engine.stats.upstream_calls == 1
+        assert all(r["total_trends"] == 1 for r in responses)
+        # Every agent gets an independent copy of the trend records.
+        responses[0]["trends"][0]["topic"] = "mutated"
+        assert responses[1]["trends"][0]["topic"] == "AI on twitter"
+
+    def test_batch_upstream_calls_scale_with_distinct_queries(self):
+        source = CountingSource()
+        engine = TrendEngine(source=source, max_concurrency_per_platform=2)
+        requests = [
+            {
+                "agent_id": f"agent_{i}",
+                "platform": ["twitter", "instagram", "tiktok"][i % 3],
+                "query": f"topic_{i % 5}",
+                "time_window": "24h",
+            }
+            for i in range(3000)
+        ]
+
+        responses = asyncio.run(engine.adetect_trends_many(requests))
+
+        assert len(responses) == len(requests)
+        assert len(source.calls) == 15
+        assert source.peak <= 2 * 3
+        assert responses[7]["trends"][0]["topic"] == "topic_2 on instagram"
+
+    def test_results_are_reused_within_ttl(self):
+        source = CountingSource(delay=0)
+        now = [0.0]
+        engine = TrendEngine(source=source, result_ttl=5.0, clock=lambda: now[0])
+
+        async def run():
+            await engine.adetect_trends("a", "tiktok", "dance")
+            await engine.adetect_trends("b", "tiktok", "dance")
+            now[0] = 10.0
+            await engine.adetect_trends("c", "tiktok", "dance")
+
+        asyncio.run(run())
+
+        assert len(source.calls) == 2
+        assert engine.stats.cache_hits == 1
+
+    def test_upstream_errors_reach_every_waiter_and_are_not_cached(self):
+        class FailingSource:
+            calls = 0
+
+            async def fetch_trends(self, platform, query, time_window):
+                FailingSource.calls += 1
+                await asyncio.sleep(0.01)
+                raise RuntimeError("upstream down")
+
+        engine = TrendEngine(source=FailingSource())
+
+        async def run():
+            return await asyncio.gather(
+                *(engine.adetect_trends(f"agent_{i}", "twitter") for i in range(10)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert FailingSource.calls == 1
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(engine.adetect_trends("agent_0", "twitter"))
+        assert FailingSource.calls == 2
+
+    def test_invalid_batch_entry_fails_before_upstream(self):
+        source = CountingSource()
+        engine = TrendEngine(source=source)
+
+        with pytest.raises(ValueError, match="platform"):
+            asyncio.run(
+                engine.adetect_trends_many(
+                    [
+                        {"agent_id": "a", "platform": "twitter"},
+                        {"agent_id": "b", "platform": "myspace"},
+                    ]
+                )
+            )
+        assert source.calls == []
+
+    def test_mcp_source_routes_to_platform_server(self):
+        client = FakeMCPClient()
+        engine = TrendEngine(source=MCPTrendSource(client))
+
+        response = asyncio.run(engine.adetect_trends("a", "instagram", "fashion", "7d"))
+
+        assert client.calls == [
+            (
+                "mcp-server-instagram",
+                "detect_trends",
+                {"query": "fashion", "time_window": "7d"},
+            )
+        ]
+        assert response["trends"][0]["source"] == "mcp-server-instagram"
+
+
+class TestDetectTrendsFacade:
+    """Test the module-level sync and async entry points."""
+
+    def test_sync_and_async_entry_points_share_configured_engine(self):
+        source = CountingSource(delay=0)
+        original = trend_fetcher.get_trend_engine()
+        try:
+            trend_fetcher.configure_trend_engine(source=source)
+
+            response = trend_fetcher.detect_trends(
+                agent_id="agent_1", platform="twitter", query="AI", time_window="1h"
+            )
+            assert set(response) == {"trends", "total_trends"}
+            assert response["total_trends"] == 1
+            assert isinstance(response["trends"][0]["trend_score"], float)
+
+            async def run():
+                return await trend_fetcher.adetect_trends_many(
+                    [{"agent_id": "agent_2", "platform": "twitter", "query": "nothing"}]
+                )
+
+            assert asyncio.run(run()) == [{"trends": [], "total_trends": 0}]
+        finally:
+            trend_fetcher._default_engine = original
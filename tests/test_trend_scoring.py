@@ -0,0 +1,122 @@
+"""
+Test suite for the streaming trend scorer.
+
+These tests assert that decayed per-window counters produce Detect Trends
+records (specs/technical.md Section 2.2.3) with bounded memory.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from worker.trend_fetcher import TrendEngine
+from worker.trend_scoring import (
+    StreamingTrendScorer,
+    TrendEvent,
+    TrendScoringStage,
+    WINDOW_NAMES,
+)
+
+NOW = 1_770_000_000.0
+
+
+class TestStreamingTrendScorer:
+    """Test counters, scoring and eviction of StreamingTrendScorer."""
+
+    def test_decayed_counts_track_each_window(self):
+        scorer = StreamingTrendScorer("mcp-server-twitter", clock=lambda: NOW)
+        scorer.ingest(TrendEvent("ai agents", NOW) for _ in range(10))
+        scorer.ingest(TrendEvent("ai agents", NOW - 3_600.0) for _ in range(10))
+
+        counts = scorer.decayed_counts(NOW)[0]
+
+        # Recent events count fully; hour-old events decay by e^-1 in the 1h
+        # window and barely at all in the 30d window.
+        assert counts[0] == pytest.approx(10 + 10 / np.e)
+        assert counts[3] == pytest.approx(20, rel=1e-2)
+
+    def test_bursting_topic_outranks_steady_topic_in_short_window(self):
+        scorer = StreamingTrendScorer("mcp-server-twitter", clock=lambda: NOW)
+        steady = [TrendEvent("steady", NOW - h * 3_600.0) for h in range(0, 24 * 7) for _ in range(2)]
+        burst = [TrendEvent("burst", NOW - 60.0, sample_content="so hot") for _ in range(40)]
+        scorer.ingest(steady + burst)
+
+        hourly = scorer.top_trends("1h", now=NOW)
+
+        assert [t["topic"] for t in hourly] == ["burst", "steady"]
+        assert hourly[0]["sample_content"] == "so hot"
+        assert all(0.0 <= t["trend_score"] <= 1.0 for t in hourly)
+        assert all(isinstance(t["trend_score"], float) for t in hourly)
+
+    def test_scores_cover_every_topic_and_window(self):
+        scorer = StreamingTrendScorer("src", clock=lambda: NOW)
+        rng = np.random.default_rng(0)
+        topics = [f"topic {i}" for i in rng.integers(0, 500, size=5_000)]
+        scorer.ingest_arrays(topics, NOW - rng.uniform(0, 86_400, size=5_000))
+
+        scores = scorer.scores(NOW)
+
+        assert scores.shape == (len(scorer), len(WINDOW_NAMES))
+        assert scores.min() >= 0.0 and scores.max() <= 1.0
+
+    def test_query_filters_by_topic_tokens(self):
+        scorer = StreamingTrendScorer("src", clock=lambda: NOW)
+        scorer.ingest(
+            [TrendEvent("AI fashion week", NOW), TrendEvent("crypto news", NOW)] * 3
+        )
+
+        assert [t["topic"] for t in scorer.top_trends(query="fashion", now=NOW)] == [
+            "AI fashion week"
+        ]
+        assert scorer.top_trends(query="nonexistent_topic_xyz", now=NOW) == []
+
+    def test_memory_is_bounded_by_max_topics(self):
+        scorer = StreamingTrendScorer("src", max_topics=64, clock=lambda: NOW)
+        scorer.ingest(TrendEvent("hot", NOW) for _ in range(100))
+        for i in range(1_000):
+            scorer.ingest([TrendEvent(f"cold {i}", NOW)])
+
+        assert len(scorer) <= 64
+        assert scorer._acc.shape[0] <= 64
+        assert scorer.top_trends("24h", limit=1, now=NOW)[0]["topic"] == "hot"
+
+    def test_eviction_spares_existing_topics_named_in_the_batch(self):
+        scorer = StreamingTrendScorer("src", max_topics=4, clock=lambda: NOW)
+        scorer.ingest([TrendEvent("a", NOW)])
+        scorer.ingest(TrendEvent(topic, NOW) for topic in "bcd" for _ in range(5))
+        scorer.ingest_arrays(["a", "e"], np.array([NOW, NOW]), np.array([100.0, 1.0]))
+
+        counts = scorer.decayed_counts(NOW)[:, 0]
+        by_topic = {t: counts[slot] for t, slot in scorer._slots.items()}
+
+        assert by_topic["a"] == pytest.approx(101.0)
+        assert by_topic["e"] == pytest.approx(1.0)
+        assert len(scorer) <= 4
+
+    def test_counters_survive_landmark_reanchoring(self):
+        scorer = StreamingTrendScorer("src")
+        scorer.ingest([TrendEvent("old", NOW)])
+        later = NOW + 100 * 3_600.0
+        scorer.ingest([TrendEvent("new", later)])
+
+        counts = scorer.decayed_counts(later)
+
+        assert np.isfinite(counts).all()
+        assert counts[0, 3] == pytest.approx(np.exp(-100 * 3_600.0 / 2_592_000.0))
+
+
+class TestTrendScoringStage:
+    """Test the scoring stage as a TrendEngine source."""
+
+    def test_engine_serves_scored_trends(self):
+        stage = TrendScoringStage(clock=lambda: 0.0)
+        stage.ingest("tiktok", [TrendEvent("dance challenge", 0.0)] * 5)
+        engine = TrendEngine(source=stage)
+
+        response = asyncio.run(engine.adetect_trends("agent_1", "tiktok", time_window="1h"))
+        empty = asyncio.run(engine.adetect_trends("agent_1", "twitter", time_window="1h"))
+
+        assert response["total_trends"] == 1
+        assert response["trends"][0]["source"] == "mcp-server-tiktok"
+        assert empty == {"trends": [], "total_trends": 0}
@@ -0,0 +1,210 @@
+"""
+Test suite for the multi-process Worker runtime (S-007).
+
+These tests assert that the supervisor forks Workers after the shared
+imports, streams DAG-ordered tasks to them and feeds completions back to the
+scheduler, requeues the tasks of a Worker that dies, drains on SIGTERM
+without losing undispatched tasks, and scales the pool with queue depth.
+"""
+
+import asyncio
+import json
+import os
+import signal
+
+import pytest
+
+from backend.queues.task_queue import TaskScheduler
+from chimera import ScalingPolicy, Supervisor
+from chimera.cli import main
+from chimera.supervisor import parse_task
+
+
+def echo():
+    async def handle(payload):
+        await asyncio.sleep(payload.get("sleep", 0))
+        if payload.get("fail"):
+            raise RuntimeError("boom")
+        if payload.get("stop"):
+            os.kill(os.getppid(), signal.SIGTERM)
+        if payload.get("crash_once") and not os.path.exists(payload["crash_once"]):
+            open(payload["crash_once"], "w").close()
+            os._exit(3)
+        return {"pid": os.getpid(), "value": payload.get("value")}
+
+    return handle
+
+
+def run(supervisor):
+    results = {}
+    supervisor.on_result = lambda task_id, ok, result: results.__setitem__(task_id, (ok, result))
+    stats = supervisor.run()
+    return stats, results
+
+
+class TestScalingPolicy:
+    """Queue-depth sizing with hysteresis."""
+
+    def test_grows_at_once_and_shrinks_slowly(self):
+        policy = ScalingPolicy(min_workers=1, max_workers=4, target_load=10, scale_down_after=5.0)
+        assert policy.decide(1, 0, now=0.0) == 1
+        assert policy.decide(1, 35, now=1.0) == 4
+        assert policy.decide(4, 500, now=2.0) == 4
+        assert policy.decide(4, 5, now=3.0) == 4
+        assert policy.decide(4, 5, now=7.9) == 4
+        assert policy.decide(4, 5, now=8.0) == 3
+        assert policy.decide(3, 5, now=9.0) == 3
+        assert policy.decide(3, 25, now=10.0) == 3  # load back up resets the timer
+        assert policy.decide(3, 5, now=11.0) == 3
+
+    def test_rejects_bad_bounds(self):
+        with pytest.raises(ValueError):
+            ScalingPolicy(min_workers=3, max_workers=2)
+
+
+class TestSupervisor:
+    """Forked Workers execute the scheduler's tasks."""
+
+    def test_runs_dag_across_workers(self):
+        supervisor = Supervisor(echo, workers=2, max_workers=2, concurrency=4)
+        for n in range(20):
+            supervisor.submit(f"t{n}", {"value": n})
+        supervisor.submit("join", {"value": "join"}, "high", [f"t{n}" for n in range(20)])
+        stats, results = run(supervisor)
+
+        assert stats.completed == 21 and stats.failed == 0
+        assert stats.spawned == stats.exited == 2
+        assert len(stats.startup_ns) == 2 and stats.startup_ms_max < 1000
+        assert results["join"] == (True, {"pid": results["join"][1]["pid"], "value": "join"})
+        assert os.getpid() not in {result["pid"] for _, result in results.values()}
+        assert len(supervisor.scheduler) == 0 and supervisor.scheduler.status("join") == "completed"
+
+    def test_failure_cancels_dependents(self):
+        supervisor = Supervisor(echo, workers=1)
+        supervisor.submit("a", {"fail": True})
+        supervisor.submit("b", {}, dependencies=["a"])
+        stats, results = run(supervisor)
+        assert stats.failed == 1 and results["a"] == (False, {"message": "RuntimeError('boom')"})
+        assert supervisor.scheduler.status("b") == "cancelled" and "b" not in results
+
+    def test_crashed_worker_tasks_are_requeued(self, tmp_path):
+        marker = str(tmp_path / "crashed")
+        supervisor = Supervisor(echo, workers=1, max_workers=1, scale_interval=0.05)
+        supervisor.submit("crash", {"crash_once": marker})
+        for n in range(5):
+            supervisor.submit(f"t{n}", {"sleep": 0.01})
+        stats, results = run(supervisor)
+        assert stats.crashed == 1 and stats.requeued >= 1
+        assert stats.completed == 6 and all(ok for ok, _ in results.values())
+
+    def test_sigterm_drains_without_losing_tasks(self):
+        scheduler = TaskScheduler()
+        supervisor = Supervisor(echo, scheduler, workers=2, concurrency=2, prefetch=2)
+        for n in range(50):
+            supervisor.submit(f"t{n}", {"sleep": 0.02})
+
+        def on_result(task_id, ok, result):
+            if not finished:
+                os.kill(os.getpid(), signal.SIGTERM)
+            (finished if ok else drained)[task_id] = result
+
+        finished, drained = {}, {}
+        supervisor.on_result = on_result
+        stats = supervisor.run()
+        statuses = {f"t{n}": scheduler.status(f"t{n}") for n in range(50)}
+        assert stats.exited == 2 and not supervisor._workers
+        assert list(statuses.values()).count("completed") == len(finished) == stats.completed
+        assert 0 < stats.completed <= 8
+        assert set(statuses.values()) == {"completed", "pending"}
+        assert set(drained) == {t for t, status in statuses.items() if status == "pending"}
+        assert stats.drained == len(drained) == 50 - stats.completed
+        assert all(result == {"message": "drained before dispatch"} for result in drained.values())
+        assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL
+
+    def test_scales_up_with_queue_depth(self):
+        supervisor = Supervisor(
+            echo, min_workers=1, max_workers=3, concurrency=2, target_load=4, scale_interval=0.02
+        )
+        for n in range(60):
+            supervisor.submit(f"t{n}", {"sleep": 0.01})
+        stats, results = run(supervisor)
+        assert stats.scale_ups == 2 and stats.peak_workers == 3
+        assert stats.completed == 60
+        assert len({result["pid"] for _, result in results.values()}) > 1
+
+
+class TestCli:
+    """The ``chimera`` entry point reads and writes JSON lines."""
+
+    def test_main_runs_task_file(self, tmp_path, capsys):
+        tasks = tmp_path / "tasks.jsonl"
+        out = tmp_path / "results.jsonl"
+        lines = [{"task_id": "a", "payload": {"value": 1}}]
+        lines.append({"task_id": "b", "priority": "high", "dependencies": ["a"], "payload": {"value": 2}})
+        tasks.write_text("\n".join(json.dumps(line) for line in lines))
+        assert parse_task(json.dumps(lines[1])) == ("b", "high", ["a"], {"value": 2})
+
+        code = main([
+            "--handler", "tests.test_worker_supervisor:echo",
+            "--tasks", str(tasks),
+            "--results", str(out),
+            "--workers", "2",
+            "--no-pin",
+        ])
+        assert code == 0
+        results = [json.loads(line) for line in out.read_text().splitlines()]
+        assert [(r["task_id"], r["ok"], r["result"]["value"]) for r in results] == [("a", True, 1), ("b", True, 2)]
+        report = json.loads(capsys.readouterr().err)
+        assert report["completed"] == 2 and report["spawned"] == 2
+
+    def test_bad_lines_are_rejected_one_by_one(self, tmp_path, capsys):
+        tasks = tmp_path / "tasks.jsonl"
+        out = tmp_path / "results.jsonl"
+        tasks.write_text("\n".join([
+            json.dumps({"task_id": "a", "payload": {"value": 1}}),
+            json.dumps({"task_id": "b", "priority": "urgent"}),
+            "{not json",
+            json.dumps({"priority": "high"}),
+            json.dumps({"task_id": "a"}),
+            json.dumps({"task_id": "c", "dependencies": ["d"], "payload": {"value": 3}}),
+            json.dumps({"task_id": "d", "payload": {"value": 4}}),
+            json.dumps({"task_id": "x", "dependencies": ["never"]}),
+        ]))
+
+        code = main([
+            "--handler", "tests.test_worker_supervisor:echo",
+            "--tasks", str(tasks),
+            "--results", str(out),
+            "--workers", "1",
+            "--no-pin",
+        ])
+        assert code == 1
+        results = [json.loads(line) for line in out.read_text().splitlines()]
+        assert sorted(r["task_id"] for r in results if r["ok"]) == ["a", "c", "d"]
+        rejected = {r["task_id"]: r["result"]["message"] for r in results if not r["ok"]}
+        assert "invalid priority" in rejected["b"] and "duplicate" in rejected["a"]
+        assert rejected["x"] == "unknown dependency: never"
+        err = capsys.readouterr().err.splitlines()
+        assert sum("rejected task (no task_id)" in line for line in err) == 2
+        assert json.loads(err[-1])["rejected"] == 5
+
+    def test_drained_tasks_fail_the_run(self, tmp_path, capsys):
+        tasks = tmp_path / "tasks.jsonl"
+        out = tmp_path / "results.jsonl"
+        tasks.write_text("\n".join([
+            json.dumps({"task_id": "a", "payload": {"stop": True}}),
+            json.dumps({"task_id": "b", "dependencies": ["a"]}),
+        ]))
+
+        code = main([
+            "--handler", "tests.test_worker_supervisor:echo",
+            "--tasks", str(tasks),
+            "--results", str(out),
+            "--workers", "1",
+            "--no-pin",
+        ])
+        assert code == 1
+        results = [json.loads(line) for line in out.read_text().splitlines()]
+        assert [(r["task_id"], r["ok"]) for r in results] == [("a", True), ("b", False)]
+        assert results[1]["result"]["message"] == "drained before dispatch"
+        assert json.loads(capsys.readouterr().err)["drained"] == 1
@@ -0,0 +1,6 @@
+"""
+Project Chimera Worker
+
+Stateless task executors for the Planner-Worker-Judge swarm
+(specs/technical.md Section 2.2).
+"""
@@ -0,0 +1,413 @@
+"""
+Character Reference Cache
+
+Per-character reference data for ``skill_generate_image`` (W-008: every
+image generation carries a ``character_reference_id`` consistency lock).
+
+Fetching and encoding a persona's reference images for every post repeats
+the same work for every image the persona publishes. :class:`CharacterReferenceCache`
+keeps the decoded reference images and their pre-computed embeddings in an
+LRU bounded by bytes; entries evicted from memory spill to a memory-mapped
+file and are promoted back on their next use instead of being reloaded.
+Entries are keyed by reference-set version, so publishing a new version of a
+character's references invalidates the old data everywhere.
+
+:class:`CharacterImageBatcher` groups concurrent generation requests for the
+same character into one ``generate_images`` call carrying the reference once.
+"""
+
+import asyncio
+import base64
+import mmap
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+import numpy as np
+
+from backend.mcp.clients.base import MCPClient
+from skills.base import SkillExecutionError, call_skill_tool
+from skills.generate_image import MCP_SERVER, GenerateImageInput
+
+MCP_ENCODE_TOOL = "encode_character_reference"
+MCP_BATCH_TOOL = "generate_images"
+
+
+@dataclass(frozen=True)
+class CharacterReference:
+    """Decoded reference images of a character and their embeddings."""
+
+    character_id: str
+    version: str
+    embeddings: np.ndarray  # (n_images, dim) float32
+    images: Tuple[bytes, ...]
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.embeddings.nbytes) + sum(len(image) for image in self.images)
+
+
+class ReferenceLoader(Protocol):
+    """Fetches and encodes a character's current reference set."""
+
+    async def load(self, character_id: str) -> CharacterReference:
+        ...
+
+
+class MCPReferenceLoader:
+    """Loads references via ``mcp-server-ideogram``'s ``encode_character_reference`` tool."""
+
+    def __init__(self, client: MCPClient, server: str = MCP_SERVER):
+        self.client = client
+        self.server = server
+
+    async def load(self, character_id: str) -> CharacterReference:
+        response = await call_skill_tool(
+            self.client, self.server, MCP_ENCODE_TOOL, {"character_reference_id": character_id}
+        )
+        return CharacterReference(
+            character_id=character_id,
+            version=str(response["version"]),
+            embeddings=np.asarray(response["embeddings"], dtype=np.float32),
+            images=tuple(base64.b64decode(image) for image in response.get("images", [])),
+        )
+
+
+@dataclass
+class CharacterCacheStats:
+    memory_hits: int = 0
+    spill_hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    spilled: int = 0
+    invalidations: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.spill_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served without loading from the provider."""
+        return (self.memory_hits + self.spill_hits) / self.lookups if self.lookups else 0.0
+
+
+class ReferenceSpillStore:
+    """
+    Append-only memory-mapped file of evicted references.
+
+    Records are ``embeddings || image_0 || image_1 ...``; the index lives in
+    memory, so the file is scratch space owned by one cache instance. It is
+    compacted when dead records outweigh live ones, and the oldest records are
+    dropped beyond ``max_bytes``, which also bounds the file size.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 1024 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._file = open(path, "w+b")
+        self._map: Optional[mmap.mmap] = None
+        self._index: "OrderedDict[str, Tuple[str, int, Tuple[int, int], Tuple[int, ...]]]" = OrderedDict()
+        self.live_bytes = 0
+        self.file_bytes = 0
+
+    def __contains__(self, character_id: str) -> bool:
+        return character_id in self._index
+
+    def put(self, reference: CharacterReference) -> None:
+        self.discard(reference.character_id)
+        offset = self.file_bytes
+        self._file.seek(offset)
+        self._file.write(np.ascontiguousarray(reference.embeddings, dtype=np.float32).tobytes())
+        for image in reference.images:
+            self._file.write(image)
+        size = reference.nbytes
+        self.file_bytes += size
+        self.live_bytes += size
+        self._index[reference.character_id] = (
+            reference.version,
+            offset,
+            tuple(reference.embeddings.shape),  # type: ignore[arg-type]
+            tuple(len(image) for image in reference.images),
+        )
+        self._unmap()
+        while self.live_bytes > self.max_bytes and len(self._index) > 1:
+            self.discard(next(iter(self._index)))
+        if self.file_bytes > self.max_bytes and self.file_bytes - self.live_bytes > self.live_bytes:
+            self._compact()
+
+    def get(self, character_id: str) -> Optional[CharacterReference]:
+        entry = self._index.get(character_id)
+        if entry is None:
+            return None
+        version, offset, shape, image_sizes = entry
+        if self._map is None:
+            self._file.flush()
+            self._map = mmap.mmap(self._file.fileno(), self.file_bytes, access=mmap.ACCESS_READ)
+        count = shape[0] * shape[1]
+        embeddings = np.frombuffer(self._map, dtype=np.float32, count=count, offset=offset)
+        position = offset + count * 4
+        images = []
+        for size in image_sizes:
+            images.append(self._map[position: position + size])
+            position += size
+        return CharacterReference(character_id, version, embeddings.reshape(shape).copy(), tuple(images))
+
+    def discard(self, character_id: str) -> None:
+        entry = self._index.pop(character_id, None)
+        if entry is not None:
+            _, _, shape, image_sizes = entry
+            self.live_bytes -= shape[0] * shape[1] * 4 + sum(image_sizes)
+
+    def _compact(self) -> None:
+        live = [self.get(character_id) for character_id in list(self._index)]
+        self._unmap()
+        self._file.seek(0)
+        self._file.truncate()
+        self._index.clear()
+        self.file_bytes = self.live_bytes = 0
+        for reference in live:
+            if reference is not None:
+                self.put(reference)
+
+    def close(self) -> None:
+        self._unmap()
+        self._file.close()
+        os.unlink(self.path)
+
+    def _unmap(self) -> None:
+        # The next get() maps the grown file afresh; release the old view now
+        # rather than leaving it to the garbage collector.
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class CharacterReferenceCache:
+    """
+    Two-tier cache of :class:`CharacterReference` by character id.
+
+    Args:
+        loader: Provider of reference sets (e.g. :class:`MCPReferenceLoader`)
+        max_bytes: Memory budget for decoded images plus embeddings
+        spill: Optional memory-mapped store for entries evicted from memory
+    """
+
+    def __init__(
+        self,
+        loader: ReferenceLoader,
+        max_bytes: int = 256 * 1024 * 1024,
+        spill: Optional[ReferenceSpillStore] = None,
+    ):
+        self.loader = loader
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self.stats = CharacterCacheStats()
+        self.memory_bytes = 0
+        self._entries: "OrderedDict[str, CharacterReference]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Task] = {}
+        self._stale: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, character_id: str, version: Optional[str] = None) -> CharacterReference:
+        """
+        Reference data of ``character_id``; ``version`` (when known from the
+        request) rejects cached data of any other version.
+        """
+        reference = self._entries.get(character_id)
+        if reference is not None and self._current(reference, version):
+            self._entries.move_to_end(character_id)
+            self.stats.memory_hits += 1
+            return reference
+        if self.spill is not None and character_id in self.spill:
+            reference = self.spill.get(character_id)
+            if reference is not None and self._current(reference, version):
+                self.spill.discard(character_id)
+                self._insert(reference)
+                self.stats.spill_hits += 1
+                return reference
+        self.stats.misses += 1
+        task = self._loading.get(character_id)
+        if task is None:
+            return await asyncio.shield(self._start_load(character_id))
+        self.stats.coalesced += 1
+        reference = await asyncio.shield(task)
+        if self._current(reference, version):
+            return reference
+        # That load predates the version this caller needs; load again.
+        task = self._loading.get(character_id) or self._start_load(character_id)
+        return await asyncio.shield(task)
+
+    def invalidate(self, character_id: str, version: Optional[str] = None) -> None:
+        """
+        Drop cached data of ``character_id``; with ``version``, only data of
+        older versions is dropped and the version is remembered so stale
+        copies are never served again.
+        """
+        if version is not None:
+            self._stale[character_id] = version
+        self._loading.pop(character_id, None)  # later lookups must not join an older load
+        reference = self._entries.get(character_id)
+        if reference is not None and (version is None or reference.version != version):
+            self._remove(character_id)
+            self.stats.invalidations += 1
+        if self.spill is not None:
+            self.spill.discard(character_id)
+
+    def _current(self, reference: CharacterReference, version: Optional[str]) -> bool:
+        wanted = version or self._stale.get(reference.character_id)
+        return wanted is None or reference.version == wanted
+
+    def _start_load(self, character_id: str) -> asyncio.Task:
+        task = asyncio.ensure_future(self._load(character_id))
+        self._loading[character_id] = task
+
+        def done(_: asyncio.Task) -> None:
+            if self._loading.get(character_id) is task:
+                del self._loading[character_id]
+
+        task.add_done_callback(done)
+        return task
+
+    async def _load(self, character_id: str) -> CharacterReference:
+        self.stats.loads += 1
+        reference = await self.loader.load(character_id)
+        if not self._current(reference, None):
+            return reference  # invalidated while loading; never cache stale data
+        self._remove(character_id)
+        if self.spill is not None:
+            self.spill.discard(character_id)
+        self._insert(reference)
+        return reference
+
+    def _insert(self, reference: CharacterReference) -> None:
+        self._entries[reference.character_id] = reference
+        self.memory_bytes += reference.nbytes
+        while self.memory_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.memory_bytes -= evicted.nbytes
+            self.stats.evictions += 1
+            if self.spill is not None:
+                self.spill.put(evicted)
+                self.stats.spilled += 1
+
+    def _remove(self, character_id: str) -> None:
+        reference = self._entries.pop(character_id, None)
+        if reference is not None:
+            self.memory_bytes -= reference.nbytes
+
+
+@dataclass
+class BatchStats:
+    requests: int = 0
+    batches: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.batches if self.batches else 0.0
+
+
+class CharacterImageBatcher:
+    """
+    Micro-batches image generations that share a character.
+
+    Requests for one character arriving within ``max_delay`` seconds (up to
+    ``max_batch``) go out as one ``generate_images`` call with the reference
+    embeddings attached once.
+
+    Args:
+        client: MCP client for ``mcp-server-ideogram``
+        cache: Character reference cache
+        max_batch: Requests per call
+        max_delay: Seconds a request waits for companions
+    """
+
+    def __init__(
+        self,
+        client: MCPClient,
+        cache: CharacterReferenceCache,
+        max_batch: int = 8,
+        max_delay: float = 0.005,
+        server: str = MCP_SERVER,
+    ):
+        self.client = client
+        self.cache = cache
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.server = server
+        self.stats = BatchStats()
+        self._pending: Dict[Tuple[str, Optional[str]], List[Tuple[GenerateImageInput, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple[str, Optional[str]], asyncio.TimerHandle] = {}
+
+    async def generate(self, input_data: GenerateImageInput) -> Dict[str, Any]:
+        """Generate one image; returns the per-request ``generate_image`` response."""
+        version = (input_data.context or {}).get("reference_version")
+        key = (input_data.character_reference_id, version)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((input_data, future))
+        if len(batch) >= self.max_batch:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.max_delay, self._flush, key)
+        return await future
+
+    def _flush(self, key: Tuple[str, Optional[str]]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, [])
+        if batch:
+            asyncio.ensure_future(self._send(key, batch))
+
+    async def _send(
+        self,
+        key: Tuple[str, Optional[str]],
+        batch: List[Tuple[GenerateImageInput, asyncio.Future]],
+    ) -> None:
+        self.stats.requests += len(batch)
+        self.stats.batches += 1
+        try:
+            reference = await self.cache.get(*key)
+            response = await call_skill_tool(
+                self.client,
+                self.server,
+                MCP_BATCH_TOOL,
+                {
+                    "character_reference_id": reference.character_id,
+                    "reference_version": reference.version,
+                    "reference_embeddings": base64.b64encode(reference.embeddings.tobytes()).decode(),
+                    "reference_shape": list(reference.embeddings.shape),
+                    "requests": [
+                        {
+                            "prompt": request.prompt,
+                            "style": request.style,
+                            "aspect_ratio": request.aspect_ratio,
+                            "resolution": request.resolution,
+                            "negative_prompt": request.negative_prompt,
+                        }
+                        for request, _ in batch
+                    ],
+                },
+            )
+            results = response.get("results") or []
+            if len(results) != len(batch):
+                raise SkillExecutionError(
+                    f"{self.server}/{MCP_BATCH_TOOL} returned {len(results)} results for {len(batch)} requests",
+                    code="validation_failed",
+                    retryable=False,
+                )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result({**result, "reference_version": reference.version})
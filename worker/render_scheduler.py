@@ -0,0 +1,332 @@
+"""
+Render Scheduler
+
+Tier-aware admission and asset reuse for ``skill_render_video`` (W-003).
+
+Each tier renders from its own capacity pool, so a burst of
+``tier_1_daily`` renders for a campaign queues behind itself and never
+delays ``tier_2_hero`` work. Within a pool, renders are admitted in arrival
+order while both a slot and the pool's in-flight cost budget allow, so a few
+long, expensive renders cannot oversubscribe the provider.
+
+Work is shared where the output would be identical:
+
+- the prepared keyframe of a tier 1 render (source image restyled and
+  cropped for the aspect ratio) is produced once per ``(source_image, style,
+  aspect_ratio)`` and reused by every render of that image;
+- renders with the same content hash (the ``assets.content_hash`` index,
+  specs/technical.md Section 3.1.4) share one in-flight render, and finished
+  tier 1 renders are answered from the asset cache.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Mapping, Optional, Protocol, Tuple
+
+from backend.mcp.clients.base import MCPClient
+from backend.mcp.clients.pooled import LatencyHistogram
+from skills.base import call_skill_tool
+from skills.render_video import MCP_SERVER, MCP_TOOL, RenderVideoInput
+
+MCP_PREPARE_TOOL = "prepare_keyframe"
+
+KeyframeKey = Tuple[str, Optional[str], str]
+
+
+@dataclass(frozen=True)
+class TierConfig:
+    """
+    Capacity pool of one render tier.
+
+    Args:
+        capacity: Concurrent renders
+        max_inflight_cost: Estimated USD of renders running at once; a single
+            render above the budget is still admitted when the pool is idle
+        cost_per_second: Estimated USD per rendered second
+        default_duration: Seconds assumed when the input leaves it open
+    """
+
+    capacity: int
+    max_inflight_cost: float
+    cost_per_second: float
+    default_duration: int
+
+
+DEFAULT_TIERS: Dict[str, TierConfig] = {
+    "tier_1_daily": TierConfig(
+        capacity=8, max_inflight_cost=2.0, cost_per_second=0.01, default_duration=15
+    ),
+    "tier_2_hero": TierConfig(
+        capacity=2, max_inflight_cost=30.0, cost_per_second=0.25, default_duration=30
+    ),
+}
+
+
+class Renderer(Protocol):
+    """Video provider behind the scheduler (``mcp-server-runway``)."""
+
+    async def prepare(self, source_image: str, style: Optional[str], aspect_ratio: str) -> Dict[str, Any]:
+        """Prepare the keyframe asset of an image-to-video render."""
+        ...
+
+    async def render(
+        self, input_data: RenderVideoInput, keyframe: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Render a video; returns the ``render_video`` tool response."""
+        ...
+
+
+class MCPRenderer:
+    """Renders through ``mcp-server-runway``'s ``prepare_keyframe`` and ``render_video`` tools."""
+
+    def __init__(self, client: MCPClient, server: str = MCP_SERVER):
+        self.client = client
+        self.server = server
+
+    async def prepare(self, source_image: str, style: Optional[str], aspect_ratio: str) -> Dict[str, Any]:
+        return await call_skill_tool(
+            self.client,
+            self.server,
+            MCP_PREPARE_TOOL,
+            {"source_image": source_image, "style": style, "aspect_ratio": aspect_ratio},
+        )
+
+    async def render(
+        self, input_data: RenderVideoInput, keyframe: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        parameters = {
+            "script": input_data.script,
+            "tier": input_data.tier,
+            "source_image": input_data.source_image,
+            "style": input_data.style,
+            "duration_seconds": input_data.duration_seconds,
+            "aspect_ratio": input_data.aspect_ratio,
+        }
+        if keyframe is not None:
+            parameters["keyframe"] = keyframe.get("asset_url") or keyframe.get("content")
+        return await call_skill_tool(self.client, self.server, MCP_TOOL, parameters)
+
+
+def render_content_hash(input_data: RenderVideoInput) -> str:
+    """SHA-256 of everything that determines the rendered video."""
+    payload = json.dumps(
+        {
+            "script": input_data.script,
+            "tier": input_data.tier,
+            "source_image": input_data.source_image,
+            "style": input_data.style,
+            "duration_seconds": input_data.duration_seconds,
+            "aspect_ratio": input_data.aspect_ratio,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AssetCache(Protocol):
+    """Render responses by content hash (``assets.content_hash``)."""
+
+    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    def put(self, content_hash: str, response: Dict[str, Any]) -> None:
+        ...
+
+
+class InMemoryAssetCache:
+    """LRU :class:`AssetCache` bounded by entry count."""
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        response = self._entries.get(content_hash)
+        if response is not None:
+            self._entries.move_to_end(content_hash)
+        return response
+
+    def put(self, content_hash: str, response: Dict[str, Any]) -> None:
+        self._entries[content_hash] = response
+        self._entries.move_to_end(content_hash)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+@dataclass
+class TierStats:
+    submitted: int = 0
+    rendered: int = 0
+    failed: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    keyframes_prepared: int = 0
+    keyframes_reused: int = 0
+    queue_wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of submissions answered without a render of their own."""
+        return (self.cache_hits + self.coalesced) / self.submitted if self.submitted else 0.0
+
+
+class _TierPool:
+    """FIFO admission by free slot and in-flight cost budget."""
+
+    def __init__(self, config: TierConfig):
+        self.config = config
+        self.running = 0
+        self.inflight_cost = 0.0
+        self._waiting: Deque[Tuple[float, asyncio.Future]] = deque()
+
+    def _fits(self, cost: float) -> bool:
+        if self.running >= self.config.capacity:
+            return False
+        return self.running == 0 or self.inflight_cost + cost <= self.config.max_inflight_cost
+
+    def _take(self, cost: float) -> None:
+        self.running += 1
+        self.inflight_cost += cost
+
+    async def acquire(self, cost: float) -> None:
+        if not self._waiting and self._fits(cost):
+            self._take(cost)
+            return
+        future = asyncio.get_running_loop().create_future()
+        entry = (cost, future)
+        self._waiting.append(entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(cost)  # admitted just as the caller gave up
+            else:
+                self._waiting.remove(entry)
+                self._wake()
+            raise
+
+    def release(self, cost: float) -> None:
+        self.running -= 1
+        self.inflight_cost -= cost
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiting and self._fits(self._waiting[0][0]):
+            cost, future = self._waiting.popleft()
+            self._take(cost)
+            future.set_result(None)
+
+
+class RenderScheduler:
+    """
+    Schedules renders per tier and reuses keyframes and finished assets.
+
+    Args:
+        renderer: Video provider (e.g. :class:`MCPRenderer`)
+        tiers: Pool configuration per tier (default: :data:`DEFAULT_TIERS`)
+        asset_cache: Content-addressed cache of tier 1 renders
+        max_keyframes: Prepared keyframes kept for reuse
+        clock: Monotonic time source for queue-wait metrics
+    """
+
+    def __init__(
+        self,
+        renderer: Renderer,
+        tiers: Optional[Mapping[str, TierConfig]] = None,
+        asset_cache: Optional[AssetCache] = None,
+        max_keyframes: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.renderer = renderer
+        self.tiers = dict(tiers or DEFAULT_TIERS)
+        self.asset_cache: AssetCache = asset_cache if asset_cache is not None else InMemoryAssetCache()
+        self.max_keyframes = max_keyframes
+        self.stats = {tier: TierStats() for tier in self.tiers}
+        self._clock = clock
+        self._pools = {tier: _TierPool(config) for tier, config in self.tiers.items()}
+        self._renders: Dict[str, asyncio.Task] = {}
+        self._keyframes: "OrderedDict[KeyframeKey, asyncio.Task]" = OrderedDict()
+
+    def estimate_cost(self, input_data: RenderVideoInput) -> float:
+        config = self.tiers[input_data.tier]
+        return config.cost_per_second * (input_data.duration_seconds or config.default_duration)
+
+    async def submit(self, input_data: RenderVideoInput) -> Dict[str, Any]:
+        """
+        Render ``input_data`` (or reuse an identical render) and return the
+        ``render_video`` response, with scheduling details under ``"scheduling"``.
+        """
+        stats = self.stats[input_data.tier]
+        stats.submitted += 1
+        content_hash = render_content_hash(input_data)
+        if input_data.tier == "tier_1_daily":
+            cached = self.asset_cache.get(content_hash)
+            if cached is not None:
+                stats.cache_hits += 1
+                return _with_scheduling(cached, content_hash, "cache", 0.0)
+        task = self._renders.get(content_hash)
+        if task is None:
+            task = asyncio.ensure_future(self._render(input_data, content_hash))
+            self._renders[content_hash] = task
+            task.add_done_callback(lambda _: self._renders.pop(content_hash, None))
+            response, waited = await asyncio.shield(task)
+            return _with_scheduling(response, content_hash, "rendered", waited)
+        stats.coalesced += 1
+        response, _ = await asyncio.shield(task)
+        return _with_scheduling(response, content_hash, "coalesced", 0.0)
+
+    async def _render(self, input_data: RenderVideoInput, content_hash: str) -> Tuple[Dict[str, Any], float]:
+        stats = self.stats[input_data.tier]
+        pool = self._pools[input_data.tier]
+        cost = self.estimate_cost(input_data)
+        queued_at = self._clock()
+        await pool.acquire(cost)
+        waited = self._clock() - queued_at
+        stats.queue_wait.observe(waited)
+        try:
+            keyframe = None
+            if input_data.tier == "tier_1_daily" and input_data.source_image:
+                keyframe = await self._keyframe(input_data, stats)
+            response = await self.renderer.render(input_data, keyframe)
+        except BaseException:
+            stats.failed += 1
+            raise
+        finally:
+            pool.release(cost)
+        stats.rendered += 1
+        if input_data.tier == "tier_1_daily":
+            self.asset_cache.put(content_hash, response)
+        return response, waited
+
+    async def _keyframe(self, input_data: RenderVideoInput, stats: TierStats) -> Dict[str, Any]:
+        key: KeyframeKey = (input_data.source_image or "", input_data.style, input_data.aspect_ratio)
+        task = self._keyframes.get(key)
+        if task is not None and not (task.done() and (task.cancelled() or task.exception())):
+            stats.keyframes_reused += 1
+            self._keyframes.move_to_end(key)
+        else:
+            stats.keyframes_prepared += 1
+            task = asyncio.ensure_future(self.renderer.prepare(*key))
+            self._keyframes[key] = task
+            while len(self._keyframes) > self.max_keyframes:
+                self._keyframes.popitem(last=False)
+        return await asyncio.shield(task)
+
+
+def _with_scheduling(
+    response: Dict[str, Any], content_hash: str, source: str, waited: float
+) -> Dict[str, Any]:
+    reused = {} if source == "rendered" else {"cost_estimate": 0.0}  # spent by the original
+    return {
+        **response,
+        **reused,
+        "scheduling": {"content_hash": content_hash, "source": source, "queue_wait_ms": waited * 1e3},
+    }
@@ -0,0 +1,384 @@
+"""
+Trend Fetcher
+
+Implements the Detect Trends contract from specs/technical.md Section 2.2.3
+(``POST /worker/detect-trends``).
+
+A fleet of 1,000+ agents polls trends for the same handful of platforms every
+planning cycle. All lookups are therefore served by a shared asyncio
+:class:`TrendEngine` which coalesces identical ``(platform, query,
+time_window)`` requests into a single upstream MCP call and fans the result
+back out to every caller. Upstream traffic scales with the number of distinct
+queries, not with the number of agents.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from backend import tracing
+from backend.mcp.clients.base import MCPClient
+from worker.trend_scoring import TrendEvent, TrendScoringStage
+
+Platform = Literal["twitter", "instagram", "tiktok"]
+TimeWindow = Literal["1h", "24h", "7d", "30d"]
+
+DEFAULT_TIME_WINDOW = "24h"
+
+
+class DetectTrendsRequest(BaseModel):
+    """Request body for ``POST /worker/detect-trends``."""
+
+    agent_id: str
+    platform: Platform
+    query: Optional[str] = None
+    time_window: TimeWindow = DEFAULT_TIME_WINDOW
+
+
+class Trend(BaseModel):
+    """A single trend entry of the Detect Trends response."""
+
+    trend_id: str = Field(default_factory=lambda: str(uuid4()))
+    topic: str
+    trend_score: float = Field(..., ge=0.0, le=1.0)
+    source: str
+    sample_content: str = ""
+    detected_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class TrendKey(NamedTuple):
+    """Coalescing key: requests sharing a key share one upstream call."""
+
+    platform: str
+    query: Optional[str]
+    time_window: str
+
+
+class TrendSource(Protocol):
+    """Upstream provider of raw trend records for a single lookup."""
+
+    async def fetch_trends(
+        self, platform: str, query: Optional[str], time_window: str
+    ) -> Sequence[Mapping[str, Any]]:
+        ...
+
+
+class MCPTrendSource:
+    """
+    Fetch trends from the platform's MCP server.
+
+    Calls ``tool`` on ``mcp-server-<platform>`` (CC-001) and accepts either a
+    bare list of trend records or a Detect Trends shaped response.
+    """
+
+    def __init__(
+        self,
+        mcp_client: MCPClient,
+        tool: str = "detect_trends",
+        server_template: str = "mcp-server-{platform}",
+    ):
+        self._client = mcp_client
+        self._tool = tool
+        self._server_template = server_template
+
+    async def fetch_trends(
+        self, platform: str, query: Optional[str], time_window: str
+    ) -> Sequence[Mapping[str, Any]]:
+        server = self._server_template.format(platform=platform)
+        arguments = {"query": query, "time_window": time_window}
+        result = await self._client.call_tool(server, self._tool, arguments)
+        if isinstance(result, Mapping):
+            return result.get("trends", [])
+        return result or []
+
+
+@dataclass
+class TrendEngineStats:
+    """Counters describing how much upstream work the engine saved."""
+
+    requests: int = 0
+    upstream_calls: int = 0
+    coalesced: int = 0
+    cache_hits: int = 0
+
+
+class _CacheEntry(NamedTuple):
+    expires_at: float
+    trends: Tuple[Dict[str, Any], ...]
+
+
+class TrendEngine:
+    """
+    Asyncio engine that deduplicates trend lookups across agents.
+
+    Concurrent requests for the same :class:`TrendKey` await one shared
+    upstream task; completed results are kept for ``result_ttl`` seconds so
+    agents polling slightly out of phase within a planning cycle are also
+    served without another upstream call. Upstream calls are bounded per
+    platform by ``max_concurrency_per_platform``.
+
+    Without an explicit ``source`` the engine answers from a local
+    :class:`~worker.trend_scoring.TrendScoringStage`, fed via
+    :func:`ingest_trend_events`.
+
+    An engine is bound to the event loop it is first used on.
+    """
+
+    def __init__(
+        self,
+        source: Optional[TrendSource] = None,
+        max_concurrency_per_platform: int = 8,
+        result_ttl: float = 5.0,
+        max_cached_keys: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_concurrency_per_platform < 1:
+            raise ValueError("max_concurrency_per_platform must be at least 1")
+        self.source: TrendSource = source or TrendScoringStage()
+        self.max_concurrency_per_platform = max_concurrency_per_platform
+        self.result_ttl = result_ttl
+        self.max_cached_keys = max_cached_keys
+        self.stats = TrendEngineStats()
+        self._clock = clock
+        self._inflight: Dict[TrendKey, "asyncio.Future[Tuple[Dict[str, Any], ...]]"] = {}
+        self._cache: Dict[TrendKey, _CacheEntry] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def adetect_trends(
+        self,
+        agent_id: str,
+        platform: str,
+        query: Optional[str] = None,
+        time_window: str = DEFAULT_TIME_WINDOW,
+    ) -> Dict[str, Any]:
+        """Async form of :func:`detect_trends` for a single agent."""
+        request = DetectTrendsRequest(
+            agent_id=agent_id, platform=platform, query=query, time_window=time_window
+        )
+        self.stats.requests += 1
+        with tracing.span("detect_trends", platform):
+            trends = await self._lookup(_key_for(request))
+        return _build_response(trends)
+
+    async def adetect_trends_many(
+        self, requests: Iterable[Mapping[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Serve a batch of Detect Trends requests.
+
+        Every request is validated up front, so a malformed entry fails the
+        whole batch before any upstream call is made. Responses are returned
+        in request order.
+        """
+        validated = [DetectTrendsRequest(**request) for request in requests]
+        self.stats.requests += len(validated)
+        keys = [_key_for(request) for request in validated]
+        distinct = list(dict.fromkeys(keys))
+        self.stats.coalesced += len(keys) - len(distinct)
+        with tracing.span("detect_trends", "batch"):
+            results = await asyncio.gather(*(self._lookup(key) for key in distinct))
+        by_key = dict(zip(distinct, results))
+        return [_build_response(by_key[key]) for key in keys]
+
+    async def _lookup(self, key: TrendKey) -> Tuple[Dict[str, Any], ...]:
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry.expires_at > self._clock():
+                self.stats.cache_hits += 1
+                return entry.trends
+            del self._cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._on_fetched, key))
+        else:
+            self.stats.coalesced += 1
+        # Shield so one caller being cancelled does not abort the shared fetch.
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: TrendKey) -> Tuple[Dict[str, Any], ...]:
+        async with self._semaphore(key.platform):
+            self.stats.upstream_calls += 1
+            raw = await self.source.fetch_trends(key.platform, key.query, key.time_window)
+        default_source = f"mcp-server-{key.platform}"
+        return tuple(
+            Trend.model_validate({"source": default_source, **item}).model_dump(mode="json")
+            for item in raw
+        )
+
+    def _on_fetched(self, key: TrendKey, task: "asyncio.Future[Any]") -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None or self.result_ttl <= 0:
+            return
+        if len(self._cache) >= self.max_cached_keys:
+            self._evict()
+        self._cache[key] = _CacheEntry(self._clock() + self.result_ttl, task.result())
+
+    def _evict(self) -> None:
+        now = self._clock()
+        for key in [k for k, entry in self._cache.items() if entry.expires_at <= now]:
+            del self._cache[key]
+        while len(self._cache) >= self.max_cached_keys:
+            # Dicts preserve insertion order, so this drops the oldest entry.
+            del self._cache[next(iter(self._cache))]
+
+    def _semaphore(self, platform: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(platform)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency_per_platform)
+            self._semaphores[platform] = semaphore
+        return semaphore
+
+
+def _key_for(request: DetectTrendsRequest) -> TrendKey:
+    return TrendKey(request.platform, request.query, request.time_window)
+
+
+def _build_response(trends: Tuple[Dict[str, Any], ...]) -> Dict[str, Any]:
+    # Each agent gets its own dicts so callers may mutate their response.
+    items = [dict(trend) for trend in trends]
+    return {"trends": items, "total_trends": len(items)}
+
+
+class _EngineLoop:
+    """Background event loop hosting the process-wide default engine."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="trend-engine", daemon=True
+                )
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    def run(self, coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def run_async(self, coro: Any) -> Any:
+        if asyncio.get_running_loop() is self._loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+
+_engine_loop = _EngineLoop()
+_default_engine = TrendEngine()
+
+
+def configure_trend_engine(
+    source: Optional[TrendSource] = None,
+    mcp_client: Optional[MCPClient] = None,
+    **engine_options: Any,
+) -> TrendEngine:
+    """
+    Replace the process-wide engine used by :func:`detect_trends`.
+
+    Pass either a ``source`` or an ``mcp_client`` (wrapped in
+    :class:`MCPTrendSource`); remaining keyword arguments are forwarded to
+    :class:`TrendEngine`.
+    """
+    global _default_engine
+    if source is None and mcp_client is not None:
+        source = MCPTrendSource(mcp_client)
+    _default_engine = TrendEngine(source=source, **engine_options)
+    return _default_engine
+
+
+def get_trend_engine() -> TrendEngine:
+    """Return the process-wide engine used by :func:`detect_trends`."""
+    return _default_engine
+
+
+def ingest_trend_events(platform: str, events: Iterable[TrendEvent]) -> int:
+    """
+    Feed mention/post events into the default engine's scoring stage.
+
+    Raises:
+        TypeError: If the default engine was configured with another source
+    """
+    source = _default_engine.source
+    if not isinstance(source, TrendScoringStage):
+        raise TypeError("default trend engine is not backed by a TrendScoringStage")
+    events = list(events)
+    return _engine_loop.run(_ingest(source, platform, events))
+
+
+async def _ingest(
+    stage: TrendScoringStage, platform: str, events: List[TrendEvent]
+) -> int:
+    # Runs on the engine loop so ingestion never races a scoring pass.
+    return stage.ingest(platform, events)
+
+
+def detect_trends(
+    agent_id: str,
+    platform: str,
+    query: Optional[str] = None,
+    time_window: str = DEFAULT_TIME_WINDOW,
+) -> Dict[str, Any]:
+    """
+    Detect trends for an agent (specs/technical.md Section 2.2.3).
+
+    Args:
+        agent_id: Requesting agent
+        platform: One of twitter, instagram, tiktok
+        query: Optional topic/keyword filter
+        time_window: One of 1h, 24h, 7d, 30d (default: 24h)
+
+    Returns:
+        ``{"trends": [...], "total_trends": n}``
+
+    Raises:
+        ValueError: If ``platform`` or ``time_window`` is not supported
+    """
+    return _engine_loop.run(
+        _default_engine.adetect_trends(agent_id, platform, query, time_window)
+    )
+
+
+async def adetect_trends(
+    agent_id: str,
+    platform: str,
+    query: Optional[str] = None,
+    time_window: str = DEFAULT_TIME_WINDOW,
+) -> Dict[str, Any]:
+    """Awaitable :func:`detect_trends`, sharing the process-wide engine."""
+    return await _engine_loop.run_async(
+        _default_engine.adetect_trends(agent_id, platform, query, time_window)
+    )
+
+
+async def adetect_trends_many(
+    requests: Iterable[Mapping[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Batch :func:`detect_trends` through the process-wide engine."""
+    return await _engine_loop.run_async(_default_engine.adetect_trends_many(list(requests)))
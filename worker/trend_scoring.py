@@ -0,0 +1,367 @@
+"""
+Streaming Trend Scorer
+
+Scoring stage for the Detect Trends contract (specs/technical.md Section
+2.2.3, W-007). Raw mention/post events are ingested as a stream and folded
+into exponentially decayed counters per topic for each of the ``1h``,
+``24h``, ``7d`` and ``30d`` windows, so ``trend_score`` never requires
+rescanning event history.
+
+Counters use forward decay: an event at time ``t`` adds ``exp((t - L) / tau)``
+to its topic's accumulator, where ``L`` is a shared landmark. The decayed
+count at ``now`` is the accumulator times ``exp(-(now - L) / tau)`` -- a single
+scalar per window -- so ingestion only touches the topics present in the new
+events and scoring every topic is one vectorized NumPy pass. Memory is bounded
+at ``max_topics`` slots; when full, the coldest topics are recycled.
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+)
+from uuid import NAMESPACE_URL, uuid5
+
+import numpy as np
+
+WINDOWS: Dict[str, float] = {
+    "1h": 3_600.0,
+    "24h": 86_400.0,
+    "7d": 604_800.0,
+    "30d": 2_592_000.0,
+}
+WINDOW_NAMES = tuple(WINDOWS)
+_TAUS = np.array(list(WINDOWS.values()), dtype=np.float64)
+
+# Re-anchor the landmark well before exp((t - L) / tau_1h) overflows float64.
+_MAX_LANDMARK_AGE = 64.0 * _TAUS[0]
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokens(text: str) -> Set[str]:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+@dataclass(frozen=True)
+class TrendEvent:
+    """A single mention/post observed on a platform."""
+
+    topic: str
+    timestamp: float
+    weight: float = 1.0
+    sample_content: Optional[str] = None
+
+
+class StreamingTrendScorer:
+    """
+    Decayed per-topic counters for one platform with vectorized scoring.
+
+    Args:
+        source: Value reported as each trend's ``source``
+        max_topics: Hard cap on tracked topics (bounds memory)
+        min_count: Minimum decayed event count for a topic to be reported
+        clock: Wall-clock source in epoch seconds
+    """
+
+    def __init__(
+        self,
+        source: str,
+        max_topics: int = 200_000,
+        min_count: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_topics < 1:
+            raise ValueError("max_topics must be at least 1")
+        if min_count <= 0:
+            raise ValueError("min_count must be positive")
+        self.source = source
+        self.max_topics = max_topics
+        self.min_count = min_count
+        self._clock = clock
+        self._landmark: Optional[float] = None
+        capacity = min(1024, max_topics)
+        self._acc = np.zeros((capacity, len(WINDOWS)), dtype=np.float64)
+        self._slots: Dict[str, int] = {}
+        self._topics: List[Optional[str]] = []
+        self._samples: List[str] = []
+        self._free: List[int] = []
+        self._batch_slots: Set[int] = set()
+        self._token_index: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def ingest(self, events: Iterable[TrendEvent]) -> int:
+        """Fold a batch of events into the counters; returns the batch size."""
+        events = list(events)
+        if not events:
+            return 0
+        return self.ingest_arrays(
+            [e.topic for e in events],
+            np.fromiter((e.timestamp for e in events), dtype=np.float64, count=len(events)),
+            np.fromiter((e.weight for e in events), dtype=np.float64, count=len(events)),
+            [e.sample_content for e in events],
+        )
+
+    def ingest_arrays(
+        self,
+        topics: Sequence[str],
+        timestamps: np.ndarray,
+        weights: Optional[np.ndarray] = None,
+        samples: Optional[Sequence[Optional[str]]] = None,
+    ) -> int:
+        """
+        Columnar form of :meth:`ingest` for high-volume producers.
+
+        Cost is O(len(topics)): only the slots named in this batch are
+        touched.
+        """
+        n = len(topics)
+        if n == 0:
+            return 0
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        weights = np.ones(n) if weights is None else np.asarray(weights, dtype=np.float64)
+
+        latest = float(timestamps.max())
+        if self._landmark is None:
+            self._landmark = latest
+        elif latest - self._landmark > _MAX_LANDMARK_AGE:
+            self._reanchor(latest)
+
+        try:
+            slots = np.fromiter(
+                (self._slot_for(t) for t in topics), dtype=np.int64, count=n
+            )
+        finally:
+            self._batch_slots.clear()
+        if samples is not None:
+            for slot, sample in zip(slots.tolist(), samples):
+                if sample:
+                    self._samples[slot] = sample
+
+        unique, inverse = np.unique(slots, return_inverse=True)
+        # (n, windows) forward-decay weights, then summed per distinct slot.
+        contrib = weights[:, None] * np.exp((timestamps[:, None] - self._landmark) / _TAUS)
+        summed = np.zeros((len(unique), len(WINDOWS)))
+        np.add.at(summed, inverse, contrib)
+        self._acc[unique] += summed
+        return n
+
+    def decayed_counts(self, now: Optional[float] = None) -> np.ndarray:
+        """Decayed event counts, shape ``(slots, windows)``."""
+        if self._landmark is None:
+            return np.zeros((0, len(WINDOWS)))
+        now = self._clock() if now is None else now
+        scale = np.exp(-(now - self._landmark) / _TAUS)
+        return self._acc[: len(self._topics)] * scale
+
+    def scores(self, now: Optional[float] = None) -> np.ndarray:
+        """
+        ``trend_score`` for every slot and window in one vectorized pass.
+
+        The score blends volume (log-scaled against the hottest topic in the
+        window) with momentum (the window's event rate relative to the next
+        longer window), yielding a value in [0.0, 1.0].
+        :meth:`top_trends` scores a single window the same way.
+        """
+        return _score_counts(self.decayed_counts(now))
+
+    def top_trends(
+        self,
+        time_window: str = "24h",
+        query: Optional[str] = None,
+        limit: int = 20,
+        now: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Highest-scoring topics for ``time_window`` as Detect Trends records."""
+        column = WINDOW_NAMES.index(time_window)
+        now = self._clock() if now is None else now
+        if self._landmark is None:
+            return []
+        # Only this window and the next longer one feed the score, so the
+        # other columns are never materialised.
+        n = len(self._topics)
+        scale = np.exp(-(now - self._landmark) / _TAUS)
+        counts = self._acc[:n, column] * scale[column]
+        longer = None
+        if column < len(WINDOWS) - 1:
+            longer = self._acc[:n, column + 1] * scale[column + 1]
+        scores = _score_window(counts, longer, column)
+
+        candidates = self._candidates(query)
+        if candidates is None:
+            eligible = np.flatnonzero(counts >= self.min_count)
+        else:
+            eligible = candidates[counts[candidates] >= self.min_count]
+        if eligible.size == 0:
+            return []
+        if eligible.size > limit:
+            part = np.argpartition(-scores[eligible], limit - 1)[:limit]
+            eligible = eligible[part]
+        ranked = eligible[np.argsort(-scores[eligible], kind="stable")]
+
+        detected_at = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        return [
+            {
+                "trend_id": str(uuid5(NAMESPACE_URL, f"{self.source}#{self._topics[i]}")),
+                "topic": self._topics[i],
+                "trend_score": float(scores[i]),
+                "source": self.source,
+                "sample_content": self._samples[i],
+                "detected_at": detected_at,
+            }
+            for i in ranked.tolist()
+        ]
+
+    def _candidates(self, query: Optional[str]) -> Optional[np.ndarray]:
+        if not query:
+            return None
+        tokens = _tokens(query)
+        if not tokens:
+            return None
+        matched: Optional[Set[int]] = None
+        for token in tokens:
+            slots = self._token_index.get(token, set())
+            matched = set(slots) if matched is None else matched & slots
+            if not matched:
+                return np.empty(0, dtype=np.int64)
+        return np.fromiter(matched, dtype=np.int64, count=len(matched))
+
+    def _slot_for(self, topic: str) -> int:
+        slot = self._slots.get(topic)
+        if slot is not None:
+            self._batch_slots.add(slot)
+            return slot
+        if len(self._slots) >= self.max_topics:
+            self._evict_coldest()
+        if self._free:
+            slot = self._free.pop()
+            self._topics[slot] = topic
+            self._samples[slot] = ""
+        else:
+            slot = len(self._topics)
+            if slot >= len(self._acc):
+                grown = np.zeros((min(len(self._acc) * 2, self.max_topics), len(WINDOWS)))
+                grown[: len(self._acc)] = self._acc
+                self._acc = grown
+            self._topics.append(topic)
+            self._samples.append("")
+        self._slots[topic] = slot
+        self._batch_slots.add(slot)
+        for token in _tokens(topic):
+            self._token_index.setdefault(token, set()).add(slot)
+        return slot
+
+    def _evict_coldest(self) -> None:
+        # Recycle the coldest 1/16th of slots at once to amortise the scan.
+        # Slots named earlier in the current batch, new or existing, must
+        # survive until the batch is folded in.
+        live = np.array(
+            [s for s in self._slots.values() if s not in self._batch_slots],
+            dtype=np.int64,
+        )
+        if live.size == 0:
+            raise ValueError("batch has more distinct topics than max_topics")
+        batch = max(1, len(live) // 16)
+        cold = live[np.argpartition(self._acc[live, -1], batch - 1)[:batch]]
+        for slot in cold.tolist():
+            topic = self._topics[slot]
+            del self._slots[topic]
+            for token in _tokens(topic):
+                bucket = self._token_index.get(token)
+                if bucket is not None:
+                    bucket.discard(slot)
+                    if not bucket:
+                        del self._token_index[token]
+            self._topics[slot] = None
+            self._acc[slot] = 0.0
+            self._free.append(slot)
+
+    def _reanchor(self, landmark: float) -> None:
+        self._acc *= np.exp(-(landmark - self._landmark) / _TAUS)
+        self._landmark = landmark
+
+
+def _score_counts(counts: np.ndarray) -> np.ndarray:
+    scores = np.empty_like(counts)
+    last = len(WINDOWS) - 1
+    for column in range(len(WINDOWS)):
+        baseline = counts[:, column + 1] if column < last else None
+        scores[:, column] = _score_window(counts[:, column], baseline, column)
+    return scores
+
+
+def _score_window(
+    counts: np.ndarray, longer: Optional[np.ndarray], column: int
+) -> np.ndarray:
+    """
+    Score one window's counts against the next longer window.
+
+    With rates ``c / tau`` and a one-event-per-window prior, momentum is
+    ``(c + 1) / (b * tau / tau_next + 1)`` where ``b`` is the longer window's
+    count; ``burst = 1 - 1 / momentum`` reduces to ``(c - b * r) / (c + 1)``.
+    The longest window is compared against the mean topic instead.
+    """
+    if counts.size == 0:
+        return counts.copy()
+    if longer is None:
+        expected = counts.mean()
+    else:
+        expected = longer * (_TAUS[column] / _TAUS[column + 1])
+    burst = counts - expected
+    burst /= counts + 1.0
+    np.clip(burst, 0.0, 1.0, out=burst)
+    burst *= 0.5
+    burst += 0.5
+
+    peak = np.log1p(counts.max())
+    volume = np.log1p(counts)
+    if peak > 0:
+        volume /= peak
+    volume *= burst
+    return np.clip(volume, 0.0, 1.0, out=volume)
+
+
+class TrendScoringStage:
+    """
+    Per-platform scorers exposed as a trend source for ``TrendEngine``.
+
+    Mention/post streams are fed through :meth:`ingest`; Detect Trends
+    lookups are answered from the decayed counters without an upstream call.
+    """
+
+    def __init__(self, limit: int = 20, **scorer_options: Any):
+        self.limit = limit
+        self._scorer_options = scorer_options
+        self._scorers: Dict[str, StreamingTrendScorer] = {}
+
+    def scorer(self, platform: str) -> StreamingTrendScorer:
+        scorer = self._scorers.get(platform)
+        if scorer is None:
+            scorer = StreamingTrendScorer(
+                source=f"mcp-server-{platform}", **self._scorer_options
+            )
+            self._scorers[platform] = scorer
+        return scorer
+
+    def ingest(self, platform: str, events: Iterable[TrendEvent]) -> int:
+        return self.scorer(platform).ingest(events)
+
+    async def fetch_trends(
+        self, platform: str, query: Optional[str], time_window: str
+    ) -> Sequence[Mapping[str, Any]]:
+        scorer = self._scorers.get(platform)
+        if scorer is None:
+            return []
+        return scorer.top_trends(time_window, query=query, limit=self.limit)